@@ -0,0 +1,14 @@
+#!/bin/bash
+
+# PROJ_PATH should be defined in the cron.jobs file
+if [ -n "$PROJ_PATH" ]; then
+    cd "$PROJ_PATH"
+else
+    cd /home/jaleazo/prod/Spotify-2.0/
+fi
+
+export PYTHONPATH=$(pwd)/src:$PYTHONPATH
+source .venv/bin/activate
+source tokens/spotify_token.sh
+# exec so systemd's SIGTERM goes straight to python and we get to shutdown gracefully
+exec python3 src/Implementations.py --daemon
@@ -12,17 +12,30 @@
 # ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
 import calendar
 import inspect
+import json
 import logging
 import os
+import threading
 import time
+import unicodedata
 
-from datetime  import datetime
-from functools import wraps
-from typing    import Any, Dict, List, Optional, Union
+from bisect             import bisect_left
+from collections        import Counter, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime           import datetime, timedelta
+from functools          import lru_cache, wraps
+from typing             import Any, Dict, Iterator, List, Optional, Union
 
-from src.helpers.decorators  import *
-from src.helpers.Settings    import Settings
-from src.proxy.Spotipy_Proxy import SpotipyProxy
+from src.helpers.decorators       import *
+from src.helpers.Database_Helpers import DatabaseHelpers
+from src.helpers.Settings         import Settings
+from src.proxy.Spotipy_Proxy      import SpotipyProxy
+
+# Most tracks spotify lets us add to a playlist in one request.
+PLAYLIST_ADD_CHUNK_SIZE = 100
+# All we keep of an album in our album cache, what 'gather_tracks_by_artist' reads. Anything else goes to spotify.
+ALBUM_CACHE_FIELDS = {'id': True, 'name': True, 'release_date': True, 'artists': {'id': True, 'name': True}
+                      , 'tracks': {'id': True, 'name': True, 'artists': {'id': True, 'name': True}}}
 
 """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
 DESCRIPTION: Validates that the given 'args' are of type 'types'.
@@ -72,10 +85,42 @@ def get_generic_field(response: dict, info: list[str]) -> list:
 
 
 """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
-DESCRIPTION: Returns all the 'elements' that fall within the start_date and end_date.
+DESCRIPTION: Parses a spotify release date, cached since the same handful of dates show up across every artist.
              Y-M is treated as Y-M-last day of month.
              Y is treated as Y-12-31.
-             Any other time format will always be included.
+             The zero padded formats spotify actually sends are sliced by hand, anything else goes to 'strptime'.
+INPUT: release_date - Release date string, 'YYYY-MM-DD', 'YYYY-MM', or 'YYYY'.
+OUTPUT: Datetime of the release date, None if it isn't in any format we know.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+@lru_cache(maxsize=None)
+def parse_release_date(release_date: str) -> Optional[datetime]:
+    try:
+        if len(release_date) == 10 and release_date[4] == '-' and release_date[7] == '-':
+            return datetime(int(release_date[:4]), int(release_date[5:7]), int(release_date[8:]))
+        if len(release_date) == 7 and release_date[4] == '-':
+            year, month = int(release_date[:4]), int(release_date[5:])
+            return datetime(year, month, calendar.monthrange(year, month)[1])
+        if len(release_date) == 4:
+            return datetime(int(release_date), 12, 31)
+    except ValueError:
+        pass
+    
+    for fmt in ('%Y-%m-%d', '%Y-%m', '%Y'):
+        try:
+            element_date = datetime.strptime(release_date, fmt)
+        except ValueError:
+            continue
+        if fmt == '%Y-%m':
+            element_date = element_date.replace(day=calendar.monthrange(element_date.year, element_date.month)[1])
+        elif fmt == '%Y':
+            element_date = element_date.replace(day=31, month=12)
+        return element_date
+    return None
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Returns all the 'elements' that fall within the start_date and end_date.
+             Any release date 'parse_release_date' can't make sense of will always be included.
 INPUT: elements - List of elements with a ['release_date'] dictionary field.
        start_date - Datetime for start of desired selection.
        end_date - Datetime for end of desired selection.
@@ -85,25 +130,116 @@ def get_elements_in_date_range(elements: list[dict], start_date: datetime, end_d
     validate_inputs([elements, start_date, end_date], [list, datetime, datetime])
     valid_elements = []
     for element in elements:
-        invalid_format_count = 0
-        for fmt in ('%Y-%m-%d', '%Y-%m', '%Y'):
-            try:
-                element_date = datetime.strptime(element["release_date"], fmt)
-                if fmt == '%Y-%m':
-                    element_date = element_date.replace(day=calendar.monthrange(element_date.year, element_date.month)[1])
-                elif fmt == '%Y':
-                    element_date = element_date.replace(day=31, month=12)
-
-                if start_date <= element_date <= end_date:
-                    valid_elements.append(element)
-                    break
-            except ValueError:
-                invalid_format_count += 1
-        if invalid_format_count >= 3:
+        element_date = parse_release_date(element["release_date"])
+        if element_date is None or start_date <= element_date <= end_date:
             valid_elements.append(element)
     return valid_elements
 
 
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Decides if an album out of our album cache is still good to use. Albums released within 
+             'ALBUM_CACHE_RECENT_DAYS' of when we cached them only last 'ALBUM_CACHE_RECENT_TTL_H' hours, anything 
+             that was already that old when we cached it never changes so it's good forever.
+INPUT: release_date - Release date of the album, None if we don't know it.
+       cached_at - Epoch seconds of when we cached the album.
+       now - Datetime we're checking against.
+OUTPUT: True if we can use the cached album, False if we should ask spotify again.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def is_album_cache_fresh(release_date: Optional[str], cached_at: int, now: datetime) -> bool:
+    cached_time = datetime.fromtimestamp(cached_at)
+    released = parse_release_date(release_date) if release_date else None
+    if released is not None and cached_time - released >= timedelta(days=Settings.ALBUM_CACHE_RECENT_DAYS):
+        return True
+    return now - cached_time < timedelta(hours=Settings.ALBUM_CACHE_RECENT_TTL_H)
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Normalizes a track title so copies of the same track compare equal. Unicode compatibility forms and case
+             are folded, anything that isn't alphanumeric is dropped, and whitespace is collapsed.
+INPUT: title - Track title as spotify gives it.
+OUTPUT: Normalized title.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def normalize_track_title(title: str) -> str:
+    title = unicodedata.normalize("NFKC", title).casefold()
+    return " ".join(''.join(char for char in title if char.isalnum() or char.isspace()).split())
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Builds the key we use to tell if two tracks are copies of the same recording (ie the single, the album
+             cut, and every compilation it ended up on), the normalized title and the set of artists on it. The album
+             tracks we dedupe are simplified track objects so we don't get an ISRC to go off of.
+INPUT: track - Track dict with 'name' and 'artists' (with 'id').
+OUTPUT: Hashable key, equal for tracks we consider the same recording.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def get_track_dedupe_key(track: dict) -> tuple:
+    return ('title', normalize_track_title(track['name']), frozenset(artist['id'] for artist in track['artists']))
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Plans the range moves to get a playlist from 'current' to 'target' order. Every track on the longest 
+             increasing subsequence (by target position) stays put, everything else is moved in target order to just
+             after its target predecessor, grabbing as many following tracks in one range as are already in place.
+INPUT: current - List of track ids in the order the playlist is in now.
+       target - List of the same track ids (duplicates included) in the order we want.
+OUTPUT: List of (range_start, insert_before, range_length) tuples to hand to 'playlist_reorder_items' in order.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def get_reorder_moves(current: list[str], target: list[str]) -> list[tuple[int, int, int]]:
+    validate_inputs([current, target], [list, list])
+    if Counter(current) != Counter(target):
+        raise Exception(f"Can't Reorder, Current And Target Tracks Differ: {len(current)} vs {len(target)}")
+    
+    # Swap ids for their target position, duplicates take positions in the order they show up
+    target_positions = defaultdict(deque)
+    for position, track_id in enumerate(target):
+        target_positions[track_id].append(position)
+    order = [target_positions[track_id].popleft() for track_id in current]
+    
+    # Longest increasing subsequence, 'tails[x]' is the index in 'order' of the smallest tail of any length x+1 run
+    tails, tail_values, previous = [], [], [None] * len(order)
+    for idx, position in enumerate(order):
+        length = bisect_left(tail_values, position)
+        previous[idx] = tails[length - 1] if length > 0 else None
+        if length == len(tails):
+            tails.append(idx)
+            tail_values.append(position)
+        else:
+            tails[length] = idx
+            tail_values[length] = position
+    in_place = set()
+    idx = tails[-1] if tails else None
+    while idx is not None:
+        in_place.add(order[idx])
+        idx = previous[idx]
+    
+    # Where each target position currently sits in 'order', a move only shifts what's between its start and end
+    indexes = [0] * len(order)
+    for idx, position in enumerate(order):
+        indexes[position] = idx
+    
+    moves = []
+    for position in range(len(order)):
+        if position in in_place:
+            continue
+        range_start = indexes[position]
+        range_length = 1
+        while range_start + range_length < len(order) and order[range_start + range_length] == position + range_length \
+                and position + range_length not in in_place:
+            range_length += 1
+        insert_before = indexes[position - 1] + 1 if position > 0 else 0
+        
+        moved = order[range_start:range_start + range_length]
+        del order[range_start:range_start + range_length]
+        new_start = insert_before if insert_before < range_start else insert_before - range_length
+        order[new_start:new_start] = moved
+        for idx in range(min(range_start, new_start), max(range_start, new_start) + range_length):
+            indexes[order[idx]] = idx
+        
+        in_place.update(moved)
+        moves.append((range_start, insert_before, range_length))
+    
+    return moves
+
+
 """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
 DESCRIPTION: Scopes decorator, this will set the scopes for the function and reset them after the function is done.
 INPUT: scopes_list - List of scopes to set for the function.
@@ -184,12 +320,24 @@ class GeneralSpotifyHelpers:
     DESCRIPTION: Creates the spotipy object for the given 'username' and 'scope'.
     INPUT: scope - List of spotify scopes to request access for, note MAX_SCOPE IS ALWAYS PASSED IN.
            username - User id we use for auth and operations (requires prior authorization for scopes).
+           album_cache_db - Optional path to the db we cache album tracks in, None always goes to spotify.
     OUTPUT: N/A
     """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
-    def __init__(self, logger: logging.Logger=None) -> None:
+    def __init__(self, logger: logging.Logger=None, album_cache_db: Optional[str]=None) -> None:
         self.logger = logger if logger is not None else logging.getLogger()
         self._scopes = []
         self.sp = SpotipyProxy(logger=self.logger)
+        
+        # Opened on first use so we only touch the db when someone actually wants album tracks
+        self.album_cache_db = album_cache_db
+        self.album_cache = None
+        self.album_cache_stats = Counter()
+        self._album_cache_lock = threading.Lock()
+        
+        # Search results and artist names are meant to cover a single run, see 'clear_search_cache'
+        self.search_cache = {}
+        self.artist_name_cache = {}
+        self._search_cache_lock = threading.Lock()
     
     """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
     DESCRIPTION: Generalized helper to pull specified data from a spotify api response.
@@ -201,18 +349,27 @@ class GeneralSpotifyHelpers:
     OUTPUT: Elements requested through the 'field_structure'.
     """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
     def _gather_data(self, response: Dict[str, Any], field_structure: Dict[str, Any]) -> List[Dict[str, Any]]:
-        data = []
+        return [element for page in self._gather_pages(response, field_structure) for element in page]
+    
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    DESCRIPTION: Same as '_gather_data' but hands back one page at a time, the next page is only requested once we ask
+                 for it so callers can stop paginating early.
+    INPUT: response - Dictionary response from spotipy api call.
+           field_structure - Dictionary of fields we want to pull from 'response', see '_gather_data'.
+    OUTPUT: Iterator of lists of the elements requested through the 'field_structure', one list per page.
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    def _gather_pages(self, response: Dict[str, Any]
+                      , field_structure: Dict[str, Any]) -> Iterator[List[Dict[str, Any]]]:
         while response:
             main_data, next_response_path = find_main_iterator(response)
             extracted_data = extract_fields(main_data, field_structure)
-            data.extend(extracted_data if isinstance(extracted_data, list) else [extracted_data])
+            yield extracted_data if isinstance(extracted_data, list) else [extracted_data]
             
             if next_response_path and len(next_response_path) > 1:
                 response = response.get(next_response_path[-2], {})
             
-            response = self.sp.next(response) if "next" in response else None
-        
-        return data
+            # Spotify sends 'next' as None on the last page, no need to go through our proxy to find that out
+            response = self.sp.next(response) if isinstance(response, dict) and response.get("next") else None
 
     """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
     DESCRIPTION: Validates the desired scope compared to the scopes used on the creation of the class. If the scope is 
@@ -280,6 +437,7 @@ class GeneralSpotifyHelpers:
             ret = {"context": None
                    , "currently_playing_type": playback['currently_playing_type']
                    , "is_playing": playback['is_playing']
+                   , "progress_ms": playback['progress_ms']
                    , "shuffle_state": playback['shuffle_state']
                    , "repeat_state": playback['repeat_state']}
             
@@ -300,6 +458,16 @@ class GeneralSpotifyHelpers:
         
         return ret
     
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    DESCRIPTION: Long polls our proxy for changes to our playback (a new track, context, or repeat state).
+    INPUT: since_seq - Last event sequence number we've seen, None to only wait on new events.
+           timeout_s - How long our proxy can wait for an event before answering.
+    OUTPUT: Dict of 'events' since 'since_seq' (each with its 'seq' and list of 'types') and the 'seq' to wait on next.
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    def get_playback_events(self, since_seq: Optional[int]=None, timeout_s: float=0) -> dict:
+        self._validate_scope(["user-read-playback-state"])
+        return self.sp.playback_events(since_seq, timeout_s)
+    
     """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
     DESCRIPTION: Overwrites spotify queue with given tracks.
     INPUT: tracks - The tracks that will be written to the queue.
@@ -354,7 +522,7 @@ class GeneralSpotifyHelpers:
         self._validate_scope(["playlist-modify-public", "playlist-modify-private"])
         validate_inputs([playlist_id, track_ids], [str, list])
         
-        track_chunks = chunks(track_ids, 100)
+        track_chunks = chunks(track_ids, PLAYLIST_ADD_CHUNK_SIZE)
         for chunk in track_chunks:
             self.sp.playlist_add_items(playlist_id, chunk)
     
@@ -461,6 +629,69 @@ class GeneralSpotifyHelpers:
                                    f"Length: {len(tracks)}, Max: {max_playlist_length}")
         return False
     
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    DESCRIPTION: Moves tracks around in a playlist, each move is made against the snapshot the last one handed back so
+                 if the playlist changes under us spotify applies our moves to the version they were planned for.
+    INPUT: playlist_id - Id of playlist we are reordering.
+           moves - List of (range_start, insert_before, range_length) tuples, see 'get_reorder_moves'.
+           snapshot_id - Snapshot of the playlist our first move was planned against.
+    OUTPUT: Snapshot id of the playlist after our last move ('snapshot_id' if there was nothing to move).
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    def reorder_playlist_tracks(self, playlist_id: str, moves: list[tuple[int, int, int]], 
+                                snapshot_id: Optional[str]=None) -> Optional[str]:
+        self._validate_scope(["playlist-modify-public", "playlist-modify-private"])
+        validate_inputs([playlist_id, moves], [str, list])
+        
+        for range_start, insert_before, range_length in moves:
+            snapshot_id = self.sp.playlist_reorder_items(playlist_id, range_start, insert_before
+                                                         , range_length=range_length
+                                                         , snapshot_id=snapshot_id)['snapshot_id']
+        return snapshot_id
+    
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+    DESCRIPTION: Gets a playlist to exactly 'track_ids' with as few calls as we can. Removes only the tracks that 
+                 shouldn't be there, appends only the ones that are missing, then reorders. Held to the same gates as 
+                 'remove_all_playlist_tracks' since it deletes.
+    INPUT: playlist_id - Id of playlist we will sync.
+           track_ids - List of track ids the playlist should end up as, in order.
+           max_playlist_length - Second gate to always check how many tracks we "expect" to be in the playlist.
+    OUTPUT: Bool on whether or not we were allowed to sync the playlist.
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+    def sync_playlist_tracks(self, playlist_id: str, track_ids: list[str], max_playlist_length: int=0) -> bool:
+        self._validate_scope(["playlist-modify-public", "playlist-modify-private", Settings.DELETE_SCOPE])
+        validate_inputs([playlist_id, track_ids], [str, list])
+        
+        current = []
+        if playlist_id in Settings.PLAYLISTS_WE_CAN_DELETE_FROM:
+            current = [track['id'] for track in self.get_playlist_tracks(playlist_id)]
+            if len(current) <= max_playlist_length:
+                # We can only remove every occurrence of a track, so anything we have too many of goes and is re-added
+                target_counts, current_counts = Counter(track_ids), Counter(current)
+                tracks_to_remove = {track_id for track_id in current_counts 
+                                    if current_counts[track_id] > target_counts[track_id]}
+                for chunk in chunks(list(tracks_to_remove), 60):
+                    self.sp.playlist_remove_all_occurrences_of_items(playlist_id, chunk)
+                
+                remaining = [track_id for track_id in current if track_id not in tracks_to_remove]
+                remaining_counts = Counter(remaining)
+                tracks_to_add = []
+                for track_id in track_ids:
+                    if remaining_counts[track_id] > 0:
+                        remaining_counts[track_id] -= 1
+                    else:
+                        tracks_to_add.append(track_id)
+                self.add_tracks_to_playlist(playlist_id, tracks_to_add)
+                
+                moves = get_reorder_moves(remaining + tracks_to_add, track_ids)
+                self.reorder_playlist_tracks(playlist_id, moves)
+                self.logger.info(f"Synced Playlist {playlist_id}: Removed {len(tracks_to_remove)}, "
+                                 f"Added {len(tracks_to_add)}, Moves {len(moves)}")
+                return True
+        
+        self.logger.error(f"Incorrectly Called DELETE With Playlist: ID: {playlist_id}, " +
+                                   f"Length: {len(current)}, Max: {max_playlist_length}")
+        return False
+    
     # ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
     # ARTISTS ═════════════════════════════════════════════════════════════════════════════════════════════════════════
     # ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
@@ -471,20 +702,41 @@ class GeneralSpotifyHelpers:
            album_types - Type of albums we are requesting. Types are  album, single, appears_on, and compilation.
            info - Info we will grab for the albums can be id, name, and release_date. 
                               There are more but I know those work.
+           start_date - If given we stop paginating each album type once we're past it, older albums on that last 
+                        page still come back so filter them yourself.
     OUTPUT: List of album dictionaries with 'info' for the given artist.
     """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
     def get_artist_albums(self, artist_id:str, 
                           album_types: list[str]=['album'], 
-                          info: list[str]=['id']):
+                          info: list[str]=['id'],
+                          start_date: Optional[datetime]=None):
         validate_inputs([artist_id, album_types, info], [str, list, list])
         
-        return self._gather_data(
-            self.sp.artist_albums(artist_id
-                                  , country="US"
-                                  , limit=50
-                                  , include_groups=','.join(album_types))
-            , {key: True for key in info}
-        )
+        if start_date is None:
+            return self._gather_data(
+                self.sp.artist_albums(artist_id
+                                      , country="US"
+                                      , limit=50
+                                      , include_groups=','.join(album_types))
+                , {key: True for key in info}
+            )
+        
+        # Each album type comes back newest first, so once a page reaches back past 'start_date' every page after it 
+        #   is older still. Types are requested separately since mixed together each one restarts from the newest.
+        albums = []
+        for album_type in album_types:
+            pages = self._gather_pages(self.sp.artist_albums(artist_id
+                                                             , country="US"
+                                                             , limit=50
+                                                             , include_groups=album_type)
+                                       , {key: True for key in info + ['release_date']})
+            for page in pages:
+                albums += [{key: album[key] for key in info} for album in page]
+                release_dates = [parse_release_date(album['release_date']) for album in page
+                                 if album['release_date'] is not None]
+                if any(release_date is not None and release_date < start_date for release_date in release_dates):
+                    break
+        return albums
 
 
     """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
@@ -501,10 +753,14 @@ class GeneralSpotifyHelpers:
                                 end_date: Optional[datetime]=None) -> list[str]:
         # validate_inputs([artist_id, start_date, end_date], [str, datetime, datetime])
         
+        # Only read album pages back as far as our range goes
+        prune_date = start_date if start_date is not None and end_date is not None else None
+        
         # Gather all artists albums/ singles
         artist_albums = self.get_artist_albums(artist_id
                                                 , album_types=['album', 'single']
-                                                , info=['id', 'release_date', 'album_type'])
+                                                , info=['id', 'release_date', 'album_type']
+                                                , start_date=prune_date)
         # Remove all compilations
         artist_albums = [album for album in artist_albums if album['album_type'] != 'compilation']
         
@@ -522,7 +778,8 @@ class GeneralSpotifyHelpers:
         # Gather all albums/ singles artist appeared on
         artist_appears_on_albums = self.get_artist_albums(artist_id
                                                 , album_types=['appears_on']
-                                                , info=['id', 'release_date', 'album_type'])
+                                                , info=['id', 'release_date', 'album_type']
+                                                , start_date=prune_date)
 
         # Remove all compilations
         artist_appears_on_albums = [album for album in artist_appears_on_albums 
@@ -533,7 +790,8 @@ class GeneralSpotifyHelpers:
         # Gather the tracks from these albums
         appears_on_album_tracks = self.get_albums_tracks([album['id'] for album in artist_appears_on_albums]
                                                          , album_info=['id', 'release_date']
-                                                         , track_info=['id', 'name'])
+                                                         , track_info=['id', 'name']
+                                                         , artist_info=['id', 'name'])
         # Get only the tracks that our artist supported
         appears_on_album_tracks = [track for album in appears_on_album_tracks for track in album['tracks'] 
                                    for artist in track['artists'] if artist_id in artist.values()]
@@ -570,8 +828,63 @@ class GeneralSpotifyHelpers:
         if artist_info:
             field_structure["artists"] = {key: True for key in artist_info}
 
-        return [album for album_chunk in album_chunks
-                for album in self._gather_data(self.sp.albums(album_chunk, market="US"), field_structure)]
+        # Our album cache only keeps 'ALBUM_CACHE_FIELDS', asking for anything more has to go to spotify
+        cacheable = set(album_info) <= set(ALBUM_CACHE_FIELDS) and set(track_info) <= set(ALBUM_CACHE_FIELDS['tracks'])\
+                        and set(artist_info) <= set(ALBUM_CACHE_FIELDS['artists'])
+        if self.album_cache_db is None or not cacheable:
+            return [album for album_chunk in album_chunks
+                    for album in self._gather_data(self.sp.albums(album_chunk, market="US"), field_structure)]
+        return extract_fields(self._get_cached_albums(album_ids), field_structure)
+    
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    DESCRIPTION: Grabs albums (tracks and their artists included) out of our album cache, only going to spotify for
+                 albums we don't have or whose cache entry is stale. Whatever we fetch gets cached, trimmed down to
+                 'ALBUM_CACHE_FIELDS'.
+    INPUT: album_ids - List of album ids to grab.
+    OUTPUT: List of album dicts with 'ALBUM_CACHE_FIELDS' in the same order as 'album_ids', None for any album
+            spotify doesn't know about.
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    def _get_cached_albums(self, album_ids: list[str]) -> list[Optional[dict]]:
+        with self._album_cache_lock:
+            if self.album_cache is None:
+                self.album_cache = DatabaseHelpers(self.album_cache_db, logger=self.logger)
+        
+        now = datetime.now()
+        unique_album_ids = list(dict.fromkeys(album_ids))
+        cache_entries = self.album_cache.get_album_cache(unique_album_ids)
+        albums = {entry['id']: json.loads(entry['album']) for entry in cache_entries
+                  if is_album_cache_fresh(entry['release_date'], entry['cached_at'], now)}
+        
+        missing_album_ids = [album_id for album_id in unique_album_ids if album_id not in albums]
+        fetched_albums = [extract_fields(album, ALBUM_CACHE_FIELDS) for album_chunk in chunks(missing_album_ids, 20)
+                          for album in self.sp.albums(album_chunk, market="US")['albums'] if album is not None]
+        self.album_cache.upsert_album_cache([(album['id'], album.get('release_date'), int(now.timestamp())
+                                              , json.dumps(album)) for album in fetched_albums])
+        
+        with self._album_cache_lock:
+            self.album_cache_stats['hits'] += len(albums)
+            self.album_cache_stats['stale'] += len(cache_entries) - len(albums)
+            self.album_cache_stats['misses'] += len(missing_album_ids) - (len(cache_entries) - len(albums))
+        
+        albums.update({album['id']: album for album in fetched_albums})
+        return [albums.get(album_id) for album_id in album_ids]
+    
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    DESCRIPTION: Logs how our album cache did since the last time we asked and starts counting again from zero. Meant
+                 to be called once at the end of a run.
+    INPUT: N/A
+    OUTPUT: Dict of 'hits', 'stale', 'misses', and 'hit_rate' (0 when we didn't look anything up).
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    def log_album_cache_stats(self) -> dict:
+        with self._album_cache_lock:
+            stats, self.album_cache_stats = self.album_cache_stats, Counter()
+        
+        lookups = stats['hits'] + stats['stale'] + stats['misses']
+        hit_rate = stats['hits'] / lookups if lookups else 0
+        if lookups:
+            self.logger.info(f"Album Cache: {stats['hits']} hits, {stats['stale']} stale, {stats['misses']} misses"
+                             f" ({hit_rate:.0%} hit rate)")
+        return {'hits': stats['hits'], 'stale': stats['stale'], 'misses': stats['misses'], 'hit_rate': hit_rate}
 
     # ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
     # TRACKS ══════════════════════════════════════════════════════════════════════════════════════════════════════════
@@ -629,8 +942,10 @@ class GeneralSpotifyHelpers:
         return artist_ids
 
     """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
-    DESCRIPTION: Verifies if the given track is the "unique" one just by searching for it, if it's the first 
-                 result then it is unique, if not then it's probably a duplicate.
+    DESCRIPTION: Verifies if the given track is the "unique" one just by searching for it, if it's one of the first 
+                 results then it is unique, if not then it's probably a duplicate. Copies of the same recording all
+                 get answered by the same search so we only search once per recording (see 'get_track_dedupe_key') 
+                 and a few of those at a time.
     INPUT: tracks - List of spotify tracks we will be verifying.
            artist_id - Str of the given artist so we can better tell if it's theirs.
     OUTPUT: List of the tracks we have verified.
@@ -638,21 +953,59 @@ class GeneralSpotifyHelpers:
     def verify_appears_on_tracks(self, tracks: list[str], artist_id: str) -> list[str]:
         validate_inputs([tracks, artist_id], [list, str])
         
-        valid_tracks = []
-        for track in tracks:
-            artist_name = self.get_artist_data(track['artists'][0]['id'], ['name'])[0]
-            track_name = ''.join(e for e in track['name'] if e.isalnum() or e == " ")
-            tracks_data = self.sp.search(f"{track_name}%20artist:{artist_name}", 
-                                         limit=5, type='track', market="US")['tracks']['items']
-            for track_data in tracks_data:
-                track_id = track_data['id']
-                if track_id == track['id']:
-                    valid_tracks.append(track['id'])
-                    break
-
-            if len(tracks_data) == 0:
-                valid_tracks.append(track['id'])
-        return valid_tracks
+        track_keys = [get_track_dedupe_key(track) for track in tracks]
+        recordings = {}
+        for track_key, track in zip(track_keys, tracks):
+            recordings.setdefault(track_key, track)
+        
+        max_workers = max(min(Settings.APPEARS_ON_SEARCH_WORKERS, len(recordings)), 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            search_results = dict(zip(recordings, executor.map(self._search_track_ids, recordings.values())))
+        self.logger.debug(f"Verified {len(tracks)} appears on tracks with {len(recordings)} searches")
+        
+        # No results at all means spotify can't find it by name, we give it the benefit of the doubt
+        return [track['id'] for track_key, track in zip(track_keys, tracks)
+                if not search_results[track_key] or track['id'] in search_results[track_key]]
+    
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    DESCRIPTION: Searches spotify for the given track by its name and first artist. Results are cached by query until
+                 'clear_search_cache' so the same track showing up for a few of our artists is only searched once.
+    INPUT: track - Track dict with 'name' and 'artists' (with 'id' and optionally 'name').
+    OUTPUT: Tuple of the track ids spotify gave back for our search, best match first.
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    def _search_track_ids(self, track: dict) -> tuple[str, ...]:
+        artist = track['artists'][0]
+        artist_name = artist.get('name')
+        if artist_name is None:
+            with self._search_cache_lock:
+                artist_name = self.artist_name_cache.get(artist['id'])
+            if artist_name is None:
+                artist_name = self.get_artist_data(artist['id'], ['name'])[0]
+                with self._search_cache_lock:
+                    self.artist_name_cache[artist['id']] = artist_name
+        
+        track_name = ''.join(e for e in track['name'] if e.isalnum() or e == " ")
+        query = f"{track_name}%20artist:{artist_name}"
+        with self._search_cache_lock:
+            if query in self.search_cache:
+                return self.search_cache[query]
+        
+        track_ids = tuple(track_data['id'] for track_data in 
+                          self.sp.search(query, limit=5, type='track', market="US")['tracks']['items'])
+        with self._search_cache_lock:
+            self.search_cache[query] = track_ids
+        return track_ids
+    
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    DESCRIPTION: Drops our cached searches and artist names so a long lived object (ie one warm in our FeaturePool)
+                 doesn't hold onto them, or stale results, forever. Meant to be called between runs.
+    INPUT: N/A
+    OUTPUT: N/A
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    def clear_search_cache(self) -> None:
+        with self._search_cache_lock:
+            self.search_cache.clear()
+            self.artist_name_cache.clear()
 
     # ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
     # MISC HELPERS ════════════════════════════════════════════════════════════════════════════════════════════════════
@@ -11,10 +11,19 @@
 #   tested. 
 #
 # METHODOLOGY -
-# For track/ playback triggered events we currently run our 'log_and_macro' function through apscheduler to
-#   periodically log our playback, and trigger macros. To make sure we are always logging, when a 'macro' is triggered
-#   we create an entirely new SpotifyFeatures object and send it off on its own thread. This allows us to log and run
-#   macros in parallel which can be very helpful if our macros take an extended amount of time.
+# For track/ playback triggered events we run our 'log_and_macro' function from 'run_playback_poller' to log our
+#   playback, and trigger macros. To make sure we are always logging, when a 'macro' is triggered we hand it off to our
+#   'macro_pool', a small set of worker threads that each keep their own warm SpotifyFeatures (see 'Feature_Pool.py').
+#   This allows us to log and run macros in parallel which can be very helpful if our macros take an extended amount
+#   of time. Re-triggering a macro on a playlist it is still working on is dropped rather than run twice.
+#
+# Rather than polling on a fixed 'LOGGING_INTERVAL_S' the poller picks when to poll next from the playback it just got
+#   (see 'get_next_poll_delay_s'). While playing we never wait longer than 'LOGGING_INTERVAL_S' but jump to just after
+#   the current track ends if that comes first. Nothing playing or paused backs off exponentially up to
+#   'LOGGING_IDLE_MAX_S', and right after a macro we check back quickly to catch the playback it left us with.
+#   While waiting we long poll our proxy for playback events (see 'wait_for_playback_event'). A new track, context, or
+#   repeat toggle wakes us right up so macros fire immediately, and since our proxy serves playback from its own poller
+#   waking up early doesn't cost us any extra calls to spotify.
 #
 # For time based events such as monthly releases, nightly backups, or weekly reports we use the 'check_date_time' 
 #   function based upon the start time of our script. This does rely on cron and our shell script to start us within
@@ -24,56 +33,96 @@
 #   is done for a few reasons, the biggest being api response rate, database changes, and simplicity. These timed
 #   triggers usually happen very early in the morning when we aren't even using spotify so if it takes 10 mins to
 #   complete vs. 4 mins parallel it doesn't really affect us.
+#
+# Date triggers don't run inline, they are queued in our durable job queue ('JOB_QUEUE_DB', see 'Job_Queue.py') once
+#   per trigger time and run off of it by 'run_queued_jobs'. The job being run heartbeats its claim, so every other
+#   cron run just polls and moves on rather than starting a second job. If our runtime monitor (or anything else) kills
+#   us partway through, the claim goes stale after 'JOB_STALE_S' and the next run resumes the job from whatever
+#   checkpoint it last saved, up to 'JOB_MAX_ATTEMPTS' times. A job that hangs only heartbeats for 'JOB_MAX_RUNTIME_S',
+#   after that its claim is left to go stale (and our runtime monitor can exit) so it can't stall our queue for good.
+#
+# DAEMON MODE -
+# Running with '--daemon' swaps the cron-per-minute model for one resident process. We keep a single scheduler and a
+#   single warm SpotifyFeatures for polling alive for good, our poller runs on the main thread, and every date
+#   trigger in 'DATE_TRIGGERS' becomes a native cron trigger that just queues its job. Queueing is cheap so a trigger
+#   never misses its window behind a long job, the queue itself is run on a single worker so our jobs still run one
+#   after another, and on startup we resume whatever our last process left in the queue. SIGTERM/ SIGINT let whatever
+#   is running finish, including queued macros, before we exit.
 # ════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
+import inspect
 import os
+import signal
+import sys
 import threading
 import time
 
+from apscheduler.executors.pool        import ThreadPoolExecutor
 from apscheduler.schedulers.background import BackgroundScheduler
-from apscheduler.triggers.interval     import IntervalTrigger
+from apscheduler.triggers.combining    import OrTrigger
+from apscheduler.triggers.cron         import CronTrigger
 from datetime                          import datetime, timedelta
+from typing                            import Optional
 
 from src.features.Shuffle_Styles import ShuffleType
 from src.Spotify_Features        import SpotifyFeatures
+from src.helpers.Feature_Pool    import FeaturePool
+from src.helpers.Job_Queue       import JobQueue
 from src.helpers.Settings        import Settings
 
-threads = []
+# Workers are only started on our first macro, a run that never triggers one never spins any up.
+macro_pool = FeaturePool(SpotifyFeatures, num_workers=Settings.MACRO_WORKERS, max_queued=Settings.MACRO_QUEUE_SIZE)
+
+# Set while a job from our queue is running, its heartbeats already tell other runs it's alive so our runtime monitor
+#   leaves it be rather than killing it partway through (and burning one of its attempts). Only up to
+#   'JOB_MAX_RUNTIME_S' though, past that we treat the job as hung, see 'keep_job_alive'.
+job_running = threading.Event()
+
+# Every time based feature, (SpotifyFeatures method name, log file name, list of 'check_date_time' trigger kwargs). 
+#   Features that land on the same minute run in this order.
+DATE_TRIGGERS = [
+    # Backup Library - Run Every Day At 2 AM
+    ("backup_spotify_library", "Backup-Library.log", [dict(hour=2, minute=0)])
+    # Update 'Latest' Playlist - Run Every Day At 2 AM
+  , ("update_daily_latest_playlist", "Update-Latest-Playlist.log", [dict(hour=2, minute=0)])
+    # Weekly Report - Run Every Monday At 3 AM
+  , ("generate_weekly_report", "Weekly-Report.log", [dict(weekday=0, hour=3, minute=0)])
+    # Upload Library Backup To Google - Run Every Sunday and Wednesday At 2 AM
+  , ("upload_latest_backup_to_drive", "Drive-Upload.log", [dict(weekday=6, hour=2, minute=0)
+                                                          , dict(weekday=2, hour=2, minute=0)])
+    # Monthly Release - Run The 1st of Every Month At 1 AM
+  , ("generate_monthly_release", "Monthly-Release.log", [dict(day=1, hour=1, minute=0)])
+    # Archive Listening History - Run The 1st of Every Month At 4 AM
+  , ("archive_listening_history", "Archive-Listening-History.log", [dict(day=1, hour=4, minute=0)])
+    # Export Listening History - Run Every Day At 5 AM
+  , ("export_listening_history", "Export-Listening-History.log", [dict(hour=5, minute=0)])
+]
 
 """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
 DESCRIPTION: Monitor method that when run as a seperate thread will exit the program if it goes over our set time.
              This is very helpful if we are ever worried about our service hanging. This can automatically do cleanup.
+             We hold off while a queued job is running, see 'job_running'.
 INPUT: N/A
 OUTPUT: N/A
 """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
 def monitor_script_runtime():
     start_time = datetime.now()
     while True:
-        if datetime.now() - start_time > timedelta(minutes=Settings.MAX_RUNTIME_MINUTES):
+        if datetime.now() - start_time > timedelta(minutes=Settings.MAX_RUNTIME_MINUTES) and not job_running.is_set():
             print("Script has been running for too long. Exiting...")
             os._exit(1)
         time.sleep(60)
 
 
 """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
-DESCRIPTION: Spins up a new thread with a new SpotifyFeature object so our main loop can continue.
+DESCRIPTION: Hands 'method' off to our 'macro_pool' so our main loop can continue.
 INPUT: method - Func that we will be calling from SpotifyFeatures.
        args - List of args we are passing to 'method'.
        log_file_name - Log filename we want to use.
        kwargs - List of kwargs we are passing to 'method'.
-OUTPUT: N/A, it does however add the thread to the global 'threads'.
-"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
-def startup_feature_thread(method, *args, log_file_name="Default.log", run_parallel=True, **kwargs):
-    global threads
-    tmp_feature = SpotifyFeatures(log_file_name=log_file_name)
-    # Here we bind the method we passed in to our new class. Prevents us from unnecessarily creating new objects
-    bound_method = method.__get__(tmp_feature)
-    thread = threading.Thread(target=bound_method, args=args, kwargs=kwargs, daemon=True)
-    thread.start()
-
-    if run_parallel:
-        threads.append(thread)
-    else:
-        thread.join()
+OUTPUT: N/A
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def startup_feature_thread(method, *args, log_file_name="Default.log", **kwargs):
+    macro_pool.submit(method, *args, log_file_name=log_file_name, **kwargs)
     
 
 """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
@@ -99,22 +148,128 @@ def check_date_time(cur_time: datetime, day: int=None, weekday: int=None, hour:
         (daily_trigger or weekly_trigger or monthly_trigger)
 
 
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Builds the apscheduler cron trigger for the same timing args 'check_date_time' takes. Note that unlike
+             'check_date_time' passing both 'day' and 'weekday' requires both to match, none of our triggers do.
+INPUT: day - Day of the month we want to trigger on (1-31).
+       weekday - Day of the week we want to trigger on (0-6), monday is 0 for both python and apscheduler.
+       hour - Hour we want to trigger on (0-23).
+       minute - Minute we want to trigger on (0-59).
+OUTPUT: CronTrigger that fires on the given time.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def get_cron_trigger(day: int=None, weekday: int=None, hour: int=None, minute: int=None) -> CronTrigger:
+    return CronTrigger(day=day, day_of_week=weekday, hour=hour, minute=minute)
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Heartbeats our claim on a running job every 'JOB_HEARTBEAT_S' until it's done, meant to be run as its own
+             thread alongside the job. A job still going after 'JOB_MAX_RUNTIME_S' is treated as hung, we stop
+             heartbeating so its claim goes stale for the next run to take over, and clear 'job_running' so our
+             runtime monitor can exit.
+INPUT: job_queue - JobQueue the job was claimed from.
+       job_id - Id of the job we are running.
+       done_event - Event set once the job has finished.
+OUTPUT: N/A
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def keep_job_alive(job_queue: JobQueue, job_id: int, done_event: threading.Event) -> None:
+    deadline = time.monotonic() + Settings.JOB_MAX_RUNTIME_S
+    while not done_event.wait(Settings.JOB_HEARTBEAT_S):
+        if time.monotonic() > deadline:
+            job_queue.logger.error(f"Job {job_id} ran past {Settings.JOB_MAX_RUNTIME_S}s, no longer keeping it alive")
+            job_running.clear()
+            return
+        try:
+            job_queue.heartbeat(job_id)
+        except Exception:
+            job_queue.logger.exception(f"Failed to heartbeat job {job_id}")
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Runs every job in our queue one at a time until there are none left we can claim (or another process
+             already holds one). Each job gets a fresh SpotifyFeatures, and any feature that takes a 'checkpoint' is
+             handed the one saved for it so a resumed job picks up where it left off.
+INPUT: job_queue - JobQueue we run jobs from.
+       stop_event - Optional event that stops us from claiming any more jobs once set.
+OUTPUT: Number of jobs we ran.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def run_queued_jobs(job_queue: JobQueue, stop_event: threading.Event=None) -> int:
+    num_jobs = 0
+    while stop_event is None or not stop_event.is_set():
+        job = job_queue.claim_next(Settings.JOB_STALE_S, Settings.JOB_MAX_ATTEMPTS)
+        if job is None:
+            break
+        
+        done_event = threading.Event()
+        heartbeat_thread = threading.Thread(target=keep_job_alive, args=(job_queue, job['id'], done_event)
+                                            , daemon=True)
+        heartbeat_thread.start()
+        job_running.set()
+        try:
+            method = getattr(SpotifyFeatures(log_file_name=job['log_file_name']), job['name'])
+            kwargs = {}
+            if "checkpoint" in inspect.signature(method).parameters:
+                kwargs['checkpoint'] = job_queue.get_checkpoint(job)
+            method(**kwargs)
+            job_queue.complete(job['id'])
+        except Exception as error:
+            job_queue.logger.exception(f"Job {job['name']} ({job['run_key']}) failed on attempt {job['attempts']}")
+            job_queue.fail(job['id'], repr(error), Settings.JOB_MAX_ATTEMPTS)
+        finally:
+            job_running.clear()
+            done_event.set()
+            heartbeat_thread.join()
+        num_jobs += 1
+    return num_jobs
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Schedules a run of our queue on our scheduler's 'date_triggers' worker. It never misfires, however long
+             the job ahead of it runs. While one run is going at most one more waits behind it, that one claims
+             anything queued since so nothing is left behind.
+INPUT: scheduler - Scheduler we run our queue on.
+       job_queue - JobQueue we run jobs from.
+       stop_event - Optional event that stops us from claiming any more jobs once set.
+OUTPUT: N/A
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def schedule_queued_jobs(scheduler, job_queue: JobQueue, stop_event: threading.Event=None) -> None:
+    scheduler.add_job(run_queued_jobs, args=[job_queue, stop_event], id="run_queued_jobs", executor="date_triggers"
+                      , max_instances=2, misfire_grace_time=None, replace_existing=True)
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Queues up a date trigger's job for this trigger time and then schedules a run of our queue, used by our
+             scheduler in daemon mode.
+INPUT: job_queue - JobQueue we queue to and run from.
+       method_name - SpotifyFeatures method name the job runs.
+       log_file_name - Log filename the job's SpotifyFeatures logs to.
+       scheduler - Scheduler we run our queue on.
+       stop_event - Optional event that stops us from claiming any more jobs once set.
+OUTPUT: N/A
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def queue_date_trigger(job_queue: JobQueue, method_name: str, log_file_name: str, scheduler
+                       , stop_event: threading.Event=None) -> None:
+    job_queue.enqueue(method_name, log_file_name, run_key=datetime.now().strftime("%Y-%m-%d %H:%M"))
+    schedule_queued_jobs(scheduler, job_queue, stop_event)
+
+
 """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
 DESCRIPTION: Grabs current playback, triggers any macros based upon the playback by starting up a new SpotifyFeatures
              thread. Additionally, assuming no macro was triggered logs the track_id to our listening databases.
 INPUT: spotify_features - SpotifyFeatures object we will use to grab playback, and call the log playback to.
-OUTPUT: N/A
+OUTPUT: Tuple of the playback we grabbed (None if nothing is playing) and whether we triggered a macro off of it.
 """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
-def log_and_macro(spotify_features) -> None:
+def log_and_macro(spotify_features) -> tuple[dict, bool]:
     playback = spotify_features.get_playback_state()
+    macro_triggered = False
     
     if playback is None:
-        return
+        return playback, macro_triggered
     
     # Only Trigger Macros If We Are Playing A Playlist
     if playback['context'] is not None and playback['context']['type'] == "playlist":
         if playback['repeat_state'] != "off":
             spotify_features.set_repeat_state('off')
+            macro_triggered = True
             shuffle_type = ShuffleType.WEIGHTED if playback['shuffle_state'] else ShuffleType.RANDOM
             startup_feature_thread(SpotifyFeatures.shuffle_playlist
                                    , playback['context']['id']
@@ -124,27 +279,122 @@ def log_and_macro(spotify_features) -> None:
             match playback['track']['id']:
                 case Settings.GEN_ARTIST_MACRO_ID:
                     spotify_features.skip_track()
+                    macro_triggered = True
                     startup_feature_thread(SpotifyFeatures.generate_artist_playlist_from_playlist
                                            , playback['context']['id']
                                            , log_file_name="Generate-Artist-Playlist.log")
 
                 case Settings.DISTRIBUTE_TRACKS_MACRO_ID:
                     spotify_features.skip_track()
+                    macro_triggered = True
                     startup_feature_thread(SpotifyFeatures.distribute_tracks_to_collections
                                            , playback['context']['id']
                                            , log_file_name="Distribute-Tracks.log")
 
                 case Settings.ORGANIZE_PLAYLIST_MACRO_ID:
                     spotify_features.skip_track()
+                    macro_triggered = True
                     startup_feature_thread(SpotifyFeatures.organize_playlist_by_date
                                            , playback['context']['id']
                                            , log_file_name="Organize-Playlist.log")
 
     spotify_features.log_playback_to_db(playback)
-            
+    return playback, macro_triggered
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Decides how long to wait before our next playback poll based upon the playback we just grabbed.
+INPUT: playback - Playback we just grabbed from 'log_and_macro', None if nothing is playing.
+       macro_triggered - Whether that playback triggered a macro.
+       idle_polls - How many polls in a row before this one found nothing playing (or paused).
+OUTPUT: Seconds until we should poll again.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def get_next_poll_delay_s(playback: dict, macro_triggered: bool, idle_polls: int=0) -> float:
+    if macro_triggered:
+        return Settings.LOGGING_MACRO_S
+    
+    if playback is None or not playback['is_playing']:
+        return min(Settings.LOGGING_INTERVAL_S * 2 ** idle_polls, Settings.LOGGING_IDLE_MAX_S)
+    
+    duration_ms = playback['track'].get('duration_ms')
+    if playback.get('progress_ms') is None or not duration_ms:
+        return Settings.LOGGING_INTERVAL_S
+    
+    # Land our next poll just after this track wraps up if it does so before our normal interval
+    remaining_s = max(duration_ms - playback['progress_ms'], 0) / 1000
+    return min(remaining_s + Settings.LOGGING_TRACK_END_S, Settings.LOGGING_INTERVAL_S)
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Waits until 'wake_time' or until our proxy raises a playback event, whichever comes first. We long poll in
+             chunks of at most 'PROXY_EVENT_WAIT_S' so 'stop_event' is still checked along the way. If we can't get
+             events from our proxy we just wait out the rest of our time.
+INPUT: spotify_features - SpotifyFeatures object we wait on events with.
+       stop_event - Event that ends our wait as soon as we notice it is set.
+       wake_time - 'time.monotonic()' we wait until at the latest.
+       since_seq - Last event sequence number we've seen, None to only wait on new events.
+OUTPUT: Event sequence number to pick up from on our next wait.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def wait_for_playback_event(spotify_features, stop_event: threading.Event, wake_time: float
+                            , since_seq: Optional[int]=None) -> Optional[int]:
+    while not stop_event.is_set():
+        remaining_s = wake_time - time.monotonic()
+        if remaining_s <= 0:
+            break
+        try:
+            events = spotify_features.get_playback_events(since_seq=since_seq
+                                                          , timeout_s=min(remaining_s, Settings.PROXY_EVENT_WAIT_S))
+        except Exception:
+            spotify_features.logger.exception("Failed to wait on playback events")
+            stop_event.wait(max(wake_time - time.monotonic(), 0))
+            break
+        since_seq = events['seq']
+        if events['events']:
+            break
+    return since_seq
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Repeatedly runs 'log_and_macro', waiting 'get_next_poll_delay_s' between each poll until 'stop_event' is
+             set. A playback event from our proxy cuts our wait short, see 'wait_for_playback_event'. A failed poll is
+             logged and treated like nothing playing so a flaky api backs us off as well. Any buffered polls (see
+             'LOGGING_BUFFERED') are flushed once we stop.
+INPUT: spotify_features - SpotifyFeatures object we poll with, passed to 'log_and_macro'.
+       stop_event - Event that ends our polling as soon as it is set.
+       runtime_s - Optional window in seconds, we won't start a poll any later than this after our first one.
+OUTPUT: Number of polls we made.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def run_playback_poller(spotify_features, stop_event: threading.Event, runtime_s: float=None) -> int:
+    start_time = time.monotonic()
+    num_polls, idle_polls = 0, 0
+    event_seq = None
+    
+    while not stop_event.is_set():
+        poll_time = time.monotonic()
+        try:
+            playback, macro_triggered = log_and_macro(spotify_features)
+        except Exception:
+            spotify_features.logger.exception("Playback poll failed")
+            playback, macro_triggered = None, False
+        num_polls += 1
+        
+        delay_s = get_next_poll_delay_s(playback, macro_triggered, idle_polls)
+        idle_polls = idle_polls + 1 if playback is None or not playback['is_playing'] else 0
+        
+        next_poll_time = poll_time + delay_s
+        if runtime_s is not None and next_poll_time - start_time > runtime_s:
+            break
+        event_seq = wait_for_playback_event(spotify_features, stop_event, next_poll_time, event_seq)
+    
+    # Don't leave anything buffered behind, the next run would pick it up but our reports shouldn't have to
+    try:
+        spotify_features.flush_playback_log()
+    except Exception:
+        spotify_features.logger.exception("Failed to flush our playback log")
+    return num_polls
+
 
 def main():
-    global threads
     start_time = datetime.now()
     
     # Startup our monitor thread to make sure if anything hangs in our program we will exit 'eventually'
@@ -156,59 +406,73 @@ def main():
     # ════════════════════════════════════════════════════════════════════════════════════════════════════════════════
     # PERIODIC TRIGGERS ══════════════════════════════════════════════════════════════════════════════════════════════
     # ════════════════════════════════════════════════════════════════════════════════════════════════════════════════
-    # Setup log_and_macro to be run over the next 'LOGGING_RUNTIME_S' every 'LOGGING_RUNTIME_S'
-    scheduler = BackgroundScheduler()
-    scheduler.add_job(log_and_macro, IntervalTrigger(seconds=Settings.LOGGING_INTERVAL_S), args=[features], 
-                      next_run_time=datetime.now())
-    scheduler.start()
-    time.sleep(Settings.LOGGING_RUNTIME_S - Settings.LOGGING_INTERVAL_S)
-    # Even though we shutdown if a log_and_macro is still running it will continue to run until exit.
-    scheduler.shutdown()
+    # Poll our playback over this run, leaving the tail of 'LOGGING_RUNTIME_S' for the next cron run to pick up.
+    run_playback_poller(features, threading.Event()
+                        , runtime_s=Settings.LOGGING_RUNTIME_S - Settings.LOGGING_INTERVAL_S)
 
     # ════════════════════════════════════════════════════════════════════════════════════════════════════════════════
     # DATE TRIGGERS ══════════════════════════════════════════════════════════════════════════════════════════════════
     # ════════════════════════════════════════════════════════════════════════════════════════════════════════════════
-    # Backup Library - Run Every Day At 2 AM
-    if check_date_time(start_time, hour=2, minute=0):
-        startup_feature_thread(SpotifyFeatures.backup_spotify_library
-                               , log_file_name="Backup-Library.log"
-                               , run_parallel=False)
-    
-    # Update 'Latest' Playlist - Run Every Day At 2 AM
-    if check_date_time(start_time, hour=2, minute=0):
-        startup_feature_thread(SpotifyFeatures.update_daily_latest_playlist
-                               , log_file_name="Update-Latest-Playlist.log"
-                               , run_parallel=False)
-    
-    # Weekly Report - Run Every Monday At 3 AM
-    if check_date_time(start_time, weekday=0, hour=3, minute=0):
-        startup_feature_thread(SpotifyFeatures.generate_weekly_report
-                               , log_file_name="Weekly-Report.log"
-                               , run_parallel=False)
-    
-    # Upload Library Backup To Google - Run Every Sunday and Wednesday At 2 AM
-    if check_date_time(start_time, weekday=6, hour=2, minute=0) \
-            or check_date_time(start_time, weekday=2, hour=2, minute=0):
-        startup_feature_thread(SpotifyFeatures.upload_latest_backup_to_drive
-                               , log_file_name="Drive-Upload.log"
-                               , run_parallel=False)
-
-    # Monthly Release - Run The 1st of Every Month At 1 AM
-    if check_date_time(start_time, day=1, hour=1, minute=0):
-        startup_feature_thread(SpotifyFeatures.generate_monthly_release
-                               , log_file_name="Monthly-Release.log"
-                               , run_parallel=False)
+    job_queue = JobQueue(Settings.JOB_QUEUE_DB)
+    for method_name, log_file_name, triggers in DATE_TRIGGERS:
+        if any(check_date_time(start_time, **trigger) for trigger in triggers):
+            job_queue.enqueue(method_name, log_file_name, run_key=start_time.strftime("%Y-%m-%d %H:%M"))
+    # This also picks back up anything an earlier run left queued or was killed partway through
+    run_queued_jobs(job_queue)
     # ════════════════════════════════════════════════════════════════════════════════════════════════════════════════
     
-    # We want to wait for any threads we triggered in our playback macros to not cut them off early.
-    [thread.join() for thread in threads]
+    # We want to wait for any macros we triggered off our playback to not cut them off early.
+    macro_pool.join()
     
     # Small sleep just to make sure all threads have exited gracefully
     time.sleep(1)
 
 
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Resident alternative to 'main', runs our poller and every date trigger off of one scheduler until we get
+             a SIGTERM or SIGINT. See 'DAEMON MODE' above.
+INPUT: N/A
+OUTPUT: N/A
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def run_daemon() -> None:
+    stop_event = threading.Event()
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop_event.set())
+    signal.signal(signal.SIGINT, lambda signum, frame: stop_event.set())
+    
+    features = SpotifyFeatures(log_file_name="Playback.log")
+    job_queue = JobQueue(Settings.JOB_QUEUE_DB)
+    
+    scheduler = BackgroundScheduler()
+    # Our queue gets a single worker so jobs never run on top of each other, queueing gets its own so triggers due at
+    #   the same time are queued in 'DATE_TRIGGERS' order without ever waiting on a running job
+    scheduler.add_executor(ThreadPoolExecutor(max_workers=1), "date_triggers")
+    scheduler.add_executor(ThreadPoolExecutor(max_workers=1), "queue_date_triggers")
+    # Jobs due at the same time are handed out in job id order, so our ids keep 'DATE_TRIGGERS' order
+    for idx, (method_name, log_file_name, triggers) in enumerate(DATE_TRIGGERS):
+        scheduler.add_job(queue_date_trigger
+                          , OrTrigger([get_cron_trigger(**trigger) for trigger in triggers])
+                          , args=[job_queue, method_name, log_file_name, scheduler, stop_event]
+                          , id=f"{idx:02d}_{method_name}"
+                          , executor="queue_date_triggers"
+                          , coalesce=True
+                          , misfire_grace_time=Settings.DAEMON_MISFIRE_GRACE_S)
+    # Resume whatever our last process left behind in our queue right away
+    schedule_queued_jobs(scheduler, job_queue, stop_event)
+    scheduler.start()
+    
+    # Our poller keeps the main thread until we are signaled to stop
+    run_playback_poller(features, stop_event)
+    
+    # Let anything already running finish up, nothing new gets started
+    scheduler.shutdown(wait=True)
+    macro_pool.shutdown(wait=True)
+
+
 if __name__ == "__main__":
-    main()
+    if "--daemon" in sys.argv[1:]:
+        run_daemon()
+    else:
+        main()
 
 
 # FIN ════════════════════════════════════════════════════════════════════════════════════════════════════════════════
\ No newline at end of file
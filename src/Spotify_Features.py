@@ -25,6 +25,8 @@
 #  DATA BACKUP ═══════════════════════════════════════════════════════════════════════════════════════════════════════
 #   Spotify Library Backup                      - reference Backup_Spotify_Data.py
 #   Log Playback To Databases                   - reference Log_Playback.py
+#   Archive Old Listening History               - reference archive_listening_history()
+#   Export Listening History For Analytics      - reference Listening_Analytics.py
 # 
 #  PLAYBACK MODIFIERS ════════════════════════════════════════════════════════════════════════════════════════════════
 #   Shuffle Playlist                            - reference Shuffle_Styles.py
@@ -42,7 +44,11 @@
 #   Upload Latest Backup To Google Drive        - reference upload_latest_backup_to_drive()
 #   Generate List Of Most Unfollowed Artist     - reference Misc_Features.py generate_featured_artists_list()
 # 
+#
+# Only the features our per-minute playback path needs are imported up front. The rest (matplotlib, pydrive, numpy
+#   behind them) are pulled in on first use via 'LAZY_FEATURES' so a cold start of 'Implementations.py' stays cheap.
 # ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
+import importlib
 import logging
 import os
 
@@ -55,13 +61,39 @@ from src.helpers.Settings         import Settings
 from src.helpers.Database_Helpers import DatabaseHelpers, get_table_fields
 
 # FEATURES
-from src.features.Misc_Features         import MiscFeatures
-from src.features.Backup_Spotify_Data   import BackupSpotifyData
-from src.features.Google_Drive_Uploader import DriveUploader
-from src.features.Log_Playback          import LogPlayback
-from src.features.Sanity_Tests          import SanityTest
-from src.features.Shuffle_Styles        import Shuffler, ShuffleType
-from src.features.Weekly_Report         import WeeklyReport
+from src.features.Misc_Features  import MiscFeatures
+from src.features.Log_Playback   import LogPlayback
+from src.features.Shuffle_Styles import Shuffler, ShuffleType
+
+# Feature class name -> module it lives in, imported the first time the feature is used.
+LAZY_FEATURES = {
+    "BackupSpotifyData":  "src.features.Backup_Spotify_Data"
+  , "DriveUploader":      "src.features.Google_Drive_Uploader"
+  , "ListeningAnalytics": "src.features.Listening_Analytics"
+  , "SanityTest":         "src.features.Sanity_Tests"
+  , "WeeklyReport":       "src.features.Weekly_Report"
+}
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Module level attribute fallback (PEP 562). Imports a 'LAZY_FEATURES' class on first access and caches it
+             as a regular module attribute so any later lookups (and mock patches) never come back through here.
+INPUT: name - Attribute name being looked up on this module.
+OUTPUT: The requested feature class.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def __getattr__(name: str):
+    if name not in LAZY_FEATURES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    feature = getattr(importlib.import_module(LAZY_FEATURES[name]), name)
+    globals()[name] = feature
+    return feature
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Grabs a feature class from this module, importing it if it hasn't been loaded yet.
+INPUT: name - Class name of the feature, a key of 'LAZY_FEATURES'.
+OUTPUT: The requested feature class.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def load_feature(name: str):
+    return globals()[name] if name in globals() else __getattr__(name)
 
 """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
 DESCRIPTION: Collection of all of our Spotify API features. Handles and abstracts our GSH object.
@@ -70,7 +102,7 @@ class SpotifyFeatures(LogAllMethods):
 
     def __init__(self, log_file_name: str="default.log", log_mode: str='a', log_level=logging.INFO) -> None:
         self.logger = get_file_logger(f'logs/{log_file_name}', log_level=log_level, mode=log_mode)
-        self.spotify = gsh.GeneralSpotifyHelpers(logger=self.logger)
+        self.spotify = gsh.GeneralSpotifyHelpers(logger=self.logger, album_cache_db=Settings.ALBUM_CACHE_DB)
         self.mfeatures = MiscFeatures(self.spotify, logger=self.logger)
         
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
@@ -96,11 +128,11 @@ class SpotifyFeatures(LogAllMethods):
         
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
     DESCRIPTION: Creates a new playlist with all released tracks from the last month from all of the user's artists.
-    INPUT: N/A
+    INPUT: checkpoint - Optional JobCheckpoint our release saves its progress to (see 'Job_Queue.py').
     OUTPUT: N/A
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
     @gsh.scopes(["user-follow-read"])
-    def generate_monthly_release(self) -> None:
+    def generate_monthly_release(self, checkpoint=None) -> None:
         last_month = datetime.today().replace(day=1) - timedelta(days=1)
         self.mfeatures.generate_artist_release(
             [artist['id'] for artist in sorted(self.spotify.get_user_artists(info=['id', 'name'])
@@ -108,7 +140,8 @@ class SpotifyFeatures(LogAllMethods):
             , f"Release Radar: {last_month.strftime("%m-%Y")}"
             , f"Releases From All Followed Artists From The Month {last_month.strftime("%m-%Y")}"
             , start_date=datetime(last_month.year, last_month.month, 1)
-            , end_date=datetime(last_month.year, last_month.month, 1).replace(day=last_month.day))
+            , end_date=datetime(last_month.year, last_month.month, 1).replace(day=last_month.day)
+            , checkpoint=checkpoint)
         
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
     DESCRIPTION: Creates a new playlist with all released tracks within given date range for all given artists.
@@ -132,7 +165,7 @@ class SpotifyFeatures(LogAllMethods):
     OUTPUT: N/A
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
     def backup_spotify_library(self) -> None:
-        BackupSpotifyData(self.spotify, logger=self.logger).backup_data()
+        load_feature("BackupSpotifyData")(self.spotify, logger=self.logger).backup_data()
 
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
     DESCRIPTION: Log the given track_id as a listened track to our listening and track_count db's.
@@ -150,6 +183,58 @@ class SpotifyFeatures(LogAllMethods):
             inc_tcdb = not any([artist for artist in dbh.get_user_followed_artists() 
                                 if playlist_name is not None and artist['name'] == playlist_name[2:]])
         LogPlayback(logger=self.logger).log_track(playback, inc_tcdb)
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Flushes any buffered playback polls into our vault, ie when our poller is shutting down.
+    INPUT: N/A
+    OUTPUT: N/A
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def flush_playback_log(self) -> None:
+        LogPlayback(logger=self.logger).flush_playback_log()
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Flushes our playback log at the start of a job that reads our listening data so it sees every poll.
+                 A failed flush shouldn't cost us the job, it just runs without our latest polls.
+    INPUT: N/A
+    OUTPUT: N/A
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def _flush_playback_log_for_reads(self) -> None:
+        try:
+            self.flush_playback_log()
+        except Exception:
+            self.logger.exception("Failed to flush our playback log, reading without it")
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Drops anything we only cache for a single run, our FeaturePool calls this before every job it runs
+                 on a warm object.
+    INPUT: N/A
+    OUTPUT: N/A
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def clear_run_caches(self) -> None:
+        self.spotify.clear_search_cache()
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Moves every month of listening sessions older than our 'hot' window out of our vault into their own
+                 archive dbs. Stats and date range queries still see the archived history.
+    INPUT: N/A
+    OUTPUT: N/A
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def archive_listening_history(self) -> None:
+        cutoff = datetime.today().replace(day=1)
+        for _ in range(Settings.LISTENING_HOT_MONTHS):
+            cutoff = (cutoff - timedelta(days=1)).replace(day=1)
+        self._flush_playback_log_for_reads()
+        DatabaseHelpers(Settings.LISTENING_VAULT_DB, logger=self.logger) \
+            .archive_listening_sessions(Settings.LISTENING_ARCHIVE_LOCATION, cutoff)
+        
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Refreshes our columnar export of the full listening history used for analytics.
+    INPUT: N/A
+    OUTPUT: N/A
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def export_listening_history(self) -> None:
+        self._flush_playback_log_for_reads()
+        load_feature("ListeningAnalytics")(logger=self.logger).export_listening_history()
         
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
     DESCRIPTION: Creates our shuffle feature and passes in our logger, spotify, and shuffle type.
@@ -158,6 +243,7 @@ class SpotifyFeatures(LogAllMethods):
     OUTPUT: N/A
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
     def shuffle_playlist(self, playlist_id: str, shuffle_type: ShuffleType) -> None:
+        self._flush_playback_log_for_reads()
         Shuffler(self.spotify, logger=self.logger).shuffle(playlist_id, shuffle_type)
 
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
@@ -169,8 +255,8 @@ class SpotifyFeatures(LogAllMethods):
         self.mfeatures.distribute_tracks_to_collections_from_playlist(playlist_id)
 
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
-    DESCRIPTION: Organizes tracks in a playlist by release date and track #. Adds the tracks back to the playlist.
-                 NO DELETION OCCURS
+    DESCRIPTION: Organizes tracks in a playlist by release date and track #. Moves the tracks in place or adds them 
+                 back to the playlist ('ORGANIZE_PLAYLIST_IN_PLACE'). NO DELETION OCCURS
     INPUT: playlist_id - Id of playlist we will 'organize'.
     OUTPUT: N/A
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
@@ -188,6 +274,16 @@ class SpotifyFeatures(LogAllMethods):
                            , artist_info: list[str]=get_table_fields('artists')) -> dict:
         return self.spotify.get_playback_state(track_info=track_info, album_info=album_info, artist_info=artist_info)
     
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Waits on our proxy for any change to our playback, see 'get_playback_events()' in GSH.
+    INPUT: since_seq - Last event sequence number we've seen, None to only wait on new events.
+           timeout_s - How long we're willing to wait.
+    OUTPUT: Dict of 'events' since 'since_seq' and the 'seq' to wait on next.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    @gsh.scopes(["user-read-playback-state"])
+    def get_playback_events(self, since_seq: Optional[int]=None, timeout_s: float=0) -> dict:
+        return self.spotify.get_playback_events(since_seq=since_seq, timeout_s=timeout_s)
+    
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
     DESCRIPTION: Updates our "latest" playlist with the "latest" tracks in our main playlist. 
                  NOTE THIS DELETES THE "latest" PLAYLIST CONTENTS.
@@ -221,8 +317,9 @@ class SpotifyFeatures(LogAllMethods):
     OUTPUT: N/A
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
     def generate_weekly_report(self) -> None:
-        sanity_tester = SanityTest(logger=self.logger)
-        WeeklyReport(sanity_tester, logger=self.logger).gen_weekly_report()
+        self._flush_playback_log_for_reads()
+        sanity_tester = load_feature("SanityTest")(logger=self.logger)
+        load_feature("WeeklyReport")(sanity_tester, logger=self.logger).gen_weekly_report()
         
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
     DESCRIPTION: Runs various santiy checks against the user's collection to verify nothing has been mismanaged.
@@ -230,13 +327,10 @@ class SpotifyFeatures(LogAllMethods):
     OUTPUT: N/A
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
     def run_sanity_checks(self) -> None:
-        sanity_tester = SanityTest(logger=self.logger)
+        sanity_tester = load_feature("SanityTest")(logger=self.logger)
         self.logger.info("SANITY TESTS ==========================================================")
-        self.logger.info(f"Diffs In Major Playlist Sets {sanity_tester.sanity_diffs_in_major_playlist_sets()}")
-        self.logger.info(f"In Progress Artists {sanity_tester.sanity_in_progress_artists()}")
-        self.logger.info(f"Duplicates {sanity_tester.sanity_duplicates()}")
-        self.logger.info(f"Artist Integrity {sanity_tester.sanity_artist_playlist_integrity()}")
-        self.logger.info(f"Contributing Artist Check {sanity_tester.sanity_contributing_artists()}")
+        for check in sanity_tester.run_checks():
+            self.logger.info(f"{check['name']} ({check['duration_s']:.3f}s) {check['results']}")
         
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
     DESCRIPTION: Uploads the latest backup of our Spotify library to Google Drive.
@@ -245,7 +339,7 @@ class SpotifyFeatures(LogAllMethods):
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
     def upload_latest_backup_to_drive(self) -> None:
         latest_backup = max(glob(f"{Settings.BACKUPS_LOCATION}*"), key=os.path.getmtime)
-        DriveUploader(logger=self.logger).upload_file(latest_backup)
+        load_feature("DriveUploader")(logger=self.logger).upload_file(latest_backup)
 
 
 # FIN ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
\ No newline at end of file
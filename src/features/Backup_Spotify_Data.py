@@ -42,6 +42,7 @@ class BackupSpotifyData(LogAllMethods):
         
         with self.vault_db.connect_db() as db_conn:
             db_conn.execute("DELETE FROM playlists_tracks;")
+            db_conn.execute("DELETE FROM playlist_snapshots;")
             db_conn.execute("DELETE FROM playlists;")
             db_conn.execute("DELETE FROM followed_artists;")
     
@@ -86,19 +87,23 @@ class BackupSpotifyData(LogAllMethods):
             self._insert_into_databases(table, values)
     
     """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
-    DESCRIPTION: Adds all user playlists into our database.
+    DESCRIPTION: Adds all user playlists into our database. Each playlist's snapshot id only goes into our vault once
+                 its tracks are in, so our sanity checks can trust it to tell them if the tracks changed.
     INPUT: N/A
     Output: N/A
     """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
     @gsh.scopes(["playlist-read-private"])
     def _add_user_playlists_to_db(self) -> None:
-        user_playlists = self.spotify.get_user_playlists(info=get_table_fields('playlists'))
+        user_playlists = self.spotify.get_user_playlists(info=get_table_fields('playlists') + ['snapshot_id'])
         self.logger.info(f"\t Inserting {len(user_playlists)} Playlists")
-        self._insert_into_databases("playlists", user_playlists)
+        self._insert_into_databases("playlists", [{field: playlist[field] for field in get_table_fields('playlists')}
+                                                  for playlist in user_playlists])
         
         for playlist in user_playlists:
             self.logger.debug(f"\t Saving Data For Playlist: {playlist['name']}")
             self._insert_tracks_into_db_from_playlist(playlist['id'])
+            if playlist['snapshot_id'] is not None:
+                self.vault_db.insert_many("playlist_snapshots", [(playlist['id'], playlist['snapshot_id'])])
 
         self.logger.info(f"\t Inserted {self.snapshot_db.get_table_size('tracks')} Tracks")
     
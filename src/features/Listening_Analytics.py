@@ -0,0 +1,259 @@
+# ╔════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦════╗
+# ║  ╔═╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═╗  ║
+# ╠══╣                                                                                                             ╠══╣
+# ║  ║    LISTENING ANALYTICS                      CREATED: 2025-06-02          https://github.com/jacobleazott    ║  ║
+# ║══║                                                                                                             ║══║
+# ║  ╚═╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═╝  ║
+# ╚════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩════╝
+# ════════════════════════════════════════════════════ DESCRIPTION ════════════════════════════════════════════════════
+# Columnar export of our entire listening history (vault + archives) for fast analytics over years of data.
+#
+# The export is a directory of NumPy '.npy' files, one per column, that we memory map back in on read. Sessions are
+#   sorted by time and store integer codes into the track dimension, tracks then point into the artist and album
+#   dimensions. Track -> artist is many to many so it's stored CSR style ('track_artist_offsets' slices into
+#   'track_artists' for each track code). Plays from 'listening_plays' are kept alongside, sorted by when they started,
+#   with how long we actually listened for.
+#
+#  export_listening_history - Rewrites the export from our vault, this is a full refresh and is atomic to readers.
+#
+#  get_top_artists - Artists ordered by number of listening sessions in a date range.
+#
+#  get_hours_per_weekday - Hours of listening (from our plays) for each day of the week in a date range.
+#
+#  get_listening_streaks - Longest and current run of consecutive days we listened to something.
+# ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
+import os
+import shutil
+
+import numpy as np
+
+from datetime import date, datetime, timedelta
+
+from src.helpers.decorators       import *
+from src.helpers.Settings         import Settings
+from src.helpers.Database_Helpers import DatabaseHelpers
+
+# Every column in our export, each one is saved as '<column>.npy'.
+SESSION_COLUMNS = ["time", "day", "track"]
+PLAY_COLUMNS    = ["play_start", "play_day", "play_ms"]
+TRACK_COLUMNS   = ["track_id", "track_name", "track_duration_ms", "track_album", "track_artist_offsets", "track_artists"]
+ARTIST_COLUMNS  = ["artist_id", "artist_name"]
+ALBUM_COLUMNS   = ["album_id", "album_name", "album_release_date"]
+EXPORT_COLUMNS  = SESSION_COLUMNS + PLAY_COLUMNS + TRACK_COLUMNS + ARTIST_COLUMNS + ALBUM_COLUMNS
+
+WEEKDAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+# 'day' is the local calendar day as a count of days since 1970-01-01 (a Thursday).
+EPOCH_DATE = date(1970, 1, 1)
+EPOCH_WEEKDAY = EPOCH_DATE.weekday()
+
+SESSIONS_QUERY = """
+    SELECT time
+         , CAST(strftime('%s', time, 'unixepoch', 'localtime') AS INTEGER) / 86400 AS day
+         , IFNULL(id_track, '') AS id_track
+    FROM {schema}.listening_sessions
+"""
+
+# Plays are never archived, they all live in our vault.
+PLAYS_QUERY = """
+    SELECT start_time
+         , CAST(strftime('%s', start_time, 'unixepoch', 'localtime') AS INTEGER) / 86400 AS day
+         , ms_played
+    FROM listening_plays
+    WHERE ms_played > 0
+"""
+
+class ListeningAnalytics(LogAllMethods):
+
+    def __init__(self, logger=None):
+        self.logger = logger if logger is not None else logging.getLogger()
+        self.vault_db = DatabaseHelpers(Settings.LISTENING_VAULT_DB, logger=self.logger)
+        self.export_location = Settings.LISTENING_EXPORT_LOCATION
+        self._columns = None
+
+    # ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
+    # Export ══════════════════════════════════════════════════════════════════════════════════════════════════════════
+    # ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
+
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Rewrites our columnar export from every listening session in our vault and its archives. The new
+                 export is written next to the old one and swapped in so readers never see a partial export.
+    INPUT: N/A
+    OUTPUT: N/A
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def export_listening_history(self) -> None:
+        columns = self._build_columns()
+
+        export_path = self.export_location.rstrip("/")
+        tmp_path, old_path = f"{export_path}.tmp", f"{export_path}.old"
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        os.makedirs(tmp_path)
+        for name in EXPORT_COLUMNS:
+            np.save(os.path.join(tmp_path, f"{name}.npy"), columns[name])
+
+        if os.path.isdir(export_path):
+            os.replace(export_path, old_path)
+        os.replace(tmp_path, export_path)
+        shutil.rmtree(old_path, ignore_errors=True)
+
+        self._columns = None
+        self.logger.info(f"Exported {len(columns['time'])} listening sessions to '{export_path}'")
+
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Reads our sessions, plays, and their dimensions out of the vault and integer codes them into columns.
+    INPUT: N/A
+    OUTPUT: Dict of column name to numpy array for every column in 'EXPORT_COLUMNS'.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def _build_columns(self) -> dict[str, np.ndarray]:
+        session_rows = []
+        # Archives are read one at a time, we can have more of them than sqlite lets us attach at once.
+        sources = [("main", {})] + [("archive", {"archive": archive['path']})
+                                    for archive in self.vault_db.get_listening_archives()]
+        for schema, attachments in sources:
+            with self.vault_db.connect_db_readonly(attachments) as db_conn:
+                session_rows += db_conn.execute(SESSIONS_QUERY.format(schema=schema)).fetchall()
+
+        with self.vault_db.connect_db_readonly() as db_conn:
+            play_rows = db_conn.execute(PLAYS_QUERY).fetchall()
+            tracks = db_conn.execute("SELECT id, name, duration_ms FROM tracks").fetchall()
+            artists = db_conn.execute("SELECT id, name FROM artists").fetchall()
+            albums = db_conn.execute("SELECT id, name, release_date FROM albums").fetchall()
+            tracks_artists = db_conn.execute("SELECT id_track, id_artist FROM tracks_artists").fetchall()
+            tracks_albums = db_conn.execute("SELECT id_track, MIN(id_album) FROM tracks_albums "
+                                            "GROUP BY id_track").fetchall()
+
+        times, days, session_tracks = (list(col) for col in zip(*session_rows)) if session_rows else ([], [], [])
+        order = np.argsort(np.array(times, dtype=np.int64), kind="stable")
+        play_starts, play_days, play_ms = (list(col) for col in zip(*play_rows)) if play_rows else ([], [], [])
+        play_order = np.argsort(np.array(play_starts, dtype=np.int64), kind="stable")
+
+        # Dimensions are sorted by id so we can code any id column with a single 'searchsorted'.
+        track_ids = np.unique(np.array([row[0] for row in tracks] + [row[0] for row in tracks_artists]
+                                       + [row[0] for row in tracks_albums] + session_tracks, dtype=str))
+        artist_ids = np.unique(np.array([row[0] for row in artists] + [row[1] for row in tracks_artists], dtype=str))
+        album_ids = np.unique(np.array([row[0] for row in albums] + [row[1] for row in tracks_albums], dtype=str))
+
+        track_info = {row[0]: row[1:] for row in tracks}
+        artist_info = {row[0]: row[1:] for row in artists}
+        album_info = {row[0]: row[1:] for row in albums}
+
+        ta_tracks = np.searchsorted(track_ids, np.array([row[0] for row in tracks_artists], dtype=str))
+        ta_artists = np.searchsorted(artist_ids, np.array([row[1] for row in tracks_artists], dtype=str))
+        ta_order = np.lexsort((ta_artists, ta_tracks))
+
+        track_album = np.full(len(track_ids), -1, dtype=np.int32)
+        track_album[np.searchsorted(track_ids, np.array([row[0] for row in tracks_albums], dtype=str))] = \
+            np.searchsorted(album_ids, np.array([row[1] for row in tracks_albums], dtype=str))
+
+        return {
+            "time": np.array(times, dtype=np.int64)[order]
+          , "day": np.array(days, dtype=np.int32)[order]
+          , "track": np.searchsorted(track_ids, np.array(session_tracks, dtype=str)).astype(np.int32)[order]
+          , "play_start": np.array(play_starts, dtype=np.int64)[play_order]
+          , "play_day": np.array(play_days, dtype=np.int32)[play_order]
+          , "play_ms": np.array(play_ms, dtype=np.int64)[play_order]
+          , "track_id": track_ids
+          , "track_name": np.array([track_info.get(id, ("", 0))[0] or "" for id in track_ids], dtype=str)
+          , "track_duration_ms": np.array([track_info.get(id, ("", 0))[1] or 0 for id in track_ids], dtype=np.int64)
+          , "track_album": track_album
+          , "track_artist_offsets": np.concatenate(([0], np.cumsum(np.bincount(ta_tracks, minlength=len(track_ids)))))
+          , "track_artists": ta_artists[ta_order].astype(np.int32)
+          , "artist_id": artist_ids
+          , "artist_name": np.array([artist_info.get(id, ("",))[0] or "" for id in artist_ids], dtype=str)
+          , "album_id": album_ids
+          , "album_name": np.array([album_info.get(id, ("", ""))[0] or "" for id in album_ids], dtype=str)
+          , "album_release_date": np.array([album_info.get(id, ("", ""))[1] or "" for id in album_ids], dtype=str)
+        }
+
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Memory maps every column of our export, only done once per instance (or after a new export).
+    INPUT: N/A
+    OUTPUT: Dict of column name to (readonly) numpy array.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def _load_columns(self) -> dict[str, np.ndarray]:
+        if self._columns is None:
+            export_path = self.export_location.rstrip("/")
+            if not os.path.isdir(export_path):
+                raise Exception(f"No listening export at '{export_path}', run 'export_listening_history' first")
+            self._columns = {name: np.load(os.path.join(export_path, f"{name}.npy"), mmap_mode='r')
+                             for name in EXPORT_COLUMNS}
+        return self._columns
+
+    # ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
+    # Statistics ══════════════════════════════════════════════════════════════════════════════════════════════════════
+    # ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
+
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Finds the slice of our (time sorted) sessions that fall inside a date range.
+    INPUT: start_date - Start of date range.
+           end_date - End of date range (inclusive).
+           times_column - Time sorted column we slice on, 'play_start' slices our plays instead.
+    OUTPUT: Slice into our session (or play) columns.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def _session_slice(self, start_date: datetime, end_date: datetime, times_column: str='time') -> slice:
+        times = self._load_columns()[times_column]
+        return slice(np.searchsorted(times, int(start_date.timestamp()), side='left')
+                   , np.searchsorted(times, int(end_date.timestamp()), side='right'))
+
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Grabs the artists we listened to the most in a date range. A session counts towards every artist on
+                 the track, ties are broken by artist name.
+    INPUT: start_date - Start of date range.
+           end_date - End of date range (inclusive).
+           num_artists - Max number of artists to return.
+    OUTPUT: List of artist dicts ('id', 'name', 'listen_count') sorted by 'listen_count' descending.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def get_top_artists(self, start_date: datetime, end_date: datetime, num_artists: int=5) -> list[dict]:
+        columns = self._load_columns()
+        track_counts = np.bincount(columns['track'][self._session_slice(start_date, end_date)]
+                                 , minlength=len(columns['track_id']))
+        artist_counts = np.bincount(columns['track_artists']
+                                  , weights=np.repeat(track_counts, np.diff(columns['track_artist_offsets']))
+                                  , minlength=len(columns['artist_id'])).astype(np.int64)
+
+        order = np.lexsort((columns['artist_name'], -artist_counts))
+        order = order[artist_counts[order] > 0][:num_artists]
+        return [{'id': str(columns['artist_id'][idx])
+               , 'name': str(columns['artist_name'][idx])
+               , 'listen_count': int(artist_counts[idx])} for idx in order]
+
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Totals up how many hours we listened on each day of the week in a date range from how long we actually
+                 played each track, a play counts towards the day (and date range) it started in.
+    INPUT: start_date - Start of date range.
+           end_date - End of date range (inclusive).
+    OUTPUT: Dict of weekday name ('Monday' -> 'Sunday') to hours listened.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def get_hours_per_weekday(self, start_date: datetime, end_date: datetime) -> dict[str, float]:
+        columns = self._load_columns()
+        plays = self._session_slice(start_date, end_date, times_column='play_start')
+        weekday_ms = np.bincount((columns['play_day'][plays] + EPOCH_WEEKDAY) % 7, weights=columns['play_ms'][plays]
+                                 , minlength=7)
+        return {weekday: float(weekday_ms[idx] / 3_600_000) for idx, weekday in enumerate(WEEKDAYS)}
+
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Finds our longest run of consecutive days listening to music and the run we are currently on. The
+                 current streak is still alive if we haven't listened yet today but did yesterday.
+    INPUT: min_sessions - Number of listening sessions a day needs to count towards a streak.
+    OUTPUT: Dict of 'longest_streak' (days), 'longest_streak_start' (datetime or None), 'current_streak' (days).
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def get_listening_streaks(self, min_sessions: int=1) -> dict:
+        days, day_counts = np.unique(self._load_columns()['day'], return_counts=True)
+        days = days[day_counts >= min_sessions]
+        if len(days) == 0:
+            return {'longest_streak': 0, 'longest_streak_start': None, 'current_streak': 0}
+
+        run_starts = np.concatenate(([0], np.flatnonzero(np.diff(days) != 1) + 1))
+        run_lengths = np.diff(np.concatenate((run_starts, [len(days)])))
+        longest = np.argmax(run_lengths)
+
+        today = (datetime.now().date() - EPOCH_DATE).days
+        return {
+            'longest_streak': int(run_lengths[longest])
+          , 'longest_streak_start': datetime.combine(EPOCH_DATE + timedelta(days=int(days[run_starts[longest]]))
+                                                   , datetime.min.time())
+          , 'current_streak': int(run_lengths[-1]) if days[-1] >= today - 1 else 0
+        }
+
+
+# FIN ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
@@ -10,14 +10,27 @@
 #   update 'track_counts.db' with "listened" songs. The 'listening_db' is great for calculating listening time, and 
 #   always having a clear log of all of our listening if we ever want to do something with it. The 'track_counts.db' 
 #   technically could always be recreated but it's just easier to build it as we go. The idea of this db is to hold how
-#   many times we have listened to a given track. For my implementation "listening" counts as having the same song
-#   being passed in back to back calls to this function. (To save this data between script runs we store it in a pickle
-#   file). This might one day be improved to include a timestamp in the pickle file so it's not dependent on frequency
-#   of calls. However, right now we query ever 15s so we count a track as listened if we've listened to 16-30s of it.
+#   many times we have listened to a given track. A track counts as "listened" once its play (see below) reaches
+#   'PLAY_COUNT_MIN_MS' of actual listening, counted in the same transaction as the poll itself so it doesn't depend on
+#   how often we poll.
 #   This gives us an ability to immediately skip songs and not worry about it counting against us in later features.
+#
+# Listening time itself comes from 'listening_plays' rather than counting sessions. Every poll (paused included) hands
+#   our playback's 'progress_ms' over to 'log_listening_play' which keeps a start, end, and ms played for each play of
+#   a track. That way our stats are exact no matter how often, or how regularly, we happen to poll.
+#
+# Each poll is a single transaction on a single connection (see 'log_playback()' in our DatabaseHelpers). The track,
+#   album, and artist rows for a track are only written the first time we see it, after that 'logged_track_ids' lets us
+#   skip them so the common case of a poll is just our play and session.
+#
+# With 'LOGGING_BUFFERED' even that transaction is put off. Polls are appended to a playback log next to our vault and
+#   only flushed into it every 'LOGGING_FLUSH_INTERVAL_S' (and once our poller stops). Jobs reading our listening data
+#   (reports, exports, shuffles) flush our log before they start so they never miss a poll, our reads themselves never
+#   write. A log left behind by a crash is simply flushed next time.
 # ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
 import logging
-import pickle
+
+from datetime import datetime
 
 from src.helpers.Database_Helpers   import DatabaseHelpers, build_entries_from_tracks
 from src.helpers.decorators         import *
@@ -27,56 +40,57 @@ from src.helpers.Settings           import Settings
 DESCRIPTION: Populates our listening_connection and track_count. Note that this class does not require a GSH object 
                 as there is no spotify api call necessary.
 """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
-class LogPlayback(LogAllMethods):        
+class LogPlayback(LogAllMethods):
+    # Shared across instances and keyed by vault path, we get a new LogPlayback every poll but only want to build (and
+    #   schema check) our vault's DatabaseHelpers once per process, and only skip entries that vault already has.
+    vault_dbs = {}
+    logged_track_ids = {}
+    # Epoch seconds of our last flush of a buffered playback log. We count from our process starting, so every cron
+    #   run doesn't flush on its first poll, anything a run leaves behind is flushed once our poller stops anyway.
+    last_flush_time = int(datetime.now().timestamp())
+    
     def __init__(self, logger: logging.Logger=None) -> None:
         self.logger = logger if logger is not None else logging.getLogger()
-        self.vault_db = DatabaseHelpers(Settings.LISTENING_VAULT_DB, logger=self.logger)
+        if Settings.LISTENING_VAULT_DB not in LogPlayback.vault_dbs:
+            LogPlayback.vault_dbs[Settings.LISTENING_VAULT_DB] = DatabaseHelpers(Settings.LISTENING_VAULT_DB
+                                                                                 , logger=self.logger)
+        self.vault_db = LogPlayback.vault_dbs[Settings.LISTENING_VAULT_DB]
+        self.logged_track_ids = LogPlayback.logged_track_ids.setdefault(Settings.LISTENING_VAULT_DB, set())
         self.track = {}
 
     """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
-    DESCRIPTION: Reads our pickle file to determine if we have listened to the track for at least 30s and updates as
-                 necessary.
-    INPUT: N/A
-    OUTPUT: N/A
-    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
-    def update_last_track_count(self) -> None:
-        try:
-            with open(Settings.LAST_TRACK_PICKLE, 'rb') as fi:
-                last_track_pickle = pickle.load(fi)
-        except (EOFError, FileNotFoundError):
-            last_track_pickle = "", False
-
-        if last_track_pickle is None or last_track_pickle[0] != self.track['id']:
-            with open(Settings.LAST_TRACK_PICKLE, 'wb') as fi:
-                pickle.dump((self.track['id'], True), fi)
-        elif last_track_pickle[1]:
-            with open(Settings.LAST_TRACK_PICKLE, 'wb') as fi:
-                pickle.dump((self.track['id'], False), fi)
-            self.vault_db.increment_track_count(self.track['id'])
-    
-    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
-    DESCRIPTION: Logs the current playing track into our listening.db.
+    DESCRIPTION: Logs our current playback into our vault, its play time always and a listening session if playing.
     INPUT: playback - Dictionary of current playback, see 'get_playback_state()' in GSH.
            inc_track_count - Whether we should increment our track_count database.
     OUTPUT: N/A
     """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
     def log_track(self, playback: dict, inc_track_count: bool) -> None:
-        if playback is None \
-            or playback['is_playing'] == False \
-            or playback['track']['id'] in Settings.MACRO_LIST:
+        if playback is None or playback['track']['id'] in Settings.MACRO_LIST:
             return
         
         self.track = playback['track']
         self.track['id'] = self.track['id'] if self.track['id'] is not None else f"local_track_{self.track['name']}"
-        entries = build_entries_from_tracks([self.track])
-        
-        for table, values in entries.items():
-            self.vault_db.insert_many(table, values)
-
-        self.vault_db.add_listening_session(self.track['id'])
+        entries = {} if self.track['id'] in self.logged_track_ids else build_entries_from_tracks([self.track])
         
-        if inc_track_count:
-            self.update_last_track_count()
+        # Pausing still has to close out how far we got, it just doesn't count as a listening session
+        poll_time = int(datetime.now().timestamp())
+        log_method = self.vault_db.buffer_playback if Settings.LOGGING_BUFFERED else self.vault_db.log_playback
+        log_method(entries, self.track['id'], playback.get('progress_ms'), playback['is_playing'], poll_time
+                   , inc_track_count=inc_track_count, max_gap_s=Settings.LISTENING_PLAY_GAP_S)
+        if Settings.LOGGING_BUFFERED and poll_time - LogPlayback.last_flush_time >= Settings.LOGGING_FLUSH_INTERVAL_S:
+            self.flush_playback_log()
+        # Only once it's committed, if anything failed we'll want to write them again next time
+        self.logged_track_ids.add(self.track['id'])
+    
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    DESCRIPTION: Flushes every buffered poll in our playback log into our vault, see 'flush_playback_log()' in our
+                 DatabaseHelpers. Safe to call whether or not we're buffering.
+    INPUT: N/A
+    OUTPUT: Number of polls flushed.
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    def flush_playback_log(self) -> int:
+        LogPlayback.last_flush_time = int(datetime.now().timestamp())
+        return self.vault_db.flush_playback_log()
 
 
 # FIN ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
\ No newline at end of file
@@ -16,21 +16,36 @@
 #   distribute_tracks_to_collections_from_playlist - Takes an id of a playlist and distributes the tracks within to all
 #                                                      of our 'artist' playlists as well as 'Master' and 'Year'.
 # 
-#   reorganize_playlist - Sorts a playlist by release date and track number. Does not delete but adds to the end.
+#   reorganize_playlist - Sorts a playlist by release date and track number. Either moves tracks in place or, without
+#                           deleting, adds them to the end.
 # 
 #   update_daily_latest_playlist - Creates a playlist of our 'latest' tracks we have added to our collections. Deletes
-#                                    tracks. 'LATEST_PLAYLIST_LENGTH' determines number of tracks.
+#                                    tracks that fell out of the window. 'LATEST_PLAYLIST_LENGTH' determines number of 
+#                                    tracks.
 # ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
 import logging
-from datetime import datetime
-from collections import defaultdict
+import unicodedata
+from collections        import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime           import datetime
 
 import src.General_Spotify_Helpers as gsh
 
 from src.helpers.Database_Helpers import DatabaseHelpers
 from src.helpers.decorators       import *
+from src.helpers.Job_Queue        import JobCheckpoint
 from src.helpers.Settings         import Settings
 
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Normalizes an artist name so our '__' playlist names match however Spotify decides to case, space, or
+             unicode compose them. Kept out of the class so it isn't wrapped by our method logging per track artist.
+INPUT: name - Artist name to normalize.
+OUTPUT: Str of the casefolded name with unicode composed and whitespace collapsed.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def normalize_artist_name(name: str) -> str:
+    return " ".join(unicodedata.normalize("NFKC", name).casefold().split())
+
+
 """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
 DESCRIPTION: 
 """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
@@ -61,33 +76,69 @@ class MiscFeatures(LogAllMethods):
            playlist_description - Description that the new playlist will be given.
            start_date - Start day of track collection.
            end_date - End day of track collection.
-           logger - Logger object used.
+           checkpoint - Optional JobCheckpoint, our playlist, the artists we gather (in batches), and how many tracks
+                          we have added are saved to it so a resumed run picks up where it left off rather than
+                          starting over with a second playlist or adding tracks twice.
     OUTPUT: Str of playlist_id created.
     """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
     @gsh.scopes(["playlist-modify-public"
                , "playlist-modify-private"
                , "playlist-read-private"])
     def generate_artist_release(self, artist_id_list: list[str], playlist_name: str, playlist_description: str,
-                start_date: Optional[datetime]=None, end_date: Optional[datetime]=None) -> str:
+                start_date: Optional[datetime]=None, end_date: Optional[datetime]=None,
+                checkpoint: Optional[JobCheckpoint]=None) -> str:
         
         if len(artist_id_list) == 0:
             return None
         
-        playlist_id = self.spotify.create_playlist(playlist_name, description=playlist_description)
-        self.logger.info(f"Created New Playlist: {playlist_id}")
-        tracks = []
-        
-        for artist_id in artist_id_list:
-            self.logger.info(f"finding tracks for {artist_id}")
-            tmp_tracks = self.spotify.gather_tracks_by_artist(artist_id, 
-                                                          start_date=start_date, 
-                                                          end_date=end_date)
-            self.logger.info(f"\tFound {len(tmp_tracks)} tracks")
-            tracks += tmp_tracks
-            
-        self.logger.info(f"Adding {len(tracks)} tracks to playlist {playlist_id}")
-        self.logger.debug(f"Tracks: {tracks}")
-        self.spotify.add_tracks_to_playlist(playlist_id, tracks)
+        checkpoint = checkpoint if checkpoint is not None else JobCheckpoint()
+        if checkpoint.get('tracks_added', False):
+            return checkpoint.get('playlist_id')
+        
+        playlist_id = checkpoint.get('playlist_id')
+        if playlist_id is None:
+            playlist_id = self.spotify.create_playlist(playlist_name, description=playlist_description)
+            checkpoint.update(playlist_id=playlist_id)
+            self.logger.info(f"Created New Playlist: {playlist_id}")
+        else:
+            self.logger.info(f"Resuming Playlist: {playlist_id}")
+        
+        def gather_artist_tracks(artist_id: str) -> list[str]:
+            artist_tracks = self.spotify.gather_tracks_by_artist(artist_id, start_date=start_date, end_date=end_date)
+            self.logger.info(f"Found {len(artist_tracks)} tracks for {artist_id}")
+            return artist_tracks
+        
+        # Artists are independent of each other so fetch a few at once, our proxy's rate limiter keeps us honest.
+        #   'map' hands results back in artist order so our playlist comes out the same as fetching one at a time.
+        #   Artists a resumed run already gathered are skipped. Every save rewrites the whole checkpoint so we only
+        #   save every 'ARTIST_RELEASE_CHECKPOINT_BATCH' artists, and whatever is left once we stop.
+        gathered_tracks = checkpoint.get('artist_tracks', {})
+        remaining_ids = [artist_id for artist_id in dict.fromkeys(artist_id_list) if artist_id not in gathered_tracks]
+        max_workers = max(min(Settings.ARTIST_RELEASE_WORKERS, len(remaining_ids)), 1)
+        num_unsaved = 0
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for artist_id, artist_tracks in zip(remaining_ids, executor.map(gather_artist_tracks, remaining_ids)):
+                    gathered_tracks[artist_id] = artist_tracks
+                    num_unsaved += 1
+                    if num_unsaved >= Settings.ARTIST_RELEASE_CHECKPOINT_BATCH:
+                        checkpoint.update(artist_tracks=gathered_tracks)
+                        num_unsaved = 0
+        finally:
+            if num_unsaved > 0:
+                checkpoint.update(artist_tracks=gathered_tracks)
+        self.spotify.log_album_cache_stats()
+        
+        # Add a chunk at a time, saving how far we got so a resumed run doesn't add any of them twice
+        tracks = [track for artist_id in artist_id_list for track in gathered_tracks[artist_id]]
+        num_added = checkpoint.get('num_tracks_added', 0)
+        self.logger.info(f"Adding {len(tracks) - num_added} of {len(tracks)} tracks to playlist {playlist_id}")
+        self.logger.debug(f"Tracks: {tracks[num_added:]}")
+        for chunk in gsh.chunks(tracks[num_added:], gsh.PLAYLIST_ADD_CHUNK_SIZE):
+            self.spotify.add_tracks_to_playlist(playlist_id, chunk)
+            num_added += len(chunk)
+            checkpoint.update(num_tracks_added=num_added)
+        checkpoint.update(tracks_added=True)
         
         return playlist_id
     
@@ -129,16 +180,22 @@ class MiscFeatures(LogAllMethods):
         self.logger.info(f"Found {len(tracks_to_distribute)} Tracks")
         self.logger.debug(f"Tracks: {tracks_to_distribute}")
         
+        # Index our artist track holders by normalized name once so each track artist is a single lookup
+        artist_playlist_index = defaultdict(list)
+        for playlist in artist_playlists:
+            artist_playlist_index[normalize_artist_name(playlist['name'][2:])].append(playlist)
+        
         # Add all tracks we need to distribute to their respective artist track holder
         for track in tracks_to_distribute:
             self.logger.info(f"Track - {track['name']}, {track['id']}")
             artist_found = False
-            for playlist_artist in artist_playlists:
-                for track_artist in track['artists']:
-                    if track_artist['name'] == playlist_artist['name'][2:] and track_artist['id'] is not None:
-                        playlist_artist['tracks'].append(track['id'])
-                        artist_found = True
-                        self.logger.info(f"\t\tArtist: {track_artist['name']}, {track_artist['id']}")
+            for track_artist in track['artists']:
+                if track_artist['id'] is None:
+                    continue
+                for playlist_artist in artist_playlist_index.get(normalize_artist_name(track_artist['name']), []):
+                    playlist_artist['tracks'].append(track['id'])
+                    artist_found = True
+                    self.logger.info(f"\t\tArtist: {track_artist['name']}, {track_artist['id']}")
             if not artist_found:
                 self.logger.error("NO CONTRIBUTING ARTIST FOUND")
                         
@@ -161,21 +218,27 @@ class MiscFeatures(LogAllMethods):
         
         
     """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
-    DESCRIPTION: This takes all non-local tracks and organizes them. It then adds the tracks back into the playlist 
-                 at the bottom so we never mess with deleting tracks. The tracks are ordered by release date and then
-                 ordered by album/ disc number/ track number.
+    DESCRIPTION: This takes all non-local tracks and organizes them by release date and then album/ disc number/ 
+                 track number. In place we move the tracks into that order with as few range moves as we can, local 
+                 and macro tracks keep their spots. Otherwise we add the tracks back into the playlist at the bottom 
+                 so we never mess with deleting tracks.
     INPUT: playlist_id - Id of playlist we are going to "reorganize".
+           in_place - Whether to reorder the playlist in place, defaults to 'ORGANIZE_PLAYLIST_IN_PLACE'.
     OUTPUT: N/A
     """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
     @gsh.scopes(["playlist-modify-public"
                , "playlist-modify-private" 
                , "playlist-read-private"])
-    def reorganize_playlist(self, playlist_id):
-        tracks = self.spotify.get_playlist_tracks(playlist_id, 
+    def reorganize_playlist(self, playlist_id: str, in_place: Optional[bool]=None) -> None:
+        in_place = Settings.ORGANIZE_PLAYLIST_IN_PLACE if in_place is None else in_place
+        # Grab our snapshot before our tracks so our moves are made against the version we planned them on
+        snapshot_id = self.spotify.get_playlist_data(playlist_id, info=['snapshot_id'])[0] if in_place else None
+        playlist_tracks = self.spotify.get_playlist_tracks(playlist_id, 
                                                 track_info=['id', 'name', 'disc_number', 'track_number', 'is_local'],
                                                 album_info=['release_date', 'id'])
         
-        tracks = [track for track in tracks if track['id'] not in Settings.MACRO_LIST and not track['is_local']]
+        is_sortable = lambda track: track['id'] not in Settings.MACRO_LIST and not track['is_local']
+        tracks = [track for track in playlist_tracks if is_sortable(track)]
         self.logger.info(f"Found {len(tracks)} Tracks To Distribute. Tracks Unorganized: {tracks}")
 
         album_sorted_dict = {}
@@ -201,11 +264,20 @@ class MiscFeatures(LogAllMethods):
         if len(track_ids_ordered) != len(tracks):
             raise Exception("TRACK LIST MISMATCH IN DISTRIBUTION")
         
-        self.spotify.add_tracks_to_playlist(playlist_id, track_ids_ordered)
+        if not in_place:
+            self.spotify.add_tracks_to_playlist(playlist_id, track_ids_ordered)
+            return
+        
+        # Local and macro tracks hold their spots, our organized tracks fill in the rest
+        track_ids_ordered = iter(track_ids_ordered)
+        target = [next(track_ids_ordered) if is_sortable(track) else track['id'] for track in playlist_tracks]
+        moves = gsh.get_reorder_moves([track['id'] for track in playlist_tracks], target)
+        self.logger.info(f"Reordering {len(target)} Tracks With {len(moves)} Moves")
+        self.spotify.reorder_playlist_tracks(playlist_id, moves, snapshot_id=snapshot_id)
         
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
-    DESCRIPTION: Grabs the latest 'PLAYLIST_LENGTH' tracks from 'SOURCE_PLAYLIST' and adds them to our 'DEST_PLAYLIST'
-                 playlist after emptying it.
+    DESCRIPTION: Grabs the latest 'PLAYLIST_LENGTH' tracks from 'SOURCE_PLAYLIST' and syncs our 'DEST_PLAYLIST' 
+                 playlist to exactly those tracks.
     INPUT: N/A
     OUTPUT: N/A
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
@@ -221,10 +293,9 @@ class MiscFeatures(LogAllMethods):
         tracks = [track['id'] for track in self.spotify.get_playlist_tracks(Settings.LATEST_SOURCE_PLAYLIST, 
                                                                              offset=offset)]
         
-        remove_success = self.spotify.remove_all_playlist_tracks(Settings.LATEST_DEST_PLAYLIST, 
-                                                                 max_playlist_length=Settings.LATEST_PLAYLIST_LENGTH+1)
-        if remove_success:
-            self.spotify.add_tracks_to_playlist(Settings.LATEST_DEST_PLAYLIST, tracks)
+        # Most days only a handful of tracks shift so only touch what changed, same deletion gates as a full wipe.
+        self.spotify.sync_playlist_tracks(Settings.LATEST_DEST_PLAYLIST, tracks, 
+                                          max_playlist_length=Settings.LATEST_PLAYLIST_LENGTH+1)
 
 
 # FIN ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
\ No newline at end of file
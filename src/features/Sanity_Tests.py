@@ -30,30 +30,79 @@
 # Non-Playable Tracks Sanity Test -
 #   - Based off of the 'preview_url' in a track but goal is to make sure every song in our main playlist is 'playable'
 #       since Spotify just 'grays' them out without notification.
+#
+# Every check only reads the playlist data we gather up front, 'run_checks' runs them one after another against that
+#   one snapshot and times each of them.
+#
+# Only a handful of playlists change week to week so our playlist differences, and the per playlist pieces of our
+#   duplicates, contributing artists, and artist integrity checks are cached in our vault against the snapshot ids
+#   (spotify's version of a playlist's tracks) our last backup saw for the playlists they were built from. Each run
+#   only re-checks the playlists (and any '__' playlists of contributing artists) whose snapshot changed, and only
+#   loads the tracks of those. A playlist we don't have a snapshot id for is always re-checked. Our non-playable
+#   check is never cached, spotify can gray a track out without touching any playlist's snapshot.
 # ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
+import hashlib
+import json
 import logging
+import time
 
 from pprint import PrettyPrinter
+from typing import Optional
 
 from src.helpers.Database_Helpers import DatabaseHelpers
 from src.helpers.decorators       import *
 from src.helpers.Settings         import Settings
 
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Hashes anything json serializable, used to tell if a cached result is still good.
+INPUT: content - Whatever our result was built from.
+OUTPUT: Hex digest of 'content'.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def get_content_hash(content) -> str:
+    return hashlib.sha1(json.dumps(content).encode()).hexdigest()
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Hashes the snapshot ids of the given playlists (along with anything else our result depends on), which
+             is all we need to know if their tracks changed since our last backup.
+INPUT: playlists - List of playlist dicts with their 'snapshot_id'.
+       content - Anything else, json serializable, our result was built from.
+OUTPUT: Hex digest of our snapshots, None if any of our playlists doesn't have one.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def get_snapshots_hash(playlists: list[dict], content=None) -> Optional[str]:
+    snapshot_ids = [playlist.get('snapshot_id') for playlist in playlists]
+    return None if None in snapshot_ids else get_content_hash([snapshot_ids, content])
+
+
 """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
 DESCRIPTION: Collection of sanity tests to verify integrity and completion of the user's collections. This is very
              dependent on having a library setup in my fashion.
 """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
 class SanityTest(LogAllMethods):
-    # List of tracks to disregard for our comparisons, this currently includes our "shuffle macro" as well as our 
-    #   "Soundtracks" playlists tracks
-    individual_artist_playlists = []
-    years_playlists = []
-    master_playlist = []
-    user_playlists = []
-    user_followed_artists = []
+    # Title and method of every check in the order we report them.
+    SANITY_CHECKS = (("Differences In Playlists", 'sanity_diffs_in_major_playlist_sets')
+                   , ("In Progress Artists", 'sanity_in_progress_artists')
+                   , ("Duplicates", 'sanity_duplicates')
+                   , ("Artist Integrity", 'sanity_artist_playlist_integrity')
+                   , ("Contributing Artists Missing", 'sanity_contributing_artists')
+                   , ("Non-Playable Tracks", 'sanity_playable_tracks'))
 
     def __init__(self, logger: logging.Logger=None) -> None:
+        # List of tracks to disregard for our comparisons, this currently includes our "shuffle macro" as well as our 
+        #   "Soundtracks" playlists tracks
         self.track_list_to_disregard = list(Settings.MACRO_LIST) 
+        self.individual_artist_playlists = []
+        self.years_playlists = []
+        self.master_playlist = []
+        # Our "Soundtracks" playlists, their tracks get added to 'track_list_to_disregard' once we need them
+        self.disregard_playlists = []
+        self.user_playlists = []
+        self.user_followed_artists = []
+        self.track_artists = {}
+        # Results of our last run keyed by (check, playlist name). Only 'run_checks' uses them, during which we also
+        #   track every entry used so far.
+        self.sanity_cache = {}
+        self.sanity_cache_used = None
         self.logger = logger if logger is not None else logging.getLogger()
         self.dbh = DatabaseHelpers(Settings.LISTENING_VAULT_DB, logger=self.logger)
         
@@ -63,28 +112,68 @@ class SanityTest(LogAllMethods):
     # "HELPER" FUNCTIONS ══════════════════════════════════════════════════════════════════════════════════════════════
     # ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
     """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
-    DESCRIPTION: Grabs all '__', year, master, and track disregard playlists for later internal use.
+    DESCRIPTION: Grabs all '__', year, master, and track disregard playlists for later internal use. Only each 
+                 playlist's id, name, and last backed up snapshot id are grabbed here, the tracks of a playlist are 
+                 left for '_get_tracks' so we never load a playlist whose results we have cached.
     INPUT: N/A
     OUTPUT: N/A
     """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
     def _gather_playlist_data(self):
         self.user_followed_artists = self.dbh.get_user_followed_artists()
         self.user_playlists = self.dbh.get_user_playlists()
+        self.sanity_cache = {(entry['check_name'], entry['cache_key']): entry 
+                             for entry in self.dbh.get_sanity_check_cache()}
+        self.individual_artist_playlists, self.years_playlists, self.master_playlist = [], [], []
+        self.disregard_playlists, self.track_artists = [], {}
+        playlist_snapshots = self.dbh.get_playlist_snapshots()
         
         for playlist in self.user_playlists:
-            tracks = self.dbh.get_tracks_from_playlist(playlist['id'])
+            playlist_info = {'id': playlist['id'], 'snapshot_id': playlist_snapshots.get(playlist['id'])}
             
             if playlist['name'].startswith('__'):
-                self.individual_artist_playlists.append({'name': playlist['name'][2:], 'tracks': tracks})
+                self.individual_artist_playlists.append({**playlist_info, 'name': playlist['name'][2:]})
                 
             if playlist['name'].startswith('20'):
-                self.years_playlists.append({'name': playlist['name'], 'tracks': tracks})
+                self.years_playlists.append({**playlist_info, 'name': playlist['name']})
                 
             if playlist['id'] == Settings.MASTER_MIX_ID:
-                self.master_playlist.append({'name': playlist['name'], 'tracks': tracks})
+                self.master_playlist.append({**playlist_info, 'name': playlist['name']})
                 
             if playlist['id'] in Settings.PLAYLIST_IDS_NOT_IN_ARTISTS:
-                self.track_list_to_disregard += [track['id'] for track in tracks]
+                self.disregard_playlists.append({**playlist_info, 'name': playlist['name']})
+    
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    DESCRIPTION: Grabs the tracks of the given playlists, loading them (and their tracks' artists) from our vault in
+                 one go for any we haven't needed yet.
+    INPUT: playlists - List of playlist dicts from '_gather_playlist_data'.
+    OUTPUT: List of every track dictionary object across 'playlists'.
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    def _get_tracks(self, playlists: list[dict]) -> list[dict]:
+        unloaded = [playlist for playlist in playlists if 'tracks' not in playlist]
+        if unloaded:
+            playlist_ids = list({playlist['id'] for playlist in unloaded})
+            playlists_tracks = self.dbh.get_all_playlists_tracks(playlist_ids)
+            self.track_artists.update(self.dbh.get_all_track_artists(playlist_ids))
+            for playlist in unloaded:
+                playlist['tracks'] = playlists_tracks.get(playlist['id'], [])
+        
+        return [track for playlist in playlists for track in playlist['tracks']]
+    
+        """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    DESCRIPTION: Grabs the artist names for a track from our 'track_artists' index.
+    INPUT: track_id - Id of the track we want the artists of.
+    OUTPUT: List of artist names.
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    def _get_artist_names(self, track_id: str) -> list[str]:
+        return [artist['name'] for artist in self.track_artists.get(track_id, [])]
+    
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    DESCRIPTION: Grabs the names of all of the artists we follow.
+    INPUT: N/A
+    OUTPUT: Set of artist names.
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    def _get_followed_artist_names(self) -> set[str]:
+        return {artist['name'] for artist in self.user_followed_artists}
     
     """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
     DESCRIPTION: Given a list of tracks, find any duplicates. Only works with 'id'.
@@ -97,8 +186,7 @@ class SanityTest(LogAllMethods):
 
         for track in tracks:
             if track['id'] in checked_ids and track['id'] not in duplicate_ids:
-                artist_names = [artist['name'] for artist in self.dbh.get_track_artists(track['id'])]
-                duplicates.append({'Name': track['name'], 'Artists': artist_names})
+                duplicates.append({'Name': track['name'], 'Artists': self._get_artist_names(track['id'])})
                 duplicate_ids.add(track['id'])
             checked_ids.add(track['id'])
 
@@ -114,13 +202,113 @@ class SanityTest(LogAllMethods):
     """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
     def _compare_track_lists(self, key_track_list, to_verify_track_list, disregard_tracks=False):
         res_list = []
+        # Tracks all come from the same 'tracks' table so the id alone tells us if it's the same track.
+        to_verify_ids = {track['id'] for track in to_verify_track_list}
+        disregard_ids = set(self.track_list_to_disregard) if disregard_tracks else set()
         
         for track in key_track_list:
-            if disregard_tracks and track['id'] in self.track_list_to_disregard: 
+            if track['id'] in disregard_ids: 
                 continue
-            if track not in to_verify_track_list: 
-                artist_names = [artist['name'] for artist in self.dbh.get_track_artists(track['id'])]
-                res_list.append({'Name': track['name'], 'Artists': artist_names})
+            if track['id'] not in to_verify_ids: 
+                res_list.append({'Name': track['name'], 'Artists': self._get_artist_names(track['id'])})
+        
+        return res_list
+    
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    DESCRIPTION: Reuses our last result for 'check' on 'cache_key' if it was built from the same content, otherwise 
+                 runs 'run_check' for a fresh one. Either way the entry is kept for '_save_sanity_cache'. Outside of
+                 'run_checks', or if we can't hash our content, we always just run 'run_check'.
+    INPUT: check - Name of the check we are caching.
+           cache_key - What within that check we are caching, ie the playlist name.
+           get_content_hash - Callable that hashes everything the result depends on, None if it can't.
+           run_check - Callable that generates the result if we can't reuse our cached one.
+    OUTPUT: List of results, json serializable.
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    def _cached_check(self, check: str, cache_key: str, get_content_hash, run_check) -> list:
+        if self.sanity_cache_used is None:
+            return run_check()
+        
+        content_hash = get_content_hash()
+        if content_hash is None:
+            return run_check()
+        
+        cached = self.sanity_cache.get((check, cache_key))
+        if cached is not None and cached['content_hash'] == content_hash:
+            self.sanity_cache_used[(check, cache_key)] = {**cached, 'hit': True}
+            return json.loads(cached['results'])
+        
+        results = run_check()
+        self.sanity_cache_used[(check, cache_key)] = {'check_name': check, 'cache_key': cache_key
+                                                      , 'content_hash': content_hash, 'results': json.dumps(results)
+                                                      , 'hit': False}
+        return results
+    
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    DESCRIPTION: Writes every cache entry we used this run back to our vault, replacing the last run's, and logs how 
+                 many of them we were able to reuse.
+    INPUT: N/A
+    OUTPUT: N/A
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    def _save_sanity_cache(self) -> None:
+        hits = sum(entry['hit'] for entry in self.sanity_cache_used.values())
+        self.logger.info(f"Reused {hits} of {len(self.sanity_cache_used)} cached sanity check results")
+        
+        self.dbh.replace_sanity_check_cache([(entry['check_name'], entry['cache_key'], entry['content_hash']
+                                              , entry['results']) for entry in self.sanity_cache_used.values()])
+        self.sanity_cache = self.sanity_cache_used
+    
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    DESCRIPTION: Finds the tracks in a '__' playlist that don't have the playlist's artist on them.
+    INPUT: playlist - Dict of the '__' playlist from '_gather_playlist_data'.
+    OUTPUT: List of string formatted tracks that do not belong in 'playlist'.
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    def _find_tracks_missing_artist(self, playlist: dict) -> list[dict]:
+        tracks = []
+        for track in self._get_tracks([playlist]):
+            artists = self._get_artist_names(track['id'])
+            if playlist['name'] not in artists:
+                tracks.append({'Name': track['name'], 'Artists': artists})
+        
+        return tracks
+    
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    DESCRIPTION: Finds the tracks in a '__' playlist that are missing from the '__' playlists of their other followed 
+                 artists.
+    INPUT: playlist - Dict of the '__' playlist from '_gather_playlist_data'.
+           followed_artist_names - Set of the artist names we follow.
+           artist_playlists - Dict of '__' playlist name to its playlist dict, only the ones we need get loaded.
+    OUTPUT: List of [track id, string formatted missing track] pairs.
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    def _find_missing_contributions(self, playlist: dict, followed_artist_names: set[str]
+                                    , artist_playlists: dict[str, dict]) -> list[list]:
+        res_list, checked_track_ids = [], set()
+        artist_track_ids = {}
+        
+        def get_artist_track_ids(artist: str) -> set[str]:
+            if artist not in artist_track_ids:
+                artist_track_ids[artist] = ({track['id'] for track in self._get_tracks([artist_playlists[artist]])}
+                                            if artist in artist_playlists else set())
+            return artist_track_ids[artist]
+        
+        for track in self._get_tracks([playlist]):
+            if track['id'] in checked_track_ids:
+                continue
+            checked_track_ids.add(track['id'])
+            # Get track artists and filter for followed ones (excluding the current playlist owner)
+            track_artists = self._get_artist_names(track['id'])
+            valid_artists = [artist for artist in track_artists if artist in followed_artist_names 
+                             and artist != playlist['name']]
+
+            # Find missing playlists for valid artists
+            missing_artists = [artist for artist in valid_artists 
+                               if track['id'] not in get_artist_track_ids(artist)]
+
+            if missing_artists:
+                res_list.append([track['id'], {
+                    'Track': track['name'],
+                    'Artists': track_artists,
+                    'Missing': missing_artists
+                }])
         
         return res_list
                 
@@ -134,15 +322,28 @@ class SanityTest(LogAllMethods):
     OUTPUT: List of collections with their respective tracks that are missing from the varying collections.
     """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
     def sanity_diffs_in_major_playlist_sets(self):
-        def collect_tracks(playlists):
-            return [track for playlist in playlists for track in playlist['tracks']]
-
-        years_tracks = collect_tracks(self.years_playlists)
-        master_tracks = collect_tracks(self.master_playlist)
-        artist_tracks = collect_tracks(
-            playlist for playlist in self.individual_artist_playlists
-            if any(playlist['name'] == artist['name'] for artist in self.user_followed_artists)
-        )
+        followed_artist_names = self._get_followed_artist_names()
+        artist_playlists = [playlist for playlist in self.individual_artist_playlists 
+                            if playlist['name'] in followed_artist_names]
+        playlists = self.years_playlists + self.master_playlist + artist_playlists + self.disregard_playlists
+        
+        return self._cached_check('diffs', "ALL PLAYLISTS"
+                                  , lambda: get_snapshots_hash(playlists, [[playlist['name'] for playlist in playlists]
+                                                                           , self.track_list_to_disregard])
+                                  , lambda: self._find_diffs_in_major_playlist_sets(artist_playlists))
+    
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    DESCRIPTION: Builds our playlist set comparisons for 'sanity_diffs_in_major_playlist_sets'.
+    INPUT: artist_playlists - List of the '__' playlists of artists we follow.
+    OUTPUT: List of collections with their respective tracks that are missing from the varying collections.
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    def _find_diffs_in_major_playlist_sets(self, artist_playlists: list[dict]) -> list[dict]:
+        # Our disregard playlists' tracks only get loaded once, after that they're already in 'track_list_to_disregard'
+        self.track_list_to_disregard += [track['id'] for track in self._get_tracks(
+            [playlist for playlist in self.disregard_playlists if 'tracks' not in playlist])]
+        years_tracks = self._get_tracks(self.years_playlists)
+        master_tracks = self._get_tracks(self.master_playlist)
+        artist_tracks = self._get_tracks(artist_playlists)
         res_list = []
 
         res_list.append({'Collection': 'In Master, Not Years', 'Track': 
@@ -170,12 +371,9 @@ class SanityTest(LogAllMethods):
     OUTPUT: List of '__' playlists that the user currently doesn't follow the artist for.
     """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
     def sanity_in_progress_artists(self):
-        res_list = []
-        for playlist in self.user_playlists:
-            if playlist['name'].startswith("__") and not any(playlist['name'][2:] == artist['name']
-                                                             for artist in self.user_followed_artists):
-                res_list.append({'Artist': playlist['name'][2:]})
-        return res_list
+        followed_artist_names = self._get_followed_artist_names()
+        return [{'Artist': playlist['name'][2:]} for playlist in self.user_playlists
+                if playlist['name'].startswith("__") and playlist['name'][2:] not in followed_artist_names]
 
     """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
     DESCRIPTION: Finds any duplicate tracks (id's) in each of our 3 collections individually and years combined.
@@ -186,13 +384,17 @@ class SanityTest(LogAllMethods):
         res_list = []
         # Find duplicates in every year, '__', and master playlist
         for playlist in self.individual_artist_playlists + self.years_playlists + self.master_playlist:
-            tmp_dupe_list = self._find_duplicates(playlist['tracks'])
+            tmp_dupe_list = self._cached_check('duplicates', playlist['name']
+                                               , lambda: get_snapshots_hash([playlist])
+                                               , lambda: self._find_duplicates(self._get_tracks([playlist])))
             if len(tmp_dupe_list) > 0:
                 res_list.append({'Playlist': playlist['name'], 'Track':tmp_dupe_list})
             
         # Find duplicates in entire year collection
-        tmp_years_dupe_list = self._find_duplicates([track for playlist in self.years_playlists 
-                                                     for track in playlist['tracks']])
+        years_playlists = self.years_playlists
+        tmp_years_dupe_list = self._cached_check('duplicates', "YEARS COLLECTION"
+                                                 , lambda: get_snapshots_hash(years_playlists)
+                                                 , lambda: self._find_duplicates(self._get_tracks(years_playlists)))
         if len(tmp_years_dupe_list) > 0:
             res_list.append({'Playlist': "YEARS COLLECTION", 'Track':tmp_years_dupe_list})
             
@@ -207,30 +409,31 @@ class SanityTest(LogAllMethods):
     def sanity_contributing_artists(self):
         res_list, checked_track_ids = [], set()
 
-        followed_artist_names = {artist['name'] for artist in self.user_followed_artists}
-        artist_playlists = {playlist['name']: {track['id'] for track in playlist['tracks']} 
-                            for playlist in self.individual_artist_playlists}
+        followed_artist_names = self._get_followed_artist_names()
+        # The last '__' playlist with a given name wins
+        artist_playlists = {playlist['name']: playlist for playlist in self.individual_artist_playlists}
 
         for playlist in self.individual_artist_playlists:
-            for track in playlist['tracks']:
-                if track['id'] in checked_track_ids:
-                    continue
-                checked_track_ids.add(track['id'])
-                # Get track artists and filter for followed ones (excluding the current playlist owner)
-                track_artists = self.dbh.get_track_artists(track['id'])
-                valid_artists = [artist['name'] for artist in track_artists if artist['name'] in followed_artist_names 
-                                 and artist['name'] != playlist['name']]
-
-                # Find missing playlists for valid artists
-                missing_artists = [artist for artist in valid_artists 
-                                   if track['id'] not in artist_playlists.get(artist, set())]
-
-                if missing_artists:
-                    res_list.append({
-                        'Track': track['name'],
-                        'Artists': [artist['name'] for artist in track_artists],
-                        'Missing': missing_artists
-                    })
+            # Our results also depend on which of the other artists on our tracks we follow and what is in their '__' 
+            #   playlists, finding those artists is a pass over every track so it gets cached too.
+            other_artists = self._cached_check('contributing_artists_others', playlist['name']
+                                               , lambda: get_snapshots_hash([playlist])
+                                               , lambda: sorted({artist for track in self._get_tracks([playlist])
+                                                                 for artist in self._get_artist_names(track['id'])
+                                                                 if artist != playlist['name']}))
+            followed_others = [[artist, artist in artist_playlists] for artist in other_artists 
+                               if artist in followed_artist_names]
+            others_playlists = [artist_playlists[artist] for artist, has_playlist in followed_others if has_playlist]
+            missing_tracks = self._cached_check('contributing_artists', playlist['name']
+                                                , lambda: get_snapshots_hash([playlist] + others_playlists
+                                                                             , followed_others)
+                                                , lambda: self._find_missing_contributions(
+                                                    playlist, followed_artist_names, artist_playlists))
+            # A track gives the same result from every '__' playlist it's in so only report it the first time
+            for track_id, missing_track in missing_tracks:
+                if track_id not in checked_track_ids:
+                    checked_track_ids.add(track_id)
+                    res_list.append(missing_track)
 
         return res_list
             
@@ -244,11 +447,9 @@ class SanityTest(LogAllMethods):
         res_list = []
 
         for playlist in self.individual_artist_playlists:
-            tracks = []
-            for track in playlist['tracks']:
-                artists = self.dbh.get_track_artists(track['id'])
-                if not any(playlist['name'] == artist['name'] for artist in artists):
-                    tracks.append({'Name': track['name'], 'Artists': [artist['name'] for artist in artists]})
+            tracks = self._cached_check('artist_integrity', playlist['name']
+                                        , lambda: get_snapshots_hash([playlist])
+                                        , lambda: self._find_tracks_missing_artist(playlist))
 
             if tracks:
                 res_list.append({'Playlist': playlist['name'], 'Track': tracks})
@@ -264,30 +465,47 @@ class SanityTest(LogAllMethods):
     def sanity_playable_tracks(self) -> list[dict]:
         res_list = []
         
-        for track in self.master_playlist[0]['tracks']:
+        for track in self._get_tracks(self.master_playlist):
             if not track['is_playable'] and not track['is_local']:
-                artist_names = [artist['name'] for artist in self.dbh.get_track_artists(track['id'])]
-                res_list.append({'Track': track['name'], 'Artists': artist_names})
+                res_list.append({'Track': track['name'], 'Artists': self._get_artist_names(track['id'])})
                 
         return res_list
             
     # ════════════════════════════════════════════════════════════════════════════════════════════════════════════════
     # MISC  ══════════════════════════════════════════════════════════════════════════════════════════════════════════
     # ════════════════════════════════════════════════════════════════════════════════════════════════════════════════
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    DESCRIPTION: Runs a single sanity check and times it.
+    INPUT: check - Name of the 'sanity_' method to run.
+    OUTPUT: Tuple of the check's results and how long it took in seconds.
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    def _timed_check(self, check: str) -> tuple[list, float]:
+        start = time.perf_counter()
+        results = getattr(self, check)()
+        return results, time.perf_counter() - start
+    
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    DESCRIPTION: Runs every check in 'SANITY_CHECKS' one after another, timing each. Whatever cached results the
+                 checks used or rebuilt are saved off for our next run.
+    INPUT: N/A
+    OUTPUT: List of dicts with the 'name', 'results', and 'duration_s' of each check in 'SANITY_CHECKS' order.
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    def run_checks(self) -> list[dict]:
+        self.sanity_cache_used = {}
+        try:
+            timed_results = [self._timed_check(check) for _, check in self.SANITY_CHECKS]
+            self._save_sanity_cache()
+        finally:
+            self.sanity_cache_used = None
+        
+        return [{'name': name, 'results': results, 'duration_s': duration_s} 
+                for (name, _), (results, duration_s) in zip(self.SANITY_CHECKS, timed_results)]
+    
     def run_suite(self) -> None:
         pp = PrettyPrinter(width=150)
-        print("Playlist Collection Differences ========")
-        pp.pprint(self.sanity_diffs_in_major_playlist_sets())
-        print("Current In Progress Artists ============")
-        pp.pprint(self.sanity_in_progress_artists())
-        print("Duplicates =============================")
-        pp.pprint(self.sanity_duplicates())
-        print("Contributing Artists ===================")
-        pp.pprint(self.sanity_contributing_artists())
-        print("Artist Playlist Integrity ==============")
-        pp.pprint(self.sanity_artist_playlist_integrity())
-        print("Non-Playable Track ====================")
-        pp.pprint(self.sanity_playable_tracks())
-        
+        for check in self.run_checks():
+            print(f"{check['name']} ({check['duration_s']:.3f}s) ".ljust(40, "="))
+            pp.pprint(check['results'])
+
 
 # FIN ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
\ No newline at end of file
@@ -14,22 +14,109 @@
 #
 #  generate_latest_artists - Generates a list of artists that we have listened to the most in the last specified time
 #                               period. It sorts in descending order by total minutes listened.
+#
+# Featured artists are computed off of our library loaded once as integer coded numpy arrays ('_load_library')
+#   instead of hitting the db per artist/ track. Every id column is coded by its index into the sorted unique ids of
+#   that type so membership checks and group bys become array indexing and 'bincount's. Latest artists is already a
+#   single aggregate over our listening rollups and stays in sql.
 # ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
-import os
-import sqlite3
+import numpy as np
 
 from datetime import datetime
-from glob import glob
 
 from src.helpers.decorators       import *
 from src.helpers.Settings         import Settings
 from src.helpers.Database_Helpers import DatabaseHelpers
 
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Integer codes a list of ids against the sorted unique 'ids' they come from.
+INPUT: ids - Sorted numpy array of unique ids.
+       values - List of ids to code.
+OUTPUT: Numpy int array of the index of each value in 'ids', -1 for any value not in 'ids'.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def encode_ids(ids: np.ndarray, values: list[str]) -> np.ndarray:
+    values = np.array(values, dtype=str)
+    codes = np.searchsorted(ids, values).astype(np.int64)
+    found = codes < len(ids)
+    found[found] = ids[codes[found]] == values[found]
+    return np.where(found, codes, -1)
+
+
 class SpotifyStatistics(LogAllMethods):
     
     def __init__(self, logger=None):
         self.logger = logger if logger is not None else logging.getLogger()
         self.vault_db = DatabaseHelpers(Settings.LISTENING_VAULT_DB,logger=self.logger)
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Loads every table our statistics need in one go and integer codes them. Row order of our join tables
+                 is kept as is (rowid order) so anything we list out comes back in the same order sqlite scans it.
+    INPUT: playlist_ids - Playlists we want the tracks of.
+    OUTPUT: Dict of numpy arrays, 'track_ids'/ 'artist_ids' are the sorted ids every other column is coded against.
+            {'track_ids', 'track_names', 'known_tracks', 'artist_ids', 'artist_names', 'known_artists', 'followed',
+             'ta_track', 'ta_artist', 'pt_playlist', 'pt_track'}
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def _load_library(self, playlist_ids: list[str]) -> dict:
+        placeholders = ','.join(['?'] * len(playlist_ids))
+        with self.vault_db.connect_db_readonly() as db_conn:
+            tracks = db_conn.execute("SELECT id, IFNULL(name, '') FROM tracks").fetchall()
+            artists = db_conn.execute("SELECT id, IFNULL(name, '') FROM artists").fetchall()
+            followed = [row[0] for row in db_conn.execute("SELECT fa.id FROM followed_artists fa "
+                                                          "JOIN artists a ON a.id = fa.id").fetchall()]
+            tracks_artists = db_conn.execute("SELECT IFNULL(id_track, ''), IFNULL(id_artist, '') "
+                                             "FROM tracks_artists ORDER BY rowid").fetchall()
+            playlists_tracks = db_conn.execute(f"SELECT id_playlist, IFNULL(id_track, '') FROM playlists_tracks "
+                                               f"WHERE id_playlist IN ({placeholders}) ORDER BY rowid"
+                                               , playlist_ids).fetchall()
+        
+        ta_tracks, ta_artists = [row[0] for row in tracks_artists], [row[1] for row in tracks_artists]
+        pt_playlists, pt_tracks = [row[0] for row in playlists_tracks], [row[1] for row in playlists_tracks]
+        track_ids = np.unique(np.array([row[0] for row in tracks] + ta_tracks + pt_tracks, dtype=str))
+        artist_ids = np.unique(np.array([row[0] for row in artists] + ta_artists, dtype=str))
+        
+        known_tracks = np.zeros(len(track_ids), dtype=bool)
+        known_tracks[encode_ids(track_ids, [row[0] for row in tracks])] = True
+        known_artists = np.zeros(len(artist_ids), dtype=bool)
+        known_artists[encode_ids(artist_ids, [row[0] for row in artists])] = True
+        followed_artists = np.zeros(len(artist_ids), dtype=bool)
+        followed_artists[encode_ids(artist_ids, followed)] = True
+        
+        track_names = np.full(len(track_ids), "", dtype=object)
+        track_names[encode_ids(track_ids, [row[0] for row in tracks])] = [row[1] for row in tracks]
+        artist_names = np.full(len(artist_ids), "", dtype=object)
+        artist_names[encode_ids(artist_ids, [row[0] for row in artists])] = [row[1] for row in artists]
+        
+        return {
+            'track_ids': track_ids
+          , 'track_names': track_names
+          , 'known_tracks': known_tracks
+          , 'artist_ids': artist_ids
+          , 'artist_names': artist_names
+          , 'known_artists': known_artists
+          , 'followed': followed_artists
+          , 'ta_track': encode_ids(track_ids, ta_tracks)
+          , 'ta_artist': encode_ids(artist_ids, ta_artists)
+          , 'pt_playlist': np.array(pt_playlists, dtype=str)
+          , 'pt_track': encode_ids(track_ids, pt_tracks)
+        }
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Self joins 'tracks_artists' on track to get every pair of artists that share a track.
+    INPUT: ta_track - Coded track of each 'tracks_artists' row we are joining.
+           ta_artist - Coded artist of each 'tracks_artists' row we are joining.
+    OUTPUT: Tuple of index arrays into 'ta_track'/ 'ta_artist', the left and right row of every pair (self included).
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def _track_artist_pairs(self, ta_track: np.ndarray, ta_artist: np.ndarray) -> tuple:
+        order = np.argsort(ta_track, kind='stable')
+        _, group_starts, group_sizes = np.unique(ta_track[order], return_index=True, return_counts=True)
+        row_sizes = np.repeat(group_sizes, group_sizes)
+        row_starts = np.repeat(group_starts, group_sizes)
+        
+        # Every row is paired with every row of its track, 'within' walks 0 -> group size for each of those rows.
+        left = np.repeat(np.arange(len(order)), row_sizes)
+        within = np.arange(len(left)) - np.repeat(np.cumsum(row_sizes) - row_sizes, row_sizes)
+        right = np.repeat(row_starts, row_sizes) + within
+        return order[left], order[right]
         
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
     DESCRIPTION: Generates a list of all artists that appear in our 'Master' collection that we do not follow.
@@ -41,38 +128,43 @@ class SpotifyStatistics(LogAllMethods):
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
     def generate_featured_artists_list(self, num_artists: int) -> list:
         playlists_to_search = [Settings.MASTER_MIX_ID, Settings.CHRISTMAS_MASTER_MIX_ID]
-        followed_artist_ids = set(artist['id'] for artist in self.vault_db.get_user_followed_artists())
+        lib = self._load_library(playlists_to_search + list(Settings.PLAYLIST_IDS_NOT_IN_ARTISTS))
+        ta_track, ta_artist, followed = lib['ta_track'], lib['ta_artist'], lib['followed']
         
-        ignored_track_ids = set(track['id'] for playlist_id in Settings.PLAYLIST_IDS_NOT_IN_ARTISTS
-                                for track in self.vault_db.get_tracks_from_playlist(playlist_id))
+        in_search_playlists = np.zeros(len(lib['track_ids']), dtype=bool)
+        in_search_playlists[lib['pt_track'][np.isin(lib['pt_playlist'], playlists_to_search)]] = True
+        ignored_tracks = np.zeros(len(lib['track_ids']), dtype=bool)
+        ignored_tracks[lib['pt_track'][np.isin(lib['pt_playlist'], list(Settings.PLAYLIST_IDS_NOT_IN_ARTISTS))]] = True
         
-        artist_appearances = [artist for artist in self.vault_db.get_artists_and_their_collabs_from_playlists(playlists_to_search, exclude_artists=followed_artist_ids)
-                              if artist['id'] not in followed_artist_ids]
+        # Candidates are artists on any track in our playlists, in id order like sqlite walks them off 'artists'.
+        search_rows = np.flatnonzero(in_search_playlists[ta_track] & lib['known_artists'][ta_artist])
+        candidates = np.unique(ta_artist[search_rows])
+        candidates = candidates[~followed[candidates]]
         
-        all_playlists_tracks = set(track['id'] for playlist_id in playlists_to_search
-                                   for track in self.vault_db.get_tracks_from_playlist(playlist_id))
+        # Unique followed artists each artist shares a track with in our playlists.
+        left, right = self._track_artist_pairs(ta_track[search_rows], ta_artist[search_rows])
+        left_artist, right_artist = ta_artist[search_rows][left], ta_artist[search_rows][right]
+        collabs = (left_artist != right_artist) & followed[right_artist]
+        collab_keys = np.unique(left_artist[collabs] * len(lib['artist_ids']) + right_artist[collabs])
+        collab_artist, collab_with = np.divmod(collab_keys, len(lib['artist_ids']))
+        num_collabs = np.bincount(collab_artist, minlength=len(lib['artist_ids']))
         
-        artist_data = []
-        for artist in artist_appearances:
-            unique_artists = [ar['name'] for ar in artist['appears_with'] if ar['id'] in followed_artist_ids]
-
-            tracks = [track['name'] for track in self.vault_db.get_artist_tracks(artist['id']) 
-                      if track['id'] not in ignored_track_ids and track['id'] in all_playlists_tracks
-                      and any(artist['id'] in followed_artist_ids for artist in self.vault_db.get_track_artists(track['id']))]
-            
-            if len(unique_artists) == 0 or len(tracks) == 0:
-                continue
-            
-            artist_data.append({
-                'Artist Name': artist['name']
-              , 'Number of Tracks':len(tracks)
-              , 'Unique Artists': [ar['name'] for ar in artist['appears_with'] if ar['id'] in followed_artist_ids]
-              , 'Track Names': tracks
-            })
+        # Tracks in our playlists (and not ignored) that have at least one followed artist on them.
+        has_followed = np.bincount(ta_track, weights=followed[ta_artist], minlength=len(lib['track_ids'])) > 0
+        valid_tracks = lib['known_tracks'] & in_search_playlists & ~ignored_tracks & has_followed
+        valid_rows = valid_tracks[ta_track]
+        num_tracks = np.bincount(ta_artist[valid_rows], minlength=len(lib['artist_ids']))
+        
+        candidates = candidates[(num_collabs[candidates] > 0) & (num_tracks[candidates] > 0)]
+        scores = num_tracks[candidates] + 2 * num_collabs[candidates]
+        top_artists = candidates[np.argsort(-scores, kind='stable')][:num_artists]
         
-        return sorted(artist_data
-                    , key=lambda artist: (artist['Number of Tracks'] + 2 * len(artist['Unique Artists']))
-                    , reverse=True)[:num_artists]
+        return [{
+            'Artist Name': lib['artist_names'][artist]
+          , 'Number of Tracks': int(num_tracks[artist])
+          , 'Unique Artists': lib['artist_names'][collab_with[collab_artist == artist]].tolist()
+          , 'Track Names': lib['track_names'][ta_track[valid_rows & (ta_artist == artist)]].tolist()
+        } for artist in top_artists]
     
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
     DESCRIPTION: Generates a list of the artists that we have listened to the most in the last specified time period.
@@ -87,4 +179,4 @@ class SpotifyStatistics(LogAllMethods):
                 for artist in artist_counts[:num_artists]]
 
 
-# FIN ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
\ No newline at end of file
+# FIN ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
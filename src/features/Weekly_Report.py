@@ -19,7 +19,6 @@
 import matplotlib.pyplot as plt 
 import os
 import smtplib
-import sqlite3
 import textwrap
 
 from datetime             import datetime, timedelta
@@ -33,6 +32,8 @@ from src.helpers.decorators  import *
 from src.helpers.Settings    import Settings
 from src.features.Statistics import SpotifyStatistics
 
+MS_PER_HOUR = 60 * 60 * 1000
+
 # ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
 # GRAPH HELPERS ═══════════════════════════════════════════════════════════════════════════════════════════════════════
 # ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
@@ -216,25 +217,22 @@ class WeeklyReport(LogAllMethods):
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
     DESCRIPTION: Generates listening data average over the last 'days_back' by weekday. Disregards days with less than 
                  25 mins of listening to disregard token refresh errors.
-    INPUT: listening_conn - Db object for listening_data.
-           days_back - Number of days to go back for average.
+    INPUT: days_back - Number of days to go back for average.
     OUTPUT: list of average hours listened to by 0 Monday - 6 Sunday.
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
-    def _gen_average_for_past_month(self, listening_conn, days_back):
+    def _gen_average_for_past_month(self, days_back):
         start = datetime.today() - timedelta(days=days_back)
+        daily_ms = self.statistics.vault_db.get_daily_listening_ms(start, datetime.today() - timedelta(days=1))
         days = [[0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0]]
         for delta in range((datetime.today() - start).days):
             result_date = (start + timedelta(days=delta)).date()
-            tmp_vals = listening_conn.execute(f"""SELECT * FROM 'listening_sessions'
-                                WHERE time >= ?
-                                AND time < ?;""",
-                                (f"{result_date} 00:00:00", f"{result_date} 23:59:59")).fetchall()
+            listen_ms = daily_ms.get(str(result_date), 0)
             
-            if len(tmp_vals) >= 100: # Basically just > 25 mins total
+            if listen_ms >= 25 * 60 * 1000:
                 index = (result_date.weekday() + 1) % 7
-                days[index] = [len(tmp_vals)*15 + days[index][0], days[index][1] + 1]
+                days[index] = [listen_ms + days[index][0], days[index][1] + 1]
         
-        return [(day[0]/3600)/day[1] if day[1] != 0 else 0 for day in days]
+        return [(day[0]/MS_PER_HOUR)/day[1] if day[1] != 0 else 0 for day in days]
     
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
     DESCRIPTION: Creates a bar plot for the last week of listening shown in hours Sunday-Saturday.
@@ -242,18 +240,14 @@ class WeeklyReport(LogAllMethods):
     OUTPUT: Saves off a listening_data_plot.png file for use later.
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
     def _gen_playback_graph(self):
-        conn = sqlite3.connect(Settings.LISTENING_VAULT_DB)
+        # Since we run on Monday AM, we want prev Sun to this past Sat
+        daily_ms = self.statistics.vault_db.get_daily_listening_ms(datetime.today() - timedelta(days=8)
+                                                                   , datetime.today() - timedelta(days=2))
         values = []
         
         for diff_day in range(0, 7):
-            # Since we run on Monday AM, we want prev Sun to this past Sat
             date = datetime.today() - timedelta(days=8-diff_day)
-            db_res = conn.execute(f"""SELECT * FROM 'listening_sessions'
-                                  WHERE time >= ?
-                                  AND time < ?;"""
-                                  , (f"{date.strftime(r"%Y-%m-%d")} 00:00:00", f"{date.strftime(r"%Y-%m-%d")} 23:59:59")
-                                  ).fetchall()
-            values.append([date.strftime("%A\n%m/%d"), db_res])
+            values.append([date.strftime("%A\n%m/%d"), daily_ms.get(date.strftime("%Y-%m-%d"), 0)])
         
         fig, ax = plt.subplots(figsize = (10, 5))
         fig.patch.set_facecolor('#181818')  # Dark gray background
@@ -264,16 +258,15 @@ class WeeklyReport(LogAllMethods):
         ax.grid(axis='y', color='white', linestyle='-.', linewidth=1, alpha=0.3)
         ax.set_axisbelow(True)
         
-        plt.bar([val[0] for val in values], [len(val[1])/240 for val in values], color='#1DB954', width=0.8)
+        plt.bar([val[0] for val in values], [val[1]/MS_PER_HOUR for val in values], color='#1DB954', width=0.8)
         plt.ylabel("Hours Spent Listening", color='white')
         plt.title(f"Spotify Listening For {(datetime.today() - timedelta(days=8)).strftime('%b %d %Y')} -"
                   f"{(datetime.today() - timedelta(days=2)).strftime('%b %d %Y')}", color='white')
         
         # Add previous month of listening data
-        average = self._gen_average_for_past_month(conn, 28)
+        average = self._gen_average_for_past_month(28)
         plt.plot(average, color='#CCCCCC', linewidth=1.5)
         
-        conn.close()
         plt.savefig(self.LISTENING_DATA_PLOT_FILEPATH) 
     
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
@@ -360,14 +353,12 @@ class WeeklyReport(LogAllMethods):
           , ("Most Featured Non-Followed Artists", self.statistics.generate_featured_artists_list(10))
         ]
         
-        sanity_tables = [
-            ("Differences In Playlists", self.sanity_tester.sanity_diffs_in_major_playlist_sets())
-          , ("In Progress Artists", self.sanity_tester.sanity_in_progress_artists())
-          , ("Duplicates", self.sanity_tester.sanity_duplicates())
-          , ("Artist Integrity", self.sanity_tester.sanity_artist_playlist_integrity())
-          , ("Contributing Artists Missing", self.sanity_tester.sanity_contributing_artists())
-          , ("Non-Playable Tracks", self.sanity_tester.sanity_playable_tracks())
-        ]
+        sanity_checks = self.sanity_tester.run_checks()
+        sanity_tables = [(check['name'], check['results']) for check in sanity_checks]
+        # Slowest first so any check that starts dragging is right at the top
+        sanity_tables.append(("Sanity Check Timings"
+                              , [{'Check': check['name'], 'Seconds': f"{check['duration_s']:.3f}"} 
+                                 for check in sorted(sanity_checks, key=lambda check: -check['duration_s'])]))
         
         self._gen_playback_graph()
         self._gen_progress_bar()
@@ -20,16 +20,25 @@
 #   trace back instead of just seeing that track[9] is out of range.
 # ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
 import contextlib
+import fcntl
+import json
 import logging
+import os
+import re
 import sqlite3
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
 from enum     import Enum
 
 from src.helpers.decorators import *
 
 class DatabaseSchema(Enum):
-    FULL = "full"         # includes listening_sessions and track_play_counts
-    SNAPSHOT = "snapshot" # excludes those two tables
+    FULL = "full"         # includes listening_sessions/ plays, track_play_counts, the listening rollups, and caches
+    SNAPSHOT = "snapshot" # excludes those tables
+
+LISTENING_TABLES = {"listening_sessions", "listening_plays", "track_play_counts", "last_track", "track_daily_rollups"
+                    , "track_hourly_rollups", "listening_archives", "playback_log_state"}
+VAULT_ONLY_TABLES = LISTENING_TABLES | {"sanity_check_cache", "album_cache", "playlist_snapshots"}
 
 
 SCHEMA_FIELDS = {
@@ -85,26 +94,146 @@ SCHEMA_FIELDS = {
         , "__constraints__" : ["UNIQUE(id_album, id_artist)"]
     },
     "listening_sessions": {
-          "time"         : "TIMESTAMP NOT NULL"
+          "time"         : "INTEGER NOT NULL" # Epoch seconds
         , "id_track"     : "TEXT" # REFERENCES tracks(id)"
+        , "__indexes__"  : ["time"]
+    },
+    "listening_plays": {
+          "start_time"   : "INTEGER NOT NULL" # Epoch seconds
+        , "end_time"     : "INTEGER NOT NULL" # Epoch seconds, last time we saw it
+        , "id_track"     : "TEXT"
+        , "ms_played"    : "INTEGER NOT NULL"
+        , "progress_ms"  : "INTEGER NOT NULL" # Track progress as of 'end_time', our next poll picks up from here
+        , "is_playing"   : "INTEGER NOT NULL" # Whether it was still playing (not paused) as of 'end_time'
+        , "__indexes__"  : ["start_time"]
     },
     "track_play_counts": {
           "id_track"     : "TEXT REFERENCES tracks(id) PRIMARY KEY"
         , "play_count"   : "INTEGER NOT NULL"
         , "__without_rowid__" : True
     },
+    "last_track": {
+          "id"           : "INTEGER PRIMARY KEY CHECK (id = 0)" # Only ever the one row
+        , "id_track"     : "TEXT NOT NULL"
+        , "counted"      : "INTEGER NOT NULL" # Whether 'id_track' already got its play count for this play
+    },
+    "playback_log_state": {
+          "id"           : "INTEGER PRIMARY KEY CHECK (id = 0)" # Only ever the one row
+        , "flushed_ns"   : "INTEGER NOT NULL" # 'logged_ns' of the last playback log record we flushed into our vault
+    },
+    "track_daily_rollups": {
+          "day"          : "TEXT NOT NULL"
+        , "id_track"     : "TEXT"
+        , "listen_count" : "INTEGER NOT NULL"
+        , "__constraints__" : ["UNIQUE(day, id_track)"]
+    },
+    "track_hourly_rollups": {
+          "hour"         : "TEXT NOT NULL"
+        , "id_track"     : "TEXT"
+        , "listen_count" : "INTEGER NOT NULL"
+        , "__constraints__" : ["UNIQUE(hour, id_track)"]
+    },
+    "listening_archives": {
+          "path"         : "TEXT PRIMARY KEY"
+        , "start_time"   : "INTEGER NOT NULL"
+        , "end_time"     : "INTEGER NOT NULL"
+        , "__without_rowid__" : True
+    },
+    "playlist_snapshots": {
+          "id_playlist"  : "TEXT PRIMARY KEY"
+        , "snapshot_id"  : "TEXT NOT NULL" # Spotify's version of the playlist's tracks as of our last backup
+        , "__without_rowid__" : True
+    },
+    "sanity_check_cache": {
+          "check_name"   : "TEXT NOT NULL"
+        , "cache_key"    : "TEXT NOT NULL"
+        , "content_hash" : "TEXT NOT NULL"
+        , "results"      : "TEXT NOT NULL" # JSON
+        , "__constraints__" : ["PRIMARY KEY(check_name, cache_key)"]
+        , "__without_rowid__" : True
+    },
+    "album_cache": {
+          "id" : "TEXT PRIMARY KEY"
+        , "release_date" : "TEXT"
+        , "cached_at"    : "INTEGER NOT NULL" # Epoch seconds
+        , "album"        : "TEXT NOT NULL" # JSON, the album's 'ALBUM_CACHE_FIELDS' (see GSH) including its tracks
+        , "__without_rowid__" : True
+    },
+}
+
+# Keeps our rollups up to date on every insert into 'listening_sessions' no matter who does the inserting. Day and hour
+#   buckets are in local time just like our reports.
+LISTENING_ROLLUP_TRIGGER = """
+    CREATE TRIGGER IF NOT EXISTS listening_sessions_rollup AFTER INSERT ON listening_sessions
+    BEGIN
+        INSERT INTO track_daily_rollups (day, id_track, listen_count)
+        VALUES (strftime('%Y-%m-%d', NEW.time, 'unixepoch', 'localtime'), NEW.id_track, 1)
+        ON CONFLICT(day, id_track) DO UPDATE SET listen_count = listen_count + 1;
+        INSERT INTO track_hourly_rollups (hour, id_track, listen_count)
+        VALUES (strftime('%Y-%m-%d %H', NEW.time, 'unixepoch', 'localtime'), NEW.id_track, 1)
+        ON CONFLICT(hour, id_track) DO UPDATE SET listen_count = listen_count + 1;
+    END;
+"""
+
+# Before 'listening_plays' every listening session stood for one fixed 15s poll. When deriving plays from that history
+#   back to back sessions of the same track (no more than 'LEGACY_PLAY_GAP_S' apart) are folded into one play.
+LEGACY_SESSION_MS = 15_000
+LEGACY_PLAY_GAP_S = 30
+DERIVE_LISTENING_PLAYS = """
+    INSERT INTO listening_plays (start_time, end_time, id_track, ms_played, progress_ms, is_playing)
+    SELECT MIN(time), MAX(time), id_track, COUNT(*) * :session_ms, COUNT(*) * :session_ms, 0
+    FROM (SELECT time, id_track, SUM(new_play) OVER (ORDER BY time, rowid) AS play
+          FROM (SELECT time, id_track, rowid
+                     , CASE WHEN id_track IS LAG(id_track) OVER sessions
+                             AND time - LAG(time) OVER sessions <= :gap_s THEN 0 ELSE 1 END AS new_play
+                FROM {sessions_table}
+                WINDOW sessions AS (ORDER BY time, rowid)))
+    GROUP BY play;
+"""
+
+# When we know our playback's progress a track gets its play count once its play reaches 'PLAY_COUNT_MIN_MS' of actual
+#   listening in 'listening_plays', no matter how often we poll.
+PLAY_COUNT_MIN_MS = 30_000
+COUNT_TRACK_PLAY = """
+    INSERT INTO track_play_counts (id_track, play_count) VALUES (:track_id, 1)
+    ON CONFLICT(id_track) DO UPDATE SET play_count = play_count + 1;
+"""
+
+# Without its progress a track gets its play count once it shows up in back to back sessions. Counting has to read our
+#   last track before it's upserted so these run in this order, in the same transaction as the session itself.
+COUNT_LAST_TRACK = """
+    INSERT INTO track_play_counts (id_track, play_count)
+    SELECT id_track, 1 FROM last_track WHERE id_track = :track_id AND counted = 0
+    ON CONFLICT(id_track) DO UPDATE SET play_count = play_count + 1;
+"""
+UPSERT_LAST_TRACK = """
+    INSERT INTO last_track (id, id_track, counted) VALUES (0, :track_id, 0)
+    ON CONFLICT(id) DO UPDATE SET counted = (id_track = excluded.id_track), id_track = excluded.id_track;
+"""
+
+# Buffered polls are appended to a log next to our vault (like sqlite's own '-wal'/'-journal' files) until we flush
+#   them. Swapping logs, appending, and flushing all happen under an flock on our '.lock' file so our poller and
+#   any job flushing before it reads, in this process or another (ie overlapping cron runs), can't step on each other.
+PLAYBACK_LOG_SUFFIX = "-playback.log"
+
+# Table, bucket column, bucket formatter, and aggregate for each source we can pull listening counts from.
+LISTENING_COUNT_SOURCES = {
+      "listening_sessions"   : ("time", lambda date: int(date.timestamp()),        "COUNT(*)")
+    , "track_hourly_rollups" : ("hour", lambda date: date.strftime("%Y-%m-%d %H"), "SUM(listen_count)")
+    , "track_daily_rollups"  : ("day",  lambda date: date.strftime("%Y-%m-%d"),    "SUM(listen_count)")
 }
 
 
 """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
-DESCRIPTION: Generic function to create a sql statement to create a table.
-INPUT: table - table value we are creating.
+DESCRIPTION: Generic function to create a sql statement to create a table and any of its indexes.
+INPUT: table - table value we are creating, optionally schema qualified.
        fields - fields that our table will have.
 Output: SQL statement to create our table with name 'table' and columns 'fields'.
 """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""         
 def generate_create_statement(table: str, fields: dict[str, str]) -> str:
     constraints = fields.pop("__constraints__", [])
     without_rowid = fields.pop("__without_rowid__", False)
+    indexes = fields.pop("__indexes__", [])
     columns = ",\n\t".join(f"{name} {col_type}" for name, col_type in fields.items())
 
     constraints_clause = ""
@@ -114,8 +243,14 @@ def generate_create_statement(table: str, fields: dict[str, str]) -> str:
     statement = f"CREATE TABLE IF NOT EXISTS {table} (\n    {columns}{constraints_clause}\n)"
     if without_rowid:
         statement += " WITHOUT ROWID"
+    statement += ";"
+    
+    schema, _, table_name = table.rpartition(".")
+    for column in indexes:
+        index_name = f"{schema}.idx_{table_name}_{column}" if schema else f"idx_{table_name}_{column}"
+        statement += f"\nCREATE INDEX IF NOT EXISTS {index_name} ON {table_name}({column});"
 
-    return statement + ";"
+    return statement
 
 
 """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
@@ -227,6 +362,81 @@ def get_column_types(db_conn, table: str) -> list:
     return column_types
 
 
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Splits an inclusive listening date range into the cheapest set of sources to count it from. Whole days
+             come from our daily rollups, whole hours from our hourly rollups, and only the leftover edges are read
+             from 'listening_sessions' itself.
+INPUT: start_date - Start of date range (inclusive).
+       end_date - End of date range (inclusive).
+OUTPUT: Dict of source table to a list of half open (start, end) ranges formatted for that table's bucket column.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def split_listening_range(start_date: datetime, end_date: datetime) -> dict[str, list[tuple]]:
+    ranges = {table: [] for table in LISTENING_COUNT_SOURCES}
+    # Our times are stored to the second so an inclusive end is the same as an exclusive end one second later
+    start = start_date.replace(microsecond=0)
+    end = end_date.replace(microsecond=0) + timedelta(seconds=1)
+    if start >= end:
+        return ranges
+
+    def add_range(table: str, range_start: datetime, range_end: datetime) -> None:
+        if range_start < range_end:
+            fmt = LISTENING_COUNT_SOURCES[table][1]
+            ranges[table].append((fmt(range_start), fmt(range_end)))
+
+    floor_hour = lambda date: date.replace(minute=0, second=0)
+    ceil_hour = lambda date: date if date == floor_hour(date) else floor_hour(date) + timedelta(hours=1)
+    hour_start, hour_end = ceil_hour(start), floor_hour(end)
+    if hour_start >= hour_end:
+        add_range("listening_sessions", start, end)
+        return ranges
+
+    floor_day = lambda date: date.replace(hour=0)
+    ceil_day = lambda date: date if date == floor_day(date) else floor_day(date) + timedelta(days=1)
+    day_start, day_end = ceil_day(hour_start), floor_day(hour_end)
+    if day_start >= day_end:
+        day_start = day_end = hour_end
+
+    add_range("listening_sessions", start, hour_start)
+    add_range("track_hourly_rollups", hour_start, day_start)
+    add_range("track_daily_rollups", day_start, day_end)
+    add_range("track_hourly_rollups", day_end, hour_end)
+    add_range("listening_sessions", hour_end, end)
+    return ranges
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Builds a sub query that gives per track listening counts for a date range using our rollups wherever the
+             range allows it. Any part of the range we have to read raw sessions for also pulls from the archives
+             that overlap it, archives that don't overlap are never touched.
+INPUT: start_date - Start of date range (inclusive).
+       end_date - End of date range (inclusive).
+       archives - List of 'listening_archives' row dicts we could need to read from.
+OUTPUT: Tuple of the SQL sub query with columns (id_track, listen_count), its parameters, and a dict of schema alias to
+        archive path that must be attached to run it. None if range is empty.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def build_listening_counts_query(start_date: datetime, end_date: datetime
+                                 , archives: list[dict]=[]) -> Optional[tuple[str, list, dict[str, str]]]:
+    selects, params, attachments = [], [], {}
+    for table, table_ranges in split_listening_range(start_date, end_date).items():
+        column, _, aggregate = LISTENING_COUNT_SOURCES[table]
+        for range_start, range_end in table_ranges:
+            sources = [table]
+            if table == "listening_sessions":
+                for archive in archives:
+                    if archive['start_time'] < range_end and archive['end_time'] > range_start:
+                        alias = next((alias for alias, path in attachments.items() if path == archive['path'])
+                                     , f"archive_{len(attachments)}")
+                        attachments[alias] = archive['path']
+                        sources.append(f"{alias}.listening_sessions")
+            
+            for source in sources:
+                selects.append(f"""SELECT id_track, {aggregate} AS listen_count FROM {source}
+                                   WHERE {column} >= ? AND {column} < ? GROUP BY id_track""")
+                params += [range_start, range_end]
+
+    return ("\nUNION ALL\n".join(selects), params, attachments) if selects else None
+
+
 """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
 DESCRIPTION: Collection of methods similar to GSH that grab from our latest local backup rather than spotify itself.
              Table definitions can be found in Backup_Spotify_Data.py.
@@ -260,15 +470,17 @@ class DatabaseHelpers(LogAllMethods):
     
     """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
     DESCRIPTION: Context manager for our database connection in readonly mode.
-    INPUT: N/A
+    INPUT: attachments - Optional dict of schema alias to db path that will be attached readonly as well.
     Output: N/A
     """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""         
     @contextlib.contextmanager
-    def connect_db_readonly(self):
+    def connect_db_readonly(self, attachments: dict[str, str]={}):
         uri = f'file:{self.db_path}?mode=ro' if '?' not in self.db_path else self.db_path
         conn = sqlite3.connect(uri, uri=True)
         try:
             conn.execute("PRAGMA foreign_keys = ON;")
+            for alias, path in attachments.items():
+                conn.execute(f"ATTACH DATABASE ? AS {alias}", (f"file:{path}?mode=ro",))
             yield conn
         finally:
             conn.close()
@@ -286,7 +498,7 @@ class DatabaseHelpers(LogAllMethods):
         schema_sql = []
 
         for table, fields in SCHEMA_FIELDS.items():
-            if self.schema == DatabaseSchema.SNAPSHOT and table in {"listening_sessions", "track_play_counts"}:
+            if self.schema == DatabaseSchema.SNAPSHOT and table in VAULT_ONLY_TABLES:
                 continue
             
             field_copy = fields.copy()
@@ -294,7 +506,183 @@ class DatabaseHelpers(LogAllMethods):
             schema_sql.append(stmt)
             
         with self.connect_db() as db_conn:
+            # No rollup trigger means this db either is brand new or predates our rollups, either way catch them up
+            rollups_missing = db_conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = ?"
+                                              , ("listening_sessions_rollup",)).fetchone() is None
+            # Same goes for our plays, any history from before them gets derived from our sessions
+            plays_missing = db_conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?"
+                                            , ("listening_plays",)).fetchone() is None
             db_conn.executescript("\n".join(schema_sql))
+            if self.schema == DatabaseSchema.FULL:
+                self._migrate_listening_times(db_conn)
+                db_conn.execute(LISTENING_ROLLUP_TRIGGER)
+                if rollups_missing:
+                    self._rebuild_listening_rollups(db_conn)
+                if plays_missing:
+                    self._derive_listening_plays(db_conn)
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Rebuilds our daily and hourly listening rollups from scratch off of 'listening_sessions'. Our trigger
+                 keeps these up to date going forward, this is only needed as a catch up for existing history.
+    INPUT: N/A
+    OUTPUT: N/A
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def rebuild_listening_rollups(self) -> None:
+        with self.connect_db() as db_conn:
+            self._rebuild_listening_rollups(db_conn)
+            # Archived sessions still count towards our rollups, we can't attach inside of a transaction
+            db_conn.commit()
+            for (archive_path,) in db_conn.execute("SELECT path FROM listening_archives").fetchall():
+                db_conn.execute("ATTACH DATABASE ? AS archive", (archive_path,))
+                self._add_to_listening_rollups(db_conn, "archive.listening_sessions")
+                db_conn.commit()
+                db_conn.execute("DETACH DATABASE archive")
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Does the actual rollup rebuild on an open connection so we can also run it while creating our db.
+    INPUT: db_conn - Open connection to our db.
+    OUTPUT: N/A
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def _rebuild_listening_rollups(self, db_conn) -> None:
+        db_conn.execute("DELETE FROM track_daily_rollups")
+        db_conn.execute("DELETE FROM track_hourly_rollups")
+        self._add_to_listening_rollups(db_conn, "listening_sessions")
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Adds every session in 'sessions_table' on top of whatever is already in our rollups.
+    INPUT: db_conn - Open connection to our db.
+           sessions_table - Table (optionally schema qualified) with the 'listening_sessions' schema to roll up.
+    OUTPUT: N/A
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def _add_to_listening_rollups(self, db_conn, sessions_table: str) -> None:
+        for table, column, fmt in [("track_daily_rollups", "day", "%Y-%m-%d")
+                                   , ("track_hourly_rollups", "hour", "%Y-%m-%d %H")]:
+            db_conn.execute(f"""
+                INSERT INTO {table} ({column}, id_track, listen_count)
+                SELECT strftime('{fmt}', time, 'unixepoch', 'localtime') AS bucket, id_track, COUNT(*)
+                FROM {sessions_table}
+                WHERE true
+                GROUP BY bucket, id_track
+                ON CONFLICT({column}, id_track) DO UPDATE SET listen_count = listen_count + excluded.listen_count;
+            """)
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: One time derivation of 'listening_plays' from the sessions we logged before we had them, this covers
+                 our vault and every archive db. See 'LEGACY_SESSION_MS'.
+    INPUT: db_conn - Open connection to our db.
+    OUTPUT: N/A
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def _derive_listening_plays(self, db_conn) -> None:
+        params = {'session_ms': LEGACY_SESSION_MS, 'gap_s': LEGACY_PLAY_GAP_S}
+        db_conn.execute(DERIVE_LISTENING_PLAYS.format(sessions_table="listening_sessions"), params)
+        # We can't attach inside of a transaction
+        db_conn.commit()
+        for (archive_path,) in db_conn.execute("SELECT path FROM listening_archives").fetchall():
+            db_conn.execute("ATTACH DATABASE ? AS archive", (archive_path,))
+            db_conn.execute(DERIVE_LISTENING_PLAYS.format(sessions_table="archive.listening_sessions"), params)
+            db_conn.commit()
+            db_conn.execute("DETACH DATABASE archive")
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: One time migration of our listening times from "%Y-%m-%d %H:%M:%S" local time strings over to integer
+                 epoch seconds. This covers our vault's sessions, our archive bounds, and every archive db.
+    INPUT: db_conn - Open connection to our db.
+    OUTPUT: N/A
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def _migrate_listening_times(self, db_conn) -> None:
+        if not self._migrate_to_epoch_times(db_conn, "listening_sessions", ["time"]):
+            return
+        
+        self.logger.info(f"\t Migrated Listening Sessions To Epoch Times")
+        self._migrate_to_epoch_times(db_conn, "listening_archives", ["start_time", "end_time"])
+        # We can't attach inside of a transaction
+        db_conn.commit()
+        for (archive_path,) in db_conn.execute("SELECT path FROM listening_archives").fetchall():
+            db_conn.execute("ATTACH DATABASE ? AS archive", (archive_path,))
+            self._migrate_to_epoch_times(db_conn, "archive.listening_sessions", ["time"])
+            db_conn.executescript(generate_create_statement("archive.listening_sessions"
+                                                            , SCHEMA_FIELDS["listening_sessions"].copy()))
+            db_conn.execute("DETACH DATABASE archive")
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Rebuilds 'table' with 'columns' as INTEGER epoch seconds if they are still declared as anything else.
+                 SQLite can't alter a column's type so we follow its documented create, copy, drop, and rename
+                 procedure. The rest of the original table definition and its indexes are kept as is. Any '_epoch'
+                 table left behind by a migration that died partway through is dropped and rebuilt from scratch.
+    INPUT: db_conn - Open connection to our db.
+           table - Table (optionally schema qualified) we are migrating.
+           columns - Columns holding local "%Y-%m-%d %H:%M:%S" times that should become epoch seconds.
+    OUTPUT: Bool on whether the table was migrated.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def _migrate_to_epoch_times(self, db_conn, table: str, columns: list[str]) -> bool:
+        schema, _, table_name = table.rpartition(".")
+        prefix = f"{schema}." if schema else ""
+        column_types = {col[1]: col[2].upper() for col in 
+                            db_conn.execute(f"PRAGMA {prefix}table_info({table_name})").fetchall()}
+        if all(column_types.get(column, "INTEGER") == "INTEGER" for column in columns):
+            return False
+        
+        create_sql = db_conn.execute(f"SELECT sql FROM {prefix}sqlite_master WHERE type = 'table' AND name = ?"
+                                     , (table_name,)).fetchone()[0]
+        index_sqls = [row[0] for row in db_conn.execute(f"""SELECT sql FROM {prefix}sqlite_master 
+                                                            WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL"""
+                                                        , (table_name,)).fetchall()]
+        for column in columns:
+            create_sql = re.sub(rf"\b{column}\s+\w+", f"{column} INTEGER", create_sql, count=1)
+        create_sql = re.sub(rf"\b{table_name}\b", f"{prefix}{table_name}_epoch", create_sql, count=1)
+        select = ", ".join(f"""CASE WHEN typeof({col}) = 'text' THEN CAST(strftime('%s', {col}, 'utc') AS INTEGER)
+                                    ELSE {col} END""" if col in columns else col for col in column_types)
+        
+        db_conn.execute(f"DROP TABLE IF EXISTS {prefix}{table_name}_epoch")
+        db_conn.execute(create_sql)
+        db_conn.execute(f"INSERT INTO {prefix}{table_name}_epoch SELECT {select} FROM {prefix}{table_name}")
+        db_conn.execute(f"DROP TABLE {prefix}{table_name}")
+        db_conn.execute(f"ALTER TABLE {prefix}{table_name}_epoch RENAME TO {table_name}")
+        for index_sql in index_sqls:
+            db_conn.execute(re.sub(r"\bINDEX\s+(\w+)", rf"INDEX {prefix}\1", index_sql, count=1))
+        return True
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Moves every closed month of 'listening_sessions' before 'before' out of our vault and into its own
+                 per month db under 'archive_location'. Our rollups are left untouched so stats still see the history
+                 and our date range queries will attach the archives themselves when they need raw sessions.
+    INPUT: archive_location - Directory we will be writing our archive dbs to.
+           before - Any month that ends on or before the start of this month will be archived.
+    OUTPUT: List of archive db paths that were written to.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def archive_listening_sessions(self, archive_location: str, before: datetime) -> list[str]:
+        cutoff = before.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        os.makedirs(archive_location, exist_ok=True)
+        archived = []
+        
+        with self.connect_db() as db_conn:
+            months = [row[0] for row in db_conn.execute("""
+                SELECT DISTINCT strftime('%Y-%m', time, 'unixepoch', 'localtime') AS month FROM listening_sessions
+                WHERE time < ? ORDER BY month""", (int(cutoff.timestamp()),)).fetchall()]
+            for month in months:
+                month_start = datetime.strptime(month, "%Y-%m")
+                month_end = (month_start + timedelta(days=32)).replace(day=1)
+                time_range = (int(month_start.timestamp()), int(month_end.timestamp()))
+                archive_path = os.path.join(archive_location, f"listening_sessions_{month_start.strftime('%Y_%m')}.db")
+                self.logger.info(f"\t Archiving {month} Listening Sessions To {archive_path}")
+                
+                db_conn.execute("ATTACH DATABASE ? AS archive", (archive_path,))
+                db_conn.executescript(generate_create_statement("archive.listening_sessions"
+                                                                , SCHEMA_FIELDS["listening_sessions"].copy()))
+                db_conn.execute("""INSERT INTO archive.listening_sessions SELECT * FROM listening_sessions
+                                   WHERE time >= ? AND time < ?""", time_range)
+                db_conn.execute("INSERT OR IGNORE INTO listening_archives VALUES (?, ?, ?)"
+                                , (archive_path, *time_range))
+                db_conn.execute("DELETE FROM listening_sessions WHERE time >= ? AND time < ?", time_range)
+                db_conn.commit()
+                db_conn.execute("DETACH DATABASE archive")
+                archived.append(archive_path)
+        
+        # Hand the freed up pages back to the filesystem, this can't be done inside of a transaction
+        if archived:
+            with self.connect_db() as db_conn:
+                db_conn.execute("VACUUM")
+        return archived
     
     """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
     DESCRIPTION: Inserts a variable amount of elements into a database table while verifying the types of your 'values'
@@ -309,23 +697,38 @@ class DatabaseHelpers(LogAllMethods):
             return  # No data to insert
 
         with self.connect_db() as db_conn:
-            expected_types = get_column_types(db_conn, table)
+            self._insert_many(db_conn, table, values, batch_size)
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: 'insert_many()' on an already open connection so it can be part of a larger transaction.
+    INPUT: db_conn - Open connection to our db.
+           table - What table we will insert into (str).
+           values - What data will be inserted into the table.
+           batch_size - How many 'values' we can add into a table at once for performance issues.
+    OUTPUT: N/A
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def _insert_many(self, db_conn, table: str, values: Union[list[dict], list[tuple], list]
+                     , batch_size: int=500) -> None:
+        if not values:
+            return  # No data to insert
         
-            # Translates values into our format from either dict, list of tuples, or just list
-            data = [tuple(d.values()) for d in values] if type(values[0]) is dict \
-                    else [(v,) for v in values] if type(values[0]) is not tuple else values 
-              
-            for row in data:
-                for i, (val, expected_type) in enumerate(zip(row, expected_types)):
-                    if not isinstance(val, expected_type):
-                        raise ValueError(f"'{val}' in column {i+1} of table '{table}' should be of type {expected_type}")
+        expected_types = get_column_types(db_conn, table)
+    
+        # Translates values into our format from either dict, list of tuples, or just list
+        data = [tuple(d.values()) for d in values] if type(values[0]) is dict \
+                else [(v,) for v in values] if type(values[0]) is not tuple else values 
+          
+        for row in data:
+            for i, (val, expected_type) in enumerate(zip(row, expected_types)):
+                if not isinstance(val, expected_type):
+                    raise ValueError(f"'{val}' in column {i+1} of table '{table}' should be of type {expected_type}")
 
-            placeholders = ", ".join("?" for _ in data[0])
-            query = f"INSERT OR IGNORE INTO {table} VALUES ({placeholders})"
+        placeholders = ", ".join("?" for _ in data[0])
+        query = f"INSERT OR IGNORE INTO {table} VALUES ({placeholders})"
 
-            for i in range(0, len(data), batch_size):
-                batch = data[i:i + batch_size]
-                db_conn.executemany(query, batch)
+        for i in range(0, len(data), batch_size):
+            batch = data[i:i + batch_size]
+            db_conn.executemany(query, batch)
     
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
     DESCRIPTION: Increments the play count of a track by 1. If the track is not in the database, it will be added.
@@ -342,12 +745,250 @@ class DatabaseHelpers(LogAllMethods):
             db_conn.execute(query, (track_id,))
     
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
-    DESCRIPTION: Adds a new listening session to the database for the given track and the current time.
+    DESCRIPTION: Adds a new listening session to the database for the given track and the current time. Optionally
+                 keeps our 'last_track' state up to date with it as well, incrementing the track's play count the
+                 second session in a row we see it. It's all one transaction so a crash can't count a play twice.
     INPUT: track_id - Track id we are listening to currently.
+           inc_track_count - Whether this session counts towards our 'track_play_counts'.
+    OUTPUT: N/A
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def add_listening_session(self, track_id: str, inc_track_count: bool=False) -> None:
+        with self.connect_db() as db_conn:
+            self._add_listening_session(db_conn, track_id, int(datetime.now().timestamp()), inc_track_count)
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: 'add_listening_session()' on an already open connection so it can be part of a larger transaction.
+    INPUT: db_conn - Open connection to our db.
+           track_id - Track id we are listening to currently.
+           session_time - Epoch seconds of our session.
+           inc_track_count - Whether this session counts towards our 'track_play_counts'.
+    OUTPUT: N/A
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def _add_listening_session(self, db_conn, track_id: str, session_time: int, inc_track_count: bool=False) -> None:
+        db_conn.execute("INSERT INTO listening_sessions VALUES (?, ?)", (session_time, track_id))
+        if inc_track_count:
+            db_conn.execute(COUNT_LAST_TRACK, {'track_id': track_id})
+            db_conn.execute(UPSERT_LAST_TRACK, {'track_id': track_id})
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Accounts for one poll of our playback in 'listening_plays'. The same track as our last play that
+                 hasn't gone backwards is the same play and gets however far it got since. Anything else finishes off
+                 our last play, if it was still playing it gets the rest of its track (up until our new play started),
+                 and starts a new play 'progress_ms' before 'poll_time'. We never credit more time than actually passed
+                 between polls so skipping around in a track can't inflate our listening.
+    INPUT: track_id - Id of the track our playback is on.
+           progress_ms - How far into the track our playback is.
+           is_playing - Whether our playback is playing or paused.
+           poll_time - Epoch seconds we grabbed our playback at.
+           max_gap_s - Longest we can go between polls of a track and still count it as the same play.
+    OUTPUT: List of track ids whose play just reached 'PLAY_COUNT_MIN_MS' with this poll.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def log_listening_play(self, track_id: str, progress_ms: int, is_playing: bool, poll_time: int
+                           , max_gap_s: int=1800) -> list[str]:
+        with self.connect_db() as db_conn:
+            return self._log_listening_play(db_conn, track_id, progress_ms, is_playing, poll_time, max_gap_s)
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: 'log_listening_play()' on an already open connection so it can be part of a larger transaction.
+    INPUT: db_conn - Open connection to our db.
+           See 'log_listening_play()' for the rest.
+    OUTPUT: See 'log_listening_play()'.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def _log_listening_play(self, db_conn, track_id: str, progress_ms: int, is_playing: bool, poll_time: int
+                            , max_gap_s: int=1800) -> list[str]:
+        reached_count = lambda before_ms, after_ms: before_ms < PLAY_COUNT_MIN_MS <= after_ms
+        last_play = db_conn.execute("""SELECT rowid, id_track, end_time, progress_ms, is_playing, ms_played
+                                       FROM listening_plays
+                                       ORDER BY start_time DESC, rowid DESC LIMIT 1""").fetchone()
+        played_ms = progress_ms
+        counted_track_ids = []
+        if last_play is not None:
+            rowid, last_track_id, last_end_time, last_progress_ms, last_is_playing, last_ms_played = last_play
+            elapsed_ms = max(poll_time - last_end_time, 0) * 1000
+            if last_track_id == track_id and last_progress_ms <= progress_ms \
+                and poll_time - last_end_time <= max_gap_s:
+                added_ms = min(progress_ms - last_progress_ms, elapsed_ms)
+                db_conn.execute("""UPDATE listening_plays
+                                   SET end_time = ?, ms_played = ms_played + ?, progress_ms = ?, is_playing = ?
+                                   WHERE rowid = ?"""
+                                , (poll_time, added_ms, progress_ms, int(is_playing), rowid))
+                return [track_id] if reached_count(last_ms_played, last_ms_played + added_ms) else []
+            
+            played_ms = min(progress_ms, elapsed_ms)
+            tail_ms = 0
+            if last_is_playing:
+                track = db_conn.execute("SELECT duration_ms FROM tracks WHERE id = ?", (last_track_id,)).fetchone()
+                duration_ms = track[0] if track is not None and track[0] is not None else last_progress_ms
+                tail_ms = max(min(duration_ms - last_progress_ms, elapsed_ms - played_ms), 0)
+            db_conn.execute("""UPDATE listening_plays
+                               SET end_time = end_time + ?, ms_played = ms_played + ?, is_playing = 0
+                               WHERE rowid = ?""", (tail_ms // 1000, tail_ms, rowid))
+            if reached_count(last_ms_played, last_ms_played + tail_ms):
+                counted_track_ids.append(last_track_id)
+        
+        db_conn.execute("INSERT INTO listening_plays VALUES (?, ?, ?, ?, ?, ?)"
+                        , (poll_time - played_ms // 1000, poll_time, track_id, played_ms, progress_ms
+                           , int(is_playing)))
+        if reached_count(0, played_ms):
+            counted_track_ids.append(track_id)
+        return counted_track_ids
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Logs one poll of our playback in a single transaction. Writes any of our track's 'entries' (see
+                 'build_entries_from_tracks()'), accounts for its play, and if we're playing adds its listening
+                 session. With 'progress_ms' play counts come from our plays (see 'PLAY_COUNT_MIN_MS'), without it
+                 from back to back sessions. Reusing the one connection also lets sqlite reuse its prepared
+                 statements for each of these.
+    INPUT: entries - Dict of table to rows for our track, empty if we already know they're in our vault.
+           track_id - Id of the track our playback is on.
+           progress_ms - How far into the track our playback is, None skips accounting for its play.
+           is_playing - Whether our playback is playing or paused.
+           poll_time - Epoch seconds we grabbed our playback at.
+           inc_track_count - Whether our poll counts towards our 'track_play_counts'.
+           max_gap_s - See 'log_listening_play()'.
     OUTPUT: N/A
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
-    def add_listening_session(self, track_id: str) -> None:
-        self.insert_many("listening_sessions", [(datetime.now().strftime(r"%Y-%m-%d %H:%M:%S"), track_id)])
+    def log_playback(self, entries: dict, track_id: str, progress_ms: Optional[int], is_playing: bool, poll_time: int
+                     , inc_track_count: bool=False, max_gap_s: int=1800) -> None:
+        with self.connect_db() as db_conn:
+            self._log_playback(db_conn, entries, track_id, progress_ms, is_playing, poll_time, inc_track_count
+                               , max_gap_s)
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: 'log_playback()' on an already open connection so we can flush many polls in one transaction.
+    INPUT: db_conn - Open connection to our db.
+           See 'log_playback()' for the rest.
+    OUTPUT: N/A
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def _log_playback(self, db_conn, entries: dict, track_id: str, progress_ms: Optional[int], is_playing: bool
+                      , poll_time: int, inc_track_count: bool=False, max_gap_s: int=1800) -> None:
+        for table, values in entries.items():
+            self._insert_many(db_conn, table, values)
+        if progress_ms is not None:
+            counted_track_ids = self._log_listening_play(db_conn, track_id, progress_ms, is_playing, poll_time
+                                                         , max_gap_s)
+            if inc_track_count:
+                for counted_track_id in counted_track_ids:
+                    db_conn.execute(COUNT_TRACK_PLAY, {'track_id': counted_track_id})
+        if is_playing:
+            self._add_listening_session(db_conn, track_id, poll_time, inc_track_count and progress_ms is None)
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Path of the append only log our buffered playback polls go into before being flushed into our vault.
+    INPUT: N/A
+    OUTPUT: Path of our playback log, our '.flushing' log is this with '.flushing' tacked on.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def get_playback_log_path(self) -> str:
+        return f"{self.db_path}{PLAYBACK_LOG_SUFFIX}"
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Whether we have any buffered playback polls that haven't made it into our vault yet.
+    INPUT: N/A
+    OUTPUT: True if either our playback log or a leftover '.flushing' log exists.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def has_playback_log(self) -> bool:
+        log_path = self.get_playback_log_path()
+        return os.path.exists(log_path) or os.path.exists(f"{log_path}.flushing")
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Context manager holding an exclusive flock on our playback log's '.lock' file, see
+                 'PLAYBACK_LOG_SUFFIX'. Our lock file is left in place, removing it would let two of us lock
+                 different files.
+    INPUT: N/A
+    OUTPUT: N/A
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    @contextlib.contextmanager
+    def lock_playback_log(self):
+        with open(f"{self.get_playback_log_path()}.lock", 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Buffered version of 'log_playback()'. Rather than a transaction (and its fsyncs) every poll, we
+                 append one json line to our playback log. It's not written to our vault until we flush it, see
+                 'flush_playback_log()'. Each record gets a 'logged_ns' so we never flush the same one twice.
+    INPUT: See 'log_playback()'.
+    OUTPUT: N/A
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def buffer_playback(self, entries: dict, track_id: str, progress_ms: Optional[int], is_playing: bool
+                        , poll_time: int, inc_track_count: bool=False, max_gap_s: int=1800) -> None:
+        record = {'logged_ns': time.time_ns(), 'entries': entries, 'track_id': track_id, 'progress_ms': progress_ms
+                  , 'is_playing': is_playing, 'poll_time': poll_time, 'inc_track_count': inc_track_count
+                  , 'max_gap_s': max_gap_s}
+        with self.lock_playback_log():
+            with open(self.get_playback_log_path(), 'a', encoding='utf-8') as log:
+                log.write(json.dumps(record) + "\n")
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Flushes every buffered poll from our playback log into our vault in a single transaction. We first
+                 swap our log out to a '.flushing' log so new polls start a fresh one. Our '.flushing' log is only
+                 removed once its transaction commits, any left behind (ie we crashed) get flushed first next time.
+                 Along with its polls we commit the last 'logged_ns' we flushed, so crashing after our commit but
+                 before removing our log can't double up any polls. A torn last line from a crash mid append is
+                 dropped.
+    INPUT: N/A
+    OUTPUT: Number of polls flushed into our vault.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def flush_playback_log(self) -> int:
+        log_path = self.get_playback_log_path()
+        flushing_path = f"{log_path}.flushing"
+        num_flushed = 0
+        with self.lock_playback_log():
+            while os.path.exists(flushing_path) or os.path.exists(log_path):
+                if not os.path.exists(flushing_path):
+                    os.replace(log_path, flushing_path)
+                with open(flushing_path, encoding='utf-8') as log:
+                    records = [json.loads(line) for line in log if line.endswith("\n")]
+                
+                with self.connect_db() as db_conn:
+                    flushed_ns = db_conn.execute("SELECT flushed_ns FROM playback_log_state").fetchone()
+                    flushed_ns = flushed_ns[0] if flushed_ns is not None else -1
+                    records = [record for record in records if record['logged_ns'] > flushed_ns]
+                    for record in records:
+                        # Json hands our rows back as lists, 'insert_many()' wants tuples
+                        entries = {table: [tuple(row) for row in rows] for table, rows in record['entries'].items()}
+                        self._log_playback(db_conn, entries, record['track_id'], record['progress_ms']
+                                           , record['is_playing'], record['poll_time'], record['inc_track_count']
+                                           , record['max_gap_s'])
+                    if records:
+                        db_conn.execute("""INSERT INTO playback_log_state (id, flushed_ns) VALUES (0, ?)
+                                           ON CONFLICT(id) DO UPDATE SET flushed_ns = excluded.flushed_ns"""
+                                        , (records[-1]['logged_ns'],))
+                # Our lock keeps anyone else from flushing under us, but a missing log just means it's already gone
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(flushing_path)
+                num_flushed += len(records)
+        return num_flushed
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Swaps out our entire sanity check cache for 'entries' in one transaction so anything we didn't just 
+                 use (ie playlists that are gone now) gets dropped along the way.
+    INPUT: entries - List of (check_name, cache_key, content_hash, results) tuples.
+    OUTPUT: N/A
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def replace_sanity_check_cache(self, entries: list[tuple]) -> None:
+        with self.connect_db() as db_conn:
+            db_conn.execute("DELETE FROM sanity_check_cache")
+            db_conn.executemany("INSERT INTO sanity_check_cache VALUES (?, ?, ?, ?)", entries)
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Adds albums to our album cache, anything we already had cached for an album gets replaced.
+    INPUT: entries - List of (id, release_date, cached_at, album) tuples.
+    OUTPUT: N/A
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def upsert_album_cache(self, entries: list[tuple]) -> None:
+        query = f"""
+            INSERT INTO album_cache (id, release_date, cached_at, album)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET release_date = excluded.release_date
+                                        , cached_at = excluded.cached_at
+                                        , album = excluded.album;
+        """
+        with self.connect_db() as db_conn:
+            db_conn.executemany(query, entries)
     
     # ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
     # Generic Data Functions ══════════════════════════════════════════════════════════════════════════════════════════
@@ -357,10 +998,12 @@ class DatabaseHelpers(LogAllMethods):
     DESCRIPTION: Since we want to return dicts and not lists of our db data we can use this method to grab our db 
                  column names and zip it up into a dictionary for us.
     INPUT: query - Sqlite query we will fetchall results from and turn into a dict.
+           p_val - Parameters for our query.
+           attachments - Optional dict of schema alias to db path our query needs attached.
     OUTPUT: List of dicts from the db query.
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
-    def _conn_query_to_dict(self, query: str, p_val: tuple=()) -> list[dict]:
-        with self.connect_db_readonly() as db_conn:
+    def _conn_query_to_dict(self, query: str, p_val: tuple=(), attachments: dict[str, str]={}) -> list[dict]:
+        with self.connect_db_readonly(attachments) as db_conn:
             db_conn.row_factory = sqlite3.Row
             return [dict(row) for row in db_conn.execute(query, p_val).fetchall()]
     
@@ -405,6 +1048,35 @@ class DatabaseHelpers(LogAllMethods):
         """
         return self._conn_query_to_dict(query, p_val=(playlist_id,))
 
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Grabs the tracks of every playlist (or just 'playlist_ids') in our backup database in one go.
+    INPUT: playlist_ids - Optional list of playlist ids to grab, None grabs every playlist.
+           batch_size - Optional parameter to set batch size to prevent SQL errors.
+    OUTPUT: Dict of playlist id to its list of track dicts (same order 'get_tracks_from_playlist' gives).
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def get_all_playlists_tracks(self, playlist_ids: Optional[list[str]]=None
+                                 , batch_size: int=999) -> dict[str, list[dict]]:
+        query = """
+            SELECT playlists_tracks.id_playlist, tracks.*
+            FROM playlists_tracks
+            JOIN tracks ON tracks.id = playlists_tracks.id_track
+            {where}
+            ORDER BY playlists_tracks.rowid
+        """
+        if playlist_ids is None:
+            rows = self._conn_query_to_dict(query.format(where=""))
+        else:
+            rows = []
+            for i in range(0, len(playlist_ids), batch_size):
+                batch = playlist_ids[i:i + batch_size]
+                where = f"WHERE playlists_tracks.id_playlist IN ({', '.join('?' for _ in batch)})"
+                rows += self._conn_query_to_dict(query.format(where=where), p_val=batch)
+        
+        playlists_tracks = {}
+        for row in rows:
+            playlists_tracks.setdefault(row.pop('id_playlist'), []).append(row)
+        return playlists_tracks
+
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
     DESCRIPTION: Grabs all of the artists from our db for a given 'track_id'.
     INPUT: track_id - Id of the track we will be grabbing artists for.
@@ -419,6 +1091,41 @@ class DatabaseHelpers(LogAllMethods):
         """
         return self._conn_query_to_dict(query, p_val=(track_id,))
    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Grabs the artists of every track in our db (or just the tracks in 'playlist_ids') in one go.
+    INPUT: playlist_ids - Optional list of playlist ids whose tracks we want, None grabs every track.
+           batch_size - Optional parameter to set batch size to prevent SQL errors.
+    OUTPUT: Dict of track id to its list of artist dicts (same order 'get_track_artists' gives).
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def get_all_track_artists(self, playlist_ids: Optional[list[str]]=None
+                              , batch_size: int=999) -> dict[str, list[dict]]:
+        query = """
+            SELECT tracks_artists.id_track, artists.*
+            FROM tracks_artists
+            JOIN artists ON artists.id = tracks_artists.id_artist
+            {where}
+            ORDER BY tracks_artists.id_track, tracks_artists.id_artist
+        """
+        if playlist_ids is None:
+            batches = [self._conn_query_to_dict(query.format(where=""))]
+        else:
+            batches = []
+            for i in range(0, len(playlist_ids), batch_size):
+                batch = playlist_ids[i:i + batch_size]
+                where = f"""WHERE tracks_artists.id_track IN (SELECT id_track FROM playlists_tracks
+                                                            WHERE id_playlist IN ({', '.join('?' for _ in batch)}))"""
+                batches.append(self._conn_query_to_dict(query.format(where=where), p_val=batch))
+        
+        track_artists = {}
+        for rows in batches:
+            batch_track_artists = {}
+            for row in rows:
+                batch_track_artists.setdefault(row.pop('id_track'), []).append(row)
+            # A track in playlists from more than one batch comes back from each of them
+            for track_id, artists in batch_track_artists.items():
+                track_artists.setdefault(track_id, artists)
+        return track_artists
+   
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
     DESCRIPTION: Grabs all of the playlists in our db.
     INPUT: N/A
@@ -444,21 +1151,66 @@ class DatabaseHelpers(LogAllMethods):
         """
         return self._conn_query_to_dict(query)
     
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Grabs all of the archive dbs our older listening sessions have been moved into.
+    INPUT: N/A
+    OUTPUT: List of archive dicts ('path', 'start_time', 'end_time') ordered oldest first.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def get_listening_archives(self) -> list[dict]:
+        return self._conn_query_to_dict("SELECT * FROM listening_archives ORDER BY start_time")
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Grabs every cached sanity check result from our last run.
+    INPUT: N/A
+    OUTPUT: List of cache dicts ('check_name', 'cache_key', 'content_hash', 'results').
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def get_sanity_check_cache(self) -> list[dict]:
+        return self._conn_query_to_dict("SELECT * FROM sanity_check_cache")
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Grabs the snapshot id every playlist had as of our last backup.
+    INPUT: N/A
+    OUTPUT: Dict of playlist id to its snapshot id, playlists we don't have one for are left out.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def get_playlist_snapshots(self) -> dict[str, str]:
+        return {row['id_playlist']: row['snapshot_id'] 
+                for row in self._conn_query_to_dict("SELECT * FROM playlist_snapshots")}
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Grabs whatever we have cached for the given albums, it's up to the caller to decide if it's too old.
+    INPUT: album_ids - List of album ids to look up.
+           batch_size - Optional parameter to set batch size to prevent SQL errors.
+    OUTPUT: List of cache dicts ('id', 'release_date', 'cached_at', 'album') for the albums we had.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def get_album_cache(self, album_ids: list[str], batch_size: int=999) -> list[dict]:
+        res = []
+        for i in range(0, len(album_ids), batch_size):
+            batch = album_ids[i:i + batch_size]
+            query = f"""
+                SELECT *
+                FROM album_cache
+                WHERE id IN ({", ".join("?" for _ in batch)});
+            """
+            res += self._conn_query_to_dict(query, p_val=batch)
+        return res
+    
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
     DESCRIPTION: Grabs all tracks listened to in a given date range.
     INPUT: start_date - Start of date range.
            end_date - End of date range.
     OUTPUT: List of track dictionaries.
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
-    def get_tracks_listened_in_date_range(self, start_date: str, end_date: str) -> list[dict]:
+    def get_tracks_listened_in_date_range(self, start_date: datetime, end_date: datetime) -> list[dict]:
+        counts_query = build_listening_counts_query(start_date, end_date, self.get_listening_archives())
+        if counts_query is None:
+            return []
+        
         query = f"""
-            SELECT id_track as id, COUNT(*) as track_count
-            FROM listening_sessions
-            WHERE time BETWEEN ? AND ?
+            SELECT id_track as id, SUM(listen_count) as track_count
+            FROM ({counts_query[0]})
             GROUP BY id;
         """
-        return self._conn_query_to_dict(query, p_val=(start_date.strftime("%Y-%m-%d %H:%M:%S")
-                                                    , end_date.strftime("%Y-%m-%d %H:%M:%S")))
+        return self._conn_query_to_dict(query, p_val=counts_query[1], attachments=counts_query[2])
         
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
     DESCRIPTION: Grabs all of the artists that have been listened to in a given date range.
@@ -466,18 +1218,41 @@ class DatabaseHelpers(LogAllMethods):
            end_date - End of date range.
     OUTPUT: List of artist dictionaries.
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
-    def get_artists_listened_in_date_range(self, start_date: str, end_date: str) -> list[dict]:
+    def get_artists_listened_in_date_range(self, start_date: datetime, end_date: datetime) -> list[dict]:
+        counts_query = build_listening_counts_query(start_date, end_date, self.get_listening_archives())
+        if counts_query is None:
+            return []
+        
+        # Artist counts are derived from our track counts at query time so 'tracks_artists' rows added after the fact
+        #   still count towards earlier listening, same as if we were scanning 'listening_sessions' directly.
         query = f"""
-            SELECT a.*, COUNT(*) AS artist_count
-            FROM listening_sessions ls
-            JOIN tracks_artists ta ON ls.id_track = ta.id_track
+            SELECT a.*, SUM(lc.listen_count) AS artist_count
+            FROM ({counts_query[0]}) lc
+            JOIN tracks_artists ta ON lc.id_track = ta.id_track
             JOIN artists a ON ta.id_artist = a.id
-            WHERE ls.time BETWEEN ? AND ?
             GROUP BY a.name
             ORDER BY artist_count DESC;
         """
-        return self._conn_query_to_dict(query, p_val=(start_date.strftime("%Y-%m-%d %H:%M:%S")
-                                                    , end_date.strftime("%Y-%m-%d %H:%M:%S")))
+        return self._conn_query_to_dict(query, p_val=counts_query[1], attachments=counts_query[2])
+        
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Grabs how long we actually listened for each day in a given date range from our plays. A play counts
+                 towards the day it started on.
+    INPUT: start_date - First day of our date range (inclusive).
+           end_date - Last day of our date range (inclusive).
+    OUTPUT: Dict of "%Y-%m-%d" day to milliseconds listened, days without listening are left out.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def get_daily_listening_ms(self, start_date: datetime, end_date: datetime) -> dict[str, int]:
+        query = """
+            SELECT strftime('%Y-%m-%d', start_time, 'unixepoch', 'localtime') AS day, SUM(ms_played) AS ms_played
+            FROM listening_plays
+            WHERE start_time >= ? AND start_time < ?
+            GROUP BY day;
+        """
+        start = datetime.combine(start_date.date(), datetime.min.time())
+        end = datetime.combine(end_date.date(), datetime.min.time()) + timedelta(days=1)
+        rows = self._conn_query_to_dict(query, p_val=(int(start.timestamp()), int(end.timestamp())))
+        return {row['day']: row['ms_played'] for row in rows if row['ms_played'] > 0}
         
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
     DESCRIPTION: Grabs all unique artists that appear in the given playlists with a list of their collaborators from
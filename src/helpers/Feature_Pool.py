@@ -0,0 +1,155 @@
+# ╔════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦════╗
+# ║  ╔═╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═╗  ║
+# ╠══╣                                                                                                             ╠══╣
+# ║  ║    FEATURE POOL                             CREATED: 2026-10-19          https://github.com/jacobleazott    ║  ║
+# ║══║                                                                                                             ║══║
+# ║  ╚═╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═╝  ║
+# ╚════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩════╝
+# ════════════════════════════════════════════════════ DESCRIPTION ════════════════════════════════════════════════════
+# This file holds our FeaturePool, a small fixed set of worker threads that run SpotifyFeatures methods (our playback
+#   macros) off of a bounded queue. Each worker keeps its own warm SpotifyFeatures per log file, so a macro doesn't pay
+#   for a fresh logger, GSH, and proxy every time it's triggered, and no object is ever shared between two threads.
+#   Anything a warm object only caches for a single run is cleared before its next job.
+#   Triggering the same macro for the same playlist while it is still queued or running is dropped rather than
+#   doubled up, and 'get_stats' hands back our queue depth and how long jobs waited and ran.
+# ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
+import logging
+import queue
+import threading
+import time
+
+from src.helpers.decorators import *
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Bounded pool of worker threads that each run SpotifyFeatures methods on their own warm feature objects.
+             Workers are only started once our first job is submitted.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+class FeaturePool(LogAllMethods):
+    
+    def __init__(self, feature_factory, num_workers: int=2, max_queued: int=8, logger: logging.Logger=None) -> None:
+        self.feature_factory = feature_factory
+        self.num_workers = num_workers
+        self.logger = logger if logger is not None else logging.getLogger()
+        self.jobs = queue.Queue(maxsize=max_queued)
+        self.lock = threading.Lock()
+        self.workers = []
+        # Keys of every job that is queued or running, see 'get_job_key'
+        self.active_keys = set()
+        self.stats = {'submitted': 0, 'deduped': 0, 'rejected': 0, 'completed': 0, 'failed': 0, 'running': 0
+                      , 'last_wait_s': 0.0, 'max_wait_s': 0.0, 'last_run_s': 0.0, 'max_run_s': 0.0}
+    
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    DESCRIPTION: Builds the key we dedupe jobs on, the same method with the same args (our playlist) is the same job.
+    INPUT: method - Func from SpotifyFeatures the job calls.
+           args - Args the job passes to 'method'.
+           kwargs - Kwargs the job passes to 'method'.
+    OUTPUT: Hashable key for this job.
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    def get_job_key(self, method, args: tuple, kwargs: dict) -> tuple:
+        return (method.__name__, args, tuple(sorted(kwargs.items())))
+    
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    DESCRIPTION: Queues up 'method' to be run on one of our workers. Duplicates of a job that is already queued or
+                 running, and anything past our queue limit, are dropped and logged.
+    INPUT: method - Func from SpotifyFeatures we will be calling.
+           args - List of args we are passing to 'method'.
+           log_file_name - Log filename of the SpotifyFeatures we run 'method' on.
+           kwargs - List of kwargs we are passing to 'method'.
+    OUTPUT: Whether the job was queued.
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    def submit(self, method, *args, log_file_name: str="Default.log", **kwargs) -> bool:
+        job_key = self.get_job_key(method, args, kwargs)
+        with self.lock:
+            if job_key in self.active_keys:
+                self.stats['deduped'] += 1
+                self.logger.info(f"Skipping {job_key}, it is already queued or running")
+                return False
+            try:
+                self.jobs.put_nowait((job_key, method, args, kwargs, log_file_name, time.monotonic()))
+            except queue.Full:
+                self.stats['rejected'] += 1
+                self.logger.warning(f"Dropping {job_key}, our queue is full at {self.jobs.maxsize} jobs")
+                return False
+            self.active_keys.add(job_key)
+            self.stats['submitted'] += 1
+            
+            self.workers = [worker for worker in self.workers if worker.is_alive()]
+            while len(self.workers) < self.num_workers:
+                worker = threading.Thread(target=self.run_worker, daemon=True)
+                worker.start()
+                self.workers.append(worker)
+        return True
+    
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    DESCRIPTION: Worker loop, runs jobs off of our queue until it pulls a None (see 'shutdown'). Our SpotifyFeatures
+                 are cached per log file and only ever used by this worker, a job that fails throws its object away.
+                 Per run caches on a warm object are cleared before each job so they don't grow forever.
+    INPUT: N/A
+    OUTPUT: N/A
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    def run_worker(self) -> None:
+        features = {}
+        while (job := self.jobs.get()) is not None:
+            job_key, method, args, kwargs, log_file_name, queued_time = job
+            start_time = time.monotonic()
+            with self.lock:
+                self.stats['running'] += 1
+            
+            failed = False
+            try:
+                if log_file_name not in features:
+                    features[log_file_name] = self.feature_factory(log_file_name=log_file_name)
+                else:
+                    features[log_file_name].clear_run_caches()
+                # Bind the method we were given to our warm object for this log file
+                method.__get__(features[log_file_name])(*args, **kwargs)
+            except Exception:
+                failed = True
+                features.pop(log_file_name, None)
+                self.logger.exception(f"Job {job_key} failed")
+            
+            wait_s, run_s = start_time - queued_time, time.monotonic() - start_time
+            with self.lock:
+                self.active_keys.discard(job_key)
+                self.stats['running'] -= 1
+                self.stats['failed' if failed else 'completed'] += 1
+                self.stats['last_wait_s'], self.stats['last_run_s'] = wait_s, run_s
+                self.stats['max_wait_s'] = max(self.stats['max_wait_s'], wait_s)
+                self.stats['max_run_s'] = max(self.stats['max_run_s'], run_s)
+            self.logger.info(f"Job {job_key} waited {wait_s:.2f}s and ran {run_s:.2f}s")
+            self.jobs.task_done()
+        self.jobs.task_done()
+    
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    DESCRIPTION: Snapshot of our pool, how many jobs are queued and running, and how long our jobs waited and ran.
+    INPUT: N/A
+    OUTPUT: Dict of our stats along with 'queue_depth' and 'workers'.
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    def get_stats(self) -> dict:
+        with self.lock:
+            return {**self.stats, 'queue_depth': self.jobs.qsize()
+                    , 'workers': len([worker for worker in self.workers if worker.is_alive()])}
+    
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    DESCRIPTION: Blocks until every job we have queued so far has finished running.
+    INPUT: N/A
+    OUTPUT: N/A
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    def join(self) -> None:
+        self.jobs.join()
+    
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    DESCRIPTION: Lets every worker finish what is already queued then stops them.
+    INPUT: wait - Whether we block until our workers have exited.
+    OUTPUT: N/A
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    def shutdown(self, wait: bool=True) -> None:
+        with self.lock:
+            workers, self.workers = self.workers, []
+        for _ in workers:
+            self.jobs.put(None)
+        if wait:
+            [worker.join() for worker in workers]
+
+
+# FIN ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
@@ -0,0 +1,204 @@
+# ╔════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦════╗
+# ║  ╔═╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═╗  ║
+# ╠══╣                                                                                                             ╠══╣
+# ║  ║    JOB QUEUE                                CREATED: 2026-10-19          https://github.com/jacobleazott    ║  ║
+# ║══║                                                                                                             ║══║
+# ║  ╚═╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═╝  ║
+# ╚════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩════╝
+# ════════════════════════════════════════════════════ DESCRIPTION ════════════════════════════════════════════════════
+# Durable SQLite backed queue for our heavy scheduled features (backups, reports, monthly releases). Each date trigger
+#   is queued once per trigger time, and whoever runs it holds a claim on it by heartbeating. A process that gets killed
+#   partway through stops heartbeating, so once its claim goes stale the next run picks the job back up along with the
+#   checkpoint it last saved. Only one job runs at a time across every process sharing our queue.
+#
+# Checkpoints are just a JSON dict a feature can save progress into ('JobCheckpoint'), features that don't take one
+#   simply rerun from the top when resumed.
+# ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
+import contextlib
+import json
+import logging
+import sqlite3
+import time
+from typing import Optional
+
+from src.helpers.decorators import *
+
+JOB_QUEUED, JOB_RUNNING, JOB_DONE, JOB_FAILED = "queued", "running", "done", "failed"
+
+CREATE_JOBS_TABLE = """
+    CREATE TABLE IF NOT EXISTS jobs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT
+      , name TEXT NOT NULL
+      , run_key TEXT NOT NULL
+      , log_file_name TEXT NOT NULL
+      , status TEXT NOT NULL
+      , attempts INTEGER NOT NULL DEFAULT 0
+      , checkpoint TEXT NOT NULL DEFAULT '{}'
+      , queued_time REAL NOT NULL
+      , heartbeat_time REAL
+      , finished_time REAL
+      , error TEXT
+      , UNIQUE (name, run_key))"""
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Progress a job has saved so far. Without a 'save_func' it only lives in memory, so features can always
+             take one whether or not they are being run off of our queue.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+class JobCheckpoint:
+    
+    def __init__(self, state: dict=None, save_func=None) -> None:
+        self.state = state if state is not None else {}
+        self.save_func = save_func
+    
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    DESCRIPTION: Grabs a value we checkpointed.
+    INPUT: key - Key of the value we want.
+           default - What we return if 'key' was never checkpointed.
+    OUTPUT: The checkpointed value or 'default'.
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    def get(self, key: str, default=None):
+        return self.state.get(key, default)
+    
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    DESCRIPTION: Updates our checkpoint with the given values and saves it off.
+    INPUT: values - Kwargs of every key/ value we want to checkpoint, these must be JSON serializable.
+    OUTPUT: N/A
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    def update(self, **values) -> None:
+        self.state.update(values)
+        if self.save_func is not None:
+            self.save_func(self.state)
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Our persisted queue of jobs, see the DESCRIPTION above. Every call is its own transaction so separate
+             processes (ie back to back cron runs) can safely share the same database.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+class JobQueue(LogAllMethods):
+    
+    def __init__(self, db_path: str, logger: logging.Logger=None) -> None:
+        self.db_path = db_path
+        self.logger = logger if logger is not None else logging.getLogger()
+        with self.connect_db() as db_conn:
+            db_conn.execute(CREATE_JOBS_TABLE)
+    
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    DESCRIPTION: Context manager for a single write transaction on our database. We take the write lock up front so
+                 two processes can never claim the same job.
+    INPUT: N/A
+    OUTPUT: N/A
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    @contextlib.contextmanager
+    def connect_db(self):
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.rollback()
+                raise
+            conn.commit()
+        finally:
+            conn.close()
+    
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    DESCRIPTION: Queues up a job, a job that was already queued for the same 'run_key' is left alone.
+    INPUT: name - SpotifyFeatures method name our job runs.
+           log_file_name - Log filename the job's SpotifyFeatures logs to.
+           run_key - Unique key for this run of 'name', ie the trigger time, so every run queues it exactly once.
+    OUTPUT: Whether a new job was queued.
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    def enqueue(self, name: str, log_file_name: str, run_key: str) -> bool:
+        with self.connect_db() as db_conn:
+            cursor = db_conn.execute("INSERT OR IGNORE INTO jobs (name, run_key, log_file_name, status, queued_time) "
+                                     "VALUES (?, ?, ?, ?, ?)", (name, run_key, log_file_name, JOB_QUEUED, time.time()))
+        if cursor.rowcount == 1:
+            self.logger.info(f"Queued job {name} ({run_key})")
+        return cursor.rowcount == 1
+    
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    DESCRIPTION: Claims our next job to run. Jobs whose claim went stale are resumed before anything new, and nothing
+                 is handed out while another job still holds a live claim.
+    INPUT: stale_s - How long without a heartbeat before we consider a running job's process dead.
+           max_attempts - How many times a job gets claimed before we give up on it.
+    OUTPUT: Dict of the claimed job (id, name, run_key, log_file_name, attempts, checkpoint), None if there isn't one.
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    def claim_next(self, stale_s: float, max_attempts: int) -> Optional[dict]:
+        now = time.time()
+        with self.connect_db() as db_conn:
+            if db_conn.execute("SELECT 1 FROM jobs WHERE status = ? AND heartbeat_time >= ?"
+                               , (JOB_RUNNING, now - stale_s)).fetchone() is not None:
+                return None
+            # Whatever is left running is stale, anything that has already used up its attempts isn't coming back
+            db_conn.execute("UPDATE jobs SET status = ?, finished_time = ?, error = COALESCE(error, 'Went stale') "
+                            "WHERE status = ? AND attempts >= ?", (JOB_FAILED, now, JOB_RUNNING, max_attempts))
+            job = db_conn.execute("SELECT id, name, run_key, log_file_name, attempts, checkpoint FROM jobs "
+                                  "WHERE status IN (?, ?) ORDER BY status = ? DESC, id LIMIT 1"
+                                  , (JOB_QUEUED, JOB_RUNNING, JOB_RUNNING)).fetchone()
+            if job is None:
+                return None
+            db_conn.execute("UPDATE jobs SET status = ?, attempts = attempts + 1, heartbeat_time = ? WHERE id = ?"
+                            , (JOB_RUNNING, now, job['id']))
+        
+        self.logger.info(f"Claimed job {job['name']} ({job['run_key']}), attempt {job['attempts'] + 1}")
+        return {**dict(job), 'attempts': job['attempts'] + 1, 'checkpoint': json.loads(job['checkpoint'])}
+    
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    DESCRIPTION: Keeps our claim on a running job alive, optionally saving its latest checkpoint along with it.
+    INPUT: job_id - Id of the job we are running.
+           checkpoint - Optional checkpoint state we want to save.
+    OUTPUT: N/A
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    def heartbeat(self, job_id: int, checkpoint: dict=None) -> None:
+        with self.connect_db() as db_conn:
+            if checkpoint is None:
+                db_conn.execute("UPDATE jobs SET heartbeat_time = ? WHERE id = ?", (time.time(), job_id))
+            else:
+                db_conn.execute("UPDATE jobs SET heartbeat_time = ?, checkpoint = ? WHERE id = ?"
+                                , (time.time(), json.dumps(checkpoint), job_id))
+    
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    DESCRIPTION: Builds the checkpoint for a claimed job, every update to it is saved straight to our queue.
+    INPUT: job - Job dict from 'claim_next'.
+    OUTPUT: JobCheckpoint holding whatever the job saved on earlier attempts.
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    def get_checkpoint(self, job: dict) -> JobCheckpoint:
+        return JobCheckpoint(job['checkpoint'], save_func=lambda state: self.heartbeat(job['id'], state))
+    
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    DESCRIPTION: Marks a job as done.
+    INPUT: job_id - Id of the job we finished.
+    OUTPUT: N/A
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    def complete(self, job_id: int) -> None:
+        with self.connect_db() as db_conn:
+            db_conn.execute("UPDATE jobs SET status = ?, finished_time = ? WHERE id = ?"
+                            , (JOB_DONE, time.time(), job_id))
+    
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    DESCRIPTION: Records a failed attempt. The job goes back in our queue (keeping its checkpoint) unless it is out of
+                 attempts.
+    INPUT: job_id - Id of the job that failed.
+           error - What went wrong.
+           max_attempts - How many times a job gets claimed before we give up on it.
+    OUTPUT: N/A
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    def fail(self, job_id: int, error: str, max_attempts: int) -> None:
+        with self.connect_db() as db_conn:
+            db_conn.execute("UPDATE jobs SET status = CASE WHEN attempts >= ? THEN ? ELSE ? END, error = ? "
+                            ", finished_time = CASE WHEN attempts >= ? THEN ? END WHERE id = ?"
+                            , (max_attempts, JOB_FAILED, JOB_QUEUED, error, max_attempts, time.time(), job_id))
+    
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    DESCRIPTION: Grabs every job in our queue, ie to see what is still pending or why something failed.
+    INPUT: status - Optional status we want to filter on.
+    OUTPUT: List of dicts for every job, oldest first.
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    def get_jobs(self, status: str=None) -> list[dict]:
+        with self.connect_db() as db_conn:
+            jobs = db_conn.execute("SELECT * FROM jobs WHERE ? IS NULL OR status = ? ORDER BY id", (status, status))
+            return [{**dict(job), 'checkpoint': json.loads(job['checkpoint'])} for job in jobs.fetchall()]
+
+
+# FIN ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
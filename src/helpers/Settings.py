@@ -29,6 +29,18 @@ class SettingsClass:
     MAX_RUNTIME_MINUTES: int    = 30
     LOGGING_RUNTIME_S: int      = 60
     LOGGING_INTERVAL_S: int     = 15
+    LOGGING_IDLE_MAX_S: int     = 60  # Longest we back off to between polls while nothing is playing
+    LOGGING_MACRO_S: int        = 3   # Quick follow up poll right after a macro fires
+    LOGGING_TRACK_END_S: int    = 1   # How long after a track should finish we poll for the next one
+    LOGGING_BUFFERED: bool      = False # Buffer polls in an append only log rather than writing our vault every poll
+    LOGGING_FLUSH_INTERVAL_S: int = 300 # How often a buffered poller flushes its log into our vault
+    DAEMON_MISFIRE_GRACE_S: int = 600 # How late a date trigger can still run in daemon mode
+    MACRO_WORKERS: int          = 2   # Worker threads our macros run on, each keeps its own warm SpotifyFeatures
+    MACRO_QUEUE_SIZE: int       = 8   # Most macros we hold waiting on a worker before we start dropping them
+    JOB_HEARTBEAT_S: int        = 30  # How often a running date trigger job refreshes its claim in our job queue
+    JOB_STALE_S: int            = 180 # How long without a heartbeat before another run takes over (resumes) a job
+    JOB_MAX_ATTEMPTS: int       = 3   # How many times a date trigger job is tried before we give up on it
+    JOB_MAX_RUNTIME_S: int      = 7200 # Longest we heartbeat a job (and hold off our runtime monitor) before it's hung
     
     # Macro IDs
     GEN_ARTIST_MACRO_ID: str          = "24NFf8j4Hc21IxQK7POU6f" # 'Creating New Melodies'
@@ -49,6 +61,10 @@ class SettingsClass:
     LATEST_SOURCE_PLAYLIST: str = MASTER_MIX_ID
     LATEST_DEST_PLAYLIST: str   = "3dZVHLVdpOGlSy8oH9WvBi" # Note this should be in PLAYLISTS_WE_CAN_DELETE_FROM, as a
                                                            #    safety percaution it is not a refernce but a duplicate.
+    
+    # Organize Playlist, in place moves tracks around instead of adding them all back to the end of the playlist. Off
+    #   by default, flip it on per playlist ('in_place') or here once you trust it with your library.
+    ORGANIZE_PLAYLIST_IN_PLACE: bool = False
 
     # Spotify API Scopes
     MAX_SCOPE_LIST: tuple = ("user-read-playback-state",
@@ -72,13 +88,38 @@ class SettingsClass:
     # DB Locations
     BACKUPS_LOCATION: str       = "databases/backups/"
     LISTENING_VAULT_DB: str     = "databases/listening_vault.db"
-    LAST_TRACK_PICKLE: str      = "databases/lastTrack.pk"
+    JOB_QUEUE_DB: str           = "databases/job_queue.db"
+    ALBUM_CACHE_DB: str         = "databases/album_cache.db"
+    LISTENING_ARCHIVE_LOCATION: str = "databases/archives/"
+    LISTENING_EXPORT_LOCATION: str  = "databases/listening_export/"
+    
+    # Number of full months of raw listening sessions we keep in our vault before archiving them off
+    LISTENING_HOT_MONTHS: int   = 3
+    # Longest we can go without polling a track (ie paused) and still count picking it back up as the same play
+    LISTENING_PLAY_GAP_S: int   = 1800
+    
+    # Artist Release, number of artists we fetch at once. All of them share our proxy's rate limit below. A queued
+    #   release saves the artists it has gathered every 'ARTIST_RELEASE_CHECKPOINT_BATCH' artists.
+    ARTIST_RELEASE_WORKERS: int = 8
+    ARTIST_RELEASE_CHECKPOINT_BATCH: int = 25
+    
+    # Appears On Verification, number of searches each artist runs at once. Also behind our proxy's rate limit.
+    APPEARS_ON_SEARCH_WORKERS: int = 4
+    
+    # Album Cache, albums released within 'ALBUM_CACHE_RECENT_DAYS' of when we cached them can still pick up tracks or
+    #   credits so we only trust those for 'ALBUM_CACHE_RECENT_TTL_H' hours. Older albums are cached for good.
+    ALBUM_CACHE_RECENT_DAYS: int  = 30
+    ALBUM_CACHE_RECENT_TTL_H: int = 24
     
     # Logging Settings
     FUNCTION_ARG_LOGGING_LEVEL: int = 15
     
     # Proxy Settings
     PROXY_SERVER_PORT: int = 5000
+    PROXY_PLAYBACK_POLL_S: int = 10 # How often our proxy polls playback for every client and its events (while playing)
+    PROXY_EVENT_WAIT_S: int = 4    # Longest a single playback event long poll waits, under our proxy's request timeout
+    PROXY_CLIENT_IDLE_S: int = 300 # Our proxy stops polling playback once no client has asked for it in this long
+    SPOTIFY_API_CALLS_PER_S: float = 20.0 # Shared by every proxy call in a process, 0 is no limit
 
 
 Settings = SettingsClass()
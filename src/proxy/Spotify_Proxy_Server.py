@@ -8,18 +8,76 @@
 # ════════════════════════════════════════════════════ DESCRIPTION ════════════════════════════════════════════════════
 # A proxy server for spotipy. This way we have a dedicated server that can handle all of our spotipy requests and most
 #   importantly, handle token refreshing. This way we can have a consistant connection to the API.
+#
+# The server also owns the one and only playback poller. 'current_playback' is answered from its latest poll as long as
+#   that is no older than one poll, anything older (or anything after a call that changes our playback, ie skipping a
+#   track) goes to spotify and becomes our latest poll. A cached poll that is still playing has its progress moved
+#   forward by its age, so our clients don't undercount their listening time. On top of that 'playback_events' lets a
+#   client long poll for changes to our playback, ie a new track, a new context, or toggling repeat, so they can react
+#   right away instead of polling for them. Our poller backs off while nothing is playing, and doesn't poll at all if no
+#   client has asked for playback or events in 'PROXY_CLIENT_IDLE_S'.
 # ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
 import logging
+import math
 import os
 import random
 import spotipy
 import threading
 import time
-from flask import Flask, request, jsonify
+from collections import deque
+from flask       import Flask, request, jsonify
 
 from src.helpers.decorators import *
 from src.helpers.Settings   import Settings
 
+# What we compare between polls to decide what changed, each key is the type of event it raises.
+PLAYBACK_EVENT_KEYS = {
+      "track"   : lambda playback: (playback.get('item') or {}).get('id')
+    , "context" : lambda playback: (playback.get('context') or {}).get('uri')
+    , "repeat"  : lambda playback: playback.get('repeat_state')
+}
+PLAYBACK_EVENT_HISTORY = 100 # How many events we hold onto for clients that fall behind
+# Spotipy calls that change our playback, our latest poll can't be trusted after any of these
+PLAYBACK_CHANGING_METHODS = {"start_playback", "pause_playback", "next_track", "previous_track", "seek_track", "repeat"
+                             , "shuffle", "volume", "transfer_playback", "add_to_queue"}
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Compares two playbacks from spotipy's 'current_playback()' for any of our 'PLAYBACK_EVENT_KEYS' changing.
+INPUT: last_playback - Our previous playback, None if nothing was playing.
+       playback - Our new playback, None if nothing is playing.
+OUTPUT: List of event types that changed between the two.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def get_playback_changes(last_playback: Optional[dict], playback: Optional[dict]) -> list[str]:
+    last_playback, playback = last_playback or {}, playback or {}
+    return [event for event, get_key in PLAYBACK_EVENT_KEYS.items() if get_key(last_playback) != get_key(playback)]
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Decides how long our proxy waits before its next playback poll. While playing we poll every
+             'PROXY_PLAYBACK_POLL_S', nothing playing or paused backs off exponentially up to 'LOGGING_IDLE_MAX_S'.
+INPUT: playback - Our latest playback from spotipy's 'current_playback()', None if nothing is playing.
+       idle_polls - How many polls in a row before this one found nothing playing (or paused).
+OUTPUT: Seconds until we should poll again.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def get_proxy_poll_delay_s(playback: Optional[dict], idle_polls: int=0) -> float:
+    if playback is not None and playback.get('is_playing'):
+        return Settings.PROXY_PLAYBACK_POLL_S
+    return min(Settings.PROXY_PLAYBACK_POLL_S * 2 ** idle_polls, Settings.LOGGING_IDLE_MAX_S)
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Moves a cached playback's 'progress_ms' forward by how long ago we polled it if it is still playing, so
+             whoever we serve it to sees (close to) where spotify is now rather than where it was at our poll.
+INPUT: playback - Playback from spotipy's 'current_playback()', None if nothing is playing.
+       age_s - Seconds since we polled 'playback'.
+OUTPUT: Copy of 'playback' with its progress moved forward (capped at its track's length), or 'playback' as is.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def get_extrapolated_playback(playback: Optional[dict], age_s: float) -> Optional[dict]:
+    if playback is None or not playback.get('is_playing') or playback.get('progress_ms') is None:
+        return playback
+    progress_ms = playback['progress_ms'] + int(max(age_s, 0) * 1000)
+    duration_ms = (playback.get('item') or {}).get('duration_ms')
+    return dict(playback, progress_ms=progress_ms if duration_ms is None else min(progress_ms, duration_ms))
+
 """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
 DESCRIPTION: Creates and manages a flask server as well as our spotipy instance. Handles token refreshing and allows 
                 us to have a consistant connection to the API.
@@ -45,8 +103,20 @@ class SpotifyServer(LogAllMethods):
 
         self._initialize_spotipy()
         
+        # Latest playback from our poller, when we grabbed it, whether we can still serve it, and the events it has
+        #   raised so far. 'client_time' is the last time anyone asked us for playback or events.
+        self.playback_condition = threading.Condition()
+        self.playback, self.playback_time, self.playback_valid = None, None, False
+        self.client_time = -math.inf
+        self.playback_seq = 0
+        self.playback_events = deque(maxlen=PLAYBACK_EVENT_HISTORY)
+        # Calls we answer ourselves rather than passing through to spotipy
+        self.server_methods = {"current_playback": self._get_current_playback
+                               , "playback_events": self._get_playback_events}
+        
         self.stop_event = threading.Event()
         threading.Thread(target=self._token_refresh_thread, daemon=True).start()
+        threading.Thread(target=self._playback_poll_thread, daemon=True).start()
         self.app.run(host="127.0.0.1", port=Settings.PROXY_SERVER_PORT)
 
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
@@ -134,6 +204,98 @@ class SpotifyServer(LogAllMethods):
             sleep_time = max(self.auth_manager.get_cached_token()['expires_at'] - time.time() - 600, 60)
             self.logger.info(f"Next refresh in {sleep_time / 60:.1f} minutes.")
             self.stop_event.wait(sleep_time)
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Grabs our current playback from spotify, raising an event for anything that changed since our last
+                 poll and waking up anyone waiting on one.
+    INPUT: N/A
+    OUTPUT: Playback exactly like spotipy's 'current_playback()'.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def _poll_playback(self):
+        playback = self.sp.current_playback()
+        with self.playback_condition:
+            # Our very first poll has nothing to compare against, that's not a change
+            changes = get_playback_changes(self.playback, playback) if self.playback_time is not None else []
+            self.playback, self.playback_time, self.playback_valid = playback, time.monotonic(), True
+            if changes:
+                self.playback_seq += 1
+                self.playback_events.append({"seq": self.playback_seq, "types": changes})
+                self.playback_condition.notify_all()
+        return playback
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Stops us from serving our latest poll, used after any call that changes our playback. Our poll
+                 schedule is left alone, the next client to ask just goes to spotify.
+    INPUT: N/A
+    OUTPUT: N/A
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def _invalidate_playback(self):
+        with self.playback_condition:
+            self.playback_valid = False
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Thread method that polls our playback (see 'get_proxy_poll_delay_s') so every client shares the one
+                 set of calls to spotify. A client going to spotify itself counts as our poll, and we don't poll at
+                 all while no client has asked us for anything in 'PROXY_CLIENT_IDLE_S'.
+    INPUT: N/A
+    OUTPUT: N/A
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def _playback_poll_thread(self):
+        idle_polls, delay_s = 0, 0
+        while not self.stop_event.is_set():
+            with self.playback_condition:
+                playback_time, client_time = self.playback_time, self.client_time
+            now = time.monotonic()
+            
+            next_poll_time = playback_time + delay_s if playback_time is not None else now
+            if now < next_poll_time:
+                self.stop_event.wait(next_poll_time - now)
+                continue
+            if now - client_time > Settings.PROXY_CLIENT_IDLE_S:
+                self.stop_event.wait(Settings.PROXY_PLAYBACK_POLL_S)
+                continue
+            
+            try:
+                playback = self._poll_playback()
+                delay_s = get_proxy_poll_delay_s(playback, idle_polls)
+                idle_polls = 0 if playback is not None and playback.get('is_playing') else idle_polls + 1
+            except Exception as error:
+                self.logger.error(f"Failed to poll playback: {error}")
+                self.stop_event.wait(Settings.PROXY_PLAYBACK_POLL_S)
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Our 'current_playback' for clients. Served from our poller's latest playback if it's no older than
+                 one poll, with its progress moved forward to now (see 'get_extrapolated_playback'), otherwise we go
+                 to spotify (which becomes our latest poll).
+    INPUT: args/ kwargs - Whatever was passed to 'current_playback', we always grab everything so they're ignored.
+    OUTPUT: Playback exactly like spotipy's 'current_playback()'.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def _get_current_playback(self, *args, **kwargs):
+        with self.playback_condition:
+            self.client_time = time.monotonic()
+            playback, playback_time, playback_valid = self.playback, self.playback_time, self.playback_valid
+        
+        age_s = time.monotonic() - playback_time if playback_valid else math.inf
+        if age_s > Settings.PROXY_PLAYBACK_POLL_S:
+            return self._poll_playback()
+        return get_extrapolated_playback(playback, age_s)
+    
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    DESCRIPTION: Long poll for playback events. Waits up to 'timeout_s' (capped at 'PROXY_EVENT_WAIT_S' so we always
+                 answer before our client's request times out) for any event after 'since_seq'.
+    INPUT: since_seq - Last event sequence number our client has seen, None to only wait on new ones.
+           timeout_s - How long we can wait for an event.
+    OUTPUT: Dict of 'events' (each a dict of 'seq' and its list of 'types') and our latest 'seq' to wait on next.
+    """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
+    def _get_playback_events(self, since_seq: Optional[int]=None, timeout_s: float=0) -> dict:
+        timeout_s = min(max(timeout_s, 0), Settings.PROXY_EVENT_WAIT_S)
+        with self.playback_condition:
+            self.client_time = time.monotonic()
+            # A restarted server starts back over at 0, don't make anyone wait on sequence numbers we'll never reach
+            since_seq = self.playback_seq if since_seq is None else min(since_seq, self.playback_seq)
+            self.playback_condition.wait_for(lambda: self.playback_seq > since_seq, timeout=timeout_s)
+            return {"events": [event for event in self.playback_events if event['seq'] > since_seq]
+                    , "seq": self.playback_seq}
 
     """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''"""
     DESCRIPTION: Allows us to call any method from spotipy through our server.
@@ -146,8 +308,14 @@ class SpotifyServer(LogAllMethods):
         kwargs = payload.get('kwargs', {})
         
         try:
-            method = getattr(self.sp, method_name)
-            return jsonify({"result": method(*args, **kwargs)})
+            method = self.server_methods[method_name] if method_name in self.server_methods \
+                        else getattr(self.sp, method_name)
+            try:
+                result = method(*args, **kwargs)
+            finally:
+                if method_name in PLAYBACK_CHANGING_METHODS:
+                    self._invalidate_playback()
+            return jsonify({"result": result})
         
         except AttributeError as error:
             self.logger.error(f"Invalid Spotipy method '{method_name}': {error}")
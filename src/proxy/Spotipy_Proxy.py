@@ -11,12 +11,56 @@
 # ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
 import logging
 import sys
+import threading
 import time
 import requests
 
 from src.helpers.decorators import *
 from src.helpers.Settings   import Settings
 
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Thread safe limiter that spaces our calls out to at most 'calls_per_s'. Each caller reserves the next free
+             slot under the lock and sleeps outside of it, so waiting threads don't hold each other up. Not a 
+             'LogAllMethods' since it sits in front of every single api call.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+class RateLimiter():
+    
+    def __init__(self, calls_per_s: float) -> None:
+        self.interval_s = 1 / calls_per_s if calls_per_s > 0 else 0
+        self.next_call_time = 0.0
+        self.lock = threading.Lock()
+    
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    DESCRIPTION: Blocks until we are allowed to make our next call.
+    INPUT: N/A
+    OUTPUT: N/A
+    """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""''""""""
+    def wait(self) -> None:
+        with self.lock:
+            now = time.perf_counter()
+            call_time = max(now, self.next_call_time)
+            self.next_call_time = call_time + self.interval_s
+        if call_time > now:
+            time.sleep(call_time - now)
+
+
+_shared_rate_limiter = None
+_shared_rate_limiter_lock = threading.Lock()
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Hands back the one rate limiter every proxy in this process shares, so our limit holds no matter how many
+             helpers or threads we have going.
+INPUT: N/A
+OUTPUT: Our shared RateLimiter, created at 'SPOTIFY_API_CALLS_PER_S' on first use.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def get_shared_rate_limiter() -> RateLimiter:
+    global _shared_rate_limiter
+    with _shared_rate_limiter_lock:
+        if _shared_rate_limiter is None:
+            _shared_rate_limiter = RateLimiter(Settings.SPOTIFY_API_CALLS_PER_S)
+        return _shared_rate_limiter
+
+
 """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
 DESCRIPTION: Abstracted proxy for spotipy. This way all methods from spotipy can be called like we actually own the 
                 instance, when in reality it is all passed through our proxy to our flask server that owns the object.
@@ -24,12 +68,14 @@ DESCRIPTION: Abstracted proxy for spotipy. This way all methods from spotipy can
 class SpotipyProxy(LogAllMethods):
     
     def __init__(self, logger: logging.Logger=None, max_retries: int=3
-                 , backoff_factor: float=1.0, overall_timeout: int=20) -> None:
+                 , backoff_factor: float=1.0, overall_timeout: int=20
+                 , rate_limiter: Optional[RateLimiter]=None) -> None:
         self.logger = logger if logger is not None else logging.getLogger()
         self.base_url=f"http://127.0.0.1:{Settings.PROXY_SERVER_PORT}"
         self.max_retries = max_retries
         self.backoff_factor = backoff_factor
         self.overall_timeout = overall_timeout
+        self.rate_limiter = rate_limiter if rate_limiter is not None else get_shared_rate_limiter()
     
     def __getattr__(self, method_name):
         def method(*args, **kwargs):
@@ -45,6 +91,7 @@ class SpotipyProxy(LogAllMethods):
                         raise TimeoutError(f"Operation timed out after {self.overall_timeout} seconds")
                     
                     # Make the request with a short timeout for each individual request
+                    self.rate_limiter.wait()
                     response = requests.post(url, json=payload, timeout=5)
                     if response.status_code == 500:
                         raise Exception("Server error 500 - Retrying...")
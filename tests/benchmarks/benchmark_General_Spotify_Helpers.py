@@ -0,0 +1,206 @@
+# ╔════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦════╗
+# ║  ╔═╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═╗  ║
+# ╠══╣                                                                                                             ╠══╣
+# ║  ║    BENCHMARKS - GSH                         CREATED: 2025-06-10          https://github.com/jacobleazott    ║  ║
+# ║══║                                                                                                             ║══║
+# ║  ╚═╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═╝  ║
+# ╚════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩════╝
+# ════════════════════════════════════════════════════ DESCRIPTION ════════════════════════════════════════════════════
+# Benchmarks the album side of 'gather_tracks_by_artist' for a monthly release. Counts the 'artist_albums' pages we
+#   read for a prolific artist with and without pruning by our start date, and times release date filtering with our
+#   cached parser vs the old 'strptime' per format loop. Lastly counts the 'albums' calls a full artist go through
+#   makes on a cold and then a warm album cache, and the searches 'verify_appears_on_tracks' makes for a featured
+#   artist whose songs keep getting put on compilations.
+#
+# Not collected by pytest, run manually from the repo root -
+#   PYTHONPATH=$(pwd)/src:$(pwd)/tests python -m tests.benchmarks.benchmark_General_Spotify_Helpers [num_albums]
+# ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
+import calendar
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+from datetime import datetime, timedelta
+from unittest import mock
+
+import src.General_Spotify_Helpers as gsh
+
+DEFAULT_NUM_ALBUMS = 1000
+NUM_FILTER_ALBUMS = 50000
+NUM_FEATURED_SONGS = 60
+NUM_COPIES_PER_SONG = 8
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Stands in for our spotipy proxy, serves 'num_albums' per album type newest first 50 to a page.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+class FakeAlbumsProxy():
+    def __init__(self, num_albums: int) -> None:
+        self.num_albums = num_albums
+        self.calls = 0
+        self.album_calls = 0
+    
+    def artist_albums(self, artist_id: str, country: str, limit: int, include_groups: str, offset: int=0) -> dict:
+        self.calls += 1
+        groups = include_groups.split(',')
+        albums = [{'id': f"{group}_{idx}", 'album_type': group
+                 , 'release_date': (datetime(2025, 6, 1) - timedelta(days=idx * 7)).strftime('%Y-%m-%d')}
+                  for group in groups for idx in range(self.num_albums)]
+        page = albums[offset:offset + limit]
+        next_page = {'offset': offset + limit, 'include_groups': include_groups, 'limit': limit}
+        return {'items': page, 'next': next_page if offset + limit < len(albums) else None}
+    
+    def next(self, response: dict) -> dict:
+        return self.artist_albums("", "US", **response['next'])
+    
+    def albums(self, album_ids: list[str], market: str) -> dict:
+        self.album_calls += 1
+        return {'albums': [{'id': album_id, 'name': album_id
+                          , 'release_date': (datetime(2025, 6, 1) - timedelta(days=int(album_id.split('_')[-1]) * 7))
+                                            .strftime('%Y-%m-%d')
+                          , 'artists': [{'id': "artist"}]
+                          , 'tracks': {'items': [{'id': f"{album_id}_track_{idx}", 'name': f"Track {idx}"
+                                                , 'artists': [{'id': "artist"}]} for idx in range(12)]}}
+                           for album_id in album_ids]}
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Stands in for our spotipy proxy when verifying appears on tracks, the first copy of every song is the one
+             search ranks.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+class FakeSearchProxy():
+    def __init__(self) -> None:
+        self.searches = 0
+        self.artist_calls = 0
+    
+    def search(self, query: str, limit: int, type: str, market: str) -> dict:
+        self.searches += 1
+        song = query.split('%20')[0].split(' ')[-1]
+        return {'tracks': {'items': [{'id': f"song_{song}_copy_0"}]}}
+    
+    def artist(self, artist_id: str) -> dict:
+        self.artist_calls += 1
+        return {'id': artist_id, 'name': f"Name {artist_id}"}
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Our old appears on verification, an artist look up and a search for every single track. Kept here so we
+             have something to compare against.
+INPUT: spotify - GSH object to search with.
+       tracks - List of spotify tracks we will be verifying.
+OUTPUT: List of the tracks we have verified.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def legacy_verify_appears_on_tracks(spotify: gsh.GeneralSpotifyHelpers, tracks: list[dict]) -> list[str]:
+    valid_tracks = []
+    for track in tracks:
+        artist_name = spotify.get_artist_data(track['artists'][0]['id'], ['name'])[0]
+        track_name = ''.join(e for e in track['name'] if e.isalnum() or e == " ")
+        tracks_data = spotify.sp.search(f"{track_name}%20artist:{artist_name}", 
+                                        limit=5, type='track', market="US")['tracks']['items']
+        for track_data in tracks_data:
+            if track_data['id'] == track['id']:
+                valid_tracks.append(track['id'])
+                break
+        if len(tracks_data) == 0:
+            valid_tracks.append(track['id'])
+    return valid_tracks
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Our old release date filter, every format tried through 'strptime' for every element. Kept here so we 
+             have something to compare against.
+INPUT: elements - List of elements with a ['release_date'] dictionary field.
+       start_date - Datetime for start of desired selection.
+       end_date - Datetime for end of desired selection.
+OUTPUT: List of all 'elements' that fell within 'start_date' and 'end_date'.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def legacy_get_elements_in_date_range(elements: list[dict], start_date: datetime, end_date: datetime) -> list[dict]:
+    valid_elements = []
+    for element in elements:
+        invalid_format_count = 0
+        for fmt in ('%Y-%m-%d', '%Y-%m', '%Y'):
+            try:
+                element_date = datetime.strptime(element["release_date"], fmt)
+                if fmt == '%Y-%m':
+                    last_day = calendar.monthrange(element_date.year, element_date.month)[1]
+                    element_date = element_date.replace(day=last_day)
+                elif fmt == '%Y':
+                    element_date = element_date.replace(day=31, month=12)
+
+                if start_date <= element_date <= end_date:
+                    valid_elements.append(element)
+                    break
+            except ValueError:
+                invalid_format_count += 1
+        if invalid_format_count >= 3:
+            valid_elements.append(element)
+    return valid_elements
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Prints the pages a one month release reads for an artist with 'num_albums' albums, singles, and appears 
+             on albums, then how long filtering release dates takes old vs new.
+INPUT: num_albums - Number of albums the artist has per album type.
+OUTPUT: N/A
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def main(num_albums: int) -> None:
+    start_date, end_date = datetime(2025, 5, 1), datetime(2025, 5, 31)
+    with mock.patch('src.General_Spotify_Helpers.SpotipyProxy', return_value=FakeAlbumsProxy(num_albums)):
+        spotify = gsh.GeneralSpotifyHelpers()
+    
+    for label, prune_date in (("every page", None), ("pruned by start date", start_date)):
+        spotify.sp.calls = 0
+        for album_types in (['album', 'single'], ['appears_on']):
+            albums = spotify.get_artist_albums("artist", album_types=album_types
+                                               , info=['id', 'release_date', 'album_type'], start_date=prune_date)
+        print(f"{'artist_albums ' + label + ' (' + str(num_albums) + ' per type)':<52} | {spotify.sp.calls:>5} calls")
+    
+    rng = random.Random(NUM_FILTER_ALBUMS)
+    release_dates = [(datetime(2000, 1, 1) + timedelta(days=rng.randrange(9000))).strftime('%Y-%m-%d')
+                     for _ in range(NUM_FILTER_ALBUMS // 3)]
+    elements = [{'release_date': rng.choice((date, date[:7], date[:4]))} for date in release_dates * 3]
+    for label, filter_func in (("strptime per format", legacy_get_elements_in_date_range)
+                             , ("cached parser", gsh.get_elements_in_date_range)):
+        gsh.parse_release_date.cache_clear()
+        start = time.perf_counter()
+        in_range = filter_func(elements, datetime(2010, 1, 1), datetime(2010, 12, 31))
+        filter_s = time.perf_counter() - start
+        print(f"{'date filter, ' + label + ' (' + str(len(elements)) + ' albums)':<52} | {filter_s * 1000:>8.2f}ms"
+              f" | {len(in_range)} in range")
+    
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        with mock.patch('src.General_Spotify_Helpers.SpotipyProxy', return_value=FakeAlbumsProxy(num_albums)):
+            spotify = gsh.GeneralSpotifyHelpers(album_cache_db=os.path.join(tmp_dir, "album_cache.db"))
+        album_ids = [f"album_{idx}" for idx in range(num_albums)]
+        for label in ("cold", "warm"):
+            spotify.sp.album_calls = 0
+            start = time.perf_counter()
+            spotify.get_albums_tracks(album_ids, album_info=['id', 'release_date'], track_info=['id', 'name'])
+            fetch_s = time.perf_counter() - start
+            hit_rate = spotify.log_album_cache_stats()['hit_rate']
+            print(f"{'albums, ' + label + ' album cache (' + str(num_albums) + ' albums)':<52} | "
+                  f"{spotify.sp.album_calls:>5} calls | {fetch_s * 1000:>8.2f}ms | {hit_rate:.0%} hit rate")
+    finally:
+        shutil.rmtree(tmp_dir)
+    
+    tracks = [{'id': f"song_{song}_copy_{copy}", 'name': f"Song {song}"
+             , 'artists': [{'id': f"main_{song % 7}", 'name': f"Name main_{song % 7}"}, {'id': "featured"}]}
+              for copy in range(NUM_COPIES_PER_SONG) for song in range(NUM_FEATURED_SONGS)]
+    verify_funcs = (("one search per track", lambda spotify: legacy_verify_appears_on_tracks(spotify, tracks))
+                  , ("deduped + cached", lambda spotify: spotify.verify_appears_on_tracks(tracks, "featured")))
+    for label, verify_func in verify_funcs:
+        with mock.patch('src.General_Spotify_Helpers.SpotipyProxy', return_value=FakeSearchProxy()):
+            spotify = gsh.GeneralSpotifyHelpers()
+        verified = verify_func(spotify)
+        print(f"{'appears on verify, ' + label + ' (' + str(len(tracks)) + ' tracks)':<52} | "
+              f"{spotify.sp.searches:>5} searches | {spotify.sp.artist_calls:>5} artist calls | {len(verified)} kept")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_NUM_ALBUMS)
+
+
+# FIN ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
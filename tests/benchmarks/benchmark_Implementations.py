@@ -0,0 +1,49 @@
+# ╔════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦════╗
+# ║  ╔═╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═╗  ║
+# ╠══╣                                                                                                             ╠══╣
+# ║  ║    BENCHMARKS - IMPLEMENTATIONS             CREATED: 2025-06-12          https://github.com/jacobleazott    ║  ║
+# ║══║                                                                                                             ║══║
+# ║  ╚═╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═╝  ║
+# ╚════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩════╝
+# ════════════════════════════════════════════════════ DESCRIPTION ════════════════════════════════════════════════════
+# Benchmarks our per-minute cold start, importing 'Implementations.py' in a fresh interpreter with '-X importtime'.
+#   Prints the best of a few runs against our budget along with whichever modules cost us the most. Timings swing too
+#   much with the machine (and anything else running on it) to assert on in our unit tests, those only make sure our
+#   heavy features aren't loaded up front.
+#
+# Not collected by pytest, run manually from the repo root -
+#   PYTHONPATH=$(pwd)/src:$(pwd)/tests python -m tests.benchmarks.benchmark_Implementations [num_runs]
+# ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
+import sys
+
+from tests.helpers.tester_helpers import get_startup_import_times
+
+DEFAULT_NUM_RUNS = 5
+STARTUP_IMPORT_BUDGET_US = 500_000   # Importing 'Implementations.py' should stay under this
+NUM_SLOWEST_MODULES = 10
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Imports 'Implementations.py' 'num_runs' times and prints our fastest cold start against our budget, along
+             with the slowest modules of that run.
+INPUT: num_runs - Number of fresh interpreters to import in.
+OUTPUT: N/A
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def main(num_runs: int) -> None:
+    import_times = min((get_startup_import_times() for _ in range(num_runs))
+                       , key=lambda run: run["src.Implementations"])
+    
+    for module, cumulative_us in sorted(import_times.items(), key=lambda item: item[1]
+                                        , reverse=True)[:NUM_SLOWEST_MODULES]:
+        print(f"{module:<48} | {cumulative_us / 1000:>8.1f}ms")
+    
+    startup_us = import_times["src.Implementations"]
+    over_budget = " OVER" if startup_us >= STARTUP_IMPORT_BUDGET_US else ""
+    print(f"{'Cold start, best of ' + str(num_runs):<48} | {startup_us / 1000:>8.1f}ms"
+          f" | budget {STARTUP_IMPORT_BUDGET_US / 1000:.0f}ms{over_budget}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_NUM_RUNS)
+
+
+# FIN ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
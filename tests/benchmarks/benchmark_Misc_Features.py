@@ -0,0 +1,212 @@
+# ╔════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦════╗
+# ║  ╔═╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═╗  ║
+# ╠══╣                                                                                                             ╠══╣
+# ║  ║    BENCHMARKS - MISC FEATURES               CREATED: 2025-06-09          https://github.com/jacobleazott    ║  ║
+# ║══║                                                                                                             ║══║
+# ║  ╚═╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═╝  ║
+# ╚════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩════╝
+# ════════════════════════════════════════════════════ DESCRIPTION ════════════════════════════════════════════════════
+# Benchmarks distributing an inbox playlist out to our collections against a generated set of '__' artist playlists.
+#   The spotify side is faked out so we only time the matching of tracks to playlists, which is compared against the
+#   old playlist by playlist scan.
+#
+# Then times a monthly artist release over 'RELEASE_NUM_ARTISTS' artists one at a time vs on our worker pool, with a
+#   fake per call latency and our shared rate limiter in front of every call like our proxy has.
+#
+# Also counts the write calls reorganizing a playlist costs us, adding everything back to the end vs moving tracks in
+#   place, for a playlist that only had a few tracks added since it was last organized and one that is fully shuffled.
+#
+# Not collected by pytest, run manually from the repo root -
+#   PYTHONPATH=$(pwd)/src:$(pwd)/tests python -m tests.benchmarks.benchmark_Misc_Features [num_artists] [num_tracks]
+# ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
+import logging
+import math
+import random
+import sys
+import time
+
+from datetime import datetime
+from unittest import mock
+
+import src.General_Spotify_Helpers as gsh
+
+from tests.helpers.mocked_Settings import Test_Settings
+from src.features.Misc_Features    import MiscFeatures
+from src.helpers.Settings          import Settings
+from src.proxy.Spotipy_Proxy       import RateLimiter
+
+DEFAULT_NUM_ARTISTS = 300
+DEFAULT_NUM_TRACKS = 500
+REORGANIZE_NUM_TRACKS = (500, 2000, 10000)
+NUM_NEW_TRACKS = 10
+RELEASE_NUM_ARTISTS = 300
+RELEASE_CALLS_PER_ARTIST = 4     # 2 'artist_albums' pages, an 'albums' chunk, and a search
+RELEASE_CALL_LATENCY_S = 0.005   # Scaled down from a real round trip so this finishes quickly
+RELEASE_CALLS_PER_S = 500.0      # Scaled down the same way
+NUM_RUNS = 20
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Stands in for our spotify helper, hands back a generated library and records what would have been added.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+class FakeSpotify():
+    def __init__(self, num_artists: int, num_tracks: int) -> None:
+        rng = random.Random(num_artists * num_tracks)
+        artists = [{'id': f"artist_{idx}", 'name': f"Artist {idx}"} for idx in range(num_artists)]
+        # A fifth of our inbox is from artists we don't have a playlist for.
+        unfollowed = [{'id': f"unfollowed_{idx}", 'name': f"Unfollowed {idx}"} for idx in range(num_artists // 5)]
+        self.playlists = [{'id': Test_Settings.MASTER_MIX_ID, 'name': "Master Mix"}
+                        , {'id': "year_playlist", 'name': str(datetime.today().year)}
+                        , *[{'id': f"playlist_{artist['id']}", 'name': f"__{artist['name']}"} for artist in artists]]
+        self.tracks = [{'id': f"track_{idx}", 'name': f"Track {idx}"
+                      , 'artists': rng.sample(artists if rng.random() > 0.2 else unfollowed, rng.choice([1, 1, 2, 3]))}
+                       for idx in range(num_tracks)]
+        self.added = {}
+    
+    def get_user_playlists(self, info: list) -> list:
+        return [dict(playlist) for playlist in self.playlists]
+    
+    def get_playlist_tracks(self, playlist_id: str, track_info: list, artist_info: list) -> list:
+        return self.tracks
+    
+    def add_unique_tracks_to_playlist(self, playlist_id: str, track_ids: list) -> None:
+        self.added[playlist_id] = list(track_ids)
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Our old matching, every track against every '__' playlist against every track artist. Kept here so we
+             have something to compare against, and to make sure we still land on the same playlists.
+INPUT: spotify - FakeSpotify to distribute from.
+OUTPUT: N/A
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def legacy_distribute(spotify: FakeSpotify) -> None:
+    artist_playlists = [dict(playlist, tracks=[]) for playlist in spotify.get_user_playlists(info=['id', 'name'])
+                        if playlist['name'].startswith('__')]
+    tracks_to_add_to_big_playlists = []
+    for track in spotify.get_playlist_tracks("inbox", track_info=['id', 'name'], artist_info=['id', 'name']):
+        for playlist_artist in artist_playlists:
+            for track_artist in track['artists']:
+                if track_artist['name'] == playlist_artist['name'][2:] and track_artist['id'] is not None:
+                    playlist_artist['tracks'].append(track['id'])
+    for playlist in artist_playlists:
+        if len(playlist['tracks']) > 0:
+            spotify.add_unique_tracks_to_playlist(playlist['id'], playlist['tracks'])
+            tracks_to_add_to_big_playlists += playlist['tracks']
+    spotify.add_unique_tracks_to_playlist(Test_Settings.MASTER_MIX_ID, tracks_to_add_to_big_playlists)
+    spotify.add_unique_tracks_to_playlist("year_playlist", tracks_to_add_to_big_playlists)
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Times 'NUM_RUNS' calls and returns the best one, our runs are short enough that noise dominates.
+INPUT: func - Callable to time.
+OUTPUT: Float of the fastest run in seconds.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def best_of(func) -> float:
+    timings = []
+    for _ in range(NUM_RUNS):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Stands in for our spotify helper in an artist release, every artist costs us a few rate limited calls 
+             that each take 'RELEASE_CALL_LATENCY_S'.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+class FakeReleaseSpotify():
+    def __init__(self) -> None:
+        self.rate_limiter = RateLimiter(RELEASE_CALLS_PER_S)
+        self.added = []
+    
+    def create_playlist(self, name: str, description: str='') -> str:
+        return "release_playlist"
+    
+    def gather_tracks_by_artist(self, artist_id: str, start_date=None, end_date=None) -> list[str]:
+        for _ in range(RELEASE_CALLS_PER_ARTIST):
+            self.rate_limiter.wait()
+            time.sleep(RELEASE_CALL_LATENCY_S)
+        return [f"{artist_id}_track"]
+    
+    def add_tracks_to_playlist(self, playlist_id: str, track_ids: list[str]) -> None:
+        self.added = list(track_ids)
+    
+    def log_album_cache_stats(self) -> None:
+        pass
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Prints how long an artist release over 'RELEASE_NUM_ARTISTS' takes one artist at a time vs on our pool.
+INPUT: logger - Quiet logger for our features.
+OUTPUT: N/A
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def print_artist_release_timings(logger: logging.Logger) -> None:
+    artist_ids = [f"artist_{idx}" for idx in range(RELEASE_NUM_ARTISTS)]
+    serial_tracks = None
+    for workers in (1, Settings.ARTIST_RELEASE_WORKERS):
+        spotify = FakeReleaseSpotify()
+        with mock.patch.object(Test_Settings, 'ARTIST_RELEASE_WORKERS', workers):
+            start = time.perf_counter()
+            MiscFeatures(spotify, logger=logger).generate_artist_release(artist_ids, "Release", "")
+            release_s = time.perf_counter() - start
+        serial_tracks = serial_tracks or spotify.added
+        assert spotify.added == serial_tracks, "Artist release came back in a different order"
+        print(f"{'artist release, ' + str(workers) + ' workers (' + str(RELEASE_NUM_ARTISTS) + ' artists)':<48}"
+              f" | {release_s:>8.3f}s")
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Prints the write calls it takes to reorganize a playlist of 'num_tracks' by adding it all back vs moving
+             tracks in place, both for a playlist with 'NUM_NEW_TRACKS' tacked on the end and a shuffled one.
+INPUT: num_tracks - Number of tracks in the playlist we reorganize.
+OUTPUT: N/A
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def print_reorganize_calls(num_tracks: int) -> None:
+    rng = random.Random(num_tracks)
+    organized = [f"track_{idx}" for idx in range(num_tracks)]
+    new_tracks = rng.sample(organized, NUM_NEW_TRACKS)
+    shuffled = rng.sample(organized, num_tracks)
+    
+    append_calls = math.ceil(num_tracks / 100)
+    for label, current in ((str(NUM_NEW_TRACKS) + " new", [track for track in organized if track not in new_tracks] + new_tracks)
+                         , ("shuffled", shuffled)):
+        start = time.perf_counter()
+        moves = gsh.get_reorder_moves(current, organized)
+        plan_s = time.perf_counter() - start
+        print(f"{'reorganize ' + label + ' (' + str(num_tracks) + ' tracks)':<48} | append {append_calls:>6} calls"
+              f" | in place {len(moves):>6} calls | planned in {plan_s * 1000:.2f}ms")
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Builds our fake library and prints how long distributing our inbox takes, old scan vs our name index.
+             Then how long an artist release takes and what reorganizing playlists of a few sizes costs us in calls.
+INPUT: num_artists - Number of '__' artist playlists.
+       num_tracks - Number of tracks in the playlist we distribute.
+OUTPUT: N/A
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+@mock.patch('src.features.Misc_Features.Settings', Test_Settings)
+def main(num_artists: int, num_tracks: int) -> None:
+    legacy_spotify = FakeSpotify(num_artists, num_tracks)
+    spotify = FakeSpotify(num_artists, num_tracks)
+    # Our per track logging isn't what we're measuring, keep it quiet.
+    logger = logging.getLogger("benchmark_Misc_Features")
+    logger.disabled = True
+    misc_features = MiscFeatures(spotify, logger=logger)
+    
+    legacy_s = best_of(lambda: legacy_distribute(legacy_spotify))
+    indexed_s = best_of(lambda: misc_features.distribute_tracks_to_collections_from_playlist("inbox"))
+    assert spotify.added == legacy_spotify.added, "Indexed distribute landed on different playlists"
+    
+    label = f"({num_artists} playlists, {num_tracks} tracks)"
+    print(f"{'legacy scan ' + label:<48} | {legacy_s * 1000:>8.2f}ms")
+    print(f"{'name index ' + label:<48} | {indexed_s * 1000:>8.2f}ms | {legacy_s / indexed_s:.1f}x")
+    
+    print_artist_release_timings(logger)
+    for reorganize_num_tracks in REORGANIZE_NUM_TRACKS:
+        print_reorganize_calls(reorganize_num_tracks)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:3]] or [DEFAULT_NUM_ARTISTS, DEFAULT_NUM_TRACKS])
+
+
+# FIN ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
@@ -0,0 +1,127 @@
+# ╔════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦════╗
+# ║  ╔═╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═╗  ║
+# ╠══╣                                                                                                             ╠══╣
+# ║  ║    BENCHMARKS - SANITY TESTS                CREATED: 2025-06-06          https://github.com/jacobleazott    ║  ║
+# ║══║                                                                                                             ║══║
+# ║  ╚═╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═╝  ║
+# ╚════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩════╝
+# ════════════════════════════════════════════════════ DESCRIPTION ════════════════════════════════════════════════════
+# Benchmarks the sanity phase of our weekly report (data load plus every sanity check) against a generated library
+#   laid out like ours, a master mix, year playlists, and a '__' playlist per artist, with a few deliberate mistakes
+#   sprinkled in so every check has something to report.
+#
+# Not collected by pytest, run manually from the repo root -
+#   PYTHONPATH=$(pwd)/src:$(pwd)/tests python -m tests.benchmarks.benchmark_Sanity_Tests [num_tracks]
+# ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+from unittest import mock
+
+from tests.helpers.mocked_Settings import Test_Settings
+from src.features.Sanity_Tests     import SanityTest
+from src.helpers.Database_Helpers  import DatabaseHelpers
+
+DEFAULT_NUM_TRACKS = 10000
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Fills our vault with a random (but seeded) library of 'num_tracks' tracks in our master mix. Roughly 20
+             tracks per artist, 1-3 artists per track, with years playlists splitting up the master mix.
+INPUT: db_path - Path of our vault db.
+       num_tracks - Number of tracks in our master mix.
+OUTPUT: N/A
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def populate_library(db_path: str, num_tracks: int) -> None:
+    rng = random.Random(num_tracks)
+    artists = [(f"artist_{idx}", f"Artist {idx}") for idx in range(max(num_tracks // 20, 10))]
+    tracks = [(f"track_{idx}", f"Track {idx}", 0, 0, int(rng.random() > 0.001), 1, 1) for idx in range(num_tracks)]
+    tracks_artists = sorted({(track[0], artist[0]) for track in tracks
+                             for artist in rng.sample(artists, rng.choice([1, 1, 2, 3]))})
+    
+    playlists = [(Test_Settings.MASTER_MIX_ID, "Master Mix", "")
+               , *[(f"year_{year}", str(year), "") for year in range(2015, 2025)]
+               , *[(f"playlist_{artist[0]}", f"__{artist[1]}", "") for artist in artists]]
+    playlists_tracks = [(Test_Settings.MASTER_MIX_ID, track[0]) for track in tracks]
+    playlists_tracks += [(f"year_{2015 + idx % 10}", track[0]) for idx, track in enumerate(tracks)
+                         if rng.random() > 0.001]
+    # Artist playlists are missing a track every now and then, the rest of our checks just find those gaps.
+    playlists_tracks += [(f"playlist_{id_artist}", id_track) for id_track, id_artist in tracks_artists
+                         if rng.random() > 0.01]
+    playlists_tracks += [(Test_Settings.MASTER_MIX_ID, track[0]) for track in rng.sample(tracks, 5)]
+    
+    with DatabaseHelpers(db_path).connect_db() as db_conn:
+        db_conn.executemany("INSERT INTO artists VALUES (?, ?)", artists)
+        db_conn.executemany("INSERT INTO followed_artists VALUES (?)", [(artist[0],) for artist in artists[:-5]])
+        db_conn.executemany("INSERT INTO tracks VALUES (?, ?, ?, ?, ?, ?, ?)", tracks)
+        db_conn.executemany("INSERT INTO tracks_artists VALUES (?, ?)", tracks_artists)
+        db_conn.executemany("INSERT INTO playlists VALUES (?, ?, ?)", playlists)
+        db_conn.executemany("INSERT INTO playlists_tracks VALUES (?, ?)", playlists_tracks)
+        db_conn.executemany("INSERT INTO playlist_snapshots VALUES (?, ?)"
+                            , [(playlist[0], "snapshot_0") for playlist in playlists])
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Drops a track from a playlist and bumps its snapshot id, same as a backup after we edited it.
+INPUT: db_path - Path of our vault db.
+       playlist_id - Id of the playlist we changed.
+OUTPUT: N/A
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def change_playlist(db_path: str, playlist_id: str) -> None:
+    with DatabaseHelpers(db_path).connect_db() as db_conn:
+        db_conn.execute("DELETE FROM playlists_tracks WHERE rowid = (SELECT MAX(rowid) FROM playlists_tracks "
+                        "WHERE id_playlist = ?)", (playlist_id,))
+        db_conn.execute("UPDATE playlist_snapshots SET snapshot_id = 'snapshot_1' WHERE id_playlist = ?"
+                        , (playlist_id,))
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Times a single call.
+INPUT: func - Callable to time.
+OUTPUT: Tuple of (result, seconds taken).
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def timed(func) -> tuple:
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Builds our library and prints how long the data load and each sanity check takes with nothing cached.
+             Then how long a fresh data load plus the whole set of checks takes fully cached and with one playlist
+             changed, ie our next weekly reports.
+INPUT: num_tracks - Number of tracks in our master mix.
+OUTPUT: N/A
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+@mock.patch('src.features.Sanity_Tests.Settings', Test_Settings)
+def main(num_tracks: int) -> None:
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        Test_Settings.LISTENING_VAULT_DB = os.path.join(tmp_dir, "vault.db")
+        populate_library(Test_Settings.LISTENING_VAULT_DB, num_tracks)
+        
+        sanity_tester, total_s = timed(SanityTest)
+        print(f"{'_gather_playlist_data':<36} | {total_s:>8.3f}s")
+        for check in sanity_tester.run_checks():
+            total_s += check['duration_s']
+            print(f"{check['name']:<36} | {check['duration_s']:>8.3f}s | {len(check['results'])} results")
+        print(f"{'Total (' + str(num_tracks) + ' tracks)':<36} | {total_s:>8.3f}s")
+        
+        # Everything is cached now, then see what a week where a single '__' playlist changed costs us
+        _, checks_s = timed(lambda: SanityTest().run_checks())
+        print(f"{'load + checks, cached':<36} | {checks_s:>8.3f}s")
+        change_playlist(Test_Settings.LISTENING_VAULT_DB, sanity_tester.individual_artist_playlists[0]['id'])
+        _, checks_s = timed(lambda: SanityTest().run_checks())
+        print(f"{'load + checks, 1 playlist changed':<36} | {checks_s:>8.3f}s")
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_NUM_TRACKS)
+
+
+# FIN ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
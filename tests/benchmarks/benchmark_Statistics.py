@@ -0,0 +1,146 @@
+# ╔════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦════╗
+# ║  ╔═╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═╗  ║
+# ╠══╣                                                                                                             ╠══╣
+# ║  ║    BENCHMARKS - STATISTICS                  CREATED: 2025-06-04          https://github.com/jacobleazott    ║  ║
+# ║══║                                                                                                             ║══║
+# ║  ╚═╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═╝  ║
+# ╚════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩════╝
+# ════════════════════════════════════════════════════ DESCRIPTION ════════════════════════════════════════════════════
+# Benchmarks 'SpotifyStatistics' against generated libraries of increasing size. Every run also checks our featured
+#   artists against the original per artist/ per track db implementation (kept here as 'legacy_*') for every library
+#   size small enough for it to finish in reasonable time.
+#
+# Not collected by pytest, run manually from the repo root -
+#   PYTHONPATH=$(pwd)/src:$(pwd)/tests python -m tests.benchmarks.benchmark_Statistics [num_tracks ...]
+# ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+from datetime import datetime
+from unittest import mock
+
+from tests.helpers.mocked_Settings import Test_Settings
+from src.features.Statistics       import SpotifyStatistics
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+LEGACY_MAX_TRACKS = 10000 # The legacy implementation scans 'tracks_artists' once per artist, quadratic past this.
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Fills our vault with a random (but seeded) library. Roughly 5 tracks per artist, 1-3 artists per track,
+             a fifth of artists followed, and a handful of listening sessions per track over 2024.
+INPUT: statistics - SpotifyStatistics whose vault we are filling.
+       num_tracks - Number of tracks in our library.
+OUTPUT: N/A
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def populate_library(statistics: SpotifyStatistics, num_tracks: int) -> None:
+    rng = random.Random(num_tracks)
+    num_artists = max(num_tracks // 5, 10)
+    artists = [(f"artist_{idx}", f"Artist {idx % (num_artists - 3)}") for idx in range(num_artists)]
+    tracks = [(f"track_{idx}", f"Track {idx}", 0, 0, 1, 1, 1) for idx in range(num_tracks)]
+    tracks_artists = list({(track[0], artist[0]) for track in tracks
+                           for artist in rng.sample(artists, rng.choice([1, 1, 2, 3]))})
+    rng.shuffle(tracks_artists)
+    
+    playlists_tracks = []
+    for playlist_id, share in [(Test_Settings.MASTER_MIX_ID, 0.8), (Test_Settings.CHRISTMAS_MASTER_MIX_ID, 0.05)
+                               , *[(playlist_id, 0.05) for playlist_id in Test_Settings.PLAYLIST_IDS_NOT_IN_ARTISTS]]:
+        playlists_tracks += [(playlist_id, track[0]) for track in rng.sample(tracks, int(num_tracks * share))]
+    
+    start, end = int(datetime(2024, 1, 1).timestamp()), int(datetime(2024, 12, 31).timestamp())
+    sessions = [(rng.randint(start, end), rng.choice(tracks)[0]) for _ in range(num_tracks * 5)]
+    
+    with statistics.vault_db.connect_db() as db_conn:
+        db_conn.executemany("INSERT INTO artists VALUES (?, ?)", artists)
+        db_conn.executemany("INSERT INTO followed_artists VALUES (?)", [(artist[0],) for artist in artists[::5]])
+        db_conn.executemany("INSERT INTO tracks VALUES (?, ?, ?, ?, ?, ?, ?)", tracks)
+        db_conn.executemany("INSERT INTO tracks_artists VALUES (?, ?)", tracks_artists)
+        db_conn.executemany("INSERT INTO playlists VALUES (?, ?, ?)"
+                            , [(playlist_id, playlist_id, "") for playlist_id in {pt[0] for pt in playlists_tracks}])
+        db_conn.executemany("INSERT INTO playlists_tracks VALUES (?, ?)", playlists_tracks)
+        db_conn.executemany("INSERT INTO listening_sessions VALUES (?, ?)", sessions)
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Original 'generate_featured_artists_list', one db query per artist and per track.
+INPUT: statistics - SpotifyStatistics we are pulling from.
+       num_artists - Number of artists to return.
+OUTPUT: Same as 'SpotifyStatistics.generate_featured_artists_list'.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def legacy_featured_artists_list(statistics: SpotifyStatistics, num_artists: int) -> list:
+    vault_db = statistics.vault_db
+    playlists_to_search = [Test_Settings.MASTER_MIX_ID, Test_Settings.CHRISTMAS_MASTER_MIX_ID]
+    followed_artist_ids = set(artist['id'] for artist in vault_db.get_user_followed_artists())
+    ignored_track_ids = set(track['id'] for playlist_id in Test_Settings.PLAYLIST_IDS_NOT_IN_ARTISTS
+                            for track in vault_db.get_tracks_from_playlist(playlist_id))
+    artist_appearances = [artist for artist in vault_db.get_artists_and_their_collabs_from_playlists(
+                                                    playlists_to_search, exclude_artists=followed_artist_ids)
+                          if artist['id'] not in followed_artist_ids]
+    all_playlists_tracks = set(track['id'] for playlist_id in playlists_to_search
+                               for track in vault_db.get_tracks_from_playlist(playlist_id))
+    
+    artist_data = []
+    for artist in artist_appearances:
+        unique_artists = [ar['name'] for ar in artist['appears_with'] if ar['id'] in followed_artist_ids]
+        tracks = [track['name'] for track in vault_db.get_artist_tracks(artist['id'])
+                  if track['id'] not in ignored_track_ids and track['id'] in all_playlists_tracks
+                  and any(ar['id'] in followed_artist_ids for ar in vault_db.get_track_artists(track['id']))]
+        if len(unique_artists) == 0 or len(tracks) == 0:
+            continue
+        artist_data.append({'Artist Name': artist['name'], 'Number of Tracks': len(tracks)
+                          , 'Unique Artists': unique_artists, 'Track Names': tracks})
+    
+    return sorted(artist_data, key=lambda artist: (artist['Number of Tracks'] + 2 * len(artist['Unique Artists']))
+                  , reverse=True)[:num_artists]
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Times a single call.
+INPUT: func - Callable to time.
+OUTPUT: Tuple of (result, seconds taken).
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def timed(func) -> tuple:
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Runs our benchmarks for each library size and prints a summary table.
+INPUT: sizes - List of library sizes (number of tracks).
+OUTPUT: N/A
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+@mock.patch('src.features.Statistics.Settings', Test_Settings)
+def main(sizes: list[int]) -> None:
+    Test_Settings.PLAYLIST_IDS_NOT_IN_ARTISTS = ['ignored_playlist_1', 'ignored_playlist_2']
+    print(f"{'tracks':>8} | {'featured':>10} | {'legacy':>10} | {'latest':>10}")
+    for num_tracks in sizes:
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            Test_Settings.LISTENING_VAULT_DB = os.path.join(tmp_dir, "vault.db")
+            statistics = SpotifyStatistics()
+            populate_library(statistics, num_tracks)
+            
+            featured, featured_s = timed(lambda: statistics.generate_featured_artists_list(50))
+            _, latest_s = timed(lambda: statistics.generate_latest_artists(
+                                                datetime(2024, 3, 1), datetime(2024, 9, 1), num_artists=num_tracks))
+            
+            legacy_column = f"{'-':>10}"
+            if num_tracks <= LEGACY_MAX_TRACKS:
+                legacy_featured, legacy_featured_s = timed(lambda: legacy_featured_artists_list(statistics, 50))
+                assert featured == legacy_featured, f"Featured artists differ for {num_tracks} tracks"
+                legacy_column = f"{legacy_featured_s:>9.3f}s"
+            
+            print(f"{num_tracks:>8} | {featured_s:>9.3f}s | {legacy_column} | {latest_s:>9.3f}s")
+        finally:
+            shutil.rmtree(tmp_dir)
+
+
+if __name__ == "__main__":
+    main([int(size) for size in sys.argv[1:]] or DEFAULT_SIZES)
+
+
+# FIN ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
@@ -170,7 +170,7 @@ current_playback_test_message = {
     #             'volume_percent': 0},
     'is_playing': True,
     'item': track_test,
-    # 'progress_ms': 0,
+    'progress_ms': 0,
     'repeat_state': 'off',
     'shuffle_state': False,
     # 'smart_shuffle': False,
@@ -182,6 +182,7 @@ get_playback_state_test_message = {
                 'id': 'Pl001'},
     'currently_playing_type': 'track',
     'is_playing': True,
+    'progress_ms': 0,
     'repeat_state': 'off',
     'shuffle_state': False,
     'track': track_test
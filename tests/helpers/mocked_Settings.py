@@ -22,6 +22,18 @@ class MockedSettingsClass():
     MAX_RUNTIME_MINUTES: int    = 30
     LOGGING_RUNTIME_S: int      = 60
     LOGGING_INTERVAL_S: int     = 15
+    LOGGING_IDLE_MAX_S: int     = 60
+    LOGGING_MACRO_S: int        = 3
+    LOGGING_TRACK_END_S: int    = 1
+    LOGGING_BUFFERED: bool      = False
+    LOGGING_FLUSH_INTERVAL_S: int = 300
+    DAEMON_MISFIRE_GRACE_S: int = 600
+    MACRO_WORKERS: int          = 2
+    MACRO_QUEUE_SIZE: int       = 8
+    JOB_HEARTBEAT_S: int        = 30
+    JOB_STALE_S: int            = 180
+    JOB_MAX_ATTEMPTS: int       = 3
+    JOB_MAX_RUNTIME_S: int      = 7200
     
     # Macro IDs
     GEN_ARTIST_MACRO_ID: str          = "Tr998"
@@ -42,6 +54,9 @@ class MockedSettingsClass():
     LATEST_SOURCE_PLAYLIST: str = MASTER_MIX_ID
     LATEST_DEST_PLAYLIST: str   = "Pl555" # Note this should be in PLAYLISTS_WE_CAN_DELETE_FROM, as a
                                                            #    safety percaution it is not a refernce but a duplicate.
+    
+    # Organize Playlist, in place moves tracks around instead of adding them all back to the end of the playlist.
+    ORGANIZE_PLAYLIST_IN_PLACE: bool = False
 
     # Spotify API Scopes
     MAX_SCOPE_LIST: tuple = ["user-read-playback-state",
@@ -64,14 +79,37 @@ class MockedSettingsClass():
 
     # DB Locations
     BACKUPS_LOCATION: str       = "fake_path/fake_backups/"
-    LAST_TRACK_PICKLE: str      = "fake_path/fake_pickle.pk"
     LISTENING_VAULT_DB: str     = "fake_path/fake_ldb.db"
+    JOB_QUEUE_DB: str           = "fake_path/fake_jobs.db"
+    ALBUM_CACHE_DB: str         = "fake_path/fake_album_cache.db"
+    LISTENING_ARCHIVE_LOCATION: str = "fake_path/fake_archives/"
+    LISTENING_EXPORT_LOCATION: str  = "fake_path/fake_export/"
+    
+    LISTENING_HOT_MONTHS: int   = 3
+    LISTENING_PLAY_GAP_S: int   = 1800
+    
+    # Sanity Checks, 1 runs them one after another
+    
+    # Artist Release, number of artists we fetch at once
+    ARTIST_RELEASE_WORKERS: int = 4
+    ARTIST_RELEASE_CHECKPOINT_BATCH: int = 3
+    
+    # Appears On Verification
+    APPEARS_ON_SEARCH_WORKERS: int = 2
+    
+    # Album Cache
+    ALBUM_CACHE_RECENT_DAYS: int  = 30
+    ALBUM_CACHE_RECENT_TTL_H: int = 24
     
     # Logging Settings
     FUNCTION_ARG_LOGGING_LEVEL: int = 15
     
     # Proxy Settings
     PROXY_SERVER_PORT: int = 9999
+    PROXY_PLAYBACK_POLL_S: int = 10
+    PROXY_EVENT_WAIT_S: int = 4
+    PROXY_CLIENT_IDLE_S: int = 300
+    SPOTIFY_API_CALLS_PER_S: float = 0.0 # 0 is no limit
     
 
 Test_Settings = MockedSettingsClass()
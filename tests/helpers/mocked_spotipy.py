@@ -59,6 +59,10 @@ class MockedSpotipyProxy():
     def current_playback(self, market=None, additional_types=None):
         return self.current_playback_response
     
+    # Not actually spotipy, answered by our proxy server itself
+    def playback_events(self, since_seq=None, timeout_s=0):
+        return {"events": [], "seq": since_seq if since_seq is not None else 0}
+    
     def pause_playback(self, device_id=None):
         self.current_playback_response['is_playing'] = False
         return None
@@ -145,6 +149,18 @@ class MockedSpotipyProxy():
         self.playlist(playlist_id)['tracks'] = [item for item in playlist_items if not item['id'] in items]
         return None
         
+    def playlist_reorder_items(self, playlist_id, range_start, insert_before, range_length=1, snapshot_id=None):
+        playlist = self.playlist(playlist_id)
+        if snapshot_id is not None and snapshot_id != playlist.get('snapshot_id'):
+            raise Exception(f"playlist_reorder_items: stale snapshot {snapshot_id}")
+        
+        moved = playlist['tracks'][range_start:range_start + range_length]
+        del playlist['tracks'][range_start:range_start + range_length]
+        new_start = insert_before if insert_before < range_start else insert_before - range_length
+        playlist['tracks'][new_start:new_start] = moved
+        playlist['snapshot_id'] = f"Sn{int(playlist.get('snapshot_id', 'Sn000')[2:]) + 1:03d}"
+        return {'snapshot_id': playlist['snapshot_id']}
+        
     def artist_albums(self, artist_id, album_type=None, include_groups=None, country=None, limit=20, offset=0):
         # (album, single, compilation, appears_on)
         artist_album_list = []
@@ -6,8 +6,13 @@
 # ║  ╚═╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═╝  ║
 # ╚════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩════╝
 # ════════════════════════════════════════════════════ DESCRIPTION ════════════════════════════════════════════════════
-# A collection of unit test helpers to create and manage our fake Spotify library we create to test with.
+# A collection of unit test helpers to create and manage our fake Spotify library we create to test with. Along with
+#   timing our startup imports for both our unit tests and benchmarks.
 # ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
+import os
+import subprocess
+import sys
+
 from typing import Optional
 
 """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
@@ -157,4 +162,23 @@ def create_env(spotify_mocked):
                                                        , [local_track, local_track, tr001, tr001]))
 
 
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Imports 'Implementations.py' in a fresh interpreter with '-X importtime'.
+INPUT: N/A
+OUTPUT: Dict of every imported module name to its cumulative import time in microseconds.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+def get_startup_import_times() -> dict:
+    repo_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([repo_root] + sys.path))
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import src.Implementations"]
+                            , cwd=repo_root, env=env, capture_output=True, text=True, check=True)
+    import_times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and not line.endswith("| imported package"):
+            _, cumulative_us, module = line.split("|")
+            if cumulative_us.strip().isdigit():
+                import_times[module.strip()] = int(cumulative_us)
+    return import_times
+
+
 # FIN ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
\ No newline at end of file
@@ -145,6 +145,8 @@ class TestBackupSpotifyData(unittest.TestCase):
         self.assertEqual(any(backup_table_lens), False)
         
         thelp.create_env(self.spotify)
+        for idx, playlist in enumerate(self.spotify.sp.playlists[1:]):
+            playlist['snapshot_id'] = f"Sn{idx:03d}"
         self.backup._add_user_playlists_to_db()
         
         # Test adding empty playlist doesn't add anything
@@ -152,6 +154,11 @@ class TestBackupSpotifyData(unittest.TestCase):
         self.assertEqual(vault_table_lens, [4, 4, 7, 9, 11, 11, 9, 7])
         backup_table_lens = [self.backup_db_conn_owner.execute(f"SELECT COUNT(*) FROM '{table}'").fetchone()[0] for table in tables]
         self.assertEqual(backup_table_lens, [4, 4, 7, 9, 11, 11, 9, 7])
+        
+        # Test Snapshots Only Go Into Our Vault, Skipping Playlists Without One
+        expected_snapshots = [(playlist['id'], playlist['snapshot_id']) for playlist in self.spotify.sp.playlists[1:]]
+        self.assertCountEqual(self.vault_db_conn_owner.execute("SELECT * FROM playlist_snapshots").fetchall()
+                              , expected_snapshots)
 
     def test_backup_data(self):
         # We have unit tested all the individual methods called in this method so we don't need to test much here.
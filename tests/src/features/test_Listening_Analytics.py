@@ -0,0 +1,171 @@
+# ╔════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦════╗
+# ║  ╔═╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═╗  ║
+# ╠══╣                                                                                                             ╠══╣
+# ║  ║    UNIT TESTS - LISTENING ANALYTICS         CREATED: 2025-06-02          https://github.com/jacobleazott    ║  ║
+# ║══║                                                                                                             ║══║
+# ║  ╚═╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═╝  ║
+# ╚════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩════╝
+# ════════════════════════════════════════════════════ DESCRIPTION ════════════════════════════════════════════════════
+# Unit tests for all functionality out of 'Listening_Analytics.py'.
+# ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+
+from datetime import datetime
+from unittest import mock
+
+from tests.helpers.mocked_Settings    import Test_Settings
+from src.features.Listening_Analytics import ListeningAnalytics
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Pins 'now' so streaks can be tested against a fixed today.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+class FakeDatetime(datetime):
+    fake_now = datetime(2025, 3, 8, 9, 0, 0)
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls.fake_now
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Unit test collection for all Listening Analytics functionality.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+@mock.patch('src.features.Listening_Analytics.Settings', Test_Settings)
+class TestListeningAnalytics(unittest.TestCase):
+
+    @mock.patch('src.features.Listening_Analytics.Settings', Test_Settings)
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+        # Other suites share 'Test_Settings' so put our paths back once we're done with them.
+        self.addCleanup(setattr, Test_Settings, 'LISTENING_VAULT_DB', Test_Settings.LISTENING_VAULT_DB)
+        self.addCleanup(setattr, Test_Settings, 'LISTENING_EXPORT_LOCATION', Test_Settings.LISTENING_EXPORT_LOCATION)
+        Test_Settings.LISTENING_VAULT_DB = os.path.join(self.tmp_dir, "vault.db")
+        Test_Settings.LISTENING_EXPORT_LOCATION = os.path.join(self.tmp_dir, "export/")
+
+        self.analytics = ListeningAnalytics()
+
+    def populate_vault(self):
+        with self.analytics.vault_db.connect_db() as db_conn:
+            db_conn.executemany("INSERT INTO artists VALUES (?, ?)", [("a1", "Artist One"), ("a2", "Artist Two")
+                                                                    , ("a3", "Artist Three")])
+            db_conn.executemany("INSERT INTO albums VALUES (?, ?, ?, ?)", [("al1", "Album One", "2024-01-01", 2)])
+            db_conn.executemany("INSERT INTO tracks VALUES (?, ?, ?, ?, ?, ?, ?)"
+                                , [("t1", "Track One", 1000, 0, 1, 1, 1), ("t2", "Track Two", 2000, 0, 1, 1, 2)
+                                 , ("t3", "Track Three", 3000, 0, 1, 1, 1)])
+            db_conn.executemany("INSERT INTO tracks_artists VALUES (?, ?)", [("t1", "a1"), ("t1", "a2"), ("t2", "a1")
+                                                                           , ("t3", "a3")])
+            db_conn.executemany("INSERT INTO tracks_albums VALUES (?, ?)", [("t1", "al1"), ("t2", "al1")])
+            db_conn.executemany("INSERT INTO listening_sessions VALUES (?, ?)", [
+                (int(datetime(2025, 2, 27, 8, 0, 0).timestamp()), "t2")     # Thursday
+              , (int(datetime(2025, 2, 28, 8, 0, 0).timestamp()), "t2")     # Friday
+              , (int(datetime(2025, 3, 3, 10, 0, 15).timestamp()), "t1")    # Monday
+              , (int(datetime(2025, 3, 3, 10, 0, 0).timestamp()), "t1")     # Monday
+              , (int(datetime(2025, 3, 4, 10, 0, 0).timestamp()), "t2")     # Tuesday
+              , (int(datetime(2025, 3, 5, 23, 59, 50).timestamp()), "t3")   # Wednesday
+              , (int(datetime(2025, 3, 7, 12, 0, 0).timestamp()), "t3")     # Friday
+              , (int(datetime(2025, 3, 7, 12, 0, 15).timestamp()), "local_track_x")])
+            play = lambda start, ms, track_id: (int(start.timestamp()), int(start.timestamp()) + ms // 1000, track_id
+                                                , ms, ms, 0)
+            db_conn.executemany("INSERT INTO listening_plays VALUES (?, ?, ?, ?, ?, ?)", [
+                play(datetime(2025, 3, 3, 23, 59, 0), 120_000, "t1")   # Monday, into Tuesday
+              , play(datetime(2025, 2, 27, 8, 0, 0), 90_000, "t2")     # Thursday
+              , play(datetime(2025, 3, 3, 10, 0, 0), 30_000, "t1")     # Monday
+              , play(datetime(2025, 3, 5, 23, 59, 50), 0, "t3")        # Wednesday, skipped straight away
+              , play(datetime(2025, 3, 7, 12, 0, 0), 45_000, "t3")])   # Friday
+        # February lives in an archive so our export has to span both.
+        self.analytics.vault_db.archive_listening_sessions(os.path.join(self.tmp_dir, "archives"), datetime(2025, 3, 1))
+        self.analytics.export_listening_history()
+
+    def test_init(self):
+        self.assertEqual(self.analytics.logger, logging.getLogger())
+        self.assertEqual(self.analytics.vault_db.db_path, Test_Settings.LISTENING_VAULT_DB)
+        self.assertEqual(self.analytics.export_location, Test_Settings.LISTENING_EXPORT_LOCATION)
+
+        analytics_logger = ListeningAnalytics(logger=logging.getLogger('custom_logger'))
+        self.assertEqual(analytics_logger.logger, logging.getLogger('custom_logger'))
+
+    def test_export_listening_history(self):
+        # Test Reading Before Any Export
+        with self.assertRaises(Exception):
+            self.analytics.get_top_artists(datetime(2025, 1, 1), datetime(2025, 12, 31))
+
+        # Test Empty Vault
+        self.analytics.export_listening_history()
+        self.assertEqual(self.analytics.get_top_artists(datetime(2025, 1, 1), datetime(2025, 12, 31)), [])
+        self.assertEqual(self.analytics.get_listening_streaks()
+                         , {'longest_streak': 0, 'longest_streak_start': None, 'current_streak': 0})
+
+        # Test Refresh Replaces The Export And Cleans Up After Itself
+        self.populate_vault()
+        self.assertEqual(sorted(os.listdir(self.tmp_dir)), ["archives", "export", "vault.db"])
+
+        columns = self.analytics._load_columns()
+        self.assertEqual(len(columns['time']), 8)
+        self.assertTrue(all(columns['time'][:-1] <= columns['time'][1:]))
+        self.assertEqual(columns['play_ms'].tolist(), [90_000, 30_000, 120_000, 45_000])
+        self.assertTrue(all(columns['play_start'][:-1] <= columns['play_start'][1:]))
+        self.assertEqual(columns['track_id'].tolist(), ["local_track_x", "t1", "t2", "t3"])
+        self.assertEqual(columns['track_name'].tolist(), ["", "Track One", "Track Two", "Track Three"])
+        self.assertEqual(columns['track_duration_ms'].tolist(), [0, 1000, 2000, 3000])
+        self.assertEqual(columns['track'].tolist(), [2, 2, 1, 1, 2, 3, 3, 0])
+        self.assertEqual(columns['track_album'].tolist(), [-1, 0, 0, -1])
+        self.assertEqual(columns['track_artist_offsets'].tolist(), [0, 0, 2, 3, 4])
+        self.assertEqual(columns['artist_id'][columns['track_artists']].tolist(), ["a1", "a2", "a1", "a3"])
+        self.assertEqual(columns['album_release_date'].tolist(), ["2024-01-01"])
+
+        # Test Export Is Memory Mapped And Readonly
+        with self.assertRaises(ValueError):
+            columns['time'][0] = 0
+
+    def test_get_top_artists(self):
+        self.populate_vault()
+
+        # Test Whole History, Ties Broken By Name
+        self.assertEqual(self.analytics.get_top_artists(datetime(2025, 1, 1), datetime(2025, 12, 31))
+                         , [{'id': 'a1', 'name': 'Artist One', 'listen_count': 5}
+                          , {'id': 'a3', 'name': 'Artist Three', 'listen_count': 2}
+                          , {'id': 'a2', 'name': 'Artist Two', 'listen_count': 2}])
+        self.assertEqual(len(self.analytics.get_top_artists(datetime(2025, 1, 1), datetime(2025, 12, 31), 2)), 2)
+
+        # Test Inclusive Range Edges
+        self.assertEqual(self.analytics.get_top_artists(datetime(2025, 3, 3), datetime(2025, 3, 3, 10, 0, 0))
+                         , [{'id': 'a1', 'name': 'Artist One', 'listen_count': 1}
+                          , {'id': 'a2', 'name': 'Artist Two', 'listen_count': 1}])
+        self.assertEqual(self.analytics.get_top_artists(datetime(2025, 3, 3, 10, 0, 16), datetime(2025, 3, 3, 23)), [])
+
+    def test_get_hours_per_weekday(self):
+        self.populate_vault()
+
+        hours = self.analytics.get_hours_per_weekday(datetime(2025, 1, 1), datetime(2025, 12, 31))
+        self.assertEqual(list(hours.keys()), ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"
+                                              , "Sunday"])
+        # Test Hours Come From How Long We Played, Each Play Counting Towards The Day It Started
+        self.assertEqual(list(hours.values()), [150_000 / 3_600_000, 0, 0, 90_000 / 3_600_000, 45_000 / 3_600_000
+                                                , 0, 0])
+
+        self.assertEqual(sum(self.analytics.get_hours_per_weekday(datetime(2025, 3, 1), datetime(2025, 3, 31))
+                             .values()), 195_000 / 3_600_000)
+
+    @mock.patch('src.features.Listening_Analytics.datetime', FakeDatetime)
+    def test_get_listening_streaks(self):
+        self.populate_vault()
+
+        # Test Yesterday Keeps Our Current Streak Alive
+        self.assertEqual(self.analytics.get_listening_streaks()
+                         , {'longest_streak': 3, 'longest_streak_start': datetime(2025, 3, 3), 'current_streak': 1})
+
+        # Test Minimum Sessions Per Day
+        self.assertEqual(self.analytics.get_listening_streaks(min_sessions=2)
+                         , {'longest_streak': 1, 'longest_streak_start': datetime(2025, 3, 3), 'current_streak': 1})
+
+        # Test A Missed Day Breaks Our Current Streak
+        FakeDatetime.fake_now = datetime(2025, 3, 9, 9, 0, 0)
+        self.addCleanup(setattr, FakeDatetime, 'fake_now', datetime(2025, 3, 8, 9, 0, 0))
+        self.assertEqual(self.analytics.get_listening_streaks()['current_streak'], 0)
+
+
+# FIN ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
@@ -19,6 +19,7 @@ from unittest import mock
 import tests.helpers.api_response_test_messages as artm
 
 from src.features.Log_Playback     import LogPlayback
+from src.helpers.Database_Helpers  import build_entries_from_tracks
 from src.helpers.Settings          import Settings
 from tests.helpers.mocked_Settings import Test_Settings
 
@@ -30,14 +31,30 @@ DESCRIPTION: Unit test collection for all Log Playback functionality.
 @mock.patch('src.features.Log_Playback.Settings', Test_Settings)
 class TestLogPlayback(unittest.TestCase):
     
-    def test_init(self):
+    def setUp(self):
+        self.addCleanup(LogPlayback.vault_dbs.clear)
+        self.addCleanup(LogPlayback.logged_track_ids.clear)
+    
+    @mock.patch('src.features.Log_Playback.DatabaseHelpers')
+    def test_init(self, MockDatabaseHelpers):
         log_playback = LogPlayback()
-        self.assertEqual(log_playback.vault_db.db_path, Test_Settings.LISTENING_VAULT_DB)
+        MockDatabaseHelpers.assert_called_once_with(Test_Settings.LISTENING_VAULT_DB, logger=logging.getLogger())
+        self.assertEqual(log_playback.vault_db, MockDatabaseHelpers.return_value)
         self.assertEqual(log_playback.logger, logging.getLogger())
         
+        # Test Every Poll Reuses Our Vault's DatabaseHelpers And Logged Tracks
+        log_playback.logged_track_ids.add("Tr001")
         custom_logger = logging.getLogger('custom_logger')
         log_playback = LogPlayback(logger=custom_logger)
         self.assertEqual(log_playback.logger, custom_logger)
+        MockDatabaseHelpers.assert_called_once()
+        self.assertEqual(log_playback.logged_track_ids, {"Tr001"})
+        
+        # Test A New Vault Gets Its Own, Nothing We Logged Elsewhere Is Skipped
+        with mock.patch.object(Test_Settings, 'LISTENING_VAULT_DB', "fake_path/new_vault.db"):
+            log_playback = LogPlayback()
+        self.assertEqual(MockDatabaseHelpers.call_count, 2)
+        self.assertEqual(log_playback.logged_track_ids, set())
 
     # def test_increment_play_count_db(self):
     #     shared_memory_db = "file:shared_memory?mode=memory&cache=shared"
@@ -66,98 +83,100 @@ class TestLogPlayback(unittest.TestCase):
     #     self.assertEqual(conn.execute(f"SELECT * FROM tracks").fetchall()
     #                      , [('Tr001', 11), ('Tr002', 99), ("", 2)])
 
-    @mock.patch('builtins.open', new_callable=mock.mock_open)
-    @mock.patch('pickle.load')
-    @mock.patch('pickle.dump')
-    def test_update_last_track_count(self, mock_dump, mock_load, mock_open):
-        # Create an instance of LogPlayback
-        log_playback = LogPlayback()
-        log_playback.track['id'] = 'Tr001'
-        log_playback.vault_db.increment_track_count = mock.MagicMock() # We don't care about triggering this here.
-
-        # Test FileNotFoundError When Reading File.
-        mock_load.side_effect = FileNotFoundError
-        log_playback.update_last_track_count()
-        mock_dump.assert_called_once_with(('Tr001', True), mock_open())
-        
-        # Test EOFError When Reading File.
-        mock_load.side_effect = EOFError
-        mock_dump.reset_mock()
-        log_playback.update_last_track_count()
-        mock_dump.assert_called_once_with(('Tr001', True), mock_open())
-        
-        # Must change side_effect to None, reset_mock() doesn't reset this.
-        mock_load.side_effect = None
-
-        # Test track ID is different.
-        mock_dump.reset_mock()
-        mock_load.return_value = ('Tr002', False)
-        log_playback.update_last_track_count()
-        mock_dump.assert_called_once_with(('Tr001', True), mock_open())
-
-        # Test track ID is the same and value is True.
-        mock_dump.reset_mock()
-        mock_load.return_value = ('Tr001', True)
-        
-        log_playback.update_last_track_count()
-        mock_dump.assert_called_once_with(('Tr001', False), mock_open())
-        log_playback.vault_db.increment_track_count.assert_called_once()
-        
-        # Test track ID is the same and value is False.
-        mock_dump.reset_mock()
-        log_playback.vault_db.increment_track_count.reset_mock() 
-        mock_load.return_value = ('Tr001', False)
-        log_playback.update_last_track_count()
-        mock_dump.assert_not_called()
-        log_playback.vault_db.increment_track_count.assert_not_called()
-    
-    def test_log_track(self):
+    @mock.patch('src.features.Log_Playback.datetime')
+    def test_log_track(self, mock_datetime):
+        mock_datetime.now.return_value.timestamp.return_value = 1_700_000_000.5
         log_playback = LogPlayback()
         log_playback.vault_db = mock.MagicMock()
-        log_playback.update_last_track_count = mock.MagicMock()
         test_playback = artm.get_playback_state_test_message.copy()
         test_playback['track']['id'] = "test_track_id"
         
         # Test None Playback
         log_playback.log_track(None, False)
-        log_playback.vault_db.add_listening_session.assert_not_called()
+        log_playback.vault_db.log_playback.assert_not_called()
         
-        # Test Not Playing Playback.
+        # Test Macro Track Playback.
+        test_playback['track']['id'] = Test_Settings.MACRO_LIST[0]
+        log_playback.log_track(test_playback, False)
+        log_playback.vault_db.log_playback.assert_not_called()
+        test_playback['track']['id'] = "test_track_id"
+        
+        # Test Not Playing Playback Is Still Logged, First Time We See A Track Writes Its Entries.
         test_playback['is_playing'] = False
+        test_playback['progress_ms'] = 42_000
         log_playback.log_track(test_playback, False)
-        log_playback.vault_db.add_listening_session.assert_not_called()
+        entries = build_entries_from_tracks([test_playback['track']])
+        log_playback.vault_db.log_playback.assert_called_once_with(
+            entries, "test_track_id", 42_000, False, 1_700_000_000, inc_track_count=False
+            , max_gap_s=Test_Settings.LISTENING_PLAY_GAP_S)
+        self.assertEqual(log_playback.logged_track_ids, {"test_track_id"})
         test_playback['is_playing'] = True
+        log_playback.vault_db.reset_mock()
         
-        # Test Macro Track Playback.
-        test_playback['track']['id'] = Test_Settings.MACRO_LIST[0]
+        # Test Inc Track Count, Known Tracks Skip Their Entries Even From A New Instance.
+        log_playback = LogPlayback()
+        log_playback.vault_db = mock.MagicMock()
+        log_playback.log_track(test_playback, True)
+        log_playback.vault_db.log_playback.assert_called_once_with(
+            {}, "test_track_id", 42_000, True, 1_700_000_000, inc_track_count=True
+            , max_gap_s=Test_Settings.LISTENING_PLAY_GAP_S)
+        log_playback.vault_db.reset_mock()
+        
+        # Test Playback Without Progress.
+        test_playback.pop('progress_ms')
         log_playback.log_track(test_playback, False)
-        log_playback.vault_db.add_listening_session.assert_not_called()
-        test_playback['track']['id'] = "test_track_id"
+        self.assertIsNone(log_playback.vault_db.log_playback.call_args.args[2])
+        test_playback['progress_ms'] = 0
+        log_playback.vault_db.reset_mock()
         
         # Test Local Track Playback.
         test_playback['track']['is_local'] = True
         test_playback['track']['id'] = None
         log_playback.log_track(test_playback, False)
-        log_playback.vault_db.insert_many.assert_called()
-        log_playback.vault_db.add_listening_session.assert_called_once_with("local_track_Fake Track 0")
-        log_playback.update_last_track_count.assert_not_called()
+        self.assertNotEqual(log_playback.vault_db.log_playback.call_args.args[0], {})
+        self.assertEqual(log_playback.vault_db.log_playback.call_args.args[1], "local_track_Fake Track 0")
         test_playback['track']['is_local'] = False
         test_playback['track']['id'] = "test_track_id"
         log_playback.vault_db.reset_mock()
         
-        # Test Inc Track Count.
-        log_playback.log_track(test_playback, True)
-        log_playback.vault_db.insert_many.assert_called()
-        log_playback.update_last_track_count.assert_called()
-        log_playback.vault_db.add_listening_session.assert_called_once_with("test_track_id")
-        log_playback.vault_db.reset_mock()
-        
-        # Test New Track Id.
+        # Test A Failed Write Doesn't Mark Our Track As Logged.
         test_playback['track']['id'] = "new_track_id"
-        log_playback.log_track(test_playback, False)
-        log_playback.vault_db.insert_many.assert_called()
-        log_playback.vault_db.add_listening_session.assert_called_once_with("new_track_id")
-        log_playback.vault_db.reset_mock()
+        log_playback.vault_db.log_playback.side_effect = sqlite3.OperationalError
+        with self.assertRaises(sqlite3.OperationalError):
+            log_playback.log_track(test_playback, False)
+        self.assertNotIn("new_track_id", log_playback.logged_track_ids)
+        test_playback['track']['id'] = "test_track_id"
+    
+    @mock.patch('src.features.Log_Playback.datetime')
+    def test_log_track_buffered(self, mock_datetime):
+        self.addCleanup(setattr, LogPlayback, 'last_flush_time', LogPlayback.last_flush_time)
+        mock_datetime.now.return_value.timestamp.return_value = 1_700_000_000
+        log_playback = LogPlayback()
+        log_playback.vault_db = mock.MagicMock()
+        log_playback.logged_track_ids.add("test_track_id")
+        test_playback = artm.get_playback_state_test_message.copy()
+        test_playback['track']['id'] = "test_track_id"
+        
+        with mock.patch.object(Test_Settings, 'LOGGING_BUFFERED', True):
+            # Test Our Process Starting Counts As A Flush So Our First Poll Only Buffers
+            self.assertLessEqual(LogPlayback.last_flush_time, int(datetime.now().timestamp()))
+            LogPlayback.last_flush_time = 1_700_000_000
+            log_playback.log_track(test_playback, True)
+            log_playback.vault_db.buffer_playback.assert_called_once_with(
+                {}, "test_track_id", 0, True, 1_700_000_000, inc_track_count=True
+                , max_gap_s=Test_Settings.LISTENING_PLAY_GAP_S)
+            log_playback.vault_db.log_playback.assert_not_called()
+            log_playback.vault_db.flush_playback_log.assert_not_called()
+            log_playback.vault_db.reset_mock()
+            
+            # Test We Only Flush Once Our Interval Is Up
+            mock_datetime.now.return_value.timestamp.return_value += Test_Settings.LOGGING_FLUSH_INTERVAL_S - 1
+            log_playback.log_track(test_playback, True)
+            log_playback.vault_db.buffer_playback.assert_called_once()
+            log_playback.vault_db.flush_playback_log.assert_not_called()
+            mock_datetime.now.return_value.timestamp.return_value += 1
+            log_playback.log_track(test_playback, True)
+            log_playback.vault_db.flush_playback_log.assert_called_once()
         
 
 # FIN ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
\ No newline at end of file
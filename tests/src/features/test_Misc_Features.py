@@ -8,12 +8,17 @@
 # ════════════════════════════════════════════════════ DESCRIPTION ════════════════════════════════════════════════════
 # Unit tests for all functionality out of 'Misc_Features.py'.
 # ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
+import json
 import logging
+import time
 import unittest
-from unittest import mock
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest           import mock
 
 from tests.helpers.mocked_Settings import Test_Settings
-from src.features.Misc_Features    import MiscFeatures
+from src.features.Misc_Features    import MiscFeatures, normalize_artist_name
+from src.helpers.Job_Queue         import JobCheckpoint
 
 """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
 DESCRIPTION: Unit test collection for all Misc Features functionality.
@@ -115,9 +120,95 @@ class TestMiscFeatures(unittest.TestCase):
         # Verify the tracks are added to the playlist
         self.mock_spotify.add_tracks_to_playlist.assert_called_once_with('test_playlist_id'
                                                                          , ['track_1', 'track_2', 'track_5', 'track_6'])
+        # Verify our album cache hit rates are reported for the run
+        self.mock_spotify.log_album_cache_stats.assert_called_once()
         # Verify the playlist is returned
         self.assertEqual(playlist_id, 'test_playlist_id')
         
+        # Test Order Holds When Earlier Artists Finish Last
+        self.mock_spotify.reset_mock()
+        artist_ids = [f"artist_{idx}" for idx in range(10)]
+        def gather_tracks_by_artist(artist_id, start_date=None, end_date=None):
+            time.sleep((10 - int(artist_id.split('_')[1])) / 1000)
+            return [f"{artist_id}_track_1", f"{artist_id}_track_2"]
+        self.mock_spotify.gather_tracks_by_artist.side_effect = gather_tracks_by_artist
+        with mock.patch('src.features.Misc_Features.ThreadPoolExecutor', wraps=ThreadPoolExecutor) as mock_executor:
+            self.mFeatures.generate_artist_release(artist_ids, 'test_playlist_name', 'test_playlist_desc')
+            mock_executor.assert_called_once_with(max_workers=Test_Settings.ARTIST_RELEASE_WORKERS)
+        self.assertEqual(self.mock_spotify.gather_tracks_by_artist.call_count, 10)
+        self.mock_spotify.add_tracks_to_playlist.assert_called_once_with('test_playlist_id'
+            , [f"{artist_id}_track_{track}" for artist_id in artist_ids for track in (1, 2)])
+        
+        # Test Failed Artist Fails The Release
+        self.mock_spotify.reset_mock()
+        self.mock_spotify.gather_tracks_by_artist.side_effect = Exception("proxy down")
+        with self.assertRaises(Exception):
+            self.mFeatures.generate_artist_release(artist_ids, 'test_playlist_name', 'test_playlist_desc')
+        self.mock_spotify.add_tracks_to_playlist.assert_not_called()
+        
+        # Test Resuming From A Checkpoint Reuses Our Playlist And Skips Gathered Artists
+        self.mock_spotify.reset_mock()
+        self.mock_spotify.gather_tracks_by_artist.side_effect = gather_tracks_by_artist
+        saved_states = []
+        checkpoint = JobCheckpoint({'playlist_id': 'resumed_playlist_id', 'artist_tracks': {'artist_1': ['t1']}}
+                                   , save_func=lambda state: saved_states.append(json.dumps(state)))
+        self.assertEqual(self.mFeatures.generate_artist_release(['artist_1', 'artist_2', 'artist_1']
+                                                                , 'test_playlist_name', 'test_playlist_desc'
+                                                                , checkpoint=checkpoint), 'resumed_playlist_id')
+        self.mock_spotify.create_playlist.assert_not_called()
+        self.mock_spotify.gather_tracks_by_artist.assert_called_once_with('artist_2', start_date=None, end_date=None)
+        self.mock_spotify.add_tracks_to_playlist.assert_called_once_with('resumed_playlist_id'
+            , ['t1', 'artist_2_track_1', 'artist_2_track_2', 't1'])
+        self.assertEqual(len(saved_states), 3)
+        self.assertEqual(checkpoint.get('num_tracks_added'), 4)
+        self.assertTrue(checkpoint.get('tracks_added'))
+        
+        # Test A Finished Checkpoint Does Nothing
+        self.mock_spotify.reset_mock()
+        self.assertEqual(self.mFeatures.generate_artist_release(['artist_1'], 'test_playlist_name'
+                                                                , 'test_playlist_desc', checkpoint=checkpoint)
+                         , 'resumed_playlist_id')
+        self.mock_spotify.create_playlist.assert_not_called()
+        self.mock_spotify.add_tracks_to_playlist.assert_not_called()
+        
+        # Test Failing Partway Keeps The Playlist And Artists We Got To
+        self.mock_spotify.reset_mock()
+        def gather_until_proxy_down(artist_id, start_date=None, end_date=None):
+            if artist_id == 'artist_2':
+                raise Exception("proxy down")
+            return [f"{artist_id}_track"]
+        self.mock_spotify.gather_tracks_by_artist.side_effect = gather_until_proxy_down
+        checkpoint = JobCheckpoint()
+        with mock.patch.object(Test_Settings, 'ARTIST_RELEASE_WORKERS', 1):
+            with self.assertRaises(Exception):
+                self.mFeatures.generate_artist_release(['artist_1', 'artist_2', 'artist_3'], 'test_playlist_name'
+                                                       , 'test_playlist_desc', checkpoint=checkpoint)
+        self.assertEqual(checkpoint.state, {'playlist_id': 'test_playlist_id'
+                                            , 'artist_tracks': {'artist_1': ['artist_1_track']}})
+        
+        # Test Gathered Artists Are Saved In Batches
+        self.mock_spotify.reset_mock()
+        self.mock_spotify.gather_tracks_by_artist.side_effect = gather_tracks_by_artist
+        saved_artists = []
+        checkpoint = JobCheckpoint(save_func=lambda state: saved_artists.append(len(state.get('artist_tracks', {}))))
+        self.mFeatures.generate_artist_release(artist_ids[:7], 'test_playlist_name', 'test_playlist_desc'
+                                               , checkpoint=checkpoint)
+        # Playlist, 3 full batches and the last artist, our one add chunk, and being done
+        self.assertEqual(saved_artists, [0, 3, 6, 7, 7, 7])
+        
+        # Test Resuming Partway Through Adding Only Adds The Chunks We Hadn't
+        self.mock_spotify.reset_mock()
+        tracks = [f"track_{idx}" for idx in range(250)]
+        checkpoint = JobCheckpoint({'playlist_id': 'resumed_playlist_id', 'artist_tracks': {'artist_1': tracks}
+                                    , 'num_tracks_added': 100})
+        self.mFeatures.generate_artist_release(['artist_1'], 'test_playlist_name', 'test_playlist_desc'
+                                               , checkpoint=checkpoint)
+        self.mock_spotify.gather_tracks_by_artist.assert_not_called()
+        self.assertEqual(self.mock_spotify.add_tracks_to_playlist.call_args_list
+                         , [mock.call('resumed_playlist_id', tracks[100:200])
+                          , mock.call('resumed_playlist_id', tracks[200:])])
+        self.assertEqual(checkpoint.get('num_tracks_added'), 250)
+        
         # Test No Artists
         self.mock_spotify.reset_mock()
         self.mock_spotify.create_playlist.assert_not_called()
@@ -125,6 +216,13 @@ class TestMiscFeatures(unittest.TestCase):
         self.mock_spotify.add_tracks_to_playlist.assert_not_called()
         self.assertIsNone(self.mFeatures.generate_artist_release([], 'test_playlist_name', 'test_playlist_desc'))
     
+    def test_normalize_artist_name(self):
+        self.assertEqual(normalize_artist_name("Artist One"), "artist one")
+        self.assertEqual(normalize_artist_name("  ARTIST\tOne  "), "artist one")
+        self.assertEqual(normalize_artist_name("Beyonce\u0301"), normalize_artist_name("Beyonc\u00e9"))
+        self.assertEqual(normalize_artist_name("Stra\u00dfe"), "strasse")
+        self.assertEqual(normalize_artist_name(""), "")
+
     @mock.patch('src.features.Misc_Features.datetime')
     def test_distribute_tracks_to_collections_from_playlist(self, MockDateTime):
         # Keep Date Consistent 
@@ -166,6 +264,10 @@ class TestMiscFeatures(unittest.TestCase):
             , 'playlist_id_7': [{'id': 'track_10', 'name': 'Macro Track', 'artists': [{'id': 'artist_1', 'name': 'Artist One'}
                                                                                       , {'id': 'artist_2', 'name': 'Artist Two'}
                                                                                       , {'id': 'artist_3', 'name': 'Artist Three'}]}]
+            # Test Artist Names That Only Match Once Normalized
+            , 'playlist_id_8': [{'id': 'track_11', 'name': 'Track Eleven', 'artists': [{'id': 'artist_1', 'name': 'artist  ONE '}]}
+                                , {'id': 'track_12', 'name': 'Track Twelve', 'artists': [{'id': 'artist_3'
+                                                                                          , 'name': 'Artist\u00a0Three'}]}]
         }.get(playlist_id, [])
         
         # Test Playlist With No Tracks
@@ -255,6 +357,17 @@ class TestMiscFeatures(unittest.TestCase):
         ], any_order=True)
         self.assertEqual(self.mock_spotify.add_unique_tracks_to_playlist.call_count, 4)
         self.mock_spotify.add_unique_tracks_to_playlist.reset_mock()
+        
+        # Test Normalized Artist Names
+        self.mFeatures.distribute_tracks_to_collections_from_playlist('playlist_id_8')
+        self.mock_spotify.add_unique_tracks_to_playlist.assert_has_calls([
+            mock.call(Test_Settings.MASTER_MIX_ID, ['track_11', 'track_12'])
+            , mock.call('years_playlist_id', ['track_11', 'track_12'])
+            , mock.call('artist_playlist_id_1', ['track_11'])
+            , mock.call('artist_playlist_id_3', ['track_12'])
+        ], any_order=True)
+        self.assertEqual(self.mock_spotify.add_unique_tracks_to_playlist.call_count, 4)
+        self.mock_spotify.add_unique_tracks_to_playlist.reset_mock()
 
         # Missing Years
         self.mock_spotify.get_user_playlists.return_value = [
@@ -368,10 +481,58 @@ class TestMiscFeatures(unittest.TestCase):
         self.mock_spotify.add_tracks_to_playlist.assert_not_called()
         self.mock_spotify.add_tracks_to_playlist.reset_mock()
     
+    def test_reorganize_playlist_in_place(self):
+        track = lambda track_id, album_id, release_date, track_number, is_local=False: {
+            'id': track_id, 'name': track_id, 'disc_number': 1, 'track_number': track_number, 'is_local': is_local
+            , 'album': {'id': album_id, 'release_date': release_date}, 'artists': []}
+        self.mock_spotify.get_playlist_data.return_value = ['snapshot_1']
+        self.mock_spotify.get_playlist_tracks.side_effect = lambda playlist_id, track_info=None, album_info=None: {
+            # Already Organized
+            'playlist_id_0': [track('track_1', 'album_1', '2020', 1), track('track_2', 'album_1', '2020', 2)]
+            # New Tracks At The End
+            , 'playlist_id_1': [track('track_1', 'album_1', '2020', 1), track('track_3', 'album_2', '2022', 1)
+                                , track('track_2', 'album_1', '2020', 2)]
+            # Local And Macro Tracks Hold Their Spots
+            , 'playlist_id_2': [track('track_3', 'album_2', '2022', 1), track(None, 'album_0', '', 0, is_local=True)
+                                , track(Test_Settings.ORGANIZE_PLAYLIST_MACRO_ID, 'album_0', '', 0)
+                                , track('track_2', 'album_1', '2020', 2), track('track_1', 'album_1', '2020', 1)]
+        }.get(playlist_id, [])
+        
+        # Test Already Organized
+        self.mFeatures.reorganize_playlist('playlist_id_0', in_place=True)
+        self.mock_spotify.get_playlist_data.assert_called_once_with('playlist_id_0', info=['snapshot_id'])
+        self.mock_spotify.reorder_playlist_tracks.assert_called_once_with('playlist_id_0', [], snapshot_id='snapshot_1')
+        self.mock_spotify.add_tracks_to_playlist.assert_not_called()
+        self.mock_spotify.reset_mock()
+        
+        # Test New Tracks At The End
+        self.mFeatures.reorganize_playlist('playlist_id_1', in_place=True)
+        self.mock_spotify.reorder_playlist_tracks.assert_called_once_with('playlist_id_1', [(1, 3, 1)]
+                                                                          , snapshot_id='snapshot_1')
+        self.mock_spotify.reset_mock()
+        
+        # Test Local And Macro Tracks
+        self.mFeatures.reorganize_playlist('playlist_id_2', in_place=True)
+        self.mock_spotify.reorder_playlist_tracks.assert_called_once_with('playlist_id_2', [(4, 0, 1), (1, 5, 1)]
+                                                                          , snapshot_id='snapshot_1')
+        self.mock_spotify.add_tracks_to_playlist.assert_not_called()
+        self.mock_spotify.reset_mock()
+        
+        # Test Settings Default
+        with mock.patch.object(Test_Settings, 'ORGANIZE_PLAYLIST_IN_PLACE', True):
+            self.mFeatures.reorganize_playlist('playlist_id_0')
+        self.mock_spotify.reorder_playlist_tracks.assert_called_once()
+        self.mock_spotify.add_tracks_to_playlist.assert_not_called()
+        self.mock_spotify.reset_mock()
+        self.mFeatures.reorganize_playlist('playlist_id_0')
+        self.mock_spotify.get_playlist_data.assert_not_called()
+        self.mock_spotify.reorder_playlist_tracks.assert_not_called()
+        self.mock_spotify.add_tracks_to_playlist.assert_called_once_with('playlist_id_0', ['track_1', 'track_2'])
+    
     def test_update_daily_latest_playlist(self):
         Test_Settings.LATEST_PLAYLIST_LENGTH = 2
         self.mock_spotify.get_playlist_data.return_value = [5]
-        self.mock_spotify.remove_all_playlist_tracks.return_value = True
+        self.mock_spotify.sync_playlist_tracks.return_value = True
         
         # Test Normal
         self.mock_spotify.get_playlist_tracks.return_value = [{'id': 'track_1'}, {'id': 'track_2'}]
@@ -379,10 +540,10 @@ class TestMiscFeatures(unittest.TestCase):
         self.mock_spotify.get_playlist_data.assert_called_once_with(Test_Settings.LATEST_SOURCE_PLAYLIST
                                                                     , info=[['tracks', 'total']])
         self.mock_spotify.get_playlist_tracks.assert_called_once_with(Test_Settings.LATEST_SOURCE_PLAYLIST, offset=3)
-        self.mock_spotify.remove_all_playlist_tracks.assert_called_once_with(Test_Settings.LATEST_DEST_PLAYLIST
-                                                                             , max_playlist_length=3)
-        self.mock_spotify.add_tracks_to_playlist.assert_called_once_with(Test_Settings.LATEST_DEST_PLAYLIST
-                                                                         , ['track_1', 'track_2'])
+        self.mock_spotify.sync_playlist_tracks.assert_called_once_with(Test_Settings.LATEST_DEST_PLAYLIST
+                                                                       , ['track_1', 'track_2'], max_playlist_length=3)
+        self.mock_spotify.remove_all_playlist_tracks.assert_not_called()
+        self.mock_spotify.add_tracks_to_playlist.assert_not_called()
         self.mock_spotify.reset_mock()
         
         # Test Empty Playlist
@@ -392,31 +553,23 @@ class TestMiscFeatures(unittest.TestCase):
         self.mock_spotify.get_playlist_data.assert_called_once_with(Test_Settings.LATEST_SOURCE_PLAYLIST
                                                                     , info=[['tracks', 'total']])
         self.mock_spotify.get_playlist_tracks.assert_called_once_with(Test_Settings.LATEST_SOURCE_PLAYLIST, offset=0)
-        self.mock_spotify.remove_all_playlist_tracks.assert_called_once_with(Test_Settings.LATEST_DEST_PLAYLIST
-                                                                             , max_playlist_length=3)
-        self.mock_spotify.add_tracks_to_playlist.assert_called_once_with(Test_Settings.LATEST_DEST_PLAYLIST, [])
+        self.mock_spotify.sync_playlist_tracks.assert_called_once_with(Test_Settings.LATEST_DEST_PLAYLIST, []
+                                                                       , max_playlist_length=3)
         self.mock_spotify.reset_mock()
         
         # Test Not Enough Tracks
-        self.mock_spotify.get_playlist_tracks.return_value = [1]
         self.mock_spotify.get_playlist_tracks.return_value = [{'id': 'track_1'}]
         self.mFeatures.update_daily_latest_playlist()
-        self.mock_spotify.get_playlist_data.assert_called_once_with(Test_Settings.LATEST_SOURCE_PLAYLIST
-                                                                    , info=[['tracks', 'total']])
         self.mock_spotify.get_playlist_tracks.assert_called_once_with(Test_Settings.LATEST_SOURCE_PLAYLIST, offset=0)
-        self.mock_spotify.remove_all_playlist_tracks.assert_called_once_with(Test_Settings.LATEST_DEST_PLAYLIST
-                                                                             , max_playlist_length=3)
-        self.mock_spotify.add_tracks_to_playlist.assert_called_once_with(Test_Settings.LATEST_DEST_PLAYLIST, ['track_1'])
+        self.mock_spotify.sync_playlist_tracks.assert_called_once_with(Test_Settings.LATEST_DEST_PLAYLIST, ['track_1']
+                                                                       , max_playlist_length=3)
         self.mock_spotify.reset_mock()
         
-        # Test Removal Error
-        self.mock_spotify.remove_all_playlist_tracks.return_value = False
+        # Test Sync Refused
+        self.mock_spotify.sync_playlist_tracks.return_value = False
         self.mFeatures.update_daily_latest_playlist()
-        self.mock_spotify.get_playlist_data.assert_called_once_with(Test_Settings.LATEST_SOURCE_PLAYLIST
-                                                                    , info=[['tracks', 'total']])
-        self.mock_spotify.get_playlist_tracks.assert_called_once_with(Test_Settings.LATEST_SOURCE_PLAYLIST, offset=0)
-        self.mock_spotify.remove_all_playlist_tracks.assert_called_once_with(Test_Settings.LATEST_DEST_PLAYLIST
-                                                                             , max_playlist_length=3)
+        self.mock_spotify.sync_playlist_tracks.assert_called_once_with(Test_Settings.LATEST_DEST_PLAYLIST, ['track_1']
+                                                                       , max_playlist_length=3)
         self.mock_spotify.add_tracks_to_playlist.assert_not_called()
 
 
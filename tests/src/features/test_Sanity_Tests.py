@@ -48,20 +48,7 @@ class TestSanityTests(unittest.TestCase):
           , {'id': Settings.PLAYLIST_IDS_NOT_IN_ARTISTS[0], 'name': 'Not in Artists'}
         ]
         
-        mock_playlist_data = {
-            'playlist_1': [{'id': '1', 'name': 'Track 1', 'duration_ms': 10, 'is_local': 0, 'is_playable': 1}]
-          , 'playlist_2': [{'id': '2', 'name': 'Track 2', 'duration_ms': 10, 'is_local': 0, 'is_playable': 1}]
-          , 'playlist_3': []
-          , 'playlist_4': [{'id': '3', 'name': 'Track 3', 'duration_ms': 99, 'is_local': 1, 'is_playable': 0}]
-          , 'playlist_5': [{'id': '4', 'name': 'Track 4', 'duration_ms': 10, 'is_local': 0, 'is_playable': 1}]
-          , Settings.MASTER_MIX_ID: 
-                [{'id': '5', 'name': 'Track 5', 'duration_ms': 10, 'is_local': 0, 'is_playable': 1}]
-          , Settings.PLAYLIST_IDS_NOT_IN_ARTISTS[0]: 
-                [{'id': '6', 'name': 'Track 6', 'duration_ms': 10, 'is_local': 0, 'is_playable': 1}]
-        }
-        
-        self.mock_dbh.get_tracks_from_playlist.side_effect = lambda playlist_id: \
-            mock_playlist_data.get(playlist_id, [])
+        self.mock_dbh.get_playlist_snapshots.return_value = {'playlist_1': 'snap_1', 'playlist_4': 'snap_4'}
         self.sanityTester._gather_playlist_data()
         
         self.mock_dbh.get_user_followed_artists.assert_called_once()
@@ -69,18 +56,48 @@ class TestSanityTests(unittest.TestCase):
                          , self.mock_dbh.get_user_followed_artists.return_value)
         self.mock_dbh.get_user_playlists.assert_called_once()
         self.assertEqual(self.sanityTester.user_playlists, self.mock_dbh.get_user_playlists.return_value)
+        self.mock_dbh.get_sanity_check_cache.assert_called_once()
+        self.mock_dbh.get_playlist_snapshots.assert_called_once()
+        # Tracks Are Left For '_get_tracks'
+        self.mock_dbh.get_all_playlists_tracks.assert_not_called()
+        self.mock_dbh.get_all_track_artists.assert_not_called()
+        self.assertEqual(self.sanityTester.track_artists, {})
         
         self.assertEqual(self.sanityTester.individual_artist_playlists, [
-            {'name': 'Test Artist 1', 'tracks': mock_playlist_data['playlist_1']},
-            {'name': 'Test Artist 2', 'tracks': mock_playlist_data['playlist_2']}])
+            {'id': 'playlist_1', 'name': 'Test Artist 1', 'snapshot_id': 'snap_1'},
+            {'id': 'playlist_2', 'name': 'Test Artist 2', 'snapshot_id': None}])
 
         self.assertEqual(self.sanityTester.years_playlists, [
-            {'name': '2025', 'tracks': mock_playlist_data['playlist_4']}])
+            {'id': 'playlist_4', 'name': '2025', 'snapshot_id': 'snap_4'}])
 
         self.assertEqual(self.sanityTester.master_playlist, [
-            {'name': 'Master Mix', 'tracks': mock_playlist_data[Settings.MASTER_MIX_ID]}])
+            {'id': Settings.MASTER_MIX_ID, 'name': 'Master Mix', 'snapshot_id': None}])
+        
+        self.assertEqual(self.sanityTester.disregard_playlists, [
+            {'id': Settings.PLAYLIST_IDS_NOT_IN_ARTISTS[0], 'name': 'Not in Artists', 'snapshot_id': None}])
+        self.assertCountEqual(self.sanityTester.track_list_to_disregard, list(Settings.MACRO_LIST))
+    
+    def test_get_tracks(self):
+        playlist_1 = {'id': 'playlist_1', 'name': 'Artist 1', 'snapshot_id': 'snap_1'}
+        playlist_2 = {'id': 'playlist_2', 'name': 'Artist 2', 'snapshot_id': 'snap_2'}
+        self.mock_dbh.get_all_playlists_tracks.return_value = {'playlist_1': [{'id': '1', 'name': 'Track 1'}]}
+        self.mock_dbh.get_all_track_artists.return_value = {'1': [{'name': 'Artist 1'}]}
+        
+        # Test Empty
+        self.assertEqual(self.sanityTester._get_tracks([]), [])
+        self.mock_dbh.get_all_playlists_tracks.assert_not_called()
         
-        self.assertCountEqual(self.sanityTester.track_list_to_disregard, list(Settings.MACRO_LIST) + ['6'])
+        # Test Loads Only The Given Playlists
+        self.assertEqual(self.sanityTester._get_tracks([playlist_1, playlist_2]), [{'id': '1', 'name': 'Track 1'}])
+        self.assertCountEqual(self.mock_dbh.get_all_playlists_tracks.call_args.args[0], ['playlist_1', 'playlist_2'])
+        self.assertCountEqual(self.mock_dbh.get_all_track_artists.call_args.args[0], ['playlist_1', 'playlist_2'])
+        self.assertEqual(playlist_2['tracks'], [])
+        self.assertEqual(self.sanityTester.track_artists, {'1': [{'name': 'Artist 1'}]})
+        
+        # Test Already Loaded Playlists Don't Go Back To The DB
+        self.assertEqual(self.sanityTester._get_tracks([playlist_1]), [{'id': '1', 'name': 'Track 1'}])
+        self.assertEqual(self.mock_dbh.get_all_playlists_tracks.call_count, 1)
+        self.assertEqual(self.mock_dbh.get_all_track_artists.call_count, 1)
     
     def test_find_duplicates(self):
         mock_track_artists = {
@@ -89,7 +106,7 @@ class TestSanityTests(unittest.TestCase):
           , '3': [{'name': 'Artist 3'}]
         }
 
-        self.mock_dbh.get_track_artists.side_effect = lambda track_id: mock_track_artists.get(track_id, [])
+        self.sanityTester.track_artists = mock_track_artists
         
         # Test Empty List
         duplicates = self.sanityTester._find_duplicates([])
@@ -132,7 +149,7 @@ class TestSanityTests(unittest.TestCase):
           , Settings.MACRO_LIST[0]: [{'name': 'Artist 6'}]
         }
 
-        self.mock_dbh.get_track_artists.side_effect = lambda track_id: mock_track_artists.get(track_id, [])
+        self.sanityTester.track_artists = mock_track_artists
         
         # Test Empty Lists
         diff_list = self.sanityTester._compare_track_lists([], [])
@@ -207,7 +224,7 @@ class TestSanityTests(unittest.TestCase):
         mock_track_artists = {
             '0': [{'name': 'Artist 1'}, {'name': 'Artist 2'}]
         }
-        self.mock_dbh.get_track_artists.side_effect = lambda track_id: mock_track_artists.get(track_id, [])
+        self.sanityTester.track_artists = mock_track_artists
         
         duplicate_list = self.sanityTester.sanity_duplicates()
         self.assertEqual(duplicate_list, [
@@ -235,7 +252,7 @@ class TestSanityTests(unittest.TestCase):
           , '3': [{'name': 'Artist 3'}]
         }
 
-        self.mock_dbh.get_track_artists.side_effect = lambda track_id: mock_track_artists.get(track_id, [])
+        self.sanityTester.track_artists = mock_track_artists
         
         sanity_artists = self.sanityTester.sanity_contributing_artists()
             
@@ -262,7 +279,7 @@ class TestSanityTests(unittest.TestCase):
           , '3': [{'name': 'Artist 3'}]
         }
         
-        self.mock_dbh.get_track_artists.side_effect = lambda track_id: mock_track_artists.get(track_id, [])
+        self.sanityTester.track_artists = mock_track_artists
         
         sanity_artists = self.sanityTester.sanity_artist_playlist_integrity()
         self.assertEqual(sanity_artists, [
@@ -275,16 +292,16 @@ class TestSanityTests(unittest.TestCase):
             '2': [{'name': 'Artist 1'}, {'name': 'Artist 2'}]
           , '3': [{'name': 'Artist 2'}]
         }
-        self.mock_dbh.get_track_artists.side_effect = lambda track_id: mock_track_artists.get(track_id, [])
+        self.sanityTester.track_artists = mock_track_artists
         
-        self.sanityTester.master_playlist[0] = {
+        self.sanityTester.master_playlist = [{
             'tracks': [
                 {'id': '1', 'name': 'Track 1', 'is_playable': True, 'is_local': False}
               , {'id': '2', 'name': 'Track 2', 'is_playable': False, 'is_local': False}
               , {'id': '3', 'name': 'Track 3', 'is_playable': False, 'is_local': False}
               , {'id': '4', 'name': 'Track 4', 'is_playable': False, 'is_local': True}
               , {'id': '5', 'name': 'Track 5', 'is_playable': True, 'is_local': True}
-            ]}
+            ]}]
 
         playable_tracks = self.sanityTester.sanity_playable_tracks()
         self.assertEqual(playable_tracks, [
@@ -292,8 +309,136 @@ class TestSanityTests(unittest.TestCase):
           , {'Track': 'Track 3', 'Artists': ['Artist 2']}
           ])
 
-    def test_run_suite(self):
+    def test_run_checks(self):
+        self.sanityTester.user_playlists = [{'id': 'Pl1', 'name': '__Artist 1'}, {'id': 'Pl2', 'name': '__Artist 2'}]
+        self.sanityTester.user_followed_artists = [{'name': 'Artist 1'}]
+        self.sanityTester.track_artists = {'1': [{'name': 'Artist 1'}], '2': [{'name': 'Artist 2'}]}
+        self.sanityTester.individual_artist_playlists = [
+            {'name': 'Artist 1', 'tracks': [{'id': '1', 'name': 'Track 1'}, {'id': '1', 'name': 'Track 1'}
+                                            , {'id': '2', 'name': 'Track 2'}]}]
+        self.sanityTester.master_playlist = [{'name': 'Master', 'tracks': [
+            {'id': '1', 'name': 'Track 1', 'is_playable': False, 'is_local': False}]}]
+        
+        # Test Every Check Is Reported In Order With A Timing
+        checks = self.sanityTester.run_checks()
+        self.assertEqual([check['name'] for check in checks], [name for name, _ in SanityTest.SANITY_CHECKS])
+        for check, (_, method) in zip(checks, SanityTest.SANITY_CHECKS):
+            self.assertEqual(check['results'], getattr(self.sanityTester, method)())
+            self.assertGreaterEqual(check['duration_s'], 0)
+        self.assertEqual(checks[1]['results'], [{'Artist': 'Artist 2'}])
+        self.assertEqual(checks[5]['results'], [{'Track': 'Track 1', 'Artists': ['Artist 1']}])
+        
+        # Test A Failing Check Is Raised Rather Than Dropped
+        with mock.patch.object(self.sanityTester, 'sanity_duplicates', side_effect=KeyError('id')):
+            with self.assertRaises(KeyError):
+                self.sanityTester.run_checks()
+
+    def test_run_checks_cache(self):
+        playlists_tracks = {'playlist_1': [{'id': '1', 'name': 'Track 1'}, {'id': '2', 'name': 'Track 2'}]
+                          , 'playlist_2': [{'id': '2', 'name': 'Track 2'}]
+                          , 'playlist_3': [{'id': '3', 'name': 'Track 3'}, {'id': '3', 'name': 'Track 3'}]
+                          , 'playlist_4': [{'id': '1', 'name': 'Track 1'}]}
+        snapshots = {'playlist_1': 'snap_1', 'playlist_2': 'snap_2', 'playlist_3': 'snap_3', 'playlist_4': 'snap_4'}
+        track_artists = {'1': [{'name': 'Artist 1'}, {'name': 'Artist 2'}]
+                       , '2': [{'name': 'Artist 2'}], '3': [{'name': 'Artist 1'}]}
+        self.mock_dbh.get_all_playlists_tracks.side_effect = lambda playlist_ids: {
+            playlist_id: playlists_tracks[playlist_id] for playlist_id in playlist_ids}
+        self.mock_dbh.get_all_track_artists.side_effect = lambda playlist_ids: track_artists
+        self.sanityTester.user_followed_artists = [{'name': 'Artist 1'}, {'name': 'Artist 2'}]
+        
+        # Every run starts off with none of our playlists' tracks loaded, same as '_gather_playlist_data'
+        def reset_playlists():
+            self.sanityTester.track_artists = {}
+            self.sanityTester.individual_artist_playlists = [
+                {'id': f"playlist_{idx}", 'name': f"Artist {idx}", 'snapshot_id': snapshots[f"playlist_{idx}"]}
+                for idx in range(1, 4)]
+            self.sanityTester.years_playlists = [{'id': 'playlist_4', 'name': '2024'
+                                                  , 'snapshot_id': snapshots['playlist_4']}]
+            self.mock_dbh.get_all_playlists_tracks.reset_mock()
+        
+        def get_loaded_playlists():
+            return sorted({playlist_id for call in self.mock_dbh.get_all_playlists_tracks.call_args_list 
+                           for playlist_id in call.args[0]})
+        
+        def get_uncached_results():
+            reset_playlists()
+            return [getattr(self.sanityTester, check)() for _, check in SanityTest.SANITY_CHECKS]
+        
+        def get_cache_misses():
+            return sorted((entry['check_name'], entry['cache_key']) for entry in self.sanityTester.sanity_cache.values()
+                          if not entry['hit'])
+        
+        # Test Our First Run Builds Everything And Saves It Off
+        reset_playlists()
+        checks = self.sanityTester.run_checks()
+        self.assertEqual([check['results'] for check in checks], get_uncached_results())
+        self.assertEqual(checks[3]['results'], [
+            {'Playlist': 'Artist 1', 'Track': [{'Name': 'Track 2', 'Artists': ['Artist 2']}]}
+          , {'Playlist': 'Artist 3', 'Track': [{'Name': 'Track 3', 'Artists': ['Artist 1']}
+                                             , {'Name': 'Track 3', 'Artists': ['Artist 1']}]}])
+        self.assertEqual(checks[4]['results'], [
+            {'Track': 'Track 1', 'Artists': ['Artist 1', 'Artist 2'], 'Missing': ['Artist 2']}
+          , {'Track': 'Track 3', 'Artists': ['Artist 1'], 'Missing': ['Artist 1']}])
+        self.assertEqual(len(get_cache_misses()), 15)
+        saved_entries = self.mock_dbh.replace_sanity_check_cache.call_args[0][0]
+        self.assertEqual(len(saved_entries), 15)
+        self.assertIn(('duplicates', 'Artist 3', mock.ANY, '[{"Name": "Track 3", "Artists": ["Artist 1"]}]')
+                      , saved_entries)
+        self.assertIsNone(self.sanityTester.sanity_cache_used)
+        
+        # Test Nothing Changed Reuses Everything Without Loading A Single Playlist
+        reset_playlists()
+        with mock.patch.object(self.sanityTester, '_find_duplicates') as mock_find_duplicates \
+           , mock.patch.object(self.sanityTester, '_find_missing_contributions') as mock_find_missing:
+            self.assertEqual([check['results'] for check in self.sanityTester.run_checks()]
+                             , [check['results'] for check in checks])
+            mock_find_duplicates.assert_not_called()
+            mock_find_missing.assert_not_called()
+        self.assertEqual(get_cache_misses(), [])
+        self.assertEqual(get_loaded_playlists(), [])
+        
+        # Test Changing One Playlist Only Rebuilds (And Loads) It And Anything That Depends On It
+        playlists_tracks['playlist_2'] = playlists_tracks['playlist_2'] + [{'id': '1', 'name': 'Track 1'}]
+        snapshots['playlist_2'] = 'snap_2_new'
+        reset_playlists()
+        checks = self.sanityTester.run_checks()
+        self.assertEqual(get_loaded_playlists(), ['playlist_1', 'playlist_2', 'playlist_4'])
+        self.assertEqual([check['results'] for check in checks], get_uncached_results())
+        self.assertEqual(checks[4]['results'], [{'Track': 'Track 3', 'Artists': ['Artist 1'], 'Missing': ['Artist 1']}])
+        self.assertEqual(get_cache_misses(), [('artist_integrity', 'Artist 2'), ('contributing_artists', 'Artist 1')
+                                              , ('contributing_artists', 'Artist 2')
+                                              , ('contributing_artists_others', 'Artist 2')
+                                              , ('diffs', 'ALL PLAYLISTS'), ('duplicates', 'Artist 2')])
+        
+        # Test Unfollowing An Artist Only Rebuilds The Checks It Shows Up In
+        self.sanityTester.user_followed_artists = [{'name': 'Artist 1'}]
+        reset_playlists()
+        checks = self.sanityTester.run_checks()
+        self.assertEqual([check['results'] for check in checks], get_uncached_results())
+        self.assertEqual(get_cache_misses(), [('contributing_artists', 'Artist 1'), ('diffs', 'ALL PLAYLISTS')])
+        
+        # Test A Playlist Without A Snapshot Is Always Rebuilt And Never Saved
+        snapshots['playlist_3'] = None
+        for _ in range(2):
+            reset_playlists()
+            checks = self.sanityTester.run_checks()
+            self.assertEqual([check['results'] for check in checks], get_uncached_results())
+            self.assertNotIn(('duplicates', 'Artist 3'), self.sanityTester.sanity_cache)
+            self.assertIn(('duplicates', 'Artist 1'), self.sanityTester.sanity_cache)
+        
+        # Test A Failed Run Leaves Our Cache Alone
+        self.mock_dbh.replace_sanity_check_cache.reset_mock()
+        with mock.patch.object(self.sanityTester, 'sanity_duplicates', side_effect=KeyError('id')):
+            with self.assertRaises(KeyError):
+                self.sanityTester.run_checks()
+        self.mock_dbh.replace_sanity_check_cache.assert_not_called()
+        self.assertIsNone(self.sanityTester.sanity_cache_used)
+        
+    @mock.patch('src.features.Sanity_Tests.SanityTest.run_checks')
+    def test_run_suite(self, mock_run_checks):
+        mock_run_checks.return_value = [{'name': 'Duplicates', 'results': [], 'duration_s': 0.5}]
         self.sanityTester.run_suite()
+        mock_run_checks.assert_called_once_with()
 
 
 # FIN ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
\ No newline at end of file
@@ -16,8 +16,10 @@ import uuid
 from datetime import datetime
 from unittest import mock
 
+import numpy as np
+
 from tests.helpers.mocked_Settings import Test_Settings
-from src.features.Statistics       import SpotifyStatistics
+from src.features.Statistics       import SpotifyStatistics, encode_ids
 
 """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
 DESCRIPTION: Unit test collection for all Statistics functionality.
@@ -43,9 +45,30 @@ class TestStatistics(unittest.TestCase):
         self.assertEqual(statistics_logger.logger, logging.getLogger('custom_logger'))
         self.assertEqual(statistics_logger.vault_db.db_path, ':memory:')
     
+    def test_encode_ids(self):
+        ids = np.array(["a", "c", "d"])
+        self.assertEqual(encode_ids(ids, ["d", "a", "a", "c"]).tolist(), [2, 0, 0, 1])
+        self.assertEqual(encode_ids(ids, ["b", "e", "", "c"]).tolist(), [-1, -1, -1, 1])
+        self.assertEqual(encode_ids(ids, []).tolist(), [])
+        self.assertEqual(encode_ids(np.array([], dtype=str), ["a"]).tolist(), [-1])
+    
+    def test_track_artist_pairs(self):
+        ta_track = np.array([1, 0, 1, 2, 1])
+        ta_artist = np.array([10, 11, 12, 13, 14])
+        left, right = self.statistics._track_artist_pairs(ta_track, ta_artist)
+        self.assertCountEqual(zip(ta_artist[left].tolist(), ta_artist[right].tolist())
+                              , [(11, 11), (13, 13)
+                               , (10, 10), (10, 12), (10, 14), (12, 10), (12, 12), (12, 14)
+                               , (14, 10), (14, 12), (14, 14)])
+        self.assertEqual([len(pairs) for pairs in self.statistics._track_artist_pairs(ta_track[:0], ta_artist[:0])]
+                         , [0, 0])
+    
     def test_generate_featured_artists_list(self):
         Test_Settings.PLAYLIST_IDS_NOT_IN_ARTISTS = ['playlist_id_1', 'playlist_id_2']
         
+        # Test Empty Database
+        self.assertEqual(self.statistics.generate_featured_artists_list(20), [])
+        
         with self.statistics.vault_db.connect_db() as vault_db_conn:
             vault_db_conn.execute("INSERT INTO artists VALUES (?, ?)", ("artist_1", "Artist One"))
             vault_db_conn.execute("INSERT INTO artists VALUES (?, ?)", ("artist_2", "Artist Two"))
@@ -111,7 +134,7 @@ class TestStatistics(unittest.TestCase):
             vault_db_conn.execute("INSERT INTO tracks (id, name) VALUES (?, ?)", ("track1", "Song One"))
             vault_db_conn.execute("INSERT INTO artists (id, name) VALUES (?, ?)", ("artist1", "Artist One"))
             vault_db_conn.execute("INSERT INTO tracks_artists (id_track, id_artist) VALUES (?, ?)", ("track1", "artist1"))
-            vault_db_conn.execute("INSERT INTO listening_sessions (time, id_track) VALUES (?, ?)", ("2022-01-01 00:00:00", "track1"))
+            vault_db_conn.execute("INSERT INTO listening_sessions (time, id_track) VALUES (?, ?)", (int(datetime(2022, 1, 1).timestamp()), "track1"))
         
         self.assertEqual(self.statistics.generate_latest_artists(datetime(2022, 1, 1)
                                                                  , end_date = datetime(2022, 12, 31))
@@ -123,8 +146,8 @@ class TestStatistics(unittest.TestCase):
             vault_db_conn.execute("INSERT INTO artists (id, name) VALUES (?, ?)", ("artist2", "Artist Two"))
             vault_db_conn.execute("INSERT INTO tracks_artists (id_track, id_artist) VALUES (?, ?)", ("track1", "artist2"))
             vault_db_conn.execute("INSERT INTO tracks_artists (id_track, id_artist) VALUES (?, ?)", ("track2", "artist2"))
-            vault_db_conn.execute("INSERT INTO listening_sessions (time, id_track) VALUES (?, ?)", ("2022-01-02 00:00:00", "track1"))
-            vault_db_conn.execute("INSERT INTO listening_sessions (time, id_track) VALUES (?, ?)", ("2022-01-10 00:00:00", "track2"))
+            vault_db_conn.execute("INSERT INTO listening_sessions (time, id_track) VALUES (?, ?)", (int(datetime(2022, 1, 2).timestamp()), "track1"))
+            vault_db_conn.execute("INSERT INTO listening_sessions (time, id_track) VALUES (?, ?)", (int(datetime(2022, 1, 10).timestamp()), "track2"))
         
         self.assertEqual(self.statistics.generate_latest_artists(datetime(2022, 1, 1)
                                                                  , end_date = datetime(2022, 12, 31))
@@ -151,9 +174,9 @@ class TestStatistics(unittest.TestCase):
         
         # Test Multiple Years
         with self.statistics.vault_db.connect_db() as vault_db_conn:
-            vault_db_conn.execute("INSERT INTO listening_sessions (time, id_track) VALUES (?, ?)", ("2023-01-02 00:00:00", "track1"))
-            vault_db_conn.execute("INSERT INTO listening_sessions (time, id_track) VALUES (?, ?)", ("2023-01-02 00:00:01", "track1"))
-            vault_db_conn.execute("INSERT INTO listening_sessions (time, id_track) VALUES (?, ?)", ("2023-01-10 00:00:00", "track1"))
+            vault_db_conn.execute("INSERT INTO listening_sessions (time, id_track) VALUES (?, ?)", (int(datetime(2023, 1, 2).timestamp()), "track1"))
+            vault_db_conn.execute("INSERT INTO listening_sessions (time, id_track) VALUES (?, ?)", (int(datetime(2023, 1, 2, 0, 0, 1).timestamp()), "track1"))
+            vault_db_conn.execute("INSERT INTO listening_sessions (time, id_track) VALUES (?, ?)", (int(datetime(2023, 1, 10).timestamp()), "track1"))
         
         self.assertEqual(self.statistics.generate_latest_artists(datetime(2022, 1, 1)
                                                                  , end_date = datetime(2023, 2, 1))
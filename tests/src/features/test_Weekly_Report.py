@@ -14,7 +14,7 @@ import unittest
 import pytest
 
 from unittest import mock
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from src.helpers.Settings           import Settings
 from src.features.Weekly_Report     import *
@@ -52,17 +52,17 @@ class TestWeeklyReport(unittest.TestCase):
             mock_smtp_server.sendmail.assert_called_once_with(Settings.SENDER_EMAIL, Settings.RECIPIENT_EMAIL, mock.ANY)
 
     @mock.patch('src.features.Weekly_Report.plt')
-    @mock.patch('sqlite3.connect')
-    def test_gen_playback_graph(self, mock_connect, mock_plt):
-        mock_conn = mock_connect.return_value
-        mock_conn.execute.return_value = mock.Mock(fetchall=mock.Mock(return_value=[1, 2, 3]))
+    @mock.patch('src.features.Weekly_Report.datetime')
+    def test_gen_playback_graph(self, mock_datetime, mock_plt):
+        mock_datetime.today.return_value = datetime(2025, 1, 6, 3)
+        get_daily_listening_ms = self.weekly_report.statistics.vault_db.get_daily_listening_ms
+        get_daily_listening_ms.return_value = {"2025-01-01": 7_200_000, "2025-01-04": 3_600_000}
         mock_plt.subplots.return_value = (mock.MagicMock(), mock.MagicMock())
         
         self.weekly_report._gen_playback_graph()
-        # Test DB Conn Connection
-        mock_connect.assert_called_once_with(Settings.LISTENING_VAULT_DB)
-        mock_conn.execute.assert_called()
-        mock_conn.close.assert_called_once()
+        # Test Daily Listening Data From Prev Sunday To Saturday
+        get_daily_listening_ms.assert_any_call(datetime(2024, 12, 29, 3), datetime(2025, 1, 4, 3))
+        mock_plt.bar.assert_called_once_with(mock.ANY, [0, 0, 0, 2, 0, 0, 1], color=mock.ANY, width=mock.ANY)
         # Test Plot Creation
         mock_plt.subplots.assert_called_once()
         mock_plt.bar.assert_called_once()
@@ -73,53 +73,67 @@ class TestWeeklyReport(unittest.TestCase):
     
     @mock.patch('src.features.Weekly_Report.datetime')
     def test_gen_average_for_past_month(self, mock_datetime):
-        listening_conn = mock.Mock()
+        get_daily_listening_ms = self.weekly_report.statistics.vault_db.get_daily_listening_ms
         # Set To A Saturday 
         mock_datetime.today.return_value = datetime(2025, 1, 5)
+        # Counts are in 15s sessions worth of listening to keep our expected hours readable
+        days_before = lambda counts: {(datetime(2025, 1, 5) - timedelta(days=len(counts) - idx)).strftime("%Y-%m-%d")
+                                      : count * 15_000 for idx, count in enumerate(counts)}
         
         # Test One Week
-        listening_conn.execute.return_value = mock.Mock(fetchall=mock.Mock(return_value=[1] * 200))
+        get_daily_listening_ms.return_value = days_before([200] * 7)
         days_back = 7
         expected_output = [200 * 15 / 3600] * 7
-        self.assertEqual(self.weekly_report._gen_average_for_past_month(listening_conn, days_back), expected_output)
+        self.assertEqual(self.weekly_report._gen_average_for_past_month(days_back), expected_output)
+        get_daily_listening_ms.assert_called_with(datetime(2024, 12, 29), datetime(2025, 1, 4))
         
         # Test Incomplete Weeks
+        get_daily_listening_ms.return_value = days_before([200] * 25)
         days_back = 25
         expected_output = [200 * 15 / 3600] * 7
-        self.assertEqual(self.weekly_report._gen_average_for_past_month(listening_conn, days_back), expected_output)
+        self.assertEqual(self.weekly_report._gen_average_for_past_month(days_back), expected_output)
         
         # Test Averaging
-        listening_conn.execute.return_value.fetchall.side_effect = [
-            [1] * 100, [1] * 100, [1] * 100, [1] * 100, [1] * 100, [1] * 100, [1] * 100, 
-            [1] * 200, [1] * 300, [1] * 400, [1] * 500, [1] * 600, [1] * 700, [1] * 800
-        ]
+        get_daily_listening_ms.return_value = days_before([100, 100, 100, 100, 100, 100, 100
+                                                             , 200, 300, 400, 500, 600, 700, 800])
         days_back = 14
         expected_output = [300 * 15 / 3600 / 2, 400 * 15 / 3600 / 2, 500 * 15 / 3600 / 2, 600 * 15 / 3600 / 2
                            , 700 * 15 / 3600 / 2, 800 * 15 / 3600 / 2, 900 * 15 / 3600 / 2]
-        self.assertEqual(self.weekly_report._gen_average_for_past_month(listening_conn, days_back), expected_output)
+        self.assertEqual(self.weekly_report._gen_average_for_past_month(days_back), expected_output)
 
         # Test Incomplete Averaging
-        listening_conn.execute.return_value.fetchall.side_effect = [
-            [1] * 99, [1] * 50, [1] * 100, [1] * 100, [1] * 100, [1] * 100, [1] * 1
-        ]
+        get_daily_listening_ms.return_value = days_before([99, 50, 100, 100, 100, 100, 1])
         days_back = 7
         expected_output = [0, 0, 100 * 15 / 3600, 100 * 15 / 3600, 100 * 15 / 3600, 100 * 15 / 3600, 0]
-        self.assertEqual(self.weekly_report._gen_average_for_past_month(listening_conn, days_back), expected_output)
+        self.assertEqual(self.weekly_report._gen_average_for_past_month(days_back), expected_output)
         
         # Test Missing Data
-        listening_conn.execute.return_value = mock.Mock(fetchall=mock.Mock(return_value=[]))
+        get_daily_listening_ms.return_value = {}
         days_back = 1000
         expected_output = [0, 0, 0, 0, 0, 0, 0]
-        self.assertEqual(self.weekly_report._gen_average_for_past_month(listening_conn, days_back), expected_output)
+        self.assertEqual(self.weekly_report._gen_average_for_past_month(days_back), expected_output)
 
     def test_gen_weekly_report(self):
+        self.mocked_sanity_tester.run_checks.return_value = [
+            {'name': 'Duplicates', 'results': [{'Playlist': 'Pl1'}], 'duration_s': 0.25}
+          , {'name': 'Artist Integrity', 'results': [], 'duration_s': 1.5}
+        ]
         with mock.patch.object(self.weekly_report, '_gen_playback_graph')\
              , mock.patch.object(self.weekly_report, '_send_email') \
-             , mock.patch('src.features.Weekly_Report.generate_dynamic_table'):
+             , mock.patch('src.features.Weekly_Report.generate_dynamic_table') as mock_table:
             
             self.weekly_report.gen_weekly_report()
             self.weekly_report._gen_playback_graph.assert_called_once()
             self.weekly_report._send_email.assert_called_once()
+            
+            # Test Our Sanity Checks Are Reported With Their Timings, Slowest First
+            self.mocked_sanity_tester.run_checks.assert_called_once_with()
+            self.assertEqual(mock_table.call_args_list[-3:], [
+                mock.call([{'Playlist': 'Pl1'}])
+              , mock.call([])
+              , mock.call([{'Check': 'Artist Integrity', 'Seconds': '1.500'}
+                         , {'Check': 'Duplicates', 'Seconds': '0.250'}])
+            ])
     
     def test_flatten_row(self):
         row = {'A': 1, 'B': 2}
@@ -8,9 +8,11 @@
 # ════════════════════════════════════════════════════ DESCRIPTION ════════════════════════════════════════════════════
 # Unit tests for all functionality out of 'Database_Helpers.py'.
 # ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
+import os
 import shutil
 import sqlite3
 import tempfile
+import threading
 import uuid
 import unittest
 from unittest import mock
@@ -39,6 +41,7 @@ class TestDatabaseHelpers(unittest.TestCase):
             tmp_unit_test_db_path = tmp_file.name
         shutil.copy("tests/helpers/unit_test.db", tmp_unit_test_db_path)
         self.dbh.db_path = tmp_unit_test_db_path
+        self.dbh.create_database()
         return sqlite3.connect(tmp_unit_test_db_path)
     
     def test_generate_create_statement(self):
@@ -60,6 +63,14 @@ class TestDatabaseHelpers(unittest.TestCase):
         }
         self.assertEqual(normalize(generate_create_statement("test_table", fields))
                          , normalize("CREATE TABLE IF NOT EXISTS test_table ( key TIMESTAMP DEFAULT CURRENT_TIMESTAMP, name BLOB, UNIQUE (key) ) WITHOUT ROWID;"))
+        
+        fields = {
+            "time": "INTEGER NOT NULL"
+          , "__indexes__": ["time"]
+        }
+        self.assertEqual(normalize(generate_create_statement("archive.test_table", fields))
+                         , normalize("CREATE TABLE IF NOT EXISTS archive.test_table ( time INTEGER NOT NULL ); "
+                                     "CREATE INDEX IF NOT EXISTS archive.idx_test_table_time ON test_table(time);"))
     
     def test_get_table_fields(self):
         schema = {
@@ -184,6 +195,35 @@ class TestDatabaseHelpers(unittest.TestCase):
         conn.commit()
         self.assertEqual(get_column_types(conn, "test_unsupported"), [int, str])
     
+    def test_split_listening_range(self):
+        epoch = lambda *args: int(datetime(*args).timestamp())
+        def tester(start_date, end_date, raw=[], hourly=[], daily=[]):
+            self.assertEqual(split_listening_range(start_date, end_date)
+                             , {"listening_sessions": raw, "track_hourly_rollups": hourly, "track_daily_rollups": daily})
+        
+        # Test Empty And Backwards Ranges
+        tester(datetime(2025, 1, 2), datetime(2025, 1, 1))
+        # Test Range Inside A Single Hour
+        tester(datetime(2025, 1, 1, 5, 10), datetime(2025, 1, 1, 5, 20)
+               , raw=[(epoch(2025, 1, 1, 5, 10), epoch(2025, 1, 1, 5, 20, 1))])
+        # Test Whole Hours With Edges
+        tester(datetime(2025, 1, 1, 5, 10), datetime(2025, 1, 1, 8, 20)
+               , raw=[(epoch(2025, 1, 1, 5, 10), epoch(2025, 1, 1, 6, 0))
+                    , (epoch(2025, 1, 1, 8, 0), epoch(2025, 1, 1, 8, 20, 1))]
+               , hourly=[("2025-01-01 06", "2025-01-01 08")])
+        # Test Whole Days With Hour And Second Edges
+        tester(datetime(2025, 1, 1, 22, 30), datetime(2025, 1, 4, 1, 15, 30, 500)
+               , raw=[(epoch(2025, 1, 1, 22, 30), epoch(2025, 1, 1, 23, 0))
+                    , (epoch(2025, 1, 4, 1, 0), epoch(2025, 1, 4, 1, 15, 31))]
+               , hourly=[("2025-01-01 23", "2025-01-02 00"), ("2025-01-04 00", "2025-01-04 01")]
+               , daily=[("2025-01-02", "2025-01-04")])
+        # Test Day Aligned Range, End Is Inclusive So We Pick Up The Final Second Too
+        tester(datetime(2025, 1, 1), datetime(2025, 1, 31)
+               , raw=[(epoch(2025, 1, 31), epoch(2025, 1, 31, 0, 0, 1))]
+               , daily=[("2025-01-01", "2025-01-31")])
+        tester(datetime(2025, 1, 1), datetime(2025, 1, 31, 23, 59, 59)
+               , daily=[("2025-01-01", "2025-02-01")])
+    
     # ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
     # DatabaseHelpers ═════════════════════════════════════════════════════════════════════════════════════════════════
     # ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
@@ -365,6 +405,410 @@ class TestDatabaseHelpers(unittest.TestCase):
         res = self.dbh.get_tracks_listened_in_date_range(datetime.now() - timedelta(days=1), datetime.now())
         self.assertEqual(res, [{"id": "0B5QmtgAv1p6QnsdXM6u0H", "track_count": 3}
                              , {"id": "4RWzi7WNbW3H1Rr0aE9oPl", "track_count": 1}])
+        
+        # Test Sessions Without Track Counting Leave Our Counts And Last Track Alone
+        self.assertEqual(self.dbh.get_track_play_counts(["0B5QmtgAv1p6QnsdXM6u0H"])[0]['play_count'], 10)
+        self.assertEqual(self.dbh.get_table_size("last_track"), 0)
+    
+    def test_add_listening_session_track_count(self):
+        db_conn = self.setup_test_db()
+        get_play_count = lambda track_id: self.dbh.get_track_play_counts([track_id])[0]['play_count']
+        
+        # Test First Session Of A Track Only Becomes Our Last Track
+        self.dbh.add_listening_session("0B5QmtgAv1p6QnsdXM6u0H", inc_track_count=True)
+        self.assertEqual(get_play_count("0B5QmtgAv1p6QnsdXM6u0H"), 10)
+        self.assertEqual(db_conn.execute("SELECT * FROM last_track").fetchall(), [(0, "0B5QmtgAv1p6QnsdXM6u0H", 0)])
+        
+        # Test Back To Back Sessions Count Once
+        for _ in range(3):
+            self.dbh.add_listening_session("0B5QmtgAv1p6QnsdXM6u0H", inc_track_count=True)
+        self.assertEqual(get_play_count("0B5QmtgAv1p6QnsdXM6u0H"), 11)
+        self.assertEqual(db_conn.execute("SELECT * FROM last_track").fetchall(), [(0, "0B5QmtgAv1p6QnsdXM6u0H", 1)])
+        
+        # Test A Track With No Count Yet, Switching Back And Forth Doesn't Count
+        self.dbh.add_listening_session("4RWzi7WNbW3H1Rr0aE9oPl", inc_track_count=True)
+        self.dbh.add_listening_session("0B5QmtgAv1p6QnsdXM6u0H", inc_track_count=True)
+        self.dbh.add_listening_session("4RWzi7WNbW3H1Rr0aE9oPl", inc_track_count=True)
+        self.assertEqual(self.dbh.get_track_play_counts(["4RWzi7WNbW3H1Rr0aE9oPl"]), [])
+        self.dbh.add_listening_session("4RWzi7WNbW3H1Rr0aE9oPl", inc_track_count=True)
+        self.assertEqual(get_play_count("4RWzi7WNbW3H1Rr0aE9oPl"), 1)
+        self.assertEqual(get_play_count("0B5QmtgAv1p6QnsdXM6u0H"), 11)
+        
+        # Test A Failed Session Leaves Our Last Track Alone
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.dbh.add_listening_session("track_1", inc_track_count=True)
+        self.assertEqual(db_conn.execute("SELECT * FROM last_track").fetchall(), [(0, "4RWzi7WNbW3H1Rr0aE9oPl", 1)])
+        self.assertEqual(self.dbh.get_table_size("listening_sessions"), 5 + 8)
+    
+    def test_sanity_check_cache(self):
+        # Test Empty Cache
+        self.assertEqual(self.dbh.get_sanity_check_cache(), [])
+        
+        self.dbh.replace_sanity_check_cache([("duplicates", "2024", "hash_1", "[]")
+                                           , ("artist_integrity", "Artist 1", "hash_2", '[{"Name": "Track 1"}]')])
+        self.assertCountEqual(self.dbh.get_sanity_check_cache(), [
+            {'check_name': "duplicates", 'cache_key': "2024", 'content_hash': "hash_1", 'results': "[]"}
+          , {'check_name': "artist_integrity", 'cache_key': "Artist 1", 'content_hash': "hash_2"
+           , 'results': '[{"Name": "Track 1"}]'}])
+        
+        # Test Replacing Drops Anything We Didn't Use
+        self.dbh.replace_sanity_check_cache([("duplicates", "2024", "hash_3", "[]")])
+        self.assertEqual(self.dbh.get_sanity_check_cache()
+                         , [{'check_name': "duplicates", 'cache_key': "2024", 'content_hash': "hash_3", 'results': "[]"}])
+        
+        # Test Duplicate Keys Are Rejected
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.dbh.replace_sanity_check_cache([("duplicates", "2024", "hash_1", "[]")
+                                               , ("duplicates", "2024", "hash_2", "[]")])
+        self.assertEqual(len(self.dbh.get_sanity_check_cache()), 1)
+    
+    def test_get_playlist_snapshots(self):
+        # Test Empty
+        self.assertEqual(self.dbh.get_playlist_snapshots(), {})
+        
+        self.dbh.insert_many("playlist_snapshots", [("playlist_1", "Sn001"), ("playlist_2", "Sn002")])
+        self.assertEqual(self.dbh.get_playlist_snapshots(), {"playlist_1": "Sn001", "playlist_2": "Sn002"})
+    
+    def test_album_cache(self):
+        # Test Empty Cache
+        self.assertEqual(self.dbh.get_album_cache(["al1"]), [])
+        self.dbh.upsert_album_cache([])
+        
+        self.dbh.upsert_album_cache([("al1", "2024-01-01", 100, '{"id": "al1"}'), ("al2", None, 200, '{"id": "al2"}')])
+        self.assertCountEqual(self.dbh.get_album_cache(["al1", "al2", "al3"]), [
+            {'id': "al1", 'release_date': "2024-01-01", 'cached_at': 100, 'album': '{"id": "al1"}'}
+          , {'id': "al2", 'release_date': None, 'cached_at': 200, 'album': '{"id": "al2"}'}])
+        
+        # Test Upserting Replaces What We Had
+        self.dbh.upsert_album_cache([("al2", "2024-02", 300, '{"id": "al2", "name": "Album 2"}')])
+        self.assertEqual(self.dbh.get_album_cache(["al2"])
+                         , [{'id': "al2", 'release_date': "2024-02", 'cached_at': 300
+                           , 'album': '{"id": "al2", "name": "Album 2"}'}])
+        
+        # Test Batching
+        self.assertEqual(len(self.dbh.get_album_cache(["al1", "al2", "al3"], batch_size=1)), 2)
+        
+        # Test Snapshots Don't Carry Our Cache
+        self.assertIn("album_cache", VAULT_ONLY_TABLES)
+    
+    def test_migrate_listening_times(self):
+        db_conn = self.setup_test_db()
+        
+        # Test Our Fixture's Text Times Were Migrated Over To Epoch Seconds In Place
+        self.assertEqual([(col[1], col[2]) for col in db_conn.execute("PRAGMA table_info(listening_sessions)")]
+                         , [("time", "INTEGER"), ("id_track", "TEXT")])
+        self.assertEqual(db_conn.execute("SELECT time, id_track FROM listening_sessions ORDER BY time").fetchall()
+                         , [(int(datetime(2025, 1, 15, 0, 12, 30).timestamp()), "0B5QmtgAv1p6QnsdXM6u0H")
+                          , (int(datetime(2025, 1, 15, 0, 12, 45).timestamp()), "0B5QmtgAv1p6QnsdXM6u0H")
+                          , (int(datetime(2025, 1, 15, 0, 13, 30).timestamp()), "0FmfRErQFP13h77PKWCawW")
+                          , (int(datetime(2025, 1, 15, 1, 14, 30).timestamp()), "1DdEuIq0H7adWm6TqFRLT5")
+                          , (int(datetime(2025, 1, 15, 2, 12, 30).timestamp()), "0U8KmbmtY2cPI0XpPSVPKu")])
+        
+        # Test The Rest Of The Original Definition And Our Time Index Survived
+        self.assertIn("REFERENCES tracks(id)", db_conn.execute("""SELECT sql FROM sqlite_master 
+                                                                  WHERE name = 'listening_sessions'""").fetchone()[0])
+        self.assertEqual(db_conn.execute("""SELECT name FROM sqlite_master 
+                                            WHERE type = 'index' AND tbl_name = 'listening_sessions'""").fetchall()
+                         , [("idx_listening_sessions_time",)])
+        
+        # Test Migrating Again Does Nothing
+        with self.dbh.connect_db() as conn:
+            self.assertFalse(self.dbh._migrate_to_epoch_times(conn, "listening_sessions", ["time"]))
+        
+        # Test A Half Finished Migration's Leftover Table Doesn't Block Us
+        with self.dbh.connect_db() as conn:
+            conn.execute("CREATE TABLE old_times(time TEXT, id TEXT)")
+            conn.execute("INSERT INTO old_times VALUES ('2025-01-15 00:12:30', 'id1')")
+            conn.execute("CREATE TABLE old_times_epoch(time INTEGER, id TEXT)")
+            conn.execute("INSERT INTO old_times_epoch VALUES (1, 'stale')")
+            self.assertTrue(self.dbh._migrate_to_epoch_times(conn, "old_times", ["time"]))
+            self.assertEqual(conn.execute("SELECT * FROM old_times").fetchall()
+                             , [(int(datetime(2025, 1, 15, 0, 12, 30).timestamp()), "id1")])
+            self.assertIsNone(conn.execute("SELECT name FROM sqlite_master WHERE name = 'old_times_epoch'").fetchone())
+    
+    def test_rebuild_listening_rollups(self):
+        db_conn = self.setup_test_db()
+        
+        # Test Existing History Is Caught Up When Our Rollups Are Created
+        self.assertEqual(db_conn.execute("SELECT * FROM track_daily_rollups ORDER BY id_track").fetchall()
+                         , [("2025-01-15", "0B5QmtgAv1p6QnsdXM6u0H", 2)
+                          , ("2025-01-15", "0FmfRErQFP13h77PKWCawW", 1)
+                          , ("2025-01-15", "0U8KmbmtY2cPI0XpPSVPKu", 1)
+                          , ("2025-01-15", "1DdEuIq0H7adWm6TqFRLT5", 1)])
+        self.assertEqual(db_conn.execute("SELECT * FROM track_hourly_rollups ORDER BY hour, id_track").fetchall()
+                         , [("2025-01-15 00", "0B5QmtgAv1p6QnsdXM6u0H", 2)
+                          , ("2025-01-15 00", "0FmfRErQFP13h77PKWCawW", 1)
+                          , ("2025-01-15 01", "1DdEuIq0H7adWm6TqFRLT5", 1)
+                          , ("2025-01-15 02", "0U8KmbmtY2cPI0XpPSVPKu", 1)])
+        
+        # Test New Sessions Are Rolled Up As They Are Inserted
+        db_conn.execute("INSERT INTO listening_sessions VALUES (?, ?)"
+                        , (int(datetime(2025, 1, 15, 2, 30).timestamp()), "0U8KmbmtY2cPI0XpPSVPKu"))
+        db_conn.execute("INSERT INTO listening_sessions VALUES (?, ?)"
+                        , (int(datetime(2025, 1, 16).timestamp()), "0U8KmbmtY2cPI0XpPSVPKu"))
+        db_conn.commit()
+        self.assertEqual(db_conn.execute("""SELECT * FROM track_hourly_rollups 
+                                            WHERE id_track = '0U8KmbmtY2cPI0XpPSVPKu' ORDER BY hour""").fetchall()
+                         , [("2025-01-15 02", "0U8KmbmtY2cPI0XpPSVPKu", 2), ("2025-01-16 00", "0U8KmbmtY2cPI0XpPSVPKu", 1)])
+        
+        # Test Day Aligned Ranges Are Served From Our Rollups
+        db_conn.execute("DELETE FROM listening_sessions")
+        db_conn.commit()
+        self.assertEqual(self.dbh.get_tracks_listened_in_date_range(datetime(2025, 1, 15), datetime(2025, 1, 15, 23, 59, 59))
+                         , [{'id': '0B5QmtgAv1p6QnsdXM6u0H', 'track_count': 2}
+                          , {'id': '0FmfRErQFP13h77PKWCawW', 'track_count': 1}
+                          , {'id': '0U8KmbmtY2cPI0XpPSVPKu', 'track_count': 2}
+                          , {'id': '1DdEuIq0H7adWm6TqFRLT5', 'track_count': 1}])
+        
+        # Test Rebuilding Matches 'listening_sessions' Again
+        self.dbh.rebuild_listening_rollups()
+        self.assertEqual(db_conn.execute("SELECT COUNT(*) FROM track_daily_rollups").fetchone()[0], 0)
+        self.assertEqual(db_conn.execute("SELECT COUNT(*) FROM track_hourly_rollups").fetchone()[0], 0)
+    
+    def test_archive_listening_sessions(self):
+        db_conn = self.setup_test_db()
+        archive_location = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, archive_location)
+        expected_tracks = self.dbh.get_tracks_listened_in_date_range(datetime(2025, 1, 15, 0, 12, 40)
+                                                                     , datetime(2025, 1, 15, 2, 12, 30))
+        
+        # Test Nothing Archived While The Month Is Still Open
+        self.assertEqual(self.dbh.archive_listening_sessions(archive_location, datetime(2025, 1, 31)), [])
+        self.assertEqual(self.dbh.get_table_size("listening_sessions"), 5)
+        
+        # Test Closed Month Is Moved Out Into Its Own Archive
+        archive_path = os.path.join(archive_location, "listening_sessions_2025_01.db")
+        self.assertEqual(self.dbh.archive_listening_sessions(archive_location, datetime(2025, 2, 3)), [archive_path])
+        self.assertEqual(self.dbh.get_table_size("listening_sessions"), 0)
+        self.assertEqual(db_conn.execute("SELECT * FROM listening_archives").fetchall()
+                         , [(archive_path, int(datetime(2025, 1, 1).timestamp()), int(datetime(2025, 2, 1).timestamp()))])
+        with sqlite3.connect(archive_path) as archive_conn:
+            self.assertEqual(archive_conn.execute("SELECT COUNT(*) FROM listening_sessions").fetchone()[0], 5)
+        self.assertEqual(self.dbh.get_listening_archives()
+                         , [{'path': archive_path, 'start_time': int(datetime(2025, 1, 1).timestamp())
+                           , 'end_time': int(datetime(2025, 2, 1).timestamp())}])
+        
+        # Test Our Queries Still Span The Archive, Including Raw Session Edges
+        self.assertEqual(self.dbh.get_tracks_listened_in_date_range(datetime(2025, 1, 15, 0, 12, 40)
+                                                                    , datetime(2025, 1, 15, 2, 12, 30)), expected_tracks)
+        self.assertEqual(self.dbh.get_artists_listened_in_date_range(datetime(2025, 1, 15, 0, 0, 0)
+                                                                     , datetime(2025, 1, 15, 1, 14, 29))
+                         , [{'id': '5b0j3TTNSKCByBq4rHYKvG', 'name': 'Promoting Sounds', 'artist_count': 2}
+                          , {'id': '0WQh63ofwTzWOy1ubiHMdk', 'name': 'Peech.', 'artist_count': 2}
+                          , {'id': '0gadJ2b9A4SKsB1RFkBb66', 'name': 'Passenger', 'artist_count': 1}])
+        
+        # Test Archives Are Pruned By Date
+        self.assertEqual(build_listening_counts_query(datetime(2025, 2, 1, 0, 0, 10), datetime(2025, 2, 1, 0, 0, 20)
+                                                      , self.dbh._conn_query_to_dict("SELECT * FROM listening_archives"))[2]
+                         , {})
+        self.assertEqual(build_listening_counts_query(datetime(2025, 1, 31, 23, 0, 10), datetime(2025, 2, 1, 0, 0, 20)
+                                                      , self.dbh._conn_query_to_dict("SELECT * FROM listening_archives"))[2]
+                         , {"archive_0": archive_path})
+        
+        # Test Rebuilding Our Rollups Still Includes Archived Sessions
+        self.dbh.rebuild_listening_rollups()
+        self.assertEqual(db_conn.execute("SELECT SUM(listen_count) FROM track_daily_rollups").fetchone()[0], 5)
+        self.assertEqual(db_conn.execute("SELECT SUM(listen_count) FROM track_hourly_rollups").fetchone()[0], 5)
+    
+    def test_derive_listening_plays(self):
+        db_conn = self.setup_test_db()
+        to_epoch = lambda *args: int(datetime(2025, 1, 15, *args).timestamp())
+        expected_plays = [(to_epoch(0, 12, 30), to_epoch(0, 12, 45), "0B5QmtgAv1p6QnsdXM6u0H", 30_000, 30_000, 0)
+                        , (to_epoch(0, 13, 30), to_epoch(0, 13, 30), "0FmfRErQFP13h77PKWCawW", 15_000, 15_000, 0)
+                        , (to_epoch(1, 14, 30), to_epoch(1, 14, 30), "1DdEuIq0H7adWm6TqFRLT5", 15_000, 15_000, 0)
+                        , (to_epoch(2, 12, 30), to_epoch(2, 12, 30), "0U8KmbmtY2cPI0XpPSVPKu", 15_000, 15_000, 0)]
+        
+        # Test Back To Back Sessions Of A Track Are Folded Into One Play
+        self.assertEqual(db_conn.execute("SELECT * FROM listening_plays ORDER BY start_time").fetchall()
+                         , expected_plays)
+        
+        # Test Deriving Only Happens When Our Plays Are First Created
+        self.dbh.create_database()
+        self.assertEqual(self.dbh.get_table_size("listening_plays"), 4)
+        
+        # Test Archived Sessions Are Derived As Well
+        archive_location = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, archive_location)
+        self.dbh.archive_listening_sessions(archive_location, datetime(2025, 2, 3))
+        db_conn.execute("DROP TABLE listening_plays")
+        db_conn.commit()
+        self.dbh.create_database()
+        self.assertEqual(db_conn.execute("SELECT * FROM listening_plays ORDER BY start_time").fetchall()
+                         , expected_plays)
+    
+    def test_log_listening_play(self):
+        self.dbh.create_database()
+        self.dbh.insert_many("tracks", [("track_a", "Track A", 200_000, 0, 0, 0, 1)])
+        get_plays = lambda: self.db_conn_owner.execute("""SELECT start_time, end_time, id_track, ms_played
+                                                               , progress_ms, is_playing
+                                                          FROM listening_plays ORDER BY rowid""").fetchall()
+        
+        # Test Our First Play Starts Where Its Progress Says It Did
+        self.dbh.log_listening_play("track_a", 5_000, True, 1_000)
+        self.assertEqual(get_plays(), [(995, 1_000, "track_a", 5_000, 5_000, 1)])
+        
+        # Test Continuing Our Play Only Adds What We Actually Listened To
+        self.dbh.log_listening_play("track_a", 20_000, True, 1_015)
+        self.dbh.log_listening_play("track_a", 150_000, True, 1_030)
+        self.assertEqual(get_plays(), [(995, 1_030, "track_a", 35_000, 150_000, 1)])
+        
+        # Test Pausing Keeps Our Play Going Without Adding Time
+        self.dbh.log_listening_play("track_a", 150_000, False, 1_600)
+        self.dbh.log_listening_play("track_a", 160_000, True, 1_610)
+        self.assertEqual(get_plays(), [(995, 1_610, "track_a", 45_000, 160_000, 1)])
+        
+        # Test A New Track Finishes Off The Rest Of Our Last Play
+        self.dbh.log_listening_play("track_b", 10_000, True, 1_670)
+        self.assertEqual(get_plays(), [(995, 1_650, "track_a", 85_000, 160_000, 0)
+                                     , (1_660, 1_670, "track_b", 10_000, 10_000, 1)])
+        
+        # Test Seeking Back Starts A New Play, Unknown Tracks Get No Tail
+        self.dbh.log_listening_play("track_b", 0, True, 1_675)
+        self.assertEqual(get_plays()[1:], [(1_660, 1_670, "track_b", 10_000, 10_000, 0)
+                                         , (1_675, 1_675, "track_b", 0, 0, 1)])
+        
+        # Test Too Long Of A Gap Starts A New Play
+        self.dbh.log_listening_play("track_b", 30_000, True, 1_675 + 1_801)
+        self.assertEqual(get_plays()[2:], [(1_675, 1_675, "track_b", 0, 0, 0)
+                                         , (3_446, 3_476, "track_b", 30_000, 30_000, 1)])
+        self.dbh.log_listening_play("track_b", 45_000, True, 3_491, max_gap_s=10)
+        self.assertEqual(get_plays()[3:], [(3_446, 3_476, "track_b", 30_000, 30_000, 0)
+                                         , (3_476, 3_491, "track_b", 15_000, 45_000, 1)])
+    
+    def test_log_playback(self):
+        db_conn = self.setup_test_db()
+        artist = thelp.create_artist("artist_1", "Artist 1")
+        track = thelp.create_track("track_1", "Track 1", thelp.create_album("album_1", "Album 1", [artist], "single")
+                                   , [artist])
+        entries = build_entries_from_tracks([track])
+        poll_time = int(datetime(2025, 2, 1, 12).timestamp())
+        
+        # Test A Paused Poll Writes Our Entries And Play But No Session
+        self.dbh.log_playback(entries, "track_1", 5_000, False, poll_time)
+        self.assertEqual(self.dbh.get_row_by_id("tracks", "track_1")
+                         , {'id': 'track_1', 'name': 'Track 1', 'duration_ms': 1, 'is_local': 0, 'is_playable': 1
+                          , 'disc_number': 1, 'track_number': 1})
+        self.assertEqual(db_conn.execute("SELECT id_track, ms_played FROM listening_plays WHERE start_time > ?"
+                                         , (poll_time - 60,)).fetchall(), [("track_1", 5_000)])
+        self.assertEqual(self.dbh.get_table_size("listening_sessions"), 5)
+        
+        # Test Playing Polls Add Their Sessions At Our Poll Time, The Track Counts Once Its Play Reaches 30s
+        self.dbh.log_playback({}, "track_1", 20_000, True, poll_time + 15, inc_track_count=True)
+        self.assertEqual(self.dbh.get_track_play_counts(["track_1"]), [])
+        self.dbh.log_playback({}, "track_1", 35_000, True, poll_time + 30, inc_track_count=True)
+        self.assertEqual(self.dbh.get_track_play_counts(["track_1"]), [{'id': 'track_1', 'play_count': 1}])
+        self.dbh.log_playback({}, "track_1", 50_000, True, poll_time + 45, inc_track_count=True)
+        self.assertEqual(db_conn.execute("SELECT time FROM listening_sessions WHERE id_track = 'track_1'").fetchall()
+                         , [(poll_time + 15,), (poll_time + 30,), (poll_time + 45,)])
+        self.assertEqual(self.dbh.get_track_play_counts(["track_1"]), [{'id': 'track_1', 'play_count': 1}])
+        self.assertEqual(db_conn.execute("""SELECT ms_played, progress_ms FROM listening_plays
+                                            WHERE id_track = 'track_1'""").fetchall(), [(50_000, 50_000)])
+        
+        # Test How Often We Poll Doesn't Change What Counts
+        self.dbh.log_playback({}, "track_1", 0, True, poll_time + 60, inc_track_count=True)
+        self.dbh.log_playback({}, "track_1", 29_000, True, poll_time + 89, inc_track_count=True)
+        self.assertEqual(self.dbh.get_track_play_counts(["track_1"]), [{'id': 'track_1', 'play_count': 1}])
+        
+        # Test A Poll We Don't Count Doesn't Count Its Play Either
+        self.dbh.log_playback({}, "track_1", 31_000, True, poll_time + 91, inc_track_count=False)
+        self.assertEqual(self.dbh.get_track_play_counts(["track_1"]), [{'id': 'track_1', 'play_count': 1}])
+        
+        # Test Without Progress We Fall Back On Back To Back Sessions
+        self.dbh.log_playback({}, "track_1", None, True, poll_time + 105, inc_track_count=True)
+        self.dbh.log_playback({}, "track_1", None, True, poll_time + 120, inc_track_count=True)
+        self.assertEqual(self.dbh.get_track_play_counts(["track_1"]), [{'id': 'track_1', 'play_count': 2}])
+        
+        # Test Anything Failing Rolls Back The Whole Poll
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.dbh.log_playback({}, "track_2", 1_000, True, poll_time + 135)
+        self.assertEqual(db_conn.execute("SELECT id_track FROM listening_plays ORDER BY rowid DESC LIMIT 1").fetchone()
+                         , ("track_1",))
+    
+    def test_flush_playback_log(self):
+        db_conn = self.setup_test_db()
+        log_path = self.dbh.get_playback_log_path()
+        flushing_path = f"{log_path}.flushing"
+        for path in [log_path, flushing_path, f"{log_path}.lock"]:
+            self.addCleanup(lambda path=path: os.path.exists(path) and os.remove(path))
+        artist = thelp.create_artist("artist_1", "Artist 1")
+        track = thelp.create_track("track_1", "Track 1", thelp.create_album("album_1", "Album 1", [artist], "single")
+                                   , [artist])
+        poll_time = int(datetime(2025, 1, 15, 12).timestamp())
+        get_sessions = lambda: db_conn.execute("""SELECT time FROM listening_sessions WHERE id_track = 'track_1'
+                                                  ORDER BY time""").fetchall()
+        
+        # Test Nothing To Flush
+        self.assertFalse(self.dbh.has_playback_log())
+        self.assertEqual(self.dbh.flush_playback_log(), 0)
+        
+        # Test Buffered Polls Stay Out Of Our Vault Until Flushed
+        self.dbh.buffer_playback(build_entries_from_tracks([track]), "track_1", 0, True, poll_time
+                                 , inc_track_count=True)
+        self.dbh.buffer_playback({}, "track_1", 15_000, True, poll_time + 15, inc_track_count=True)
+        self.assertTrue(self.dbh.has_playback_log())
+        self.assertEqual(get_sessions(), [])
+        self.assertEqual(self.dbh.flush_playback_log(), 2)
+        self.assertFalse(self.dbh.has_playback_log())
+        self.assertEqual(get_sessions(), [(poll_time,), (poll_time + 15,)])
+        self.assertEqual(self.dbh.get_track_play_counts(["track_1"]), [])
+        
+        # Test Reads Never Flush Our Log, Even Of Our Listening Data
+        listened_ms = self.dbh.get_daily_listening_ms(datetime(2025, 1, 15), datetime(2025, 1, 15))
+        self.dbh.buffer_playback({}, "track_1", 30_000, True, poll_time + 30, inc_track_count=True)
+        self.dbh.get_user_playlists()
+        self.assertEqual(self.dbh.get_daily_listening_ms(datetime(2025, 1, 15), datetime(2025, 1, 15)), listened_ms)
+        self.assertTrue(self.dbh.has_playback_log())
+        self.assertEqual(self.dbh.flush_playback_log(), 1)
+        self.assertEqual(self.dbh.get_daily_listening_ms(datetime(2025, 1, 15), datetime(2025, 1, 15))
+                         , {"2025-01-15": 75_000 + 30_000})
+        self.assertEqual(self.dbh.get_track_play_counts(["track_1"]), [{'id': 'track_1', 'play_count': 1}])
+        
+        # Test Appends Wait On Whoever Holds Our Lock, Even Through Another Open Of It (ie Another Process)
+        with self.dbh.lock_playback_log():
+            append_thread = threading.Thread(target=self.dbh.buffer_playback
+                                             , args=({}, "track_1", 35_000, True, poll_time + 35))
+            append_thread.start()
+            append_thread.join(0.2)
+            self.assertTrue(append_thread.is_alive())
+            self.assertFalse(self.dbh.has_playback_log())
+        append_thread.join()
+        self.assertTrue(self.dbh.has_playback_log())
+        
+        # Test Someone Else Removing Our Log Out From Under Us Isn't An Error
+        remove = os.remove
+        def remove_twice(path):
+            remove(path)
+            remove(path)
+        with mock.patch('src.helpers.Database_Helpers.os.remove', side_effect=remove_twice):
+            self.assertEqual(self.dbh.flush_playback_log(), 1)
+        self.assertFalse(self.dbh.has_playback_log())
+        
+        # Test Crash Recovery, A Leftover '.flushing' Log Goes First And A Torn Line Is Dropped
+        self.dbh.buffer_playback({}, "track_1", 45_000, True, poll_time + 45)
+        os.replace(log_path, flushing_path)
+        self.dbh.buffer_playback({}, "track_1", 60_000, True, poll_time + 60)
+        with open(flushing_path, 'a', encoding='utf-8') as log:
+            log.write('{"logged_ns": ')
+        self.assertEqual(self.dbh.flush_playback_log(), 2)
+        self.assertEqual(get_sessions()[-3:], [(poll_time + 35,), (poll_time + 45,), (poll_time + 60,)])
+        
+        # Test Crashing After Our Commit But Before Removing Our Log Doesn't Flush It Twice
+        self.dbh.buffer_playback({}, "track_1", 75_000, True, poll_time + 75)
+        with open(log_path, encoding='utf-8') as log:
+            crashed_log = log.read()
+        self.assertEqual(self.dbh.flush_playback_log(), 1)
+        with open(flushing_path, 'w', encoding='utf-8') as log:
+            log.write(crashed_log)
+        self.assertEqual(self.dbh.flush_playback_log(), 0)
+        self.assertEqual(len(get_sessions()), 7)
+        
+        # Test A Failed Flush Keeps Our Log Around
+        self.dbh.buffer_playback({}, "track_2", 0, True, poll_time + 90)
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.dbh.flush_playback_log()
+        self.assertTrue(self.dbh.has_playback_log())
+        self.assertEqual(len(self.dbh.get_tracks_listened_in_date_range(datetime(2025, 1, 15), datetime(2025, 1, 16)))
+                         , 5)
     
     def test_conn_query_to_dict(self):
         self.setup_test_db()
@@ -421,6 +865,20 @@ class TestDatabaseHelpers(unittest.TestCase):
         ]
         self.assertEqual(self.dbh.get_tracks_from_playlist("4UWdavQLwFVg3teF89KKEt"), expected_results)
     
+    def test_get_all_playlists_tracks(self):
+        self.setup_test_db()
+        
+        playlists_tracks = self.dbh.get_all_playlists_tracks()
+        self.assertEqual(list(playlists_tracks.keys()), ["4UWdavQLwFVg3teF89KKEt"])
+        self.assertEqual(playlists_tracks["4UWdavQLwFVg3teF89KKEt"]
+                         , self.dbh.get_tracks_from_playlist("4UWdavQLwFVg3teF89KKEt"))
+        
+        # Test Only Grabbing Some Playlists, Across Batches
+        self.assertEqual(self.dbh.get_all_playlists_tracks([]), {})
+        self.assertEqual(self.dbh.get_all_playlists_tracks(["playlist_1"]), {})
+        self.assertEqual(self.dbh.get_all_playlists_tracks(["playlist_1", "4UWdavQLwFVg3teF89KKEt"], batch_size=1)
+                         , playlists_tracks)
+    
     def test_get_track_artists(self):
         self.setup_test_db()
         
@@ -435,6 +893,29 @@ class TestDatabaseHelpers(unittest.TestCase):
                          , [{"id": "0MlOPi3zIDMVrfA9R04Fe3", "name": "American Authors"},
                             {"id": "5gw5ANPCVcxU0maLiGRzzP", "name": "Billy Raffoul"}])
     
+    def test_get_all_track_artists(self):
+        self.setup_test_db()
+        
+        track_artists = self.dbh.get_all_track_artists()
+        self.assertNotIn("track_1", track_artists)
+        self.assertEqual(track_artists["0FmfRErQFP13h77PKWCawW"], [{"id": "0gadJ2b9A4SKsB1RFkBb66", "name": "Passenger"}])
+        self.assertEqual(track_artists["0U8KmbmtY2cPI0XpPSVPKu"]
+                         , [{"id": "0MlOPi3zIDMVrfA9R04Fe3", "name": "American Authors"},
+                            {"id": "5gw5ANPCVcxU0maLiGRzzP", "name": "Billy Raffoul"}])
+        
+        # Test Every Track Matches 'get_track_artists'
+        for track_id, artists in track_artists.items():
+            self.assertEqual(artists, self.dbh.get_track_artists(track_id))
+        
+        # Test Only Grabbing The Tracks Of Some Playlists, Across Batches Without Doubling Up
+        playlist_track_ids = {track['id'] for track in self.dbh.get_tracks_from_playlist("4UWdavQLwFVg3teF89KKEt")}
+        self.assertEqual(self.dbh.get_all_track_artists([]), {})
+        self.assertEqual(self.dbh.get_all_track_artists(["playlist_1"]), {})
+        self.assertEqual(self.dbh.get_all_track_artists(["4UWdavQLwFVg3teF89KKEt", "4UWdavQLwFVg3teF89KKEt"]
+                                                        , batch_size=1)
+                         , {track_id: artists for track_id, artists in track_artists.items()
+                            if track_id in playlist_track_ids})
+    
     def test_get_user_playlists(self):
         self.setup_test_db()
         self.assertEqual(self.dbh.get_user_playlists()
@@ -507,6 +988,18 @@ class TestDatabaseHelpers(unittest.TestCase):
                           , {'id': '0WQh63ofwTzWOy1ubiHMdk', 'name': 'Peech.', 'artist_count': 2}
                           , {'id': '0gadJ2b9A4SKsB1RFkBb66', 'name': 'Passenger', 'artist_count': 1}])
     
+    def test_get_daily_listening_ms(self):
+        self.setup_test_db()
+        self.dbh.log_listening_play("0U8KmbmtY2cPI0XpPSVPKu", 90_000, False
+                                    , int(datetime(2025, 1, 17, 23, 59, 59).timestamp()))
+        
+        # Test No Listening In Range
+        self.assertEqual(self.dbh.get_daily_listening_ms(datetime(2024, 1, 1), datetime(2024, 12, 31)), {})
+        # Test Days Are Inclusive And Plays Count Towards The Day They Started On
+        self.assertEqual(self.dbh.get_daily_listening_ms(datetime(2025, 1, 15, 12), datetime(2025, 1, 17, 1))
+                         , {"2025-01-15": 75_000, "2025-01-17": 90_000})
+        self.assertEqual(self.dbh.get_daily_listening_ms(datetime(2025, 1, 18), datetime(2025, 1, 18)), {})
+    
     def test_get_artists_and_their_collabs_from_playlists(self):
         def normalize_artist_entry(entry):
             """Sorts appears_with by id for consistent comparison."""
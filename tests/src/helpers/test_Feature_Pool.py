@@ -0,0 +1,146 @@
+# ╔════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦════╗
+# ║  ╔═╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═╗  ║
+# ╠══╣                                                                                                             ╠══╣
+# ║  ║    UNIT TESTS - FEATURE POOL                CREATED: 2026-10-19          https://github.com/jacobleazott    ║  ║
+# ║══║                                                                                                             ║══║
+# ║  ╚═╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═╝  ║
+# ╚════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩════╝
+# ════════════════════════════════════════════════════ DESCRIPTION ════════════════════════════════════════════════════
+# Unit tests for all functionality out of 'Feature_Pool.py'.
+# ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
+import logging
+import threading
+import unittest
+from unittest import mock
+
+from src.helpers.Feature_Pool import FeaturePool
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Stand in for SpotifyFeatures, records every job run on it and can block (signaling 'started') until we
+             release it.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+class FakeFeatures:
+    started = threading.Event()
+    release = threading.Event()
+    
+    def __init__(self, log_file_name: str) -> None:
+        self.log_file_name = log_file_name
+        self.calls = []
+        self.cache_clears = 0
+    
+    def run_macro(self, playlist_id: str, block: bool=False) -> None:
+        self.calls.append(playlist_id)
+        if block:
+            FakeFeatures.started.set()
+            FakeFeatures.release.wait(5)
+    
+    def fail_macro(self, playlist_id: str) -> None:
+        raise KeyError(playlist_id)
+    
+    def clear_run_caches(self) -> None:
+        self.cache_clears += 1
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Unit test collection for all Feature Pool functionality.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+class TestFeaturePool(unittest.TestCase):
+    
+    def setUp(self):
+        FakeFeatures.started.clear()
+        FakeFeatures.release.clear()
+        self.features = []
+        self.factory = mock.MagicMock(side_effect=self.make_features)
+        self.logger = mock.MagicMock()
+        self.pool = FeaturePool(self.factory, num_workers=1, max_queued=2, logger=self.logger)
+        self.addCleanup(self.pool.shutdown)
+        self.addCleanup(FakeFeatures.release.set)
+    
+    def make_features(self, log_file_name: str) -> FakeFeatures:
+        self.features.append(FakeFeatures(log_file_name))
+        return self.features[-1]
+    
+    def test_init(self):
+        pool = FeaturePool(FakeFeatures)
+        self.assertEqual(pool.logger, logging.getLogger())
+        self.assertEqual(pool.num_workers, 2)
+        self.assertEqual(pool.jobs.maxsize, 8)
+        self.assertEqual(pool.workers, [])
+        self.assertEqual(pool.get_stats()['queue_depth'], 0)
+    
+    def test_get_job_key(self):
+        self.assertEqual(self.pool.get_job_key(FakeFeatures.run_macro, ("p1",), {'block': True, 'a': 1})
+                         , ("run_macro", ("p1",), (('a', 1), ('block', True))))
+    
+    def test_submit(self):
+        # Test Our Worker Starts On Our First Job And Blocks On It
+        self.assertTrue(self.pool.submit(FakeFeatures.run_macro, "p1", block=True, log_file_name="Macro.log"))
+        self.assertEqual(len(self.pool.workers), 1)
+        self.assertTrue(FakeFeatures.started.wait(5))
+        self.assertEqual(self.pool.get_stats()['running'], 1)
+        
+        # Test The Same Macro On The Same Playlist Is Deduped, A Different Playlist Is Not
+        self.assertFalse(self.pool.submit(FakeFeatures.run_macro, "p1", block=True, log_file_name="Macro.log"))
+        self.assertTrue(self.pool.submit(FakeFeatures.run_macro, "p2", log_file_name="Macro.log"))
+        self.assertTrue(self.pool.submit(FakeFeatures.run_macro, "p3", log_file_name="Macro.log"))
+        
+        # Test Our Queue Is Bounded
+        self.assertFalse(self.pool.submit(FakeFeatures.run_macro, "p4", log_file_name="Macro.log"))
+        self.logger.warning.assert_called_once()
+        stats = self.pool.get_stats()
+        self.assertEqual((stats['submitted'], stats['deduped'], stats['rejected']), (3, 1, 1))
+        self.assertEqual((stats['queue_depth'], stats['running'], stats['workers']), (2, 1, 1))
+        
+        # Test Releasing Our Worker Runs Everything Queued On One Warm Object
+        FakeFeatures.release.set()
+        self.pool.join()
+        self.factory.assert_called_once_with(log_file_name="Macro.log")
+        stats = self.pool.get_stats()
+        self.assertEqual((stats['completed'], stats['queue_depth'], stats['running']), (3, 0, 0))
+        self.assertEqual(self.pool.active_keys, set())
+        
+        # Test A Finished Job Can Be Triggered Again
+        self.assertTrue(self.pool.submit(FakeFeatures.run_macro, "p1", log_file_name="Macro.log"))
+        self.pool.join()
+    
+    def test_run_worker(self):
+        # Test Each Log File Gets Its Own Warm Object
+        self.pool.submit(FakeFeatures.run_macro, "p1", log_file_name="A.log")
+        self.pool.submit(FakeFeatures.run_macro, "p2", log_file_name="B.log")
+        self.pool.join()
+        self.pool.submit(FakeFeatures.run_macro, "p3", log_file_name="A.log")
+        self.pool.join()
+        self.assertEqual(self.factory.call_args_list, [mock.call(log_file_name="A.log")
+                                                       , mock.call(log_file_name="B.log")])
+        # Test Our Warm Object's Run Caches Are Cleared Before Every Job It Is Reused For
+        self.assertEqual([features.cache_clears for features in self.features], [1, 0])
+        
+        # Test A Failed Job Is Logged And Throws Away Its Object
+        self.pool.submit(FakeFeatures.fail_macro, "p1", log_file_name="A.log")
+        self.pool.join()
+        self.logger.exception.assert_called_once()
+        self.pool.submit(FakeFeatures.run_macro, "p1", log_file_name="A.log")
+        self.pool.join()
+        self.assertEqual(self.factory.call_count, 3)
+        
+        # Test Our Latency Stats
+        stats = self.pool.get_stats()
+        self.assertEqual((stats['completed'], stats['failed']), (4, 1))
+        self.assertGreaterEqual(stats['max_wait_s'], stats['last_wait_s'])
+        self.assertGreaterEqual(stats['max_run_s'], stats['last_run_s'])
+        self.assertGreaterEqual(stats['last_wait_s'], 0)
+    
+    def test_shutdown(self):
+        self.pool.submit(FakeFeatures.run_macro, "p1", log_file_name="A.log")
+        workers = list(self.pool.workers)
+        self.pool.shutdown(wait=True)
+        self.assertEqual(self.pool.workers, [])
+        self.assertFalse(any(worker.is_alive() for worker in workers))
+        self.assertEqual(self.pool.get_stats()['completed'], 1)
+        
+        # Test Our Pool Starts Back Up On Its Next Job
+        self.pool.submit(FakeFeatures.run_macro, "p2", log_file_name="A.log")
+        self.pool.join()
+        self.assertEqual(self.pool.get_stats()['completed'], 2)
+
+
+# FIN ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
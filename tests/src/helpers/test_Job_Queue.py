@@ -0,0 +1,149 @@
+# ╔════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦════╗
+# ║  ╔═╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═╗  ║
+# ╠══╣                                                                                                             ╠══╣
+# ║  ║    UNIT TESTS - JOB QUEUE                   CREATED: 2026-10-19          https://github.com/jacobleazott    ║  ║
+# ║══║                                                                                                             ║══║
+# ║  ╚═╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═══════╦══════╦══════╦══════╦══════╦══════╦══════╦══════╦═╝  ║
+# ╚════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩═══════╩══════╩══════╩══════╩══════╩══════╩══════╩══════╩════╝
+# ════════════════════════════════════════════════════ DESCRIPTION ════════════════════════════════════════════════════
+# Unit tests for all functionality out of 'Job_Queue.py'.
+# ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from src.helpers.Job_Queue import *
+
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+DESCRIPTION: Unit test collection for all Job Queue functionality.
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+@mock.patch('src.helpers.Job_Queue.time')
+class TestJobQueue(unittest.TestCase):
+    
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+        self.db_path = os.path.join(self.tmp_dir, "jobs.db")
+        self.job_queue = JobQueue(self.db_path)
+    
+    def test_init(self, mock_time):
+        self.assertEqual(self.job_queue.logger, logging.getLogger())
+        self.assertEqual(self.job_queue.get_jobs(), [])
+        
+        # Test Reopening Keeps Our Jobs
+        mock_time.time.return_value = 100.0
+        self.job_queue.enqueue("backup", "Backup.log", "k1")
+        job_queue = JobQueue(self.db_path, logger=logging.getLogger('custom_logger'))
+        self.assertEqual(job_queue.logger, logging.getLogger('custom_logger'))
+        self.assertEqual([job['name'] for job in job_queue.get_jobs()], ["backup"])
+    
+    def test_job_checkpoint(self, mock_time):
+        # Test In Memory
+        checkpoint = JobCheckpoint()
+        self.assertIsNone(checkpoint.get('playlist_id'))
+        self.assertEqual(checkpoint.get('artist_tracks', {}), {})
+        checkpoint.update(playlist_id="p1")
+        self.assertEqual(checkpoint.get('playlist_id'), "p1")
+        
+        # Test Every Update Is Saved
+        save_func = mock.MagicMock()
+        checkpoint = JobCheckpoint({'playlist_id': "p1"}, save_func=save_func)
+        checkpoint.update(tracks_added=True)
+        save_func.assert_called_once_with({'playlist_id': "p1", 'tracks_added': True})
+    
+    def test_enqueue(self, mock_time):
+        mock_time.time.return_value = 100.0
+        self.assertTrue(self.job_queue.enqueue("backup", "Backup.log", "k1"))
+        self.assertTrue(self.job_queue.enqueue("report", "Report.log", "k1"))
+        self.assertTrue(self.job_queue.enqueue("backup", "Backup.log", "k2"))
+        
+        # Test The Same Run Is Only Ever Queued Once
+        self.assertFalse(self.job_queue.enqueue("backup", "Backup.log", "k1"))
+        
+        jobs = self.job_queue.get_jobs()
+        self.assertEqual([(job['name'], job['run_key']) for job in jobs]
+                         , [("backup", "k1"), ("report", "k1"), ("backup", "k2")])
+        self.assertEqual(jobs[0], {'id': 1, 'name': "backup", 'run_key': "k1", 'log_file_name': "Backup.log"
+                                   , 'status': JOB_QUEUED, 'attempts': 0, 'checkpoint': {}, 'queued_time': 100.0
+                                   , 'heartbeat_time': None, 'finished_time': None, 'error': None})
+    
+    def test_claim_next(self, mock_time):
+        mock_time.time.return_value = 100.0
+        self.assertIsNone(self.job_queue.claim_next(60, 3))
+        self.job_queue.enqueue("backup", "Backup.log", "k1")
+        self.job_queue.enqueue("report", "Report.log", "k1")
+        
+        # Test Jobs Are Claimed In Order
+        job = self.job_queue.claim_next(60, 3)
+        self.assertEqual(job, {'id': 1, 'name': "backup", 'run_key': "k1", 'log_file_name': "Backup.log"
+                               , 'attempts': 1, 'checkpoint': {}})
+        self.assertEqual(self.job_queue.get_jobs(JOB_RUNNING)[0]['heartbeat_time'], 100.0)
+        
+        # Test Nothing Is Handed Out While Our Claim Is Live, Even Across Queue Objects
+        mock_time.time.return_value = 150.0
+        self.assertIsNone(self.job_queue.claim_next(60, 3))
+        self.assertIsNone(JobQueue(self.db_path).claim_next(60, 3))
+        self.job_queue.heartbeat(job['id'], {'step': 1})
+        
+        # Test A Stale Claim Is Resumed Before Anything New, Along With Its Checkpoint
+        mock_time.time.return_value = 211.0
+        job = self.job_queue.claim_next(60, 3)
+        self.assertEqual((job['id'], job['attempts'], job['checkpoint']), (1, 2, {'step': 1}))
+        
+        # Test A Stale Claim Out Of Attempts Is Given Up On
+        mock_time.time.return_value = 300.0
+        self.assertEqual(self.job_queue.claim_next(60, 2)['name'], "report")
+        failed_job = self.job_queue.get_jobs(JOB_FAILED)[0]
+        self.assertEqual((failed_job['id'], failed_job['error'], failed_job['finished_time']), (1, "Went stale", 300.0))
+    
+    def test_heartbeat(self, mock_time):
+        mock_time.time.return_value = 100.0
+        self.job_queue.enqueue("release", "Release.log", "k1")
+        job = self.job_queue.claim_next(60, 3)
+        
+        mock_time.time.return_value = 130.0
+        self.job_queue.heartbeat(job['id'])
+        self.assertEqual(self.job_queue.get_jobs()[0]['heartbeat_time'], 130.0)
+        self.assertEqual(self.job_queue.get_jobs()[0]['checkpoint'], {})
+        
+        # Test Our Checkpoint Saves With Our Heartbeat
+        mock_time.time.return_value = 140.0
+        checkpoint = self.job_queue.get_checkpoint(job)
+        checkpoint.update(playlist_id="p1", artist_tracks={'a1': ["t1"]})
+        self.assertEqual(self.job_queue.get_jobs()[0]['heartbeat_time'], 140.0)
+        self.assertEqual(self.job_queue.get_jobs()[0]['checkpoint']
+                         , {'playlist_id': "p1", 'artist_tracks': {'a1': ["t1"]}})
+    
+    def test_complete(self, mock_time):
+        mock_time.time.return_value = 100.0
+        self.job_queue.enqueue("backup", "Backup.log", "k1")
+        job = self.job_queue.claim_next(60, 3)
+        
+        mock_time.time.return_value = 120.0
+        self.job_queue.complete(job['id'])
+        self.assertEqual(self.job_queue.get_jobs(JOB_DONE)[0]['finished_time'], 120.0)
+        self.assertIsNone(self.job_queue.claim_next(60, 3))
+    
+    def test_fail(self, mock_time):
+        mock_time.time.return_value = 100.0
+        self.job_queue.enqueue("backup", "Backup.log", "k1")
+        
+        # Test We Retry Until We Are Out Of Attempts
+        job = self.job_queue.claim_next(60, 2)
+        self.job_queue.get_checkpoint(job).update(step=1)
+        self.job_queue.fail(job['id'], "KeyError('a')", 2)
+        self.assertEqual(self.job_queue.get_jobs(JOB_QUEUED)[0]['error'], "KeyError('a')")
+        
+        job = self.job_queue.claim_next(60, 2)
+        self.assertEqual((job['attempts'], job['checkpoint']), (2, {'step': 1}))
+        self.job_queue.fail(job['id'], "KeyError('b')", 2)
+        failed_job = self.job_queue.get_jobs()[0]
+        self.assertEqual((failed_job['status'], failed_job['error'], failed_job['finished_time'])
+                         , (JOB_FAILED, "KeyError('b')", 100.0))
+        self.assertIsNone(self.job_queue.claim_next(60, 2))
+
+
+# FIN ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
@@ -9,14 +9,18 @@
 # Unit tests for all functionality out of 'Spotify_Proxy_Server.py'.
 # ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
 import os
+import tempfile
+import threading
 import time
 import unittest
 
 from unittest import mock
 from flask import Flask
 
+from src.helpers.Database_Helpers   import DatabaseHelpers
 from src.helpers.Settings           import Settings
-from src.proxy.Spotify_Proxy_Server import SpotifyServer
+from src.proxy.Spotify_Proxy_Server import (SpotifyServer, get_extrapolated_playback, get_playback_changes
+                                            , get_proxy_poll_delay_s)
 from tests.helpers.mocked_Settings  import Test_Settings
 
 """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
@@ -50,8 +54,10 @@ class TestSpotifyProxyServer(unittest.TestCase):
         mocked_get_logger.assert_called_once()
         mocked_flask.assert_called_once()
         mocked_spotipy.Spotify.assert_called_once()
-        mocked_threading.Thread.assert_called_once_with(target=proxy._token_refresh_thread, daemon=True)
-        mocked_threading.Thread.return_value.start.assert_called_once()
+        mocked_threading.Thread.assert_has_calls([
+            mock.call(target=proxy._token_refresh_thread, daemon=True), mock.call().start()
+          , mock.call(target=proxy._playback_poll_thread, daemon=True), mock.call().start()])
+        self.assertEqual(list(proxy.server_methods.keys()), ["current_playback", "playback_events"])
         mocked_flask.return_value.run.assert_called_once_with(host="127.0.0.1", port=Settings.PROXY_SERVER_PORT)
         mocked_flask.reset_mock()
         
@@ -100,10 +106,11 @@ class TestSpotifyProxyServer(unittest.TestCase):
         self.assertEqual(mock_sleep.call_count, 4)
         self.assertEqual(self.mock_logger.error.call_count, 5)
     
+    @mock.patch('src.proxy.Spotify_Proxy_Server.time.time', return_value=1_700_000_000)
     @mock.patch('src.proxy.Spotify_Proxy_Server.SpotifyServer._initialize_spotipy')
     @mock.patch('src.proxy.Spotify_Proxy_Server.SpotifyServer._refresh_token')
     @mock.patch('src.proxy.Spotify_Proxy_Server.time.sleep')
-    def test_token_refresh_thread(self, mock_sleep, mock_refresh_token, mock_initialize_spotipy):
+    def test_token_refresh_thread(self, mock_sleep, mock_refresh_token, mock_initialize_spotipy, mock_time):
         mock_stop_event = mock.MagicMock()
         self.proxy_server.stop_event = mock_stop_event
         mock_auth_manager = mock.MagicMock()
@@ -229,6 +236,230 @@ class TestSpotifyProxyServer(unittest.TestCase):
         response = client.post('/spotipy/sample_method', json={})
         self.assertEqual(response.json, {'error': 'Test Exception'})
         self.assertEqual(response.status_code, 500)
+        mock_spotipy.reset_mock()
+        
+        # Test Server Methods Are Answered By Us Rather Than Spotipy
+        self.proxy_server.server_methods = {"current_playback": mock.MagicMock(return_value={"is_playing": True})}
+        response = client.post('/spotipy/current_playback', json={"args": [], "kwargs": {"market": "US"}})
+        self.assertEqual(response.json, {"result": {"is_playing": True}})
+        self.proxy_server.server_methods["current_playback"].assert_called_once_with(market="US")
+        mock_spotipy.current_playback.assert_not_called()
+        
+        # Test Calls That Change Our Playback Stop Us Serving Our Latest Poll, Even If They Fail
+        self.proxy_server._invalidate_playback = mock.MagicMock()
+        client.post('/spotipy/sample_method', json={})
+        self.proxy_server._invalidate_playback.assert_not_called()
+        client.post('/spotipy/next_track', json={})
+        mock_spotipy.repeat.side_effect = Exception("Test Exception")
+        response = client.post('/spotipy/repeat', json={"args": ["off"]})
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(self.proxy_server._invalidate_playback.call_count, 2)
+    
+    def test_get_playback_changes(self):
+        playback = {'item': {'id': 'Tr001'}, 'context': {'uri': 'spotify:playlist:Pl001'}, 'repeat_state': 'off'}
+        
+        # Test Nothing Changed, Including Things We Don't Watch
+        self.assertEqual(get_playback_changes(playback, dict(playback, progress_ms=5000, is_playing=False)), [])
+        self.assertEqual(get_playback_changes(None, None), [])
+        
+        # Test Each Change
+        self.assertEqual(get_playback_changes(playback, dict(playback, item={'id': 'Tr002'})), ["track"])
+        self.assertEqual(get_playback_changes(playback, dict(playback, context=None)), ["context"])
+        self.assertEqual(get_playback_changes(playback, dict(playback, repeat_state='context')), ["repeat"])
+        
+        # Test Starting And Stopping Playback
+        self.assertEqual(get_playback_changes(None, playback), ["track", "context", "repeat"])
+        self.assertEqual(get_playback_changes(dict(playback, context=None), None), ["track", "repeat"])
+    
+    def test_get_proxy_poll_delay_s(self):
+        # Test Playing Polls At Our Normal Interval
+        self.assertEqual(get_proxy_poll_delay_s({'is_playing': True}, idle_polls=3), Settings.PROXY_PLAYBACK_POLL_S)
+        
+        # Test Nothing Playing Or Paused Backs Off Up To Our Idle Max
+        self.assertEqual([get_proxy_poll_delay_s(None, idle_polls) for idle_polls in range(5)]
+                         , [min(Settings.PROXY_PLAYBACK_POLL_S * 2 ** idle_polls, Settings.LOGGING_IDLE_MAX_S)
+                            for idle_polls in range(5)])
+        self.assertEqual(get_proxy_poll_delay_s({'is_playing': False}, 10), Settings.LOGGING_IDLE_MAX_S)
+    
+    @mock.patch('src.proxy.Spotify_Proxy_Server.time')
+    def test_poll_playback(self, mock_time):
+        self.proxy_server.playback_condition = threading.Condition()
+        mock_time.monotonic.return_value = 100.0
+        playback = {'item': {'id': 'Tr001'}, 'context': None, 'repeat_state': 'off'}
+        
+        # Test Our First Poll Is Not An Event
+        self.proxy_server.sp.current_playback.return_value = playback
+        self.assertEqual(self.proxy_server._poll_playback(), playback)
+        self.assertEqual((self.proxy_server.playback, self.proxy_server.playback_time), (playback, 100.0))
+        self.assertTrue(self.proxy_server.playback_valid)
+        self.assertEqual((self.proxy_server.playback_seq, list(self.proxy_server.playback_events)), (0, []))
+        
+        # Test No Change
+        self.proxy_server._poll_playback()
+        self.assertEqual(self.proxy_server.playback_seq, 0)
+        
+        # Test Changes Raise One Event Each Poll
+        self.proxy_server.sp.current_playback.return_value = dict(playback, item={'id': 'Tr002'}, repeat_state='track')
+        self.proxy_server._poll_playback()
+        self.proxy_server.sp.current_playback.return_value = None
+        self.proxy_server._poll_playback()
+        self.assertEqual(list(self.proxy_server.playback_events), [{"seq": 1, "types": ["track", "repeat"]}
+                                                                 , {"seq": 2, "types": ["track", "repeat"]}])
+        self.assertIsNone(self.proxy_server.playback)
+    
+    @mock.patch('src.proxy.Spotify_Proxy_Server.time')
+    def test_invalidate_playback(self, mock_time):
+        self.proxy_server.playback_condition = threading.Condition()
+        mock_time.monotonic.return_value = 100.0
+        self.proxy_server.sp.current_playback.return_value = {'is_playing': True}
+        self.proxy_server._poll_playback()
+        
+        self.proxy_server._invalidate_playback()
+        self.assertFalse(self.proxy_server.playback_valid)
+        self.assertEqual(self.proxy_server.playback_time, 100.0)
+    
+    @mock.patch('src.proxy.Spotify_Proxy_Server.time')
+    def test_playback_poll_thread(self, mock_time):
+        self.proxy_server.playback_condition = threading.Condition()
+        clock = [100.0]
+        mock_time.monotonic.side_effect = lambda: clock[0]
+        self.proxy_server.stop_event = mock.MagicMock()
+        self.proxy_server.stop_event.wait.side_effect = lambda timeout: clock.__setitem__(0, clock[0] + timeout)
+        playbacks = [None, {'is_playing': False}, Exception("Test Exception"), {'is_playing': True}
+                     , {'is_playing': True}]
+        def poll_playback():
+            playback = playbacks.pop(0)
+            if isinstance(playback, Exception):
+                raise playback
+            self.proxy_server.playback, self.proxy_server.playback_time = playback, clock[0]
+            return playback
+        self.proxy_server._poll_playback = mock.MagicMock(side_effect=poll_playback)
+        
+        def run_poll_thread(num_loops):
+            self.proxy_server.stop_event.is_set.side_effect = [False] * num_loops + [True]
+            self.proxy_server.stop_event.wait.reset_mock()
+            self.proxy_server._playback_poll_thread()
+            return [wait_call.args[0] for wait_call in self.proxy_server.stop_event.wait.call_args_list]
+        
+        # Test No Client Means No Polls
+        self.assertEqual(run_poll_thread(2), [Settings.PROXY_PLAYBACK_POLL_S] * 2)
+        self.proxy_server._poll_playback.assert_not_called()
+        
+        # Test Idle Backs Off, Failed Polls Are Logged And We Carry On, Then Playing Polls At Our Interval
+        self.proxy_server.client_time = clock[0]
+        poll_s = Settings.PROXY_PLAYBACK_POLL_S
+        self.assertEqual(run_poll_thread(9), [poll_s, poll_s * 2, poll_s, poll_s, poll_s])
+        self.assertEqual(self.proxy_server._poll_playback.call_count, 5)
+        self.mock_logger.error.assert_called_once_with("Failed to poll playback: Test Exception")
+        
+        # Test A Client Going To Spotify While We Wait Counts As Our Poll
+        playbacks.append({'is_playing': True})
+        def client_polls(timeout):
+            clock[0] += timeout
+            self.proxy_server.playback_time = clock[0] - 3
+        self.proxy_server.stop_event.wait.side_effect = client_polls
+        self.assertEqual(run_poll_thread(3), [poll_s, poll_s - 3])
+        self.assertEqual(self.proxy_server._poll_playback.call_count, 6)
+        
+        # Test Clients Going Quiet Stops Our Polls
+        self.proxy_server.stop_event.wait.side_effect = lambda timeout: clock.__setitem__(0, clock[0] + timeout)
+        clock[0] = self.proxy_server.client_time + Settings.PROXY_CLIENT_IDLE_S + poll_s + 1
+        self.assertEqual(run_poll_thread(1), [poll_s])
+        self.assertEqual(self.proxy_server._poll_playback.call_count, 6)
+    
+    @mock.patch('src.proxy.Spotify_Proxy_Server.time')
+    def test_get_current_playback(self, mock_time):
+        self.proxy_server.playback_condition = threading.Condition()
+        playback = {'is_playing': True, 'progress_ms': 10_000, 'item': {'id': 'Tr001', 'duration_ms': 200_000}}
+        self.proxy_server.sp.current_playback.return_value = playback
+        mock_time.monotonic.return_value = 100.0
+        
+        # Test Nothing Polled Yet Goes To Spotify, And Becomes Our Latest Poll
+        self.assertEqual(self.proxy_server._get_current_playback(market="US"), playback)
+        self.proxy_server.sp.current_playback.assert_called_once_with()
+        self.assertEqual((self.proxy_server.playback_time, self.proxy_server.client_time), (100.0, 100.0))
+        self.proxy_server.sp.reset_mock()
+        
+        # Test Served From Our Latest Poll Within One Poll, Moved Forward By Its Age
+        mock_time.monotonic.return_value = 100.0 + Settings.PROXY_PLAYBACK_POLL_S
+        self.assertEqual(self.proxy_server._get_current_playback()['progress_ms']
+                         , 10_000 + Settings.PROXY_PLAYBACK_POLL_S * 1000)
+        self.assertEqual(self.proxy_server.playback['progress_ms'], 10_000)
+        self.proxy_server.sp.current_playback.assert_not_called()
+        
+        # Test Anything Older Goes To Spotify
+        mock_time.monotonic.return_value = 101.0 + Settings.PROXY_PLAYBACK_POLL_S
+        self.proxy_server.sp.current_playback.return_value = None
+        self.assertIsNone(self.proxy_server._get_current_playback())
+        self.proxy_server.sp.current_playback.assert_called_once()
+        self.proxy_server.sp.reset_mock()
+        
+        # Test Nothing Playing Is Served From Our Latest Poll Too
+        self.assertIsNone(self.proxy_server._get_current_playback())
+        self.proxy_server.sp.current_playback.assert_not_called()
+        
+        # Test Changing Our Playback Goes Straight To Spotify
+        self.proxy_server._invalidate_playback()
+        self.proxy_server.sp.current_playback.return_value = dict(playback, repeat_state='off')
+        self.assertEqual(self.proxy_server._get_current_playback()['repeat_state'], 'off')
+        self.proxy_server.sp.current_playback.assert_called_once()
+    
+    def test_get_extrapolated_playback(self):
+        playback = {'is_playing': True, 'progress_ms': 10_000, 'item': {'id': 'Tr001', 'duration_ms': 15_000}}
+        self.assertIsNone(get_extrapolated_playback(None, 5))
+        self.assertEqual(get_extrapolated_playback(playback, 0), playback)
+        self.assertEqual(get_extrapolated_playback(playback, 2.5)['progress_ms'], 12_500)
+        
+        # Test We Never Go Past The End Of Our Track, Or Move Anything Not Playing
+        self.assertEqual(get_extrapolated_playback(playback, 10)['progress_ms'], 15_000)
+        self.assertEqual(get_extrapolated_playback(dict(playback, item=None), 10)['progress_ms'], 20_000)
+        self.assertEqual(get_extrapolated_playback(dict(playback, is_playing=False), 5)['progress_ms'], 10_000)
+        self.assertEqual(get_extrapolated_playback({'is_playing': True, 'progress_ms': None}, 5)['progress_ms'], None)
+    
+    @mock.patch('src.proxy.Spotify_Proxy_Server.time')
+    def test_get_current_playback_ms_played(self, mock_time):
+        self.proxy_server.playback_condition = threading.Condition()
+        self.proxy_server.sp.current_playback.return_value = {'is_playing': True, 'progress_ms': 10_000
+                                                              , 'item': {'id': 'Tr001', 'duration_ms': 200_000}}
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        vault_db = DatabaseHelpers(os.path.join(temp_dir.name, "vault.db"))
+        
+        # Test Logging Every Poll Off Of Our One Cached Spotify Poll Still Credits All Our Listening Time
+        for poll_s in range(0, Settings.PROXY_PLAYBACK_POLL_S + 1, 2):
+            mock_time.monotonic.return_value = 100.0 + poll_s
+            playback = self.proxy_server._get_current_playback()
+            vault_db.log_listening_play('Tr001', playback['progress_ms'], True, 1_700_000_000 + poll_s)
+        self.proxy_server.sp.current_playback.assert_called_once()
+        with vault_db.connect_db() as db_conn:
+            self.assertEqual(db_conn.execute("SELECT ms_played FROM listening_plays").fetchall()
+                             , [(10_000 + Settings.PROXY_PLAYBACK_POLL_S * 1000,)])
+    
+    def test_get_playback_events(self):
+        self.proxy_server.playback_condition = threading.Condition()
+        self.proxy_server.sp.current_playback.return_value = None
+        self.proxy_server._poll_playback()
+        
+        # Test No Events Times Out Empty
+        start_time = time.monotonic()
+        self.assertEqual(self.proxy_server._get_playback_events(timeout_s=0.05), {"events": [], "seq": 0})
+        self.assertGreaterEqual(time.monotonic() - start_time, 0.05)
+        self.assertGreaterEqual(self.proxy_server.client_time, start_time)
+        
+        # Test We Wake Up As Soon As An Event Comes In
+        self.proxy_server.sp.current_playback.return_value = {'item': {'id': 'Tr001'}}
+        threading.Timer(0.05, self.proxy_server._poll_playback).start()
+        self.assertEqual(self.proxy_server._get_playback_events(since_seq=0, timeout_s=30)
+                         , {"events": [{"seq": 1, "types": ["track"]}], "seq": 1})
+        
+        # Test Events We Already Have Come Back Right Away, Future Sequence Numbers Are Treated As Our Latest
+        self.assertEqual(self.proxy_server._get_playback_events(since_seq=0)["seq"], 1)
+        self.assertEqual(self.proxy_server._get_playback_events(since_seq=5), {"events": [], "seq": 1})
+        
+        # Test Our Wait Is Capped Under Our Client's Timeout
+        with mock.patch.object(self.proxy_server, 'playback_condition') as mock_condition:
+            self.proxy_server._get_playback_events(timeout_s=60)
+            self.assertEqual(mock_condition.wait_for.call_args.kwargs['timeout'], Settings.PROXY_EVENT_WAIT_S)
 
 
 # FIN ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
\ No newline at end of file
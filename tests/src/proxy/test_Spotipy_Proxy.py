@@ -10,10 +10,13 @@
 # ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
 import logging
 import pytest
+import threading
 import unittest
 from unittest import mock
 
-from src.proxy.Spotipy_Proxy        import SpotipyProxy
+import src.proxy.Spotipy_Proxy as spotipy_proxy_module
+
+from src.proxy.Spotipy_Proxy        import RateLimiter, SpotipyProxy
 from tests.helpers.mocked_Settings  import Test_Settings
 
 """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
@@ -30,6 +33,8 @@ class TestSpotipyProxy(unittest.TestCase):
         self.assertEqual(test_defaults_spotipy_proxy.max_retries, 3)
         self.assertEqual(test_defaults_spotipy_proxy.backoff_factor, 1.0)
         self.assertEqual(test_defaults_spotipy_proxy.overall_timeout, 20)
+        self.assertIs(test_defaults_spotipy_proxy.rate_limiter, spotipy_proxy_module.get_shared_rate_limiter())
+        self.assertIs(SpotipyProxy().rate_limiter, test_defaults_spotipy_proxy.rate_limiter)
         
         # Test Custom
         Test_Settings.PROXY_SERVER_PORT = "1212"
@@ -41,10 +46,46 @@ class TestSpotipyProxy(unittest.TestCase):
         self.assertEqual(test_spotipy_proxy.max_retries, 20)
         self.assertEqual(test_spotipy_proxy.backoff_factor, 99.9)
         self.assertEqual(test_spotipy_proxy.overall_timeout, 1000)
+        
+        rate_limiter = RateLimiter(1)
+        self.assertIs(SpotipyProxy(rate_limiter=rate_limiter).rate_limiter, rate_limiter)
     
+    @mock.patch('src.proxy.Spotipy_Proxy.time')
+    def test_rate_limiter(self, mocked_time):
+        mocked_time.perf_counter.return_value = 100.0
+        
+        # Test No Limit
+        rate_limiter = RateLimiter(0)
+        for _ in range(5):
+            rate_limiter.wait()
+        mocked_time.sleep.assert_not_called()
+        
+        # Test Calls Are Spaced Out
+        rate_limiter = RateLimiter(4)
+        for _ in range(4):
+            rate_limiter.wait()
+        self.assertEqual(mocked_time.sleep.call_args_list, [mock.call(0.25), mock.call(0.5), mock.call(0.75)])
+        mocked_time.sleep.reset_mock()
+        
+        # Test Time Passing Frees Our Slots Back Up
+        mocked_time.perf_counter.return_value = 200.0
+        rate_limiter.wait()
+        mocked_time.sleep.assert_not_called()
+        
+        # Test Threads Never Share A Slot
+        rate_limiter = RateLimiter(10)
+        threads = [threading.Thread(target=rate_limiter.wait) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sorted(round(sleep.args[0], 6) for sleep in mocked_time.sleep.call_args_list)
+                         , [round(slot * 0.1, 6) for slot in range(1, 20)])
+
     @mock.patch('src.proxy.Spotipy_Proxy.requests')
     def test_get_attr(self, mocked_requests):
-        spotipy_proxy = SpotipyProxy(backoff_factor=0.0)
+        rate_limiter = mock.MagicMock()
+        spotipy_proxy = SpotipyProxy(backoff_factor=0.0, rate_limiter=rate_limiter)
         mock_requests_post = mocked_requests.post
         
         # Test 200 Response
@@ -52,6 +93,7 @@ class TestSpotipyProxy(unittest.TestCase):
         mock_requests_post.return_value.json.return_value = {"result": "test"}
         self.assertEqual(spotipy_proxy.test1(), "test")
         mock_requests_post.assert_called_once()
+        rate_limiter.wait.assert_called_once()
         mock_requests_post.reset_mock()
         
         # Test 500 Response Max Retries
@@ -60,6 +102,8 @@ class TestSpotipyProxy(unittest.TestCase):
         with pytest.raises(SystemExit) as exc_info:
             spotipy_proxy.test1()
         self.assertEqual(mock_requests_post.call_count, 3)
+        # Test Every Retry Waits On Our Limiter
+        self.assertEqual(rate_limiter.wait.call_count, 4)
         mock_requests_post.reset_mock()
 
         # Test 500 Response Then 200
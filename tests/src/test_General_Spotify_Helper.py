@@ -9,6 +9,11 @@
 # Unit tests for all functionality out of 'General_Spotify_Helpers.py'.
 # ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
 import inspect
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
 import unittest
 
 from datetime import datetime
@@ -63,6 +68,91 @@ class TestGSH(unittest.TestCase):
         self.assertEqual(gsh.chunks([], 0),   [])
         self.assertEqual(gsh.chunks([], 5),   [])
     
+    def test_parse_release_date(self):
+        gsh.parse_release_date.cache_clear()
+        
+        self.assertEqual(gsh.parse_release_date('2000-01-15'), datetime(2000, 1, 15))
+        self.assertEqual(gsh.parse_release_date('2000-02'), datetime(2000, 2, 29))
+        self.assertEqual(gsh.parse_release_date('2001-02'), datetime(2001, 2, 28))
+        self.assertEqual(gsh.parse_release_date('2000'), datetime(2000, 12, 31))
+        # Test Unpadded Dates Still Parse
+        self.assertEqual(gsh.parse_release_date('2000-1'), datetime(2000, 1, 31))
+        self.assertEqual(gsh.parse_release_date('2000-1-5'), datetime(2000, 1, 5))
+        # Test Formats We Don't Know
+        self.assertIsNone(gsh.parse_release_date(''))
+        self.assertIsNone(gsh.parse_release_date('0000'))
+        self.assertIsNone(gsh.parse_release_date('2000-02-30'))
+        self.assertIsNone(gsh.parse_release_date('Jan 5th'))
+        # Test Cached
+        gsh.parse_release_date('2000-01-15')
+        self.assertEqual(gsh.parse_release_date.cache_info().hits, 1)
+    
+    def test_is_album_cache_fresh(self):
+        now = datetime(2025, 3, 1)
+        half_day_ago = int(datetime(2025, 2, 28, 12).timestamp())
+        two_days_ago = int(datetime(2025, 2, 27).timestamp())
+        
+        # Test Albums That Were Already Settled When Cached Never Go Stale
+        self.assertTrue(gsh.is_album_cache_fresh('2020-01-01', int(datetime(2021, 1, 1).timestamp()), now))
+        self.assertTrue(gsh.is_album_cache_fresh('2025-01-01', two_days_ago, now))
+        # Test Recent Releases Only Last So Long
+        self.assertTrue(gsh.is_album_cache_fresh('2025-02-20', half_day_ago, now))
+        self.assertFalse(gsh.is_album_cache_fresh('2025-02-20', two_days_ago, now))
+        # Test Year Only Releases Count From The End Of Their Year
+        self.assertFalse(gsh.is_album_cache_fresh('2025', two_days_ago, now))
+        # Test Release Dates We Don't Know Are Treated As Recent
+        self.assertTrue(gsh.is_album_cache_fresh(None, half_day_ago, now))
+        self.assertFalse(gsh.is_album_cache_fresh(None, two_days_ago, now))
+        self.assertFalse(gsh.is_album_cache_fresh('0000-01-01', two_days_ago, now))
+    
+    def test_normalize_track_title(self):
+        self.assertEqual(gsh.normalize_track_title("Song A"), "song a")
+        self.assertEqual(gsh.normalize_track_title("  SONG   a!? "), "song a")
+        self.assertEqual(gsh.normalize_track_title("Ｓｏｎｇ Ａ"), "song a")
+        self.assertEqual(gsh.normalize_track_title("Straße (feat. Ünder)"), "strasse feat ünder")
+        self.assertEqual(gsh.normalize_track_title(""), "")
+    
+    def test_get_track_dedupe_key(self):
+        track = {'name': "Song A", 'artists': [{'id': 'Ar001'}, {'id': 'Ar002'}]}
+        self.assertEqual(gsh.get_track_dedupe_key(track), ('title', "song a", frozenset({'Ar001', 'Ar002'})))
+        # Test Artist Order And Title Formatting Don't Matter
+        self.assertEqual(gsh.get_track_dedupe_key(track)
+                         , gsh.get_track_dedupe_key({'name': "song a!", 'artists': [{'id': 'Ar002'}, {'id': 'Ar001'}]}))
+        self.assertNotEqual(gsh.get_track_dedupe_key(track)
+                            , gsh.get_track_dedupe_key({'name': "Song A", 'artists': [{'id': 'Ar001'}]}))
+        self.assertNotEqual(gsh.get_track_dedupe_key(track)
+                            , gsh.get_track_dedupe_key({**track, 'name': "Song A - Remastered"}))
+    
+    def test_get_reorder_moves(self):
+        with self.assertRaises(Exception): gsh.get_reorder_moves(None, [])
+        with self.assertRaises(Exception): gsh.get_reorder_moves(['1', '2'], ['1', '3'])
+        with self.assertRaises(Exception): gsh.get_reorder_moves(['1', '1'], ['1'])
+        
+        def apply_moves(tracks, moves):
+            tracks = list(tracks)
+            for range_start, insert_before, range_length in moves:
+                moved = tracks[range_start:range_start + range_length]
+                del tracks[range_start:range_start + range_length]
+                new_start = insert_before if insert_before < range_start else insert_before - range_length
+                tracks[new_start:new_start] = moved
+            return tracks
+        
+        # Test Nothing To Move
+        self.assertEqual(gsh.get_reorder_moves([], []), [])
+        self.assertEqual(gsh.get_reorder_moves(['1', '2', '3'], ['1', '2', '3']), [])
+        # Test Single Track Moves Both Ways
+        self.assertEqual(gsh.get_reorder_moves(['5', '1', '2', '3', '4'], ['1', '2', '3', '4', '5']), [(0, 5, 1)])
+        self.assertEqual(gsh.get_reorder_moves(['2', '3', '4', '5', '1'], ['1', '2', '3', '4', '5']), [(4, 0, 1)])
+        # Test Runs Move As One Range
+        self.assertEqual(gsh.get_reorder_moves(['4', '5', '6', '1', '2', '3', '7'], ['1', '2', '3', '4', '5', '6', '7'])
+                         , [(0, 6, 3)])
+        # Test Reversed And Duplicates
+        current, target = ['5', '4', '3', '2', '1'], ['1', '2', '3', '4', '5']
+        self.assertEqual(len(gsh.get_reorder_moves(current, target)), 4)
+        self.assertEqual(apply_moves(current, gsh.get_reorder_moves(current, target)), target)
+        current, target = ['2', '1', '2', '3', '1'], ['1', '1', '2', '2', '3']
+        self.assertEqual(apply_moves(current, gsh.get_reorder_moves(current, target)), target)
+    
     def test_get_generic_field(self):
         with self.assertRaises(Exception): gsh.get_generic_field("data", ["id", "name"])
         with self.assertRaises(Exception): gsh.get_generic_field(None, ["id"])
@@ -368,6 +458,24 @@ class TestGSH(unittest.TestCase):
         field_structure = {'name': True, "duration": True}
         self.assertEqual(GSH._gather_data(response, field_structure)
                          , [{"name": "Track1", "duration": 30}])
+    
+    def test_gather_pages(self):
+        GSH = gsh.GeneralSpotifyHelpers()
+        response = {"items": [{"name": "Track1"}, {"name": "Track2"}]
+                    , "next": {"items": [{"name": "Track3"}], "next": {"name": "Track4"}}}
+        
+        with mock.patch.object(GSH.sp, 'next', wraps=GSH.sp.next) as mock_next:
+            # Test Pages Come Back Separately
+            self.assertEqual(list(GSH._gather_pages(response, {'name': True}))
+                             , [[{"name": "Track1"}, {"name": "Track2"}], [{"name": "Track3"}], [{"name": "Track4"}]])
+            mock_next.reset_mock()
+            
+            # Test We Only Request The Next Page Once Asked For It
+            pages = GSH._gather_pages(response, {'name': True})
+            self.assertEqual(next(pages), [{"name": "Track1"}, {"name": "Track2"}])
+            mock_next.assert_not_called()
+            self.assertEqual(next(pages), [{"name": "Track3"}])
+            mock_next.assert_called_once()
 
     def test_validate_scope(self):
         test_scopes = [ "user-read-private"
@@ -438,6 +546,7 @@ class TestGSH(unittest.TestCase):
             'context': {'id': 'Pl001', 'type': 'playlist'},
             'currently_playing_type': 'track',
             'is_playing': True,
+            'progress_ms': 0,
             'repeat_state': 'off',
             'shuffle_state': False,
             'track': {'album': {'id': 'Al000', 'artists': [{'id': 'Ar000'}]}
@@ -449,6 +558,7 @@ class TestGSH(unittest.TestCase):
             'context': None,
             'currently_playing_type': 'track',
             'is_playing': True,
+            'progress_ms': 0,
             'repeat_state': 'off',
             'shuffle_state': False,
             'track': {'album': {'id': 'Al000', 'artists': [{'id': 'Ar000'}]}
@@ -476,6 +586,19 @@ class TestGSH(unittest.TestCase):
         # Test None 'Item'
         spotify.sp.current_playback_response['item'] = None
         self.assertEqual(spotify.get_playback_state(), None)
+    
+    def test_get_playback_events(self):
+        spotify = gsh.GeneralSpotifyHelpers()
+        spotify._scopes = list(Settings.MAX_SCOPE_LIST)
+        spotify.sp.playback_events = mock.MagicMock(return_value={"events": [], "seq": 2})
+        
+        self.assertEqual(spotify.get_playback_events(2, 4), {"events": [], "seq": 2})
+        spotify.sp.playback_events.assert_called_once_with(2, 4)
+        
+        # Test Missing Scope
+        spotify._scopes = []
+        with self.assertRaises(Exception):
+            spotify.get_playback_events()
 
     @mock.patch("time.sleep", return_value=None)
     def test_write_to_queue(self, mock_sleep):
@@ -739,6 +862,89 @@ class TestGSH(unittest.TestCase):
         spotify.remove_all_playlist_tracks("Pl100", max_playlist_length=4)
         self.assertEqual(len(spotify.sp.playlist_items("Pl100")['items']), 0)
 
+    def test_reorder_playlist_tracks(self):
+        spotify = gsh.GeneralSpotifyHelpers()
+        spotify._scopes = list(Settings.MAX_SCOPE_LIST)
+        thelp.create_env(spotify)
+        spotify.sp.playlists.append(thelp.create_playlist("Pl100", "Reorder Playlist", "no description", []))
+        spotify.add_tracks_to_playlist("Pl100", ["Tr001", "Tr002", "Tr004"])
+        
+        # Test Nothing To Move Hands Back Our Snapshot
+        self.assertEqual(spotify.reorder_playlist_tracks("Pl100", []), None)
+        self.assertEqual(spotify.reorder_playlist_tracks("Pl100", [], snapshot_id="Sn000"), "Sn000")
+        
+        # Test Each Move Uses The Last Snapshot
+        self.assertEqual(spotify.reorder_playlist_tracks("Pl100", [(2, 0, 1), (1, 3, 2)]), "Sn002")
+        self.assertEqual([track['id'] for track in spotify.get_playlist_tracks("Pl100")], ["Tr004", "Tr001", "Tr002"])
+        self.assertEqual(spotify.reorder_playlist_tracks("Pl100", [(0, 3, 1)], snapshot_id="Sn002"), "Sn003")
+        self.assertEqual([track['id'] for track in spotify.get_playlist_tracks("Pl100")], ["Tr001", "Tr002", "Tr004"])
+        
+        # Test Stale Snapshot
+        with self.assertRaises(Exception): spotify.reorder_playlist_tracks("Pl100", [(0, 3, 1)], snapshot_id="Sn000")
+
+    @mock.patch('src.General_Spotify_Helpers.Settings', Test_Settings)
+    def test_sync_playlist_tracks(self):
+        spotify = gsh.GeneralSpotifyHelpers()
+        spotify._scopes = list(Settings.MAX_SCOPE_LIST)
+        thelp.create_env(spotify)
+        
+        self.addCleanup(setattr, Test_Settings, 'PLAYLISTS_WE_CAN_DELETE_FROM'
+                        , Test_Settings.PLAYLISTS_WE_CAN_DELETE_FROM)
+        Test_Settings.PLAYLISTS_WE_CAN_DELETE_FROM = ["Pl100"]
+        spotify.sp.playlists.append(thelp.create_playlist("Pl100", "Fake Delete PLaylist", "no description", []))
+        spotify.add_tracks_to_playlist("Pl100", ["Tr001", "Tr002", "Tr004"])
+        get_track_ids = lambda playlist_id: [track['id'] for track in spotify.get_playlist_tracks(playlist_id)]
+        
+        with self.assertRaises(Exception): spotify.sync_playlist_tracks("Pl100", ["Tr001"], max_playlist_length=5)
+        spotify._scopes.append(Test_Settings.DELETE_SCOPE)
+        
+        # Test Deletion Gates
+        self.assertFalse(spotify.sync_playlist_tracks("Pl002", [], max_playlist_length=5))
+        self.assertEqual(len(get_track_ids("Pl002")), 3)
+        self.assertFalse(spotify.sync_playlist_tracks("Pl100", []))
+        self.assertFalse(spotify.sync_playlist_tracks("Pl100", [], max_playlist_length=2))
+        self.assertEqual(get_track_ids("Pl100"), ["Tr001", "Tr002", "Tr004"])
+        
+        with mock.patch.object(spotify.sp, 'playlist_remove_all_occurrences_of_items'
+                               , wraps=spotify.sp.playlist_remove_all_occurrences_of_items) as mock_remove, \
+             mock.patch.object(spotify.sp, 'playlist_add_items', wraps=spotify.sp.playlist_add_items) as mock_add, \
+             mock.patch.object(spotify.sp, 'playlist_reorder_items'
+                               , wraps=spotify.sp.playlist_reorder_items) as mock_reorder:
+            # Test Already In Sync Touches Nothing
+            self.assertTrue(spotify.sync_playlist_tracks("Pl100", ["Tr001", "Tr002", "Tr004"], max_playlist_length=3))
+            mock_remove.assert_not_called()
+            mock_add.assert_not_called()
+            mock_reorder.assert_not_called()
+            
+            # Test Window Sliding Forward Is One Remove And One Add
+            self.assertTrue(spotify.sync_playlist_tracks("Pl100", ["Tr002", "Tr004", "Tr005"], max_playlist_length=3))
+            mock_remove.assert_called_once_with("Pl100", ["Tr001"])
+            mock_add.assert_called_once_with("Pl100", ["Tr005"])
+            mock_reorder.assert_not_called()
+            self.assertEqual(get_track_ids("Pl100"), ["Tr002", "Tr004", "Tr005"])
+            mock_remove.reset_mock()
+            mock_add.reset_mock()
+            
+            # Test Reorder Only
+            self.assertTrue(spotify.sync_playlist_tracks("Pl100", ["Tr005", "Tr002", "Tr004"], max_playlist_length=3))
+            mock_remove.assert_not_called()
+            mock_add.assert_not_called()
+            mock_reorder.assert_called_once_with("Pl100", 2, 0, range_length=1, snapshot_id=None)
+            self.assertEqual(get_track_ids("Pl100"), ["Tr005", "Tr002", "Tr004"])
+            mock_reorder.reset_mock()
+            
+            # Test Duplicates Are Removed And Re-Added Into Place
+            self.assertTrue(spotify.sync_playlist_tracks("Pl100", ["Tr002", "Tr005", "Tr002"], max_playlist_length=3))
+            mock_remove.assert_called_once_with("Pl100", ["Tr004"])
+            mock_add.assert_called_once_with("Pl100", ["Tr002"])
+            self.assertEqual(get_track_ids("Pl100"), ["Tr002", "Tr005", "Tr002"])
+            self.assertTrue(spotify.sync_playlist_tracks("Pl100", ["Tr002"], max_playlist_length=3))
+            self.assertEqual(get_track_ids("Pl100"), ["Tr002"])
+        
+        # Test Emptying
+        self.assertTrue(spotify.sync_playlist_tracks("Pl100", [], max_playlist_length=1))
+        self.assertEqual(get_track_ids("Pl100"), [])
+
     def test_get_artist_albums(self):
         spotify = gsh.GeneralSpotifyHelpers()
         spotify._scopes = list(Settings.MAX_SCOPE_LIST)
@@ -784,6 +990,43 @@ class TestGSH(unittest.TestCase):
         # Artist with full Creds On Shared Album
         self.assertEqual(spotify.get_artist_albums('Ar005'), [{'id': 'Al008'}, {'id': 'Al010'}])
     
+    def test_get_artist_albums_start_date(self):
+        spotify = gsh.GeneralSpotifyHelpers()
+        spotify.sp = mock.MagicMock()
+        spotify.sp.next.side_effect = lambda response: response['next']
+        page = lambda albums, next_page=None: {'items': [{'id': album_id, 'release_date': release_date}
+                                                        for album_id, release_date in albums], 'next': next_page}
+        # Newest first within each album type
+        responses = {
+            'album': page([('Al001', '2025-03-01'), ('Al002', '2025-01')]
+                          , page([('Al003', '2024-12-31'), ('Al004', '2024')], page([('Al005', '2020')])))
+            , 'single': page([('Al006', '2025'), ('Al007', 'weird date')], page([('Al008', '2019-05-05')]))
+            , 'appears_on': page([])
+        }
+        spotify.sp.artist_albums.side_effect = \
+            lambda artist_id, country, limit, include_groups: responses[include_groups]
+        
+        # Test No Start Date Reads Everything In One Request
+        responses['album,single'] = page([('Al001', '2025-03-01')], page([('Al006', '2025')]))
+        self.assertEqual(spotify.get_artist_albums('Ar001', album_types=['album', 'single'])
+                         , [{'id': 'Al001'}, {'id': 'Al006'}])
+        spotify.sp.reset_mock()
+        
+        # Test We Stop Once A Page Reaches Past Our Start Date, Each Album Type On Its Own
+        self.assertEqual(spotify.get_artist_albums('Ar001', album_types=['album', 'single', 'appears_on']
+                                                   , info=['id'], start_date=datetime(2025, 1, 1))
+                         , [{'id': 'Al001'}, {'id': 'Al002'}, {'id': 'Al003'}, {'id': 'Al004'}, {'id': 'Al006'}
+                            , {'id': 'Al007'}, {'id': 'Al008'}])
+        self.assertEqual([call.kwargs['include_groups'] for call in spotify.sp.artist_albums.call_args_list]
+                         , ['album', 'single', 'appears_on'])
+        self.assertEqual(spotify.sp.next.call_count, 2)
+        spotify.sp.reset_mock()
+        
+        # Test Start Date Before Everything Reads Every Page
+        self.assertEqual(len(spotify.get_artist_albums('Ar001', album_types=['album'], info=['id', 'release_date']
+                                                       , start_date=datetime(1990, 1, 1))), 5)
+        self.assertEqual(spotify.sp.next.call_count, 2)
+    
     def test_gather_tracks_by_artist(self):
         # Don't really need to test the start and end date since we test 'get_elements_in_date_range' well.
         # Can't do this until 'verify_appears_on_tracks' is mocked. BRO-76
@@ -841,6 +1084,55 @@ class TestGSH(unittest.TestCase):
                         'tracks': [{'artists': [{'id': 'Ar002'}], 'id': 'Tr001', 'name': 'Fake Track 1'},
                                    {'artists': [{'id': 'Ar002'}], 'id': 'Tr002', 'name': 'Fake Track 2'}],
                         'artists': [{'id': 'Ar002'}]}])
+    
+    def test_get_albums_tracks_album_cache(self):
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        cache_db = os.path.join(tmp_dir, "cache.db")
+        
+        uncached_spotify = gsh.GeneralSpotifyHelpers()
+        thelp.create_env(uncached_spotify)
+        spotify = gsh.GeneralSpotifyHelpers(album_cache_db=cache_db)
+        thelp.create_env(spotify)
+        for album in spotify.sp.env_albums:
+            album['release_date'] = '2020-01-01' if album['id'] == 'Al002' else '0000-01-01'
+        spotify.sp.albums = mock.MagicMock(wraps=spotify.sp.albums)
+        self.assertIsNone(spotify.album_cache)
+        
+        # Test First Look Up Goes To Spotify Once Per Album
+        album_ids = ['Al002', 'Al003', 'Al002']
+        expected = uncached_spotify.get_albums_tracks(album_ids, album_info=['id', 'name'])
+        self.assertEqual(spotify.get_albums_tracks(album_ids, album_info=['id', 'name']), expected)
+        spotify.sp.albums.assert_called_once_with(['Al002', 'Al003'], market="US")
+        self.assertEqual(spotify.album_cache.get_table_size("album_cache"), 2)
+        self.assertEqual(spotify.log_album_cache_stats(), {'hits': 0, 'stale': 0, 'misses': 2, 'hit_rate': 0})
+        
+        # Test Second Look Up Comes Straight From Our Cache, Whatever Info We Ask For
+        spotify.sp.albums.reset_mock()
+        self.assertEqual(spotify.get_albums_tracks(album_ids, album_info=['id', 'name']), expected)
+        self.assertEqual(spotify.get_albums_tracks(['Al003'], track_info=['id', 'name'])
+                         , uncached_spotify.get_albums_tracks(['Al003'], track_info=['id', 'name']))
+        spotify.sp.albums.assert_not_called()
+        self.assertEqual(spotify.log_album_cache_stats(), {'hits': 3, 'stale': 0, 'misses': 0, 'hit_rate': 1})
+        
+        # Test We Only Cache What We Read, Asking For Anything More Goes To Spotify
+        cached_album = json.loads(spotify.album_cache.get_album_cache(['Al003'])[0]['album'])
+        self.assertEqual(set(cached_album), set(gsh.ALBUM_CACHE_FIELDS))
+        self.assertEqual(spotify.get_albums_tracks(['Al003'], album_info=['id', 'album_type'])
+                         , uncached_spotify.get_albums_tracks(['Al003'], album_info=['id', 'album_type']))
+        spotify.sp.albums.assert_called_once_with(['Al003'], market="US")
+        spotify.sp.albums.reset_mock()
+        self.assertEqual(spotify.log_album_cache_stats()['hit_rate'], 0)
+        
+        # Test Recent Releases Go Stale, Settled Ones Don't
+        with sqlite3.connect(cache_db) as db_conn:
+            db_conn.execute("UPDATE album_cache SET cached_at = cached_at - ?"
+                            , ((Settings.ALBUM_CACHE_RECENT_TTL_H + 1) * 3600,))
+        db_conn.close()
+        self.assertEqual(spotify.get_albums_tracks(album_ids, album_info=['id', 'name']), expected)
+        spotify.sp.albums.assert_called_once_with(['Al003'], market="US")
+        self.assertEqual(spotify.log_album_cache_stats(), {'hits': 1, 'stale': 1, 'misses': 0, 'hit_rate': 0.5})
+        self.assertEqual(spotify.log_album_cache_stats(), {'hits': 0, 'stale': 0, 'misses': 0, 'hit_rate': 0})
         # Multi Track Album, Differing Artist Info and Track Info
         self.assertEqual(spotify.get_albums_tracks(['Al002'], artist_info=['id', 'name'], track_info=['id', 'name']), 
                          [{'id': 'Al002',
@@ -932,8 +1224,44 @@ class TestGSH(unittest.TestCase):
                                                                                    ['Ar004', 'Fake Artist 4']])
 
     def test_verify_appears_on_tracks(self):
-        # TODO BRO-76: We will need search functionality mocked for this.
-        print("\n\tNot Implemented")
+        spotify = gsh.GeneralSpotifyHelpers()
+        thelp.create_env(spotify)
+        search_results = {"Song A%20artist:Main Artist": ['Tr_A1']
+                        , "Song B%20artist:Other Artist": ['Tr_B2']
+                        , "Song C%20artist:Fake Artist 1": []}
+        spotify.sp.search = mock.MagicMock(side_effect=lambda query, limit, type, market: 
+                                           {'tracks': {'items': [{'id': track_id} 
+                                                                 for track_id in search_results[query]]}})
+        spotify.sp.artist = mock.MagicMock(wraps=spotify.sp.artist)
+        
+        song_a_artists = [{'id': 'Ar_Main', 'name': "Main Artist"}, {'id': 'Ar_Us', 'name': "Us"}]
+        tracks = [{'id': 'Tr_A1', 'name': "Song A", 'artists': song_a_artists}
+                , {'id': 'Tr_A2', 'name': "Song A", 'artists': song_a_artists}
+                , {'id': 'Tr_A3', 'name': "song a!", 'artists': song_a_artists[::-1]}
+                , {'id': 'Tr_B1', 'name': "Song B", 'artists': [{'id': 'Ar_Other', 'name': "Other Artist"}]}
+                , {'id': 'Tr_B2', 'name': "SONG B", 'artists': [{'id': 'Ar_Other', 'name': "Other Artist"}]}
+                , {'id': 'Tr_C1', 'name': "Song C", 'artists': [{'id': 'Ar001'}]}]
+        
+        # Test One Search Per Recording, Copies Spotify Doesn't Rank Are Dropped
+        self.assertEqual(spotify.verify_appears_on_tracks([], 'Ar_Us'), [])
+        self.assertEqual(spotify.verify_appears_on_tracks(tracks, 'Ar_Us'), ['Tr_A1', 'Tr_B2', 'Tr_C1'])
+        self.assertEqual(spotify.sp.search.call_count, 3)
+        spotify.sp.search.assert_any_call("Song A%20artist:Main Artist", limit=5, type='track', market="US")
+        # Test Artist Names Come From The Track When We Have Them
+        spotify.sp.artist.assert_called_once_with('Ar001')
+        
+        # Test Searches And Artist Names Are Cached
+        self.assertEqual(spotify.verify_appears_on_tracks([tracks[5], tracks[1], tracks[0]], 'Ar_Us')
+                         , ['Tr_C1', 'Tr_A1'])
+        self.assertEqual(spotify.sp.search.call_count, 3)
+        spotify.sp.artist.assert_called_once()
+        
+        # Test Clearing Our Caches Means We Search Again
+        spotify.clear_search_cache()
+        self.assertEqual((spotify.search_cache, spotify.artist_name_cache), ({}, {}))
+        self.assertEqual(spotify.verify_appears_on_tracks([tracks[5]], 'Ar_Us'), ['Tr_C1'])
+        self.assertEqual(spotify.sp.search.call_count, 4)
+        self.assertEqual(spotify.sp.artist.call_count, 2)
 
     # ═════════════════════════════════════════════════════════════════════════════════════════════════════════════════
     # MISC HELPERS ════════════════════════════════════════════════════════════════════════════════════════════════════
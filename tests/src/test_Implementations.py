@@ -17,6 +17,12 @@ import src.Implementations
 from src.Implementations           import *
 from src.Spotify_Features          import SpotifyFeatures
 from tests.helpers.mocked_Settings import Test_Settings
+from tests.helpers.tester_helpers  import get_startup_import_times
+
+# Modules only our rarer features need, none of these should be loaded just to poll playback.
+STARTUP_FORBIDDEN_MODULES = ["matplotlib", "PIL", "pydrive", "numpy", "smtplib", "src.features.Weekly_Report"
+                             , "src.features.Google_Drive_Uploader", "src.features.Listening_Analytics"
+                             , "src.features.Sanity_Tests", "src.features.Backup_Spotify_Data"]
 
 """""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
 DESCRIPTION: Unit test collection for all Implementations functionality.
@@ -24,9 +30,6 @@ DESCRIPTION: Unit test collection for all Implementations functionality.
 @mock.patch('src.Implementations.Settings', Test_Settings)
 class TestStatistics(unittest.TestCase):
 
-    def setUp(self):
-        src.Implementations.threads = []
-    
     @mock.patch("src.Implementations.datetime")
     @mock.patch("src.Implementations.os")
     @mock.patch("src.Implementations.time")
@@ -56,47 +59,38 @@ class TestStatistics(unittest.TestCase):
 
         mock_os._exit.assert_called_once_with(1)
         mock_time.sleep.assert_called_once_with(60)
+        mock_os.reset_mock()
+        mock_time.reset_mock()
+        
+        # Test A Running Queued Job Holds Off Our Exit Until It's Done
+        past_runtime = start_time + timedelta(minutes=Test_Settings.MAX_RUNTIME_MINUTES + 1)
+        mock_datetime.now.side_effect = [start_time, past_runtime, past_runtime]
+        mock_time.sleep.side_effect = lambda _: job_running.clear()
+        job_running.set()
+        try:
+            with self.assertRaises(SystemExit):
+                monitor_script_runtime()
+        finally:
+            job_running.clear()
+        mock_os._exit.assert_called_once_with(1)
+        mock_time.sleep.assert_called_once_with(60)
     
-    @mock.patch("src.Implementations.threading")
+    @mock.patch("src.Implementations.macro_pool")
     @mock.patch("src.Implementations.SpotifyFeatures")
-    def test_startup_feature_thread(self, mock_spotify_features, mock_threading):
-        mock_thread = mock.MagicMock()
-        mock_threading.Thread.return_value = mock_thread
-        
+    def test_startup_feature_thread(self, mock_spotify_features, mock_pool):
         def test_method():
             pass
         
-        # Test Default
+        # Test Default Goes To Our Pool
         startup_feature_thread(test_method)
-        
-        mock_spotify_features.assert_called_once_with(log_file_name="Default.log")
-        mock_threading.Thread.assert_called_once_with(target=mock.ANY, args=(), kwargs={}, daemon=True)
-        mock_thread.start.assert_called_once()
-        mock_thread.join.assert_not_called()
-        self.assertEqual(src.Implementations.threads, [mock_thread])
-        mock_threading.Thread.reset_mock()
-        mock_spotify_features.reset_mock()
-        
-        # Test Args and Kwargs
-        startup_feature_thread(test_method, 1, 2, test='yep', test2='yepp')
-        mock_threading.Thread.assert_called_once_with(target=mock.ANY
-                                                      , args=(1, 2)
-                                                      , kwargs={'test': 'yep', 'test2': 'yepp'}
-                                                      , daemon=True)
-        self.assertEqual(src.Implementations.threads, [mock_thread, mock_thread])
-        mock_threading.Thread.reset_mock()
-        mock_spotify_features.reset_mock()
-        
-        # Test log_file_name
-        startup_feature_thread(test_method, log_file_name="Test.log")
-        mock_spotify_features.assert_called_once_with(log_file_name="Test.log")
-        self.assertEqual(src.Implementations.threads, [mock_thread, mock_thread, mock_thread])
-        mock_spotify_features.reset_mock()
-        
-        # Test 'run_parallel'
-        startup_feature_thread(test_method, run_parallel=False)
-        mock_thread.join.assert_called_once()
-        self.assertEqual(src.Implementations.threads, [mock_thread, mock_thread, mock_thread])
+        mock_pool.submit.assert_called_once_with(test_method, log_file_name="Default.log")
+        mock_spotify_features.assert_not_called()
+        mock_pool.reset_mock()
+        
+        # Test Args, Kwargs, and log_file_name
+        startup_feature_thread(test_method, 1, 2, log_file_name="Test.log", test='yep', test2='yepp')
+        mock_pool.submit.assert_called_once_with(test_method, 1, 2, log_file_name="Test.log", test='yep'
+                                                 , test2='yepp')
 
     def test_check_date_time(self):
         test_time = datetime(2025, 3, 11, 12, 30)
@@ -142,6 +136,118 @@ class TestStatistics(unittest.TestCase):
         self.assertTrue(check_date_time(datetime(2025, 3, 1, 0, 0), weekday=0, day=1, hour=0, minute=0))
         self.assertTrue(check_date_time(datetime(2025, 3, 3, 0, 0), weekday=0, day=1, hour=0, minute=0))
     
+    def test_get_cron_trigger(self):
+        self.assertEqual(str(get_cron_trigger(hour=2, minute=0)), "cron[hour='2', minute='0']")
+        self.assertEqual(str(get_cron_trigger(weekday=0, hour=3, minute=0))
+                         , "cron[day_of_week='0', hour='3', minute='0']")
+        self.assertEqual(str(get_cron_trigger(day=1, hour=1, minute=30)), "cron[day='1', hour='1', minute='30']")
+        
+        # Test Fire Times Line Up With 'check_date_time'
+        trigger = get_cron_trigger(weekday=6, hour=2, minute=0)
+        now = datetime(2025, 3, 12, 12, 0, tzinfo=trigger.timezone)
+        next_fire_time = trigger.get_next_fire_time(None, now)
+        self.assertEqual(next_fire_time.replace(tzinfo=None), datetime(2025, 3, 16, 2, 0))
+        self.assertTrue(check_date_time(next_fire_time, weekday=6, hour=2, minute=0))
+    
+    def test_keep_job_alive(self):
+        mock_queue = mock.MagicMock()
+        done_event = mock.MagicMock()
+        done_event.wait.side_effect = [False, False, True]
+        mock_queue.heartbeat.side_effect = [OSError("locked"), None]
+        
+        # Test A Failed Heartbeat Is Logged And We Keep Going
+        keep_job_alive(mock_queue, 7, done_event)
+        done_event.wait.assert_called_with(Test_Settings.JOB_HEARTBEAT_S)
+        self.assertEqual(mock_queue.heartbeat.call_args_list, [mock.call(7), mock.call(7)])
+        mock_queue.logger.exception.assert_called_once()
+        mock_queue.reset_mock()
+        
+        # Test A Hung Job Stops Being Heartbeated Past Our Max Runtime And Lets Our Monitor Exit
+        done_event.wait.side_effect = None
+        done_event.wait.return_value = False
+        job_running.set()
+        self.addCleanup(job_running.clear)
+        with mock.patch('src.Implementations.time') as mock_time:
+            mock_time.monotonic.side_effect = [0, 1, Test_Settings.JOB_MAX_RUNTIME_S + 1]
+            keep_job_alive(mock_queue, 7, done_event)
+        mock_queue.heartbeat.assert_called_once_with(7)
+        mock_queue.logger.error.assert_called_once()
+        self.assertFalse(job_running.is_set())
+    
+    @mock.patch('src.Implementations.keep_job_alive')
+    @mock.patch('src.Implementations.SpotifyFeatures')
+    def test_run_queued_jobs(self, mock_features, mock_keep_alive):
+        mock_queue = mock.MagicMock()
+        jobs = [{'id': 1, 'name': "backup_spotify_library", 'run_key': "k", 'log_file_name': "Backup-Library.log"
+                 , 'attempts': 1, 'checkpoint': {}}
+              , {'id': 2, 'name': "generate_monthly_release", 'run_key': "k", 'log_file_name': "Monthly-Release.log"
+                 , 'attempts': 2, 'checkpoint': {'playlist_id': "p1"}}
+              , None]
+        mock_queue.claim_next.side_effect = jobs
+        jobs_running = []
+        def generate_monthly_release(checkpoint=None):
+            pass
+        def fail_monthly_release(checkpoint=None):
+            jobs_running.append(job_running.is_set())
+            raise KeyError("artists")
+        mock_features.return_value.generate_monthly_release = mock.create_autospec(generate_monthly_release
+                                                                                   , side_effect=fail_monthly_release)
+        
+        # Test Every Job Runs In Order, Checkpoints Only Go To Features That Take Them
+        self.assertEqual(run_queued_jobs(mock_queue), 2)
+        mock_queue.claim_next.assert_called_with(Test_Settings.JOB_STALE_S, Test_Settings.JOB_MAX_ATTEMPTS)
+        self.assertEqual(mock_features.call_args_list, [mock.call(log_file_name="Backup-Library.log")
+                                                        , mock.call(log_file_name="Monthly-Release.log")])
+        mock_features.return_value.backup_spotify_library.assert_called_once_with()
+        mock_queue.complete.assert_called_once_with(1)
+        mock_queue.get_checkpoint.assert_called_once_with(jobs[1])
+        mock_features.return_value.generate_monthly_release.assert_called_once_with(
+            checkpoint=mock_queue.get_checkpoint.return_value)
+        
+        # Test A Failed Job Is Handed Back To Our Queue
+        mock_queue.fail.assert_called_once_with(2, "KeyError('artists')", Test_Settings.JOB_MAX_ATTEMPTS)
+        mock_queue.logger.exception.assert_called_once()
+        
+        # Test Every Job Heartbeats Until It's Done
+        self.assertEqual([keep_alive.args[:2] for keep_alive in mock_keep_alive.call_args_list]
+                         , [(mock_queue, 1), (mock_queue, 2)])
+        self.assertTrue(all(keep_alive.args[2].is_set() for keep_alive in mock_keep_alive.call_args_list))
+        
+        # Test Our Runtime Monitor Holds Off Only While A Job Runs
+        self.assertEqual(jobs_running, [True])
+        self.assertFalse(job_running.is_set())
+        
+        # Test Stopping Claims Nothing
+        mock_queue.reset_mock()
+        stop_event = threading.Event()
+        stop_event.set()
+        self.assertEqual(run_queued_jobs(mock_queue, stop_event), 0)
+        mock_queue.claim_next.assert_not_called()
+    
+    def test_schedule_queued_jobs(self):
+        mock_scheduler = mock.MagicMock()
+        mock_queue = mock.MagicMock()
+        stop_event = threading.Event()
+        
+        schedule_queued_jobs(mock_scheduler, mock_queue, stop_event)
+        mock_scheduler.add_job.assert_called_once_with(run_queued_jobs, args=[mock_queue, stop_event]
+                                                       , id="run_queued_jobs", executor="date_triggers"
+                                                       , max_instances=2, misfire_grace_time=None
+                                                       , replace_existing=True)
+    
+    @mock.patch('src.Implementations.schedule_queued_jobs')
+    @mock.patch('src.Implementations.datetime')
+    def test_queue_date_trigger(self, mock_datetime, mock_schedule_jobs):
+        mock_queue = mock.MagicMock()
+        mock_scheduler = mock.MagicMock()
+        stop_event = threading.Event()
+        mock_datetime.now.return_value = datetime(2025, 3, 16, 2, 0, 30)
+        
+        queue_date_trigger(mock_queue, "backup_spotify_library", "Backup-Library.log", mock_scheduler, stop_event)
+        mock_queue.enqueue.assert_called_once_with("backup_spotify_library", "Backup-Library.log"
+                                                   , run_key="2025-03-16 02:00")
+        mock_schedule_jobs.assert_called_once_with(mock_scheduler, mock_queue, stop_event)
+    
     @mock.patch('src.Implementations.startup_feature_thread')
     def test_log_and_macro(self, mock_startup):
         mock_features = mock.MagicMock()
@@ -155,7 +261,7 @@ class TestStatistics(unittest.TestCase):
         
         # Test None Playback
         mock_features.get_playback_state.return_value = None
-        log_and_macro(mock_features)
+        self.assertEqual(log_and_macro(mock_features), (None, False))
         mock_features.get_playback_state.assert_called_once()
         mock_features.log_playback_to_db.assert_not_called()
         mock_startup.assert_not_called()
@@ -163,7 +269,7 @@ class TestStatistics(unittest.TestCase):
 
         # Test None Context
         mock_features.get_playback_state.return_value = {'context': None}
-        log_and_macro(mock_features)
+        self.assertEqual(log_and_macro(mock_features), ({'context': None}, False))
         mock_features.log_playback_to_db.assert_called_once_with({'context': None})
         mock_startup.assert_not_called()
         reset_mocks()
@@ -183,14 +289,14 @@ class TestStatistics(unittest.TestCase):
         
         # Test No Macro Playback
         mock_features.get_playback_state.return_value = test_playback
-        log_and_macro(mock_features)
+        self.assertEqual(log_and_macro(mock_features), (test_playback, False))
         mock_features.log_playback_to_db.assert_called_once_with(test_playback)
         mock_startup.assert_not_called()
         reset_mocks()
         
         # Test Generate Artist Macro
         test_playback['track']['id'] = Test_Settings.GEN_ARTIST_MACRO_ID
-        log_and_macro(mock_features)
+        self.assertEqual(log_and_macro(mock_features), (test_playback, True))
         mock_features.skip_track.assert_called_once()
         mock_startup.assert_called_once_with(SpotifyFeatures.generate_artist_playlist_from_playlist
                                              , test_playback['context']['id']
@@ -200,7 +306,7 @@ class TestStatistics(unittest.TestCase):
         
         # Test Distribute Tracks Macro
         test_playback['track']['id'] = Test_Settings.DISTRIBUTE_TRACKS_MACRO_ID
-        log_and_macro(mock_features)
+        self.assertEqual(log_and_macro(mock_features), (test_playback, True))
         mock_features.skip_track.assert_called_once()
         mock_startup.assert_called_once_with(SpotifyFeatures.distribute_tracks_to_collections
                                              , test_playback['context']['id']
@@ -210,7 +316,7 @@ class TestStatistics(unittest.TestCase):
         
         # Test Organize Playlist Macro
         test_playback['track']['id'] = Test_Settings.ORGANIZE_PLAYLIST_MACRO_ID
-        log_and_macro(mock_features)
+        self.assertEqual(log_and_macro(mock_features), (test_playback, True))
         mock_features.skip_track.assert_called_once()
         mock_startup.assert_called_once_with(SpotifyFeatures.organize_playlist_by_date
                                              , test_playback['context']['id']
@@ -222,7 +328,7 @@ class TestStatistics(unittest.TestCase):
         test_playback['track']['id'] = "Tr001"
         test_playback['shuffle_state'] = True
         test_playback['repeat_state'] = "don't care"
-        log_and_macro(mock_features)
+        self.assertEqual(log_and_macro(mock_features), (test_playback, True))
         mock_features.skip_track.assert_not_called()
         mock_features.set_repeat_state.assert_called_once_with('off')
         mock_startup.assert_called_once_with(SpotifyFeatures.shuffle_playlist
@@ -234,7 +340,7 @@ class TestStatistics(unittest.TestCase):
         
         # Test Shuffle Styles
         test_playback['shuffle_state'] = False
-        log_and_macro(mock_features)
+        self.assertEqual(log_and_macro(mock_features), (test_playback, True))
         mock_features.skip_track.assert_not_called()
         mock_features.set_repeat_state.assert_called_once_with('off')
         mock_startup.assert_called_once_with(SpotifyFeatures.shuffle_playlist
@@ -246,7 +352,7 @@ class TestStatistics(unittest.TestCase):
         
         # Test Shuffle and Other Macro - Shuffle Takes Precedence, Only One Trigger
         test_playback['track']['id'] = Test_Settings.GEN_ARTIST_MACRO_ID
-        log_and_macro(mock_features)
+        self.assertEqual(log_and_macro(mock_features), (test_playback, True))
         mock_features.skip_track.assert_not_called()
         mock_features.set_repeat_state.assert_called_once_with('off')
         mock_startup.assert_called_once_with(SpotifyFeatures.shuffle_playlist
@@ -256,14 +362,165 @@ class TestStatistics(unittest.TestCase):
         mock_features.log_playback_to_db.assert_called_once_with(test_playback)
         reset_mocks()
     
+    def test_get_next_poll_delay_s(self):
+        playing = {'is_playing': True, 'progress_ms': 0, 'track': {'id': 'Tr001', 'duration_ms': 200_000}}
+        paused = dict(playing, is_playing=False)
+        
+        # Test Macros Poll Quickly No Matter The Playback
+        self.assertEqual(get_next_poll_delay_s(playing, True), Test_Settings.LOGGING_MACRO_S)
+        self.assertEqual(get_next_poll_delay_s(None, True, idle_polls=5), Test_Settings.LOGGING_MACRO_S)
+        
+        # Test Idle And Paused Back Off Exponentially Up To Our Max
+        for playback in [None, paused]:
+            self.assertEqual([get_next_poll_delay_s(playback, False, idle_polls) for idle_polls in range(5)]
+                             , [15, 30, 60, 60, 60])
+        
+        # Test Mid Track Polls On Our Normal Interval
+        self.assertEqual(get_next_poll_delay_s(playing, False), Test_Settings.LOGGING_INTERVAL_S)
+        self.assertEqual(get_next_poll_delay_s(playing, False, idle_polls=3), Test_Settings.LOGGING_INTERVAL_S)
+        
+        # Test Polls Land Just After The Track Ends
+        self.assertEqual(get_next_poll_delay_s(dict(playing, progress_ms=190_000), False), 11)
+        self.assertEqual(get_next_poll_delay_s(dict(playing, progress_ms=199_500), False), 1.5)
+        self.assertEqual(get_next_poll_delay_s(dict(playing, progress_ms=250_000), False), 1)
+        self.assertEqual(get_next_poll_delay_s(dict(playing, progress_ms=186_000), False), 15)
+        
+        # Test Missing Progress Or Duration Falls Back To Our Interval
+        self.assertEqual(get_next_poll_delay_s(dict(playing, progress_ms=None), False), 15)
+        self.assertEqual(get_next_poll_delay_s(dict(playing, track={'id': 'Tr001'}), False), 15)
+        self.assertEqual(get_next_poll_delay_s(dict(playing, track={'id': 'Tr001', 'duration_ms': 0}), False), 15)
+    
+    @mock.patch('src.Implementations.time')
+    def test_wait_for_playback_event(self, mock_time):
+        clock = [1000.0]
+        mock_time.monotonic.side_effect = lambda: clock[0]
+        stop_event = mock.MagicMock()
+        stop_event.is_set.return_value = False
+        stop_event.wait.side_effect = lambda timeout: clock.__setitem__(0, clock[0] + timeout)
+        mock_features = mock.MagicMock()
+        def long_poll(events):
+            def get_playback_events(since_seq, timeout_s):
+                clock[0] += timeout_s
+                return events.pop(0)
+            return get_playback_events
+        
+        # Test No Events Long Polls In Chunks Until Our Wake Time
+        mock_features.get_playback_events.side_effect = long_poll([{"events": [], "seq": 3}] * 3)
+        self.assertEqual(wait_for_playback_event(mock_features, stop_event, 1010.0), 3)
+        self.assertEqual(mock_features.get_playback_events.call_args_list
+                         , [mock.call(since_seq=None, timeout_s=4), mock.call(since_seq=3, timeout_s=4)
+                          , mock.call(since_seq=3, timeout_s=2)])
+        self.assertEqual(clock[0], 1010.0)
+        mock_features.reset_mock()
+        
+        # Test An Event Wakes Us Up Early
+        mock_features.get_playback_events.side_effect = long_poll([{"events": [], "seq": 3}
+                                                                   , {"events": [{"seq": 4, "types": ["track"]}]
+                                                                      , "seq": 4}])
+        self.assertEqual(wait_for_playback_event(mock_features, stop_event, 1020.0, since_seq=3), 4)
+        self.assertEqual(clock[0], 1018.0)
+        mock_features.reset_mock()
+        
+        # Test Already Past Our Wake Time Or Stopped
+        self.assertEqual(wait_for_playback_event(mock_features, stop_event, 1000.0, since_seq=4), 4)
+        stop_event.is_set.return_value = True
+        self.assertEqual(wait_for_playback_event(mock_features, stop_event, 1030.0, since_seq=4), 4)
+        mock_features.get_playback_events.assert_not_called()
+        stop_event.is_set.return_value = False
+        
+        # Test Failing To Get Events Just Waits Out Our Time
+        mock_features.get_playback_events.side_effect = KeyError("events")
+        self.assertEqual(wait_for_playback_event(mock_features, stop_event, 1030.0, since_seq=4), 4)
+        mock_features.logger.exception.assert_called_once()
+        stop_event.wait.assert_called_once_with(12.0)
+    
+    @mock.patch('src.Implementations.wait_for_playback_event')
+    @mock.patch('src.Implementations.log_and_macro')
+    @mock.patch('src.Implementations.time')
+    def test_run_playback_poller(self, mock_time, mock_log_and_macro, mock_wait_for_event):
+        clock = [1000.0]
+        mock_time.monotonic.side_effect = lambda: clock[0]
+        stop_event = mock.MagicMock()
+        stop_event.is_set.return_value = False
+        stop_event.wait.side_effect = lambda timeout: clock.__setitem__(0, clock[0] + timeout)
+        # Our event waits are tested on their own, here they just wait out the rest of our delay
+        mock_wait_for_event.side_effect = lambda features, event, wake_time, since_seq: \
+            stop_event.wait(wake_time - clock[0]) or 7
+        mock_features = mock.MagicMock()
+        
+        playing = {'is_playing': True, 'progress_ms': 0, 'track': {'id': 'Tr001', 'duration_ms': 200_000}}
+        polls = [(dict(playing, progress_ms=190_000), False)     # 11s, Just After Track End
+               , (playing, True)                                 # 3s, Macro
+               , (playing, False)                                # 15s, Interval
+               , (None, False)                                   # 15s, Idle Back Off Starts
+               , (None, False)                                   # 30s
+               , (dict(playing, is_playing=False), False)        # 60s, Paused Counts As Idle
+               , (None, False)                                   # 60s, Capped
+               , KeyError("poll")                                # 60s, Failures Count As Idle Too
+               , (playing, False)]                               # 15s, Playing Resets Our Back Off
+        
+        # Test Delays Between Polls
+        def stop_after_polls(spotify_features):
+            if mock_log_and_macro.call_count == len(polls):
+                stop_event.is_set.return_value = True
+            poll = polls[mock_log_and_macro.call_count - 1]
+            if isinstance(poll, Exception):
+                raise poll
+            return poll
+        mock_log_and_macro.side_effect = stop_after_polls
+        
+        self.assertEqual(run_playback_poller(mock_features, stop_event), len(polls))
+        mock_log_and_macro.assert_has_calls([mock.call(mock_features)] * len(polls))
+        self.assertEqual([wait_call.args[0] for wait_call in stop_event.wait.call_args_list]
+                         , [11, 3, 15, 15, 30, 60, 60, 60, 15])
+        self.assertEqual([wait_call.args[3] for wait_call in mock_wait_for_event.call_args_list], [None] + [7] * 8)
+        mock_features.logger.exception.assert_called_once()
+        mock_features.flush_playback_log.assert_called_once()
+        
+        # Test Slow Polls Eat Into Our Delay
+        stop_event.reset_mock()
+        stop_event.is_set.return_value = False
+        mock_log_and_macro.reset_mock()
+        def slow_poll(spotify_features):
+            clock[0] += 4
+            stop_event.is_set.return_value = mock_log_and_macro.call_count == 2
+            return playing, False
+        mock_log_and_macro.side_effect = slow_poll
+        self.assertEqual(run_playback_poller(mock_features, stop_event), 2)
+        self.assertEqual([wait_call.args[0] for wait_call in stop_event.wait.call_args_list], [11, 11])
+        
+        # Test Runtime Window, No Poll Starts After It
+        stop_event.reset_mock()
+        stop_event.is_set.return_value = False
+        mock_log_and_macro.reset_mock()
+        mock_log_and_macro.side_effect = None
+        mock_log_and_macro.return_value = (None, False)
+        self.assertEqual(run_playback_poller(mock_features, stop_event, runtime_s=45), 3)
+        self.assertEqual([wait_call.args[0] for wait_call in stop_event.wait.call_args_list], [15, 30])
+        
+        # Test Already Stopped
+        stop_event.is_set.return_value = True
+        mock_log_and_macro.reset_mock()
+        self.assertEqual(run_playback_poller(mock_features, stop_event), 0)
+        mock_log_and_macro.assert_not_called()
+        
+        # Test A Failed Flush Is Logged Rather Than Raised
+        mock_features.reset_mock()
+        mock_features.flush_playback_log.side_effect = OSError("flush")
+        self.assertEqual(run_playback_poller(mock_features, stop_event), 0)
+        mock_features.logger.exception.assert_called_once()
+    
+    @mock.patch('src.Implementations.macro_pool')
     @mock.patch('src.Implementations.SpotifyFeatures')
-    @mock.patch('src.Implementations.startup_feature_thread')
-    @mock.patch('src.Implementations.BackgroundScheduler')
+    @mock.patch('src.Implementations.run_queued_jobs')
+    @mock.patch('src.Implementations.JobQueue')
+    @mock.patch('src.Implementations.run_playback_poller')
     @mock.patch('src.Implementations.datetime')
     @mock.patch('src.Implementations.threading')
     @mock.patch('src.Implementations.time')
-    def test_main(self, mock_time, mock_threading, mock_datetime, mock_scheduler, mock_startup, mock_features):
-        global threads
+    def test_main(self, mock_time, mock_threading, mock_datetime, mock_poller, mock_job_queue, mock_run_jobs
+                  , mock_features, mock_pool):
+        mock_enqueue = mock_job_queue.return_value.enqueue
         mock_thread = mock.MagicMock()
         mock_threading.Thread.return_value = mock_thread
         
@@ -274,67 +531,128 @@ class TestStatistics(unittest.TestCase):
         mock_threading.Thread.assert_called_once_with(target=monitor_script_runtime, daemon=True)
         mock_thread.start.assert_called_once()
         mock_features.assert_called_once_with(log_file_name=mock.ANY)
-        mock_scheduler.return_value.add_job.assert_called_once_with(log_and_macro
-                                                            , mock.ANY
-                                                            , args=[mock_features.return_value]
-                                                            , next_run_time=mock_datetime.now.return_value)
-        mock_scheduler.return_value.start.assert_called_once()
-        mock_time.sleep.assert_has_calls([mock.call(45), mock.call(1)])
-        mock_scheduler.return_value.shutdown.assert_called_once()
-        
-        # Test Joining Threads
-        mock_1 = mock.MagicMock()
-        mock_2 = mock.MagicMock()
-        src.Implementations.threads += [mock_1, mock_2, mock_1]
-        main()
-        mock_2.join.assert_called_once()
-        self.assertEqual(mock_1.join.call_count, 2)
+        mock_poller.assert_called_once_with(mock_features.return_value, mock_threading.Event.return_value
+                                            , runtime_s=45)
+        mock_time.sleep.assert_called_once_with(1)
+        
+        # Test Waiting On Our Macros, And Our Job Queue Always Runs To Resume Anything Left Over
+        mock_pool.join.assert_called_once()
+        mock_job_queue.assert_called_once_with(Test_Settings.JOB_QUEUE_DB)
+        mock_run_jobs.assert_called_once_with(mock_job_queue.return_value)
+        mock_enqueue.assert_not_called()
         
         # Test Backup and Update Latest Playlist
         mock_datetime.now.return_value = datetime(2025, 3, 16, 2, 0, 30)
         main()
-        mock_startup.assert_has_calls([
-            mock.call(mock_features.backup_spotify_library
-                      , log_file_name="Backup-Library.log"
-                      , run_parallel=False)
-          , mock.call(mock_features.update_daily_latest_playlist
-                      , log_file_name="Update-Latest-Playlist.log"
-                      , run_parallel=False)
+        self.assertEqual({enqueue.kwargs['run_key'] for enqueue in mock_enqueue.call_args_list}, {"2025-03-16 02:00"})
+        mock_enqueue.assert_has_calls([
+            mock.call("backup_spotify_library", "Backup-Library.log", run_key=mock.ANY)
+          , mock.call("update_daily_latest_playlist", "Update-Latest-Playlist.log", run_key=mock.ANY)
         ])
-        mock_startup.reset_mock()
+        mock_enqueue.reset_mock()
         
         # Test Weekly Report
         mock_datetime.now.return_value = datetime(2025, 3, 17, 3, 0, 0)
         main()
-        mock_startup.assert_called_once_with(mock_features.generate_weekly_report
-                                             , log_file_name="Weekly-Report.log"
-                                             , run_parallel=False)
-        mock_startup.reset_mock()
+        mock_enqueue.assert_called_once_with("generate_weekly_report", "Weekly-Report.log", run_key=mock.ANY)
+        mock_enqueue.reset_mock()
         
         # Test Google Drive Upload
         mock_datetime.now.return_value = datetime(2025, 3, 16, 2, 0, 0)
         main()
-        mock_startup.assert_any_call(mock_features.upload_latest_backup_to_drive
-                                             , log_file_name="Drive-Upload.log"
-                                             , run_parallel=False)
-        self.assertEqual(mock_startup.call_count, 3) # 2AM Also Triggers Backup and Update Latest Playlist
-        mock_startup.reset_mock()
+        mock_enqueue.assert_any_call("upload_latest_backup_to_drive", "Drive-Upload.log", run_key=mock.ANY)
+        self.assertEqual(mock_enqueue.call_count, 3) # 2AM Also Triggers Backup and Update Latest Playlist
+        mock_enqueue.reset_mock()
         
         mock_datetime.now.return_value = datetime(2025, 3, 19, 2, 0, 0)
         main()
-        mock_startup.assert_any_call(mock_features.upload_latest_backup_to_drive
-                                             , log_file_name="Drive-Upload.log"
-                                             , run_parallel=False)
-        self.assertEqual(mock_startup.call_count, 3) # 2AM Also Triggers Backup and Update Latest Playlist
-        mock_startup.reset_mock()
+        mock_enqueue.assert_any_call("upload_latest_backup_to_drive", "Drive-Upload.log", run_key=mock.ANY)
+        self.assertEqual(mock_enqueue.call_count, 3) # 2AM Also Triggers Backup and Update Latest Playlist
+        mock_enqueue.reset_mock()
         
         # Test Monthly Release
         mock_datetime.now.return_value = datetime(2025, 4, 1, 1, 0, 59)
         main()
-        mock_startup.assert_called_once_with(mock_features.generate_monthly_release
-                                             , log_file_name="Monthly-Release.log"
-                                             , run_parallel=False)
-        mock_startup.reset_mock()
+        mock_enqueue.assert_called_once_with("generate_monthly_release", "Monthly-Release.log", run_key=mock.ANY)
+        mock_enqueue.reset_mock()
+        
+        # Test Archive Listening History
+        mock_datetime.now.return_value = datetime(2025, 4, 1, 4, 0, 0)
+        main()
+        mock_enqueue.assert_called_once_with("archive_listening_history", "Archive-Listening-History.log"
+                                             , run_key=mock.ANY)
+        mock_enqueue.reset_mock()
+        
+        # Test Export Listening History
+        mock_datetime.now.return_value = datetime(2025, 3, 16, 5, 0, 0)
+        main()
+        mock_enqueue.assert_called_once_with("export_listening_history", "Export-Listening-History.log"
+                                             , run_key=mock.ANY)
+        mock_enqueue.reset_mock()
+    
+    @mock.patch('src.Implementations.macro_pool')
+    @mock.patch('src.Implementations.schedule_queued_jobs')
+    @mock.patch('src.Implementations.SpotifyFeatures')
+    @mock.patch('src.Implementations.BackgroundScheduler')
+    @mock.patch('src.Implementations.JobQueue')
+    @mock.patch('src.Implementations.run_playback_poller')
+    @mock.patch('src.Implementations.signal')
+    @mock.patch('src.Implementations.threading')
+    def test_run_daemon(self, mock_threading, mock_signal, mock_poller, mock_job_queue, mock_scheduler, mock_features
+                        , mock_schedule_jobs, mock_pool):
+        mock_stop_event = mock_threading.Event.return_value
+        
+        run_daemon()
+        
+        # Test One Warm Features Object And No Runtime Monitor
+        mock_features.assert_called_once_with(log_file_name="Playback.log")
+        mock_threading.Thread.assert_not_called()
+        
+        # Test Signals Stop Us
+        mock_signal.signal.assert_has_calls([mock.call(mock_signal.SIGTERM, mock.ANY)
+                                           , mock.call(mock_signal.SIGINT, mock.ANY)])
+        for signal_call in mock_signal.signal.call_args_list:
+            mock_stop_event.set.reset_mock()
+            signal_call.args[1](signal_call.args[0], None)
+            mock_stop_event.set.assert_called_once()
+        mock_poller.assert_called_once_with(mock_features.return_value, mock_stop_event)
+        
+        # Test Every Date Trigger Is Scheduled
+        scheduler = mock_scheduler.return_value
+        scheduler.add_executor.assert_has_calls([mock.call(mock.ANY, "date_triggers")
+                                               , mock.call(mock.ANY, "queue_date_triggers")])
+        add_job_calls = scheduler.add_job.call_args_list
+        self.assertEqual(len(add_job_calls), len(DATE_TRIGGERS))
+        mock_job_queue.assert_called_once_with(Test_Settings.JOB_QUEUE_DB)
+        
+        job_ids = [add_job_call.kwargs['id'] for add_job_call in add_job_calls]
+        self.assertEqual(job_ids, sorted(job_ids))
+        for add_job_call, (method_name, log_file_name, triggers) in zip(add_job_calls, DATE_TRIGGERS):
+            self.assertEqual(add_job_call.args[0], queue_date_trigger)
+            self.assertEqual(str(add_job_call.args[1])
+                             , f"or[{', '.join(str(get_cron_trigger(**trigger)) for trigger in triggers)}]")
+            self.assertEqual(add_job_call.kwargs['args'], [mock_job_queue.return_value, method_name, log_file_name
+                                                           , scheduler, mock_stop_event])
+            self.assertEqual(add_job_call.kwargs['executor'], "queue_date_triggers")
+            self.assertEqual(add_job_call.kwargs['misfire_grace_time'], Test_Settings.DAEMON_MISFIRE_GRACE_S)
+        
+        # Test We Resume Our Job Queue On Startup
+        mock_schedule_jobs.assert_called_once_with(scheduler, mock_job_queue.return_value, mock_stop_event)
+        
+        # Test Graceful Shutdown
+        scheduler.start.assert_called_once()
+        scheduler.shutdown.assert_called_once_with(wait=True)
+        mock_pool.shutdown.assert_called_once_with(wait=True)
+
+    def test_startup_imports(self):
+        import_times = get_startup_import_times()
+        self.assertIn("src.Implementations", import_times)
+        self.assertIn("src.Spotify_Features", import_times)
+
+        # Test None Of Our Heavy Features Are Loaded Up Front
+        for module in STARTUP_FORBIDDEN_MODULES:
+            self.assertEqual([name for name in import_times if name == module or name.startswith(f"{module}.")], []
+                             , msg=module)
 
 
 # FIN ════════════════════════════════════════════════════════════════════════════════════════════════════════════════
\ No newline at end of file
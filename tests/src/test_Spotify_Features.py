@@ -12,12 +12,14 @@ import unittest
 from unittest import mock
 from datetime import datetime, timedelta
 
+import src.Spotify_Features
 import tests.helpers.tester_helpers as thelp
 
 from tests.helpers.mocked_spotipy   import MockedSpotipyProxy
 from src.Spotify_Features           import SpotifyFeatures
 from src.features.Shuffle_Styles    import ShuffleType
 from src.helpers.Database_Helpers   import get_table_fields
+from src.helpers.Job_Queue          import JobCheckpoint
 from src.helpers.Settings           import Settings
 
 
@@ -44,7 +46,7 @@ class TestSpotifyFeatures(unittest.TestCase):
         features = SpotifyFeatures(log_file_name='test.log', log_mode='w', log_level=10)
 
         MockGetFileLogger.assert_called_once_with('logs/test.log', mode='w', log_level=10)
-        MockGSH.assert_called_once_with(logger=MockGetFileLogger())
+        MockGSH.assert_called_once_with(logger=MockGetFileLogger(), album_cache_db=Settings.ALBUM_CACHE_DB)
         MockMiscFeatures.assert_called_once_with(MockGSH(), logger=MockGetFileLogger())
         self.assertEqual(features.logger, MockGetFileLogger())
         self.assertEqual(features.spotify, MockGSH())
@@ -82,7 +84,14 @@ class TestSpotifyFeatures(unittest.TestCase):
         self.mock_misc_features.generate_artist_release.assert_called_once_with(
                                             ['Ar002', 'Ar003', 'Ar004']
                                             , mock.ANY, mock.ANY
-                                            , start_date=expected_start_date, end_date=expected_end_date)
+                                            , start_date=expected_start_date, end_date=expected_end_date
+                                            , checkpoint=None)
+        
+        # Test Our Checkpoint Is Handed Down
+        self.mock_misc_features.generate_artist_release.reset_mock()
+        checkpoint = JobCheckpoint()
+        self.spotify_features.generate_monthly_release(checkpoint=checkpoint)
+        self.assertEqual(self.mock_misc_features.generate_artist_release.call_args.kwargs['checkpoint'], checkpoint)
     
     def test_generate_release_playlist(self):
         thelp.create_env(self.spotify_features.spotify)
@@ -156,11 +165,45 @@ class TestSpotifyFeatures(unittest.TestCase):
         MockLogPlayback().log_track.assert_called_once_with(playback, True)
         MockLogPlayback().log_track.reset_mock()
     
+    @mock.patch('src.Spotify_Features.LogPlayback')
+    def test_flush_playback_log_for_reads(self, MockLogPlayback):
+        self.spotify_features._flush_playback_log_for_reads()
+        MockLogPlayback.assert_called_once_with(logger=self.spotify_features.logger)
+        MockLogPlayback().flush_playback_log.assert_called_once()
+        
+        # Test A Failed Flush Is Logged And Our Job Carries On
+        MockLogPlayback().flush_playback_log.side_effect = OSError("flush")
+        with self.assertLogs(self.spotify_features.logger, level='ERROR'):
+            self.spotify_features._flush_playback_log_for_reads()
+    
+    @mock.patch('src.Spotify_Features.datetime')
+    @mock.patch('src.Spotify_Features.DatabaseHelpers')
+    def test_archive_listening_history(self, MockDatabaseHelpers, mock_datetime):
+        # Test We Keep 'LISTENING_HOT_MONTHS' Full Months Plus The Current One
+        mock_datetime.today.return_value = datetime(2025, 5, 17, 4, 0, 0)
+        with mock.patch.object(self.spotify_features, '_flush_playback_log_for_reads') as mock_flush:
+            self.spotify_features.archive_listening_history()
+        mock_flush.assert_called_once()
+        MockDatabaseHelpers.assert_called_once_with(Settings.LISTENING_VAULT_DB, logger=self.spotify_features.logger)
+        MockDatabaseHelpers().archive_listening_sessions.assert_called_once_with(
+            Settings.LISTENING_ARCHIVE_LOCATION
+          , datetime(2025, 5 - Settings.LISTENING_HOT_MONTHS, 1, 4, 0, 0))
+    
+    @mock.patch('src.Spotify_Features.ListeningAnalytics')
+    def test_export_listening_history(self, MockListeningAnalytics):
+        with mock.patch.object(self.spotify_features, '_flush_playback_log_for_reads') as mock_flush:
+            self.spotify_features.export_listening_history()
+        mock_flush.assert_called_once()
+        MockListeningAnalytics.assert_called_once_with(logger=self.spotify_features.logger)
+        MockListeningAnalytics().export_listening_history.assert_called_once()
+    
     @mock.patch('src.Spotify_Features.Shuffler')
     def test_shuffle_playlist(self, MockShuffler):
         playlist_id = 'test_playlist_id'
         for shuffle in ShuffleType:
-            self.spotify_features.shuffle_playlist(playlist_id, shuffle)
+            with mock.patch.object(self.spotify_features, '_flush_playback_log_for_reads') as mock_flush:
+                self.spotify_features.shuffle_playlist(playlist_id, shuffle)
+            mock_flush.assert_called_once()
             MockShuffler.assert_called_once_with(self.spotify_features.spotify, logger=self.spotify_features.logger)
             MockShuffler().shuffle.assert_called_once_with(playlist_id, shuffle)
             MockShuffler.reset_mock()
@@ -189,10 +232,24 @@ class TestSpotifyFeatures(unittest.TestCase):
                                                     , artist_info=get_table_fields('artists'))
         MockGetPlaybackState.reset_mock()
     
+    @mock.patch('src.General_Spotify_Helpers.GeneralSpotifyHelpers.get_playback_events')
+    def test_get_playback_events(self, MockGetPlaybackEvents):
+        self.spotify_features.get_playback_events()
+        MockGetPlaybackEvents.assert_called_once_with(since_seq=None, timeout_s=0)
+        MockGetPlaybackEvents.reset_mock()
+        
+        self.spotify_features.get_playback_events(since_seq=3, timeout_s=4)
+        MockGetPlaybackEvents.assert_called_once_with(since_seq=3, timeout_s=4)
+    
     def test_update_daily_latest_playlist(self):
         self.spotify_features.update_daily_latest_playlist()
         self.mock_misc_features.update_daily_latest_playlist.assert_called_once()
     
+    @mock.patch('src.General_Spotify_Helpers.GeneralSpotifyHelpers.clear_search_cache')
+    def test_clear_run_caches(self, MockClearSearchCache):
+        self.spotify_features.clear_run_caches()
+        MockClearSearchCache.assert_called_once()
+    
     @mock.patch('src.General_Spotify_Helpers.GeneralSpotifyHelpers.change_playback')
     def test_skip_track(self, MockChangePlayback):
         self.spotify_features.skip_track()
@@ -206,12 +263,32 @@ class TestSpotifyFeatures(unittest.TestCase):
         self.spotify_features.set_repeat_state('context')
         MockChangePlayback.assert_called_once_with(repeat="context")
     
+    def test_load_feature(self):
+        for name, module in src.Spotify_Features.LAZY_FEATURES.items():
+            feature = src.Spotify_Features.load_feature(name)
+            self.assertEqual(feature.__name__, name)
+            self.assertEqual(feature.__module__, module)
+            self.assertIs(getattr(src.Spotify_Features, name), feature)
+            self.assertIs(vars(src.Spotify_Features)[name], feature)
+
+        # Test Patched Features Are What We Load
+        with mock.patch('src.Spotify_Features.WeeklyReport') as MockWeeklyReport:
+            self.assertIs(src.Spotify_Features.load_feature("WeeklyReport"), MockWeeklyReport)
+        self.assertIsNot(src.Spotify_Features.load_feature("WeeklyReport"), MockWeeklyReport)
+
+        # Test Unknown Attributes
+        with self.assertRaises(AttributeError):
+            src.Spotify_Features.load_feature("NotAFeature")
+        self.assertFalse(hasattr(src.Spotify_Features, "NotAFeature"))
+
     @mock.patch('src.Spotify_Features.WeeklyReport')
     @mock.patch('src.Spotify_Features.SanityTest')
     def test_generate_weekly_report(self, MockSanityTest, MockWeeklyReport):
         mock_sanity_instance = mock.MagicMock()
         MockSanityTest.return_value = mock_sanity_instance
-        self.spotify_features.generate_weekly_report()
+        with mock.patch.object(self.spotify_features, '_flush_playback_log_for_reads') as mock_flush:
+            self.spotify_features.generate_weekly_report()
+        mock_flush.assert_called_once()
 
         MockSanityTest.assert_called_once_with(logger=self.spotify_features.logger)
         MockWeeklyReport.assert_called_once_with(mock_sanity_instance, logger=self.spotify_features.logger)
@@ -219,16 +296,18 @@ class TestSpotifyFeatures(unittest.TestCase):
     
     @mock.patch('src.Spotify_Features.SanityTest')
     def test_run_sanity_checks(self, MockSanityTest):
-        self.spotify_features.run_sanity_checks()
-        MockSanityTest.assert_called_once_with(logger=self.spotify_features.logger)
-        expected_calls = [mock.call.sanity_diffs_in_major_playlist_sets()
-                          , mock.call.sanity_in_progress_artists()
-                          , mock.call.sanity_duplicates()
-                          , mock.call.sanity_artist_playlist_integrity() 
-                          , mock.call.sanity_contributing_artists()]
-
-        actual_calls = [call for call in MockSanityTest().mock_calls if '__str__' not in str(call)]
-        self.assertCountEqual(actual_calls, expected_calls)
+        MockSanityTest().run_checks.return_value = [
+            {'name': 'Duplicates', 'results': [{'Playlist': 'Pl1'}], 'duration_s': 0.25}
+          , {'name': 'Artist Integrity', 'results': [], 'duration_s': 1.5}
+        ]
+        MockSanityTest.reset_mock()
+        
+        with mock.patch.object(self.spotify_features, 'logger') as mock_logger:
+            self.spotify_features.run_sanity_checks()
+        MockSanityTest.assert_called_once_with(logger=mock_logger)
+        MockSanityTest().run_checks.assert_called_once_with()
+        mock_logger.info.assert_any_call("Duplicates (0.250s) [{'Playlist': 'Pl1'}]")
+        mock_logger.info.assert_any_call("Artist Integrity (1.500s) []")
     
     @mock.patch('src.Spotify_Features.DriveUploader')
     @mock.patch('src.Spotify_Features.glob')